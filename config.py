@@ -47,6 +47,11 @@ BATCH_SIZE = 50
 BATCH_SLEEP = 2.0  # seconds between batch downloads
 FUNDAMENTAL_SLEEP = 0.5  # seconds between individual ticker info calls
 PRICE_HISTORY_MONTHS = 14  # months of price history to download
+# Concurrent price batch downloads. yfinance is not thread-safe (shared
+# session/cache state), so keep 1 unless the downloader is; yf.download
+# already parallelises the tickers within a batch.
+PRICE_FETCH_WORKERS = 1
+PRICE_FETCH_RATE = 0.5  # price batch requests started per second
 
 # Cache settings
 CACHE_DIR = "cache"
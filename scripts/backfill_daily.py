@@ -18,6 +18,7 @@ from sqlalchemy import text
 
 from src.db.engine import get_async_engine
 from src.quality.validators import PriceValidator
+from src.services.data_service import DataService
 from src.settings import get_settings
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
@@ -40,7 +41,7 @@ async def backfill_ticker_polygon(ticker: str, instrument_id: int, start: str, e
 
     provider = PolygonProvider()
     validator = PriceValidator()
-    engine = get_async_engine()
+    data_service = DataService()
 
     # Fetch in 2-year chunks to stay within API limits
     current = datetime.strptime(start, "%Y-%m-%d")
@@ -62,25 +63,23 @@ async def backfill_ticker_polygon(ticker: str, instrument_id: int, start: str, e
             if errors:
                 logger.warning("%s: validation errors: %s", ticker, [r.message for r in errors])
 
-            # Insert into DB
-            async with engine.begin() as conn:
-                for dt_idx, row in df.iterrows():
-                    await conn.execute(text("""
-                        INSERT INTO price_bars (time, instrument_id, open, high, low, close, volume, adj_close, source)
-                        VALUES (:time, :iid, :open, :high, :low, :close, :volume, :close, 'polygon')
-                        ON CONFLICT (time, instrument_id) DO UPDATE SET
-                            open = EXCLUDED.open, high = EXCLUDED.high,
-                            low = EXCLUDED.low, close = EXCLUDED.close,
-                            volume = EXCLUDED.volume
-                    """), {
-                        "time": dt_idx, "iid": instrument_id,
-                        "open": float(row.get("open", 0)),
-                        "high": float(row.get("high", 0)),
-                        "low": float(row.get("low", 0)),
-                        "close": float(row.get("close", 0)),
-                        "volume": int(row.get("volume", 0)),
-                    })
-            total_bars += len(df)
+            # Insert into DB: one COPY + set-based upsert per chunk. ON CONFLICT
+            # cannot touch the same (time, instrument_id) twice in one statement.
+            ohlcv = df.reindex(columns=["open", "high", "low", "close", "volume"]).fillna(0)
+            ohlcv = ohlcv[~ohlcv.index.duplicated(keep="last")]
+            records = [
+                (dt_idx.to_pydatetime(), instrument_id, float(o), float(h), float(lo), float(c), int(v), float(c))
+                for dt_idx, o, h, lo, c, v in zip(ohlcv.index, *(ohlcv[col] for col in ohlcv.columns))
+            ]
+            await data_service.bulk_upsert(
+                "price_bars",
+                ["time", "instrument_id", "open", "high", "low", "close", "volume", "adj_close"],
+                records,
+                conflict=["time", "instrument_id"],
+                update=["open", "high", "low", "close", "volume"],
+                source="polygon",
+            )
+            total_bars += len(records)
 
         current = chunk_end
         await asyncio.sleep(0.5)  # Rate limit
@@ -93,25 +92,20 @@ async def backfill_ticker_yfinance(ticker: str, instrument_id: int, period: str)
     from src.services.providers.yfinance_provider import YFinanceProvider
 
     provider = YFinanceProvider()
-    engine = get_async_engine()
 
     df = await provider.fetch_prices([ticker], period)
     if df.empty:
         return 0
 
-    async with engine.begin() as conn:
-        for dt_idx in df.index:
-            price = df.loc[dt_idx].iloc[0] if len(df.columns) == 1 else df.loc[dt_idx, ticker]
-            if price is None or (isinstance(price, float) and price != price):
-                continue
-            await conn.execute(text("""
-                INSERT INTO price_bars (time, instrument_id, close, adj_close, source)
-                VALUES (:time, :iid, :close, :close, 'yfinance')
-                ON CONFLICT (time, instrument_id) DO UPDATE SET
-                    close = EXCLUDED.close, adj_close = EXCLUDED.adj_close
-            """), {"time": dt_idx, "iid": instrument_id, "close": float(price)})
-
-    return len(df)
+    prices = df.iloc[:, 0] if len(df.columns) == 1 else df[ticker]
+    return await DataService().bulk_upsert(
+        "price_bars",
+        ["time", "instrument_id", "close", "adj_close"],
+        DataService.price_records(prices.to_frame(ticker), {ticker: instrument_id}),
+        conflict=["time", "instrument_id"],
+        update=["close", "adj_close"],
+        source="yfinance",
+    )
 
 
 async def main():
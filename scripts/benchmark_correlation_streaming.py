@@ -0,0 +1,78 @@
+"""Benchmark the incremental correlation service on a large universe.
+
+Seeds StreamingCorrelationService with a window of 5-minute bars, then
+times the per-bar update, materializing the full matrix, row / pair
+lookups and a memory-mapped snapshot, against recomputing
+``DataFrame.corr()`` over the window.
+
+Usage:
+    python -m scripts.benchmark_correlation_streaming
+    python -m scripts.benchmark_correlation_streaming --symbols 3000 --window 390 --include-full
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from src.correlation.config import StreamingConfig, WindowType
+from src.correlation.streaming import StreamingCorrelationService
+from src.testing.benchmarks import BenchmarkSuite
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+logger = logging.getLogger(__name__)
+
+
+def make_bars(n_bars: int, n_symbols: int, seed: int = 0) -> pd.DataFrame:
+    """5-minute returns driven by one market factor plus noise."""
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2026-01-05 09:35", periods=n_bars, freq="5min")
+    market = rng.normal(0, 0.001, (n_bars, 1))
+    betas = rng.uniform(0.5, 1.5, n_symbols)
+    data = market * betas + rng.normal(0, 0.002, (n_bars, n_symbols))
+    return pd.DataFrame(data, index=index, columns=[f"S{i:04d}" for i in range(n_symbols)])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Streaming correlation benchmark")
+    parser.add_argument("--symbols", type=int, default=3000)
+    parser.add_argument("--window", type=int, default=390, help="bars in the rolling window")
+    parser.add_argument("--window-type", default="fixed", choices=[w.value for w in WindowType])
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--include-full", action="store_true", help="also time DataFrame.corr() over the window")
+    args = parser.parse_args()
+
+    bars = make_bars(args.window + args.iterations * 2 + 10, args.symbols)
+    history_path = os.path.join(tempfile.mkdtemp(), "correlation_history.npy")
+    config = StreamingConfig(
+        window=args.window, window_type=WindowType(args.window_type),
+        history_path=history_path, history_capacity=args.iterations + 2,
+    )
+
+    with StreamingCorrelationService(list(bars.columns), config) as service:
+        service.update_many(bars.iloc[:args.window])
+        live = iter(bars.iloc[args.window:].to_numpy())
+
+        def update_and_matrix():
+            service.update(next(live))
+            return service.matrix()
+
+        suite = BenchmarkSuite("correlation_streaming", iterations=args.iterations)
+        suite.add_benchmark("update_bar", lambda: service.update(next(live)))
+        suite.add_benchmark("update_bar_and_matrix", update_and_matrix)
+        suite.add_benchmark("get_row", lambda: service.get_row("S0001"))
+        suite.add_benchmark("record_snapshot", service.record_snapshot)
+        if args.include_full:
+            window = bars.iloc[-args.window:]
+            suite.add_benchmark("dataframe_corr_full", window.corr)
+
+        for result in suite.run_all():
+            logger.info("%-26s mean %9.1f ms  p95 %9.1f ms", result.name, result.mean_ms, result.p95_ms)
+        logger.info("average correlation %.3f", service.matrix().avg_correlation)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Benchmark UniverseScanner.scan_all across a large universe.
+
+Replaces the network with a DataFeed whose get_bars() sleeps for a fixed
+latency and returns synthetic bars, then times the serial scan against
+the concurrent scan with and without timeframe derivation.
+
+Usage:
+    python -m scripts.benchmark_ema_scanner
+    python -m scripts.benchmark_ema_scanner --tickers 1500 --latency-ms 50 --workers 32 --include-serial
+"""
+
+import argparse
+import logging
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.ema_signals.clouds import EMASignalConfig
+from src.ema_signals.data_feed import DataFeed
+from src.ema_signals.scanner import UniverseScanner
+from src.testing.benchmarks import BenchmarkSuite
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+logger = logging.getLogger(__name__)
+
+
+def make_bars(index: pd.DatetimeIndex, seed: int) -> pd.DataFrame:
+    """Random-walk OHLCV bars on the given index."""
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 0.1, len(index)))
+    open_ = np.concatenate([[100.0], close[:-1]])
+    return pd.DataFrame({
+        "open": open_,
+        "high": np.maximum(open_, close) + 0.05,
+        "low": np.minimum(open_, close) - 0.05,
+        "close": close,
+        "volume": rng.integers(1_000, 10_000, len(index)).astype(float),
+    }, index=index)
+
+
+class SimulatedFeed(DataFeed):
+    """DataFeed that serves canned bars after a fixed delay."""
+
+    def __init__(self, latency: float):
+        super().__init__()
+        self.latency = latency
+        self.requests = 0
+        self._lock = threading.Lock()
+        sessions = pd.bdate_range("2024-03-04", periods=5)
+        minute_index = pd.DatetimeIndex([
+            ts for day in sessions
+            for ts in pd.date_range(day + pd.Timedelta("9h30min"), periods=390, freq="1min")
+        ])
+        self._frames = {
+            "1m": make_bars(minute_index, 1),
+            "5m": make_bars(pd.date_range("2024-01-02 09:30", periods=780, freq="5min"), 2),
+            "10m": make_bars(pd.date_range("2024-01-02 09:30", periods=390, freq="15min"), 3),
+            "1h": make_bars(pd.date_range("2023-11-01 09:30", periods=420, freq="1h"), 4),
+            "1d": make_bars(pd.bdate_range("2023-01-02", periods=252), 5),
+        }
+
+    def get_bars(self, ticker: str, timeframe: str, lookback: int = 200) -> pd.DataFrame:
+        time.sleep(self.latency)
+        with self._lock:
+            self.requests += 1
+        return self._frames[timeframe].copy()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="EMA universe scan benchmark")
+    parser.add_argument("--tickers", type=int, default=1500)
+    parser.add_argument("--timeframes", default="1m,5m,10m,1h")
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--workers", type=int, default=32)
+    parser.add_argument("--include-serial", action="store_true", help="also time the serial scan (slow)")
+    args = parser.parse_args()
+
+    tickers = [f"T{i:04d}" for i in range(args.tickers)]
+    timeframes = args.timeframes.split(",")
+    modes = [
+        ("concurrent", EMASignalConfig(scan_workers=args.workers, derive_timeframes=False)),
+        ("concurrent_derived", EMASignalConfig(scan_workers=args.workers)),
+    ]
+    if args.include_serial:
+        modes.insert(0, ("serial", EMASignalConfig(scan_workers=1, derive_timeframes=False)))
+
+    for name, config in modes:
+        scanner = UniverseScanner(config)
+        scanner.data_feed = SimulatedFeed(args.latency_ms / 1000)
+        suite = BenchmarkSuite(f"ema_scan_{name}", iterations=1)
+        suite.add_benchmark(name, lambda s=scanner: s.scan_all(tickers, timeframes))
+        for result in suite.run_all():
+            logger.info(
+                "%-20s %8.1f s  bar requests %d",
+                result.name, result.mean_ms / 1000, scanner.data_feed.requests,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Benchmark EventBus.publish routing with many subscribers.
+
+Registers a mix of exact (``quotes.S00001``), trailing-star
+(``signals.S0001*``) and leading-star (``*.S00001``) subscriptions, then
+publishes across the topic space with the topic cache warm and cold,
+against the previous linear fnmatch scan over every subscriber. The
+async cases time publish plus drain through the per-subscriber queues,
+one event per handler call and in micro-batches.
+
+Usage:
+    python -m scripts.benchmark_event_bus
+    python -m scripts.benchmark_event_bus --subscribers 10000 --publishes 20000 --include-linear
+"""
+
+import argparse
+import asyncio
+import fnmatch
+import logging
+
+import numpy as np
+
+from src.event_bus import EventBus, EventBusConfig, EventEnvelope
+from src.testing.benchmarks import BenchmarkSuite
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+logger = logging.getLogger(__name__)
+
+
+def make_bus(n_subscribers: int, n_symbols: int, cache_size: int, batch: bool = False) -> EventBus:
+    """80% exact, 15% trailing-star, 5% leading-star subscriptions."""
+    bus = EventBus(EventBusConfig(max_subscribers_per_topic=n_subscribers, topic_cache_size=cache_size))
+    rng = np.random.default_rng(0)
+    for i in range(n_subscribers):
+        sym = f"S{rng.integers(n_symbols):05d}"
+        kind = rng.random()
+        if kind < 0.80:
+            pattern = f"{rng.choice(['quotes', 'trades', 'orders'])}.{sym}"
+        elif kind < 0.95:
+            pattern = f"signals.{sym[:-1]}*"
+        else:
+            pattern = f"*.{sym}"
+        bus.subscribe(f"sub{i}", pattern, lambda event: None, batch=batch)
+    return bus
+
+
+def make_topics(n_publishes: int, n_symbols: int) -> list[str]:
+    rng = np.random.default_rng(1)
+    channels = np.array(["quotes", "trades", "orders", "signals"])
+    return [
+        f"{channels[c]}.S{s:05d}"
+        for c, s in zip(rng.integers(len(channels), size=n_publishes), rng.integers(n_symbols, size=n_publishes))
+    ]
+
+
+def linear_match(bus: EventBus, topic: str) -> list:
+    return [s for s in bus._subscribers.values() if fnmatch.fnmatch(topic, s.topic_pattern)]
+
+
+def publish_queued(bus: EventBus, topics: list[str], event: EventEnvelope) -> None:
+    async def run():
+        await bus.start()
+        for topic in topics:
+            bus.publish(topic, event)
+        await bus.stop()
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(run())
+    finally:
+        loop.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="EventBus routing benchmark")
+    parser.add_argument("--subscribers", type=int, default=10_000)
+    parser.add_argument("--symbols", type=int, default=5_000)
+    parser.add_argument("--publishes", type=int, default=20_000)
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--include-linear", action="store_true", help="also time the linear fnmatch scan (slow)")
+    args = parser.parse_args()
+
+    bus = make_bus(args.subscribers, args.symbols, cache_size=4 * args.symbols)
+    cold_bus = make_bus(args.subscribers, args.symbols, cache_size=1)
+    batch_bus = make_bus(args.subscribers, args.symbols, cache_size=4 * args.symbols, batch=True)
+    topics = make_topics(args.publishes, args.symbols)
+    event = EventEnvelope(event_type="benchmark", data={})
+    matched = sum(len(bus._get_matching_subscribers(t)) for t in topics)
+    logger.info("%d subscribers, %d publishes, %d deliveries", args.subscribers, len(topics), matched)
+
+    suite = BenchmarkSuite("event_bus", iterations=args.iterations)
+    suite.add_benchmark("publish_cached", lambda: [bus.publish(t, event) for t in topics])
+    suite.add_benchmark("publish_async", lambda: publish_queued(bus, topics, event))
+    suite.add_benchmark("publish_async_batched", lambda: publish_queued(batch_bus, topics, event))
+    suite.add_benchmark("route_cached", lambda: [bus._get_matching_subscribers(t) for t in topics])
+    suite.add_benchmark("route_uncached", lambda: [cold_bus._get_matching_subscribers(t) for t in topics])
+    if args.include_linear:
+        linear_topics = topics[: max(1, len(topics) // 20)]
+        suite.add_benchmark(f"route_linear_x{len(linear_topics)}", lambda: [linear_match(bus, t) for t in linear_topics])
+
+    for result in suite.run_all():
+        logger.info(
+            "%-26s mean %9.1f ms  p95 %9.1f ms", result.name, result.mean_ms, result.p95_ms,
+        )
+
+
+if __name__ == "__main__":
+    main()
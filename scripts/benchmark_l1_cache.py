@@ -0,0 +1,76 @@
+"""Benchmark dashboard-style fan-out through DataService.get_prices.
+
+Issues N concurrent identical requests for a synthetic price panel held
+in an in-process Redis stand-in (fakeredis): uncached (every request
+reads Redis), single-flight only (L1 storage disabled), and full L1.
+Reports latency and the number of Redis reads per configuration.
+
+Usage:
+    python -m scripts.benchmark_l1_cache
+    python -m scripts.benchmark_l1_cache --tickers 500 --days 504 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import logging
+
+from scripts.benchmark_redis_codec import make_panel
+from src.cache.local import LocalCache
+from src.cache.redis_client import cache
+from src.services.data_service import DataService
+from src.testing.benchmarks import BenchmarkSuite
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="L1 cache fan-out benchmark")
+    parser.add_argument("--tickers", type=int, default=500)
+    parser.add_argument("--days", type=int, default=504)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--iterations", type=int, default=10)
+    args = parser.parse_args()
+
+    import fakeredis
+
+    panel = make_panel(args.tickers, args.days)
+    tickers = list(panel.columns)
+    loop = asyncio.new_event_loop()
+    cache._async_client = fakeredis.FakeAsyncRedis()
+    loop.run_until_complete(cache.set_dataframe("axion:prices:bulk:all:1d", panel, 300))
+
+    reads = {"count": 0}
+    get_dataframe = cache.get_dataframe
+
+    async def counting_get(key):
+        reads["count"] += 1
+        return await get_dataframe(key)
+
+    cache.get_dataframe = counting_get
+
+    for label, max_entries in (("uncached", None), ("single_flight", 0), ("l1", 256)):
+        service = DataService(local_cache=LocalCache(name=f"bench_{label}", max_entries=max_entries or 0))
+        service._listener_started = True  # no pub/sub against the stand-in
+        if max_entries is None:
+            # Previous behaviour: every request reads Redis itself
+            request = lambda s=service: s._load_prices(tickers, "14mo", "1d", "axion:prices:bulk:all:1d")
+        else:
+            request = lambda s=service: s.get_prices(tickers)
+
+        async def fan_out(r=request):
+            await asyncio.gather(*[r() for _ in range(args.concurrency)])
+
+        suite = BenchmarkSuite(f"l1_cache_{label}", iterations=args.iterations)
+        suite.add_benchmark(f"{label}_x{args.concurrency}", lambda f=fan_out: loop.run_until_complete(f()))
+        reads["count"] = 0
+        for result in suite.run_all():
+            logger.info(
+                "%-20s mean %8.2f ms  p95 %8.2f ms  redis reads %d",
+                result.name, result.mean_ms, result.p95_ms, reads["count"],
+            )
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Benchmark OptionsBacktester: day-by-day scalar vs batched repricing.
+
+Runs short put and iron condor backtests over a synthetic decade of
+daily prices and ATM IVs in both modes, then times a delta x DTE x
+profit-target sweep in a single call.
+
+Usage:
+    python -m scripts.benchmark_options_backtest
+    python -m scripts.benchmark_options_backtest --years 10 --iterations 3 --include-scalar
+"""
+
+import argparse
+import logging
+
+import numpy as np
+import pandas as pd
+
+from src.options.backtest import OptionsBacktester
+from src.options.config import BacktestConfig
+from src.testing.benchmarks import BenchmarkSuite
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+logger = logging.getLogger(__name__)
+
+
+def make_history(n_days: int, seed: int = 42) -> tuple[pd.Series, pd.Series]:
+    """Random-walk prices and a mean-reverting ATM IV series."""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2014-01-02", periods=n_days)
+    prices = 100 * np.cumprod(1 + rng.normal(0.0003, 0.012, n_days))
+    iv = np.clip(0.2 + 0.05 * np.sin(np.arange(n_days) / 30) + rng.normal(0, 0.02, n_days), 0.08, 0.6)
+    return pd.Series(prices, index=dates), pd.Series(iv, index=dates)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Options backtester benchmark")
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--iterations", type=int, default=3)
+    parser.add_argument("--include-scalar", action="store_true", help="also time the day-by-day path (slow)")
+    args = parser.parse_args()
+
+    prices, ivs = make_history(252 * args.years)
+    modes = [("vectorized", OptionsBacktester())]
+    if args.include_scalar:
+        modes.append(("scalar", OptionsBacktester(BacktestConfig(vectorized=False))))
+
+    suite = BenchmarkSuite("options_backtest", iterations=args.iterations)
+    for label, bt in modes:
+        suite.add_benchmark(f"short_put_{label}", lambda b=bt: b.backtest_short_put(prices, ivs))
+        suite.add_benchmark(f"iron_condor_{label}", lambda b=bt: b.backtest_iron_condor(prices, ivs))
+
+    deltas, dtes, targets = [0.10, 0.16, 0.20, 0.25, 0.30], [30, 45, 60], [0.25, 0.50, 0.75]
+    suite.add_benchmark(
+        f"sweep_{len(deltas) * len(dtes) * len(targets)}_short_put",
+        lambda: modes[0][1].sweep(prices, ivs, delta_targets=deltas, dtes=dtes, profit_targets=targets),
+    )
+
+    for result in suite.run_all():
+        logger.info("%-26s mean %9.1f ms  p95 %9.1f ms", result.name, result.mean_ms, result.p95_ms)
+
+
+if __name__ == "__main__":
+    main()
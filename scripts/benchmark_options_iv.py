@@ -0,0 +1,96 @@
+"""Benchmark chain-wide implied volatility and Greeks.
+
+Builds a synthetic SPX-style chain (calls and puts across strikes and
+expiries, priced off a smile) and times the per-contract scalar solver
+against the array solver, plus the two chain consumers that use it:
+VolatilitySurfaceBuilder.build_from_chain and
+ChainAnalyzer.compute_greeks_for_chain.
+
+Usage:
+    python -m scripts.benchmark_options_iv
+    python -m scripts.benchmark_options_iv --strikes 200 --expiries 12 --iterations 10 --include-scalar
+"""
+
+import argparse
+import logging
+
+import numpy as np
+import pandas as pd
+
+from src.options.chain import ChainAnalyzer
+from src.options.models import OptionContract
+from src.options.pricing import OptionsPricingEngine, OptionType
+from src.options.volatility import VolatilitySurfaceBuilder
+from src.testing.benchmarks import BenchmarkSuite
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+logger = logging.getLogger(__name__)
+
+
+def make_chain(spot: float, n_strikes: int, n_expiries: int) -> pd.DataFrame:
+    """Calls and puts priced off a skewed smile with a term structure."""
+    engine = OptionsPricingEngine()
+    strikes = np.linspace(0.6 * spot, 1.4 * spot, n_strikes)
+    dtes = np.unique(np.geomspace(7, 365, n_expiries).astype(int))
+    kk, dd = np.meshgrid(strikes, dtes)
+    kk, dd = np.tile(kk.ravel(), 2), np.tile(dd.ravel(), 2)
+    types = np.repeat(["call", "put"], kk.size // 2)
+    log_m = np.log(kk / spot)
+    iv = 0.15 + 0.02 * np.sqrt(dd / 365) - 0.25 * log_m + 0.6 * log_m ** 2
+    mid = engine.black_scholes_array(spot, kk, dd / 365.0, 0.05, iv, types).price
+    return pd.DataFrame({"strike": kk, "dte": dd, "mid_price": mid, "option_type": types})
+
+
+def to_contracts(chain: pd.DataFrame) -> list[OptionContract]:
+    return [
+        OptionContract(
+            strike=k, expiry_days=d, last=p,
+            option_type=OptionType.CALL if t == "call" else OptionType.PUT,
+        )
+        for k, d, p, t in zip(chain["strike"], chain["dte"], chain["mid_price"], chain["option_type"])
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Chain-wide IV / Greeks benchmark")
+    parser.add_argument("--spot", type=float, default=5000.0)
+    parser.add_argument("--strikes", type=int, default=200)
+    parser.add_argument("--expiries", type=int, default=12)
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--include-scalar", action="store_true", help="also time the per-contract solver (slow)")
+    args = parser.parse_args()
+
+    chain = make_chain(args.spot, args.strikes, args.expiries)
+    engine = OptionsPricingEngine()
+    builder = VolatilitySurfaceBuilder(pricing_engine=engine)
+    analyzer = ChainAnalyzer(pricing_engine=engine)
+    strikes = chain["strike"].to_numpy()
+    T = chain["dte"].to_numpy() / 365.0
+    mids = chain["mid_price"].to_numpy()
+    types = chain["option_type"].to_numpy()
+    logger.info("chain: %d contracts", len(chain))
+
+    suite = BenchmarkSuite("options_iv", iterations=args.iterations)
+    suite.add_benchmark(
+        "iv_array", lambda: engine.implied_volatility_array(mids, args.spot, strikes, T, 0.05, types),
+    )
+    suite.add_benchmark(
+        "greeks_array", lambda: engine.black_scholes_array(args.spot, strikes, T, 0.05, 0.2, types),
+    )
+    suite.add_benchmark("build_from_chain", lambda: builder.build_from_chain(chain, args.spot))
+    suite.add_benchmark(
+        "compute_greeks_for_chain",
+        lambda: analyzer.compute_greeks_for_chain(to_contracts(chain), args.spot),
+    )
+    if args.include_scalar:
+        suite.add_benchmark("iv_scalar", lambda: [
+            engine.implied_volatility(p, args.spot, k, t, 0.05, o)
+            for p, k, t, o in zip(mids, strikes, T, types)
+        ])
+
+    for result in suite.run_all():
+        logger.info("%-26s mean %9.2f ms  p95 %9.2f ms", result.name, result.mean_ms, result.p95_ms)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Benchmark the streamed price read path.
+
+Encodes a synthetic daily panel as a binary COPY TO stream and times
+decoding it in network-sized pieces into the preallocated price grid,
+against the legacy path of materializing row tuples and pivoting them
+in pandas.
+
+Usage:
+    python -m scripts.benchmark_price_stream
+    python -m scripts.benchmark_price_stream --tickers 500 --days 2520 --iterations 5
+"""
+
+import argparse
+import logging
+import struct
+
+import numpy as np
+import pandas as pd
+
+from src.services.data_service import (
+    _COPY_ROW,
+    _PG_EPOCH_US,
+    _PgBinaryCopyParser,
+    _PriceGrid,
+    _decode_copy_rows,
+)
+from src.testing.benchmarks import BenchmarkSuite
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+logger = logging.getLogger(__name__)
+
+
+def make_stream(n_tickers: int, n_days: int, seed: int = 0) -> tuple[bytes, list[tuple]]:
+    """Time-ordered binary COPY payload and the equivalent row tuples."""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2015-01-02", periods=n_days, tz="UTC")
+    times = np.repeat(dates.as_unit("us").asi8, n_tickers)
+    ids = np.tile(np.arange(1, n_tickers + 1), n_days)
+    prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, (n_days, n_tickers)), axis=0)).ravel()
+
+    rows = np.empty(len(times), dtype=_COPY_ROW)
+    rows["nfields"], rows["time_len"], rows["id_len"], rows["value_len"] = 3, 8, 4, 8
+    rows["time"], rows["id"], rows["value"] = times - _PG_EPOCH_US, ids, prices
+    payload = b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0) + rows.tobytes() + struct.pack(">h", -1)
+
+    tickers = np.array([f"T{i:04d}" for i in range(1, n_tickers + 1)], dtype=object)
+    tuples = list(zip(pd.to_datetime(times, unit="us", utc=True).to_pydatetime(), tickers[ids - 1], prices.tolist()))
+    return payload, tuples
+
+
+def streamed(payload: bytes, n_tickers: int, n_days: int, piece: int = 65_536) -> pd.DataFrame:
+    parser = _PgBinaryCopyParser()
+    grid = _PriceGrid(list(range(1, n_tickers + 1)), n_days)
+    for start in range(0, len(payload), piece):
+        rows = parser.feed(payload[start:start + piece])
+        if len(rows):
+            grid.add(*_decode_copy_rows([rows]))
+    return grid.frame([f"T{i:04d}" for i in range(1, n_tickers + 1)], drop_empty=True)
+
+
+def legacy(tuples: list[tuple]) -> pd.DataFrame:
+    df = pd.DataFrame(tuples, columns=["time", "ticker", "adj_close"])
+    return df.pivot(index="time", columns="ticker", values="adj_close")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Streamed price read benchmark")
+    parser.add_argument("--tickers", type=int, default=500)
+    parser.add_argument("--days", type=int, default=2520)
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+
+    payload, tuples = make_stream(args.tickers, args.days)
+    check = streamed(payload, args.tickers, args.days)
+    diff = np.nanmax(np.abs(check.to_numpy() - legacy(tuples).to_numpy()))
+    logger.info("%d rows, %.1f MB COPY payload, max |diff| vs pivot %.2e", len(tuples), len(payload) / 1e6, diff)
+
+    suite = BenchmarkSuite("price_stream", iterations=args.iterations)
+    suite.add_benchmark("copy_grid", lambda: streamed(payload, args.tickers, args.days))
+    suite.add_benchmark("tuples_pivot", lambda: legacy(tuples))
+
+    for result in suite.run_all():
+        logger.info("%-26s mean %9.1f ms  p95 %9.1f ms", result.name, result.mean_ms, result.p95_ms)
+
+
+if __name__ == "__main__":
+    main()
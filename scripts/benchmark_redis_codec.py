@@ -0,0 +1,65 @@
+"""Benchmark JSON vs binary DataFrame codecs in RedisCache.
+
+Writes and reads a synthetic close-price panel through RedisCache's
+sync path against an in-process Redis stand-in (fakeredis), once per
+codec, and reports latency and payload size.
+
+Usage:
+    python -m scripts.benchmark_redis_codec
+    python -m scripts.benchmark_redis_codec --tickers 500 --days 504 --iterations 20
+"""
+
+import argparse
+import logging
+
+import numpy as np
+import pandas as pd
+
+from src.cache.redis_client import RedisCache
+from src.testing.benchmarks import BenchmarkSuite
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+logger = logging.getLogger(__name__)
+
+
+def make_panel(n_tickers: int, n_days: int, seed: int = 42) -> pd.DataFrame:
+    """Generate a random-walk close price panel."""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2023-01-02", periods=n_days, name="date")
+    returns = rng.normal(0.0003, 0.02, size=(n_days, n_tickers))
+    prices = np.round(100 * np.cumprod(1 + returns, axis=0), 2)
+    return pd.DataFrame(prices, index=dates, columns=[f"T{i:04d}" for i in range(n_tickers)])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Redis DataFrame codec benchmark")
+    parser.add_argument("--tickers", type=int, default=500)
+    parser.add_argument("--days", type=int, default=504)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    import fakeredis
+
+    panel = make_panel(args.tickers, args.days)
+    server = fakeredis.FakeServer()
+    suite = BenchmarkSuite("redis_codec", iterations=args.iterations)
+
+    for codec, compress in (("json", False), ("binary", False), ("binary", True)):
+        cache = RedisCache(df_codec=codec, compress=compress)
+        cache._sync_client = fakeredis.FakeRedis(server=server)
+        name = f"{codec}+zlib" if compress else codec
+        key = f"axion:bench:{name}"
+
+        suite.add_benchmark(f"{name}_write", lambda c=cache, k=key: c.set_dataframe_sync(k, panel, 300))
+        suite.add_benchmark(f"{name}_read", lambda c=cache, k=key: c.get_dataframe_sync(k))
+
+        cache.set_dataframe_sync(key, panel, 300)
+        size = len(cache._sync_client.get(key))
+        logger.info("%-11s payload: %.2f MB", name, size / 1e6)
+
+    for result in suite.run_all():
+        logger.info("%-18s mean %7.2f ms  p95 %7.2f ms", result.name, result.mean_ms, result.p95_ms)
+
+
+if __name__ == "__main__":
+    main()
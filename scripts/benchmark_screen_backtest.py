@@ -0,0 +1,109 @@
+"""Benchmark ScreenBacktester: per-date dicts vs a MetricsPanel.
+
+Builds a synthetic monthly history for a universe, backtests one screen
+through run() (full run_screen per rebalance date) and run_panel(), then
+backtests a grid of parameter variants with run_panel_batch() against
+the same loaded panel.
+
+Usage:
+    python -m scripts.benchmark_screen_backtest
+    python -m scripts.benchmark_screen_backtest --symbols 3000 --years 15 --variants 200
+"""
+
+import argparse
+import logging
+
+import numpy as np
+import pandas as pd
+
+from src.screener import (
+    CustomFormula, FilterCondition, Operator, Screen, ScreenBacktestConfig, ScreenBacktester,
+)
+from src.screener.backtest import MetricsPanel
+from src.testing.benchmarks import BenchmarkSuite
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+logger = logging.getLogger(__name__)
+
+METRICS = ["pe_ratio", "pb_ratio", "roe", "dividend_yield", "revenue_growth", "market_cap"]
+
+
+def make_panel(n_symbols: int, years: int, seed: int = 42) -> MetricsPanel:
+    """Random-walk prices and metrics at month ends."""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range("2010-01-31", periods=years * 12, freq="ME")
+    symbols = [f"S{i:05d}" for i in range(n_symbols)]
+    shape = (len(dates), n_symbols)
+    frames = {
+        "price": pd.DataFrame(50 * np.exp(np.cumsum(rng.normal(0.005, 0.08, shape), axis=0)), dates, symbols),
+        "pe_ratio": pd.DataFrame(rng.uniform(3, 60, shape), dates, symbols),
+        "pb_ratio": pd.DataFrame(rng.uniform(0.3, 15, shape), dates, symbols),
+        "roe": pd.DataFrame(rng.normal(15, 10, shape), dates, symbols),
+        "dividend_yield": pd.DataFrame(rng.uniform(0, 6, shape), dates, symbols),
+        "revenue_growth": pd.DataFrame(rng.normal(0.08, 0.1, shape), dates, symbols),
+        "market_cap": pd.DataFrame(rng.uniform(3e8, 5e11, shape), dates, symbols),
+    }
+    return MetricsPanel(frames)
+
+
+def to_historical(panel: MetricsPanel) -> dict:
+    """Per-date symbol -> metrics dicts, the input run() expects."""
+    stacked = {name: panel.get(name).to_numpy() for name in panel.metrics}
+    return {
+        d.date(): {
+            symbol: {name: float(stacked[name][t, j]) for name in panel.metrics}
+            for j, symbol in enumerate(panel.symbols)
+        }
+        for t, d in enumerate(panel.dates)
+    }
+
+
+def make_variants(n: int) -> list[Screen]:
+    """Value screens over a grid of P/E and ROE thresholds."""
+    grid = np.linspace(8, 30, max(int(np.sqrt(n)), 1))
+    screens = []
+    for pe in grid:
+        for roe in np.linspace(5, 25, max(n // len(grid), 1)):
+            screens.append(Screen(
+                name=f"pe<{pe:.1f},roe>{roe:.1f}",
+                filters=[FilterCondition(filter_id="pe_ratio", operator=Operator.LT, value=float(pe))],
+                custom_formulas=[CustomFormula(expression=f"roe > {roe:.2f} and dividend_yield > 1")],
+            ))
+    return screens[:n]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Screen backtest benchmark")
+    parser.add_argument("--symbols", type=int, default=3000)
+    parser.add_argument("--years", type=int, default=15)
+    parser.add_argument("--variants", type=int, default=200)
+    parser.add_argument("--skip-dict", action="store_true", help="skip the slow per-date dict backtest")
+    args = parser.parse_args()
+    logging.getLogger("src.screener").setLevel(logging.WARNING)
+
+    panel = make_panel(args.symbols, args.years)
+    screens = make_variants(args.variants)
+    config = ScreenBacktestConfig(max_positions=30)
+    backtester = ScreenBacktester()
+
+    suite = BenchmarkSuite("screen_backtest", iterations=1)
+    if not args.skip_dict:
+        historical = to_historical(panel)
+        suite.add_benchmark("dict_single", lambda: backtester.run(screens[0], historical, config))
+    suite.add_benchmark("panel_single", lambda: backtester.run_panel(screens[0], panel, config))
+    suite.add_benchmark(
+        f"panel_batch_x{len(screens)}", lambda: backtester.run_panel_batch(screens, panel, config),
+    )
+
+    if not args.skip_dict:
+        expected = backtester.run(screens[0], historical, config)
+        actual = backtester.run_panel(screens[0], panel, config)
+        logger.info(
+            "total return dict %.4f%% panel %.4f%%", expected.total_return, actual.total_return,
+        )
+    for result in suite.run_all():
+        logger.info("%-22s %10.1f ms", result.name, result.mean_ms)
+
+
+if __name__ == "__main__":
+    main()
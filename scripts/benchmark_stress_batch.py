@@ -0,0 +1,75 @@
+"""Benchmark batched historical stress tests across many accounts.
+
+Builds a synthetic price history and a few thousand random account
+books, then times the per-account scenario loop against a single
+run_historical_batch sweep over the cached scenario shock matrix.
+
+Usage:
+    python -m scripts.benchmark_stress_batch
+    python -m scripts.benchmark_stress_batch --accounts 5000 --symbols 2000 --holdings 50 --include-loop
+"""
+
+import argparse
+import logging
+
+import numpy as np
+import pandas as pd
+
+from src.risk.stress_test import StressTestEngine
+from src.testing.benchmarks import BenchmarkSuite
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+logger = logging.getLogger(__name__)
+
+
+def make_engine(n_symbols: int, seed: int = 0) -> StressTestEngine:
+    """Random-walk prices from 2000 through 2023 plus a benchmark."""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2000-01-03", "2023-12-29")
+    prices = pd.DataFrame(
+        100 * np.cumprod(1 + rng.normal(0, 0.015, (len(dates), n_symbols)), axis=0),
+        index=dates, columns=[f"S{i:04d}" for i in range(n_symbols)],
+    )
+    benchmark = pd.Series(100 * np.cumprod(1 + rng.normal(0, 0.01, len(dates))), index=dates)
+    return StressTestEngine(historical_data=prices, benchmark_data=benchmark)
+
+
+def make_accounts(symbols: list[str], n_accounts: int, holdings: int, seed: int = 1) -> dict[str, list[dict]]:
+    rng = np.random.default_rng(seed)
+    return {
+        f"ACCT{k:05d}": [
+            {"symbol": symbols[i], "weight": w}
+            for i, w in zip(rng.choice(len(symbols), holdings, replace=False), rng.dirichlet(np.ones(holdings)))
+        ]
+        for k in range(n_accounts)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batched stress test benchmark")
+    parser.add_argument("--accounts", type=int, default=3000)
+    parser.add_argument("--symbols", type=int, default=1500)
+    parser.add_argument("--holdings", type=int, default=50)
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--include-loop", action="store_true", help="also time the per-account loop (slow)")
+    args = parser.parse_args()
+
+    engine = make_engine(args.symbols)
+    accounts = make_accounts(list(engine.historical_returns.columns), args.accounts, args.holdings)
+    weights = engine.positions_to_weights(accounts)
+    logger.info("%d accounts x %d symbols", *weights.shape)
+
+    suite = BenchmarkSuite("stress_batch", iterations=args.iterations)
+    suite.add_benchmark("positions_to_weights", lambda: engine.positions_to_weights(accounts))
+    suite.add_benchmark("run_historical_batch", lambda: engine.run_historical_batch(weights))
+    if args.include_loop:
+        suite.add_benchmark("per_account_loop", lambda: [
+            engine.run_historical_tests(positions, 1_000_000) for positions in accounts.values()
+        ])
+
+    for result in suite.run_all():
+        logger.info("%-26s mean %9.1f ms  p95 %9.1f ms", result.name, result.mean_ms, result.p95_ms)
+
+
+if __name__ == "__main__":
+    main()
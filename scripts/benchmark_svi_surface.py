@@ -0,0 +1,107 @@
+"""Benchmark intraday surface refreshes with SVISurfaceEngine.
+
+Generates a universe of option chains priced off per-expiry SVI smiles,
+then times repeated refresh cycles in which a fraction of the expiries
+re-quote (and optionally spot moves), against the single global SVI fit
+of VolatilitySurfaceBuilder.build_from_chain.
+
+Usage:
+    python -m scripts.benchmark_svi_surface
+    python -m scripts.benchmark_svi_surface --underlyings 200 --strikes 60 --expiries 12 --changed 0.25 --workers 0
+"""
+
+import argparse
+import logging
+
+import numpy as np
+import pandas as pd
+
+from src.options.config import VolatilityConfig
+from src.options.pricing import OptionsPricingEngine
+from src.options.volatility import SVISurfaceEngine, VolatilitySurfaceBuilder
+from src.testing.benchmarks import BenchmarkSuite
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+logger = logging.getLogger(__name__)
+
+ENGINE = OptionsPricingEngine()
+
+
+def make_chain(spot: float, n_strikes: int, n_expiries: int, seed: int) -> pd.DataFrame:
+    """OTM calls and puts priced off SVI slices with a rising term structure."""
+    rng = np.random.default_rng(seed)
+    strikes = np.linspace(0.75 * spot, 1.25 * spot, n_strikes)
+    frames = []
+    for dte in np.unique(np.geomspace(7, 365, n_expiries).astype(int)):
+        t = dte / 365.0
+        k = np.log(strikes / spot)
+        a = (0.03 + 0.01 * rng.random()) * t
+        b, rho, m, sigma = 0.1 * np.sqrt(t) + 0.02, -0.6 + 0.2 * rng.random(), 0.01, 0.1 + 0.05 * t
+        iv = np.sqrt((a + b * (rho * (k - m) + np.sqrt((k - m) ** 2 + sigma ** 2))) / t)
+        types = np.where(strikes < spot, "put", "call")
+        mid = ENGINE.black_scholes_array(spot, strikes, t, 0.05, iv, types).price
+        frames.append(pd.DataFrame({"strike": strikes, "dte": dte, "mid_price": mid, "option_type": types}))
+    return pd.concat(frames, ignore_index=True)
+
+
+def requote(chain: pd.DataFrame, fraction: float, rng: np.random.Generator) -> pd.DataFrame:
+    """Move the mids of a random subset of expiries by up to +-2%."""
+    chain = chain.copy()
+    expiries = chain["dte"].unique()
+    moved = rng.choice(expiries, size=max(1, int(len(expiries) * fraction)), replace=False)
+    rows = chain["dte"].isin(moved)
+    chain.loc[rows, "mid_price"] *= 1 + rng.uniform(-0.02, 0.02)
+    return chain
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incremental SVI surface benchmark")
+    parser.add_argument("--underlyings", type=int, default=200)
+    parser.add_argument("--strikes", type=int, default=60)
+    parser.add_argument("--expiries", type=int, default=12)
+    parser.add_argument("--changed", type=float, default=0.25, help="fraction of expiries re-quoted per cycle")
+    parser.add_argument("--workers", type=int, default=1, help="slice-fit processes (0 = all cores)")
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--include-builder", action="store_true", help="also time build_from_chain per underlying")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    chains = {
+        f"U{i:03d}": (make_chain(100.0, args.strikes, args.expiries, seed=i), 100.0)
+        for i in range(args.underlyings)
+    }
+    n_contracts = sum(len(c) for c, _ in chains.values())
+    logger.info("%d underlyings, %d contracts", len(chains), n_contracts)
+
+    config = VolatilityConfig(svi_workers=args.workers)
+    with SVISurfaceEngine(config) as engine:
+        def cold():
+            engine.invalidate()
+            engine.update_many(chains)
+
+        # Pre-generate one set of re-quoted chains per refresh cycle
+        cycles = iter([
+            {s: (requote(c, args.changed, rng), spot) for s, (c, spot) in chains.items()}
+            for _ in range(args.iterations)
+        ])
+
+        def refresh():
+            engine.update_many(next(cycles))
+
+        cold()
+        suite = BenchmarkSuite("svi_surface", iterations=args.iterations)
+        suite.add_benchmark("cold_full_fit", cold)
+        suite.add_benchmark(f"refresh_{args.changed:.0%}_changed", refresh)
+        if args.include_builder:
+            builder = VolatilitySurfaceBuilder(config)
+            suite.add_benchmark(
+                "build_from_chain_all",
+                lambda: [builder.build_from_chain(c, spot) for c, spot in chains.values()],
+            )
+        for result in suite.run_all():
+            logger.info("%-26s mean %9.1f ms  p95 %9.1f ms", result.name, result.mean_ms, result.p95_ms)
+        logger.info("engine stats: %s", engine.stats)
+
+
+if __name__ == "__main__":
+    main()
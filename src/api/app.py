@@ -60,9 +60,12 @@ async def lifespan(app: FastAPI):
         pass
 
     logger.info("Axion API starting up")
+    backtest_jobs = backtesting.get_job_manager()
+    backtest_jobs.start()
     yield
     # ── Shutdown ──
     logger.info("Axion API shutting down")
+    await backtest_jobs.shutdown()
 
 
 # ── App Factory ──────────────────────────────────────────────────────
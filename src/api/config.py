@@ -20,6 +20,7 @@ class WebSocketChannel(str, Enum):
     ALERTS = "alerts"
     SIGNALS = "signals"
     ORDERS = "orders"
+    BACKTESTS = "backtests"
 
 
 class WebhookEvent(str, Enum):
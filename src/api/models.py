@@ -423,7 +423,10 @@ class BacktestResponse(BaseModel):
     profit_factor: float = 0.0
     start_date: date = Field(default_factory=date.today)
     end_date: date = Field(default_factory=date.today)
-    status: str = "completed"
+    status: str = "completed"  # queued, running, completed, failed, cancelled
+    progress: float = 0.0
+    queue_position: Optional[int] = None
+    error: Optional[str] = None
 
 
 # ─── WebSocket ───────────────────────────────────────────────────────────
@@ -1,62 +1,197 @@
 """Backtesting API Routes.
 
-Endpoints for running backtests and retrieving results.
+Endpoints for queueing backtests and retrieving results. Runs execute
+asynchronously in the BacktestJobManager process pool; progress and
+partial equity curves stream over ``/backtest/{id}/stream``.
 """
 
+import asyncio
 import logging
-import secrets
-from datetime import date
+import uuid
+from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect
 
+from src.api.config import WebSocketChannel
 from src.api.dependencies import AuthContext, check_rate_limit, require_scope
 from src.api.models import (
     BacktestRequest,
     BacktestResponse,
 )
+from src.api.websocket import WebSocketManager
+from src.backtesting.jobs import (
+    BacktestJob,
+    BacktestJobManager,
+    BacktestJobSpec,
+    JobQueueFullError,
+    JobStatus,
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/backtest", tags=["Backtesting"])
 
-# In-memory store
-_backtests: dict[str, BacktestResponse] = {}
+_CHANNEL = WebSocketChannel.BACKTESTS.value
+
+# Progress subscribers: one WebSocketManager subscription per (connection, job)
+_ws_manager = WebSocketManager()
+_sockets: dict[str, WebSocket] = {}
+_job_manager: Optional[BacktestJobManager] = None
+
+
+async def _publish(job_id: str, payload: dict) -> None:
+    """Send a job event to every socket subscribed to it, concurrently."""
+    sends = []
+    for delivery in _ws_manager.broadcast(_CHANNEL, payload, symbol=job_id):
+        websocket = _sockets.get(delivery["connection_id"])
+        if websocket is not None:
+            sends.append(_send(delivery["connection_id"], websocket, delivery["message"]))
+    await asyncio.gather(*sends)
+
+
+async def _send(connection_id: str, websocket: WebSocket, message: str) -> None:
+    """Deliver one message; a failing socket is dropped without affecting the others."""
+    try:
+        await websocket.send_text(message)
+    except Exception:
+        _drop_socket(connection_id)
+
+
+def _drop_socket(connection_id: str) -> None:
+    _sockets.pop(connection_id, None)
+    _ws_manager.disconnect(connection_id)
+
+
+def get_job_manager() -> BacktestJobManager:
+    """Return (or create) the global BacktestJobManager."""
+    global _job_manager
+    if _job_manager is None:
+        _job_manager = BacktestJobManager(publish=_publish)
+    return _job_manager
+
+
+def _owned_job(backtest_id: str, auth: AuthContext) -> BacktestJob:
+    job = get_job_manager().get_job(backtest_id)
+    if job is None or (auth.authenticated and job.tenant_id != auth.user_id):
+        raise HTTPException(status_code=404, detail=f"Backtest not found: {backtest_id}")
+    return job
+
+
+def _to_response(job: BacktestJob) -> BacktestResponse:
+    metrics = job.metrics
+    return BacktestResponse(
+        backtest_id=job.job_id,
+        strategy=job.spec.strategy,
+        total_return=metrics.get("total_return", 0.0),
+        cagr=metrics.get("cagr", 0.0),
+        sharpe_ratio=metrics.get("sharpe_ratio", 0.0),
+        max_drawdown=metrics.get("max_drawdown", 0.0),
+        total_trades=metrics.get("total_trades", 0),
+        win_rate=metrics.get("win_rate", 0.0),
+        profit_factor=metrics.get("profit_factor", 0.0),
+        start_date=job.spec.start_date,
+        end_date=job.spec.end_date,
+        status=job.status.value,
+        progress=job.progress,
+        queue_position=get_job_manager().queue_position(job.job_id),
+        error=job.error,
+    )
 
 
 @router.post("", response_model=BacktestResponse, status_code=201)
 async def run_backtest(request: BacktestRequest, auth: AuthContext = Depends(require_scope("write"))) -> BacktestResponse:
-    """Run a backtest."""
-    backtest_id = secrets.token_hex(8)
-
-    result = BacktestResponse(
-        backtest_id=backtest_id,
+    """Queue a backtest; returns immediately with its id and queue status."""
+    spec = BacktestJobSpec(
         strategy=request.strategy,
         start_date=request.start_date,
         end_date=request.end_date,
-        status="completed",
+        initial_capital=request.initial_capital,
+        symbols=[s.upper() for s in request.symbols],
+        rebalance_frequency=request.rebalance_frequency,
+        params=request.params,
     )
-
-    _backtests[backtest_id] = result
-    return result
+    try:
+        job = get_job_manager().submit(auth.user_id, spec)
+    except JobQueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e)) from e
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    return _to_response(job)
 
 
 @router.get("/{backtest_id}", response_model=BacktestResponse)
 async def get_backtest(backtest_id: str, auth: AuthContext = Depends(check_rate_limit)) -> BacktestResponse:
-    """Get backtest results."""
-    result = _backtests.get(backtest_id)
-    if not result:
-        raise HTTPException(status_code=404, detail=f"Backtest not found: {backtest_id}")
-    return result
+    """Get backtest status and, once completed, summary metrics."""
+    return _to_response(_owned_job(backtest_id, auth))
+
+
+@router.delete("/{backtest_id}", response_model=BacktestResponse)
+async def cancel_backtest(backtest_id: str, auth: AuthContext = Depends(require_scope("write"))) -> BacktestResponse:
+    """Cancel a backtest that has not started yet."""
+    job = _owned_job(backtest_id, auth)
+    if job.status != JobStatus.QUEUED:
+        raise HTTPException(status_code=409, detail=f"Backtest is {job.status.value}")
+    return _to_response(await get_job_manager().cancel(backtest_id))
 
 
 @router.get("/{backtest_id}/tearsheet")
 async def get_tearsheet(backtest_id: str, auth: AuthContext = Depends(check_rate_limit)) -> dict:
     """Get backtest tear sheet."""
-    result = _backtests.get(backtest_id)
-    if not result:
-        raise HTTPException(status_code=404, detail=f"Backtest not found: {backtest_id}")
+    job = _owned_job(backtest_id, auth)
+    result = get_job_manager().get_result(backtest_id)
+    if result is None:
+        raise HTTPException(status_code=409, detail=f"Backtest is {job.status.value}")
 
     return {
         "backtest_id": backtest_id,
-        "strategy": result.strategy,
-        "tearsheet": "Tear sheet data not available in demo.",
+        "strategy": job.spec.strategy,
+        "metrics": result["metrics"],
+        "equity_curve": result["equity_curve"],
+        "total_trades": result["n_trades"],
+        "terminated_early": result["terminated_early"],
     }
+
+
+@router.websocket("/{backtest_id}/stream")
+async def stream_backtest(websocket: WebSocket, backtest_id: str) -> None:
+    """Stream status, progress and partial equity points for one backtest.
+
+    Sends the current state (including the equity curve so far) on
+    connect, then each event until the job finishes.
+    """
+    from src.api.dependencies import _auth_required, get_key_manager
+
+    user_id = websocket.query_params.get("user_id", "anonymous")
+    if _auth_required():
+        metadata = get_key_manager().validate_key(websocket.query_params.get("token", ""))
+        if metadata is None:
+            await websocket.close(code=4001, reason="Invalid or missing token")
+            return
+        user_id = metadata.get("user_id", "anonymous")
+
+    job = get_job_manager().get_job(backtest_id)
+    if job is None or (_auth_required() and job.tenant_id != user_id):
+        await websocket.close(code=4004, reason="Backtest not found")
+        return
+
+    await websocket.accept()
+    conn_id = uuid.uuid4().hex[:16]
+    ok, msg = _ws_manager.connect(conn_id, user_id)
+    if not ok:
+        await websocket.send_json({"error": msg})
+        await websocket.close()
+        return
+    _ws_manager.subscribe(conn_id, _CHANNEL, [backtest_id])
+    _sockets[conn_id] = websocket
+
+    try:
+        await websocket.send_json({"channel": _CHANNEL, "event": "snapshot", **job.to_dict(include_curve=True)})
+        if job.done:
+            await websocket.close()
+            return
+        while True:
+            await websocket.receive_text()
+            _ws_manager.heartbeat(conn_id)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        _drop_socket(conn_id)
@@ -4,6 +4,7 @@ A comprehensive event-driven backtesting framework with:
 - Multi-timeframe support (minute to monthly)
 - Realistic execution modeling (slippage, commissions, market impact)
 - Walk-forward optimization to prevent overfitting
+- Adaptive parameter search (successive halving, Bayesian)
 - Monte Carlo analysis for statistical significance
 - Strategy comparison framework with proper benchmarking
 - Visual reporting with tear sheets and trade analysis
@@ -46,11 +47,15 @@ from src.backtesting.config import (
     DEFAULT_RISK,
     DEFAULT_WALK_FORWARD,
     DEFAULT_MONTE_CARLO,
+    BacktestJobConfig,
+    DEFAULT_BACKTEST_JOBS,
 )
 
 from src.backtesting.models import (
     BarData,
     MarketEvent,
+    ArrayMarketEvent,
+    OHLCVPanel,
     Signal,
     Order,
     Fill,
@@ -89,11 +94,32 @@ from src.backtesting.optimization import (
     MonteCarloAnalyzer,
 )
 
+from src.backtesting.search import (
+    ParameterGrid,
+    SuccessiveHalvingSearch,
+    BayesianSearch,
+)
+
 from src.backtesting.reporting import (
     TearSheetGenerator,
     StrategyComparator,
 )
 
+from src.backtesting.strategies import (
+    EqualWeightStrategy,
+    MomentumStrategy,
+)
+
+from src.backtesting.jobs import (
+    BacktestJob,
+    BacktestJobManager,
+    BacktestJobSpec,
+    BacktestResultStore,
+    JobQueueFullError,
+    JobStatus,
+    register_strategy,
+)
+
 __all__ = [
     # Config
     "BacktestConfig",
@@ -111,9 +137,13 @@ __all__ = [
     "DEFAULT_RISK",
     "DEFAULT_WALK_FORWARD",
     "DEFAULT_MONTE_CARLO",
+    "BacktestJobConfig",
+    "DEFAULT_BACKTEST_JOBS",
     # Models
     "BarData",
     "MarketEvent",
+    "ArrayMarketEvent",
+    "OHLCVPanel",
     "Signal",
     "Order",
     "Fill",
@@ -142,7 +172,22 @@ __all__ = [
     # Optimization
     "WalkForwardOptimizer",
     "MonteCarloAnalyzer",
+    # Search
+    "ParameterGrid",
+    "SuccessiveHalvingSearch",
+    "BayesianSearch",
     # Reporting
     "TearSheetGenerator",
     "StrategyComparator",
+    # Strategies
+    "EqualWeightStrategy",
+    "MomentumStrategy",
+    # Jobs
+    "BacktestJob",
+    "BacktestJobManager",
+    "BacktestJobSpec",
+    "BacktestResultStore",
+    "JobQueueFullError",
+    "JobStatus",
+    "register_strategy",
 ]
@@ -123,6 +123,10 @@ class BacktestConfig:
     adjust_for_splits: bool = True
     adjust_for_dividends: bool = True
     survivorship_bias_free: bool = True
+    columnar_streaming: bool = False  # Stream preloaded NumPy rows instead of per-bar objects
+
+    # Abort the run once drawdown falls below this level (None = run to the end)
+    early_stop_drawdown: Optional[float] = None
 
     # Benchmark
     benchmark: str = "SPY"
@@ -139,6 +143,16 @@ class WalkForwardConfig:
     in_sample_pct: float = 0.70  # 70% in-sample, 30% OOS
     optimization_metric: str = "sharpe"  # sharpe, cagr, sortino
     min_trades_per_window: int = 10
+    n_workers: int = 1  # Worker processes for parallel search (1 = serial, 0 = all cores)
+    parallel_windows: bool = False  # Fan out whole windows instead of grid combinations
+
+    # Search strategy: grid (exhaustive), halving (successive halving), bayesian (GP surrogate)
+    search_method: str = "grid"
+    halving_eta: int = 3  # Keep the best 1/eta candidates per rung
+    halving_min_fraction: float = 0.25  # Share of in-sample data used by the first rung
+    bayesian_n_trials: int = 50  # Total backtests per window
+    bayesian_n_initial: int = 10  # Random evaluations before the surrogate takes over
+    early_stop_drawdown: Optional[float] = None  # Abort in-sample runs below this drawdown (e.g. -0.30)
 
 
 @dataclass
@@ -149,6 +163,20 @@ class MonteCarloConfig:
     confidence_level: float = 0.95
     bootstrap_block_size: int = 1  # For block bootstrap
     random_strategy_tests: int = 1000  # For significance testing
+    vectorized: bool = True  # Batched NumPy resampling instead of one pandas series per sample
+    max_batch_elements: int = 4_000_000  # Cap on (resamples x length) per batch to bound memory
+
+
+@dataclass
+class BacktestJobConfig:
+    """Asynchronous backtest job queue configuration."""
+
+    max_workers: int = 0  # Process pool size (0 = all cores)
+    max_running_per_tenant: int = 2  # Concurrent jobs one tenant may occupy
+    max_queued_per_tenant: int = 20  # Waiting jobs per tenant before submissions are refused
+    progress_every_bars: int = 21  # Bars between progress / partial equity updates
+    results_dir: Optional[str] = None  # Persisted results (None = <tempdir>/axion_backtests)
+    max_results_in_memory: int = 64  # LRU of completed results kept in-process
 
 
 # Default configurations
@@ -158,3 +186,4 @@ DEFAULT_RISK = RiskConfig()
 DEFAULT_BACKTEST = BacktestConfig()
 DEFAULT_WALK_FORWARD = WalkForwardConfig()
 DEFAULT_MONTE_CARLO = MonteCarloConfig()
+DEFAULT_BACKTEST_JOBS = BacktestJobConfig()
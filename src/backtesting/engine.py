@@ -6,7 +6,7 @@ risk management, and comprehensive performance analysis.
 
 import logging
 from datetime import datetime, timedelta
-from typing import Optional, Protocol, Iterator
+from typing import Callable, Optional, Protocol, Iterator
 import numpy as np
 import pandas as pd
 
@@ -14,7 +14,7 @@ from src.backtesting.config import (
     BacktestConfig, DEFAULT_BACKTEST, RebalanceFrequency,
 )
 from src.backtesting.models import (
-    BarData, MarketEvent, Signal, Order, Fill, BacktestResult,
+    BarData, MarketEvent, ArrayMarketEvent, OHLCVPanel, Signal, Order, Fill, BacktestResult,
     BacktestMetrics, OrderSide, OrderType,
 )
 from src.backtesting.execution import SimulatedBroker, CostModel
@@ -155,6 +155,14 @@ class HistoricalDataHandler:
         self._symbols = list(data.columns)
         self._current_idx = 0
 
+    def n_bars(self) -> int:
+        """Number of timestamps inside the configured date range."""
+        if self._data is None or self._data.empty:
+            return 0
+        start = pd.Timestamp(self.config.start_date)
+        end = pd.Timestamp(self.config.end_date)
+        return len(self._data.loc[start:end])
+
     def stream_bars(self) -> Iterator[MarketEvent]:
         """Stream market events chronologically.
 
@@ -188,46 +196,168 @@ class HistoricalDataHandler:
             if bars:
                 yield MarketEvent(timestamp=timestamp, bars=bars)
 
-    def stream_ohlcv_bars(
-        self,
-        ohlcv_data: dict[str, pd.DataFrame],
-    ) -> Iterator[MarketEvent]:
-        """Stream OHLCV data for multiple symbols.
+    def price_matrix(self) -> tuple[pd.DatetimeIndex, np.ndarray, np.ndarray]:
+        """Preload the in-range price matrix as contiguous arrays.
+
+        Returns:
+            Tuple of (timestamps, prices, valid) where prices is a
+            C-contiguous float64 array of shape (n_bars, n_symbols) and
+            valid marks finite, positive prices.
+        """
+        if self._data is None or self._data.empty:
+            return pd.DatetimeIndex([]), np.empty((0, 0)), np.empty((0, 0), dtype=bool)
+
+        start = pd.Timestamp(self.config.start_date)
+        end = pd.Timestamp(self.config.end_date)
+        data = self._data.loc[start:end]
+
+        prices = np.ascontiguousarray(data.to_numpy(dtype=np.float64))
+        with np.errstate(invalid="ignore"):
+            valid = np.isfinite(prices) & (prices > 0)
+
+        return data.index, prices, valid
+
+    def stream_arrays(self) -> Iterator[ArrayMarketEvent]:
+        """Stream columnar market events chronologically.
+
+        Same bars as stream_bars(), but each event holds row views into
+        the preloaded price matrix instead of per-symbol BarData objects.
+
+        Yields:
+            ArrayMarketEvent for each bar/timestamp with at least one price.
+        """
+        timestamps, prices, valid = self.price_matrix()
+        if len(timestamps) == 0:
+            return
+
+        symbol_index = {symbol: i for i, symbol in enumerate(self._symbols)}
+        has_bars = valid.any(axis=1)
+
+        for i in np.flatnonzero(has_bars):
+            yield ArrayMarketEvent(
+                timestamp=timestamps[i],
+                symbols=self._symbols,
+                symbol_index=symbol_index,
+                close=prices[i],
+                valid=valid[i],
+            )
+
+    def align_ohlcv(self, ohlcv_data: dict[str, pd.DataFrame]) -> OHLCVPanel:
+        """Align per-symbol OHLCV frames onto one shared timestamp axis.
+
+        Each frame is reindexed once into a (timestamp x symbol x field)
+        array; cells without a bar are NaN and masked out in ``valid``.
+        Missing open/high/low fall back to close, missing volume to the
+        1,000,000 default.
 
         Args:
             ohlcv_data: Dict of symbol -> DataFrame with OHLCV columns.
 
-        Yields:
-            MarketEvent for each timestamp.
+        Returns:
+            OHLCVPanel restricted to the configured date range.
         """
-        # Collect all timestamps
-        all_timestamps = set()
-        for df in ohlcv_data.values():
-            all_timestamps.update(df.index)
+        symbols = list(ohlcv_data.keys())
+        indexes = [df.index for df in ohlcv_data.values() if len(df) > 0]
+        if not indexes:
+            return OHLCVPanel(
+                timestamps=pd.DatetimeIndex([]),
+                symbols=symbols,
+                values=np.empty((0, len(symbols), len(OHLCVPanel.FIELDS))),
+                valid=np.empty((0, len(symbols)), dtype=bool),
+            )
+
+        timestamps = indexes[0]
+        for idx in indexes[1:]:
+            timestamps = timestamps.union(idx)
+        timestamps = timestamps.unique().sort_values()
 
-        # Sort and filter
-        timestamps = sorted(all_timestamps)
         start = pd.Timestamp(self.config.start_date)
         end = pd.Timestamp(self.config.end_date)
-        timestamps = [t for t in timestamps if start <= t <= end]
+        timestamps = timestamps[(timestamps >= start) & (timestamps <= end)]
+
+        n_fields = len(OHLCVPanel.FIELDS)
+        values = np.full((len(timestamps), len(symbols), n_fields), np.nan)
+        valid = np.zeros((len(timestamps), len(symbols)), dtype=bool)
+
+        for j, df in enumerate(ohlcv_data.values()):
+            if len(df) == 0:
+                continue
+            df = df[~df.index.duplicated(keep="last")]
+            rows = timestamps.get_indexer(df.index)
+            present = rows >= 0
+            rows = rows[present]
+
+            close = self._ohlcv_column(df, "close")
+            if close is None:
+                close = np.zeros(len(df))
+            for k, name in enumerate(OHLCVPanel.FIELDS):
+                col = self._ohlcv_column(df, name)
+                if col is None:
+                    col = np.full(len(df), 1_000_000.0) if name == "volume" else close
+                values[rows, j, k] = col[present]
+            valid[rows, j] = True
+
+        volume = values[:, :, OHLCVPanel.FIELDS.index("volume")]
+        volume[np.isnan(volume) & valid] = 1_000_000.0
+
+        return OHLCVPanel(timestamps=timestamps, symbols=symbols, values=values, valid=valid)
+
+    @staticmethod
+    def _ohlcv_column(df: pd.DataFrame, name: str) -> Optional[np.ndarray]:
+        """Get an OHLCV column as float64, accepting Title or lower case."""
+        for col in (name.capitalize(), name):
+            if col in df.columns:
+                return df[col].to_numpy(dtype=np.float64)
+        return None
+
+    def stream_ohlcv_arrays(
+        self,
+        ohlcv_data: dict[str, pd.DataFrame] | OHLCVPanel,
+    ) -> Iterator[ArrayMarketEvent]:
+        """Stream OHLCV data as columnar events over an aligned panel.
 
-        for timestamp in timestamps:
-            bars = {}
-            for symbol, df in ohlcv_data.items():
-                if timestamp in df.index:
-                    row = df.loc[timestamp]
-                    bars[symbol] = BarData(
-                        symbol=symbol,
-                        timestamp=timestamp,
-                        open=row.get("Open", row.get("open", row.get("Close", 0))),
-                        high=row.get("High", row.get("high", row.get("Close", 0))),
-                        low=row.get("Low", row.get("low", row.get("Close", 0))),
-                        close=row.get("Close", row.get("close", 0)),
-                        volume=int(row.get("Volume", row.get("volume", 1_000_000))),
-                    )
+        Args:
+            ohlcv_data: Dict of symbol -> OHLCV DataFrame, or a panel
+                previously built with align_ohlcv().
 
-            if bars:
-                yield MarketEvent(timestamp=timestamp, bars=bars)
+        Yields:
+            ArrayMarketEvent for each timestamp with at least one bar.
+        """
+        panel = ohlcv_data if isinstance(ohlcv_data, OHLCVPanel) else self.align_ohlcv(ohlcv_data)
+        if len(panel) == 0:
+            return
+
+        symbol_index = {symbol: j for j, symbol in enumerate(panel.symbols)}
+        fields = {name: panel.get_field(name) for name in OHLCVPanel.FIELDS}
+
+        for i in np.flatnonzero(panel.valid.any(axis=1)):
+            yield ArrayMarketEvent(
+                timestamp=panel.timestamps[i],
+                symbols=panel.symbols,
+                symbol_index=symbol_index,
+                close=fields["close"][i],
+                valid=panel.valid[i],
+                open=fields["open"][i],
+                high=fields["high"][i],
+                low=fields["low"][i],
+                volume=fields["volume"][i],
+            )
+
+    def stream_ohlcv_bars(
+        self,
+        ohlcv_data: dict[str, pd.DataFrame] | OHLCVPanel,
+    ) -> Iterator[MarketEvent]:
+        """Stream OHLCV data for multiple symbols.
+
+        Args:
+            ohlcv_data: Dict of symbol -> DataFrame with OHLCV columns,
+                or a panel previously built with align_ohlcv().
+
+        Yields:
+            MarketEvent for each timestamp.
+        """
+        for event in self.stream_ohlcv_arrays(ohlcv_data):
+            yield MarketEvent(timestamp=event.timestamp, bars=event.bars)
 
 
 class BacktestEngine:
@@ -273,11 +403,19 @@ class BacktestEngine:
         self.data_handler.load_data(price_data)
         self._benchmark_prices = benchmark
 
-    def run(self, strategy: Strategy) -> BacktestResult:
+    def run(
+        self,
+        strategy: Strategy,
+        progress: Optional[Callable[[int, int], None]] = None,
+        progress_every: int = 21,
+    ) -> BacktestResult:
         """Run backtest with given strategy.
 
         Args:
             strategy: Strategy implementing on_bar method.
+            progress: Called as ``progress(bars_done, total_bars)`` every
+                ``progress_every`` bars and once at the end.
+            progress_every: Bars between progress calls.
 
         Returns:
             BacktestResult with all performance data.
@@ -291,11 +429,35 @@ class BacktestEngine:
         self._last_rebalance = None
 
         # Main event loop
-        for event in self.data_handler.stream_bars():
+        if self.config.columnar_streaming:
+            events = self.data_handler.stream_arrays()
+        else:
+            events = self.data_handler.stream_bars()
+
+        terminated_early = False
+        stop_drawdown = self.config.early_stop_drawdown
+        total_bars = self.data_handler.n_bars() if progress else 0
+        bars_done = 0
+        for event in events:
             self._process_event(event, strategy)
+            bars_done += 1
+            if progress and bars_done % progress_every == 0:
+                progress(bars_done, total_bars)
+
+            if stop_drawdown is not None and self.portfolio.drawdown <= stop_drawdown:
+                logger.info(
+                    f"Backtest stopped early at {event.timestamp}: "
+                    f"drawdown {self.portfolio.drawdown:.1%}"
+                )
+                terminated_early = True
+                break
+
+        if progress and bars_done % progress_every:
+            progress(bars_done, total_bars)
 
         # Compile results
         result = self._compile_results()
+        result.terminated_early = terminated_early
 
         logger.info(
             f"Backtest complete: {result.metrics.total_return:.1%} return, "
@@ -304,23 +466,31 @@ class BacktestEngine:
 
         return result
 
-    def _process_event(self, event: MarketEvent, strategy: Strategy):
+    def _process_event(self, event: MarketEvent | ArrayMarketEvent, strategy: Strategy):
         """Process a single market event.
 
         Args:
-            event: Market event with bar data.
+            event: Market event with bar data, or a columnar array event.
             strategy: Strategy instance.
         """
         # 1. Update market data in portfolio
-        self.portfolio.update_market_data(event)
+        if isinstance(event, ArrayMarketEvent):
+            self.portfolio.update_market_arrays(event)
+        else:
+            self.portfolio.update_market_data(event)
 
         # 2. Process pending orders
-        for symbol, bar in event.bars.items():
-            fills = self.broker.process_bar(bar)
-            for fill in fills:
-                self.portfolio.process_fill(fill)
-                if hasattr(strategy, 'on_fill'):
-                    strategy.on_fill(fill)
+        if isinstance(event, ArrayMarketEvent):
+            fills = self.broker.process_arrays(event)
+        else:
+            fills = []
+            for bar in event.bars.values():
+                fills.extend(self.broker.process_bar(bar))
+
+        for fill in fills:
+            self.portfolio.process_fill(fill)
+            if hasattr(strategy, 'on_fill'):
+                strategy.on_fill(fill)
 
         # 3. Check stop-losses
         stop_signals = self.risk_manager.check_stop_losses(self.portfolio)
@@ -365,7 +535,7 @@ class BacktestEngine:
 
         return False
 
-    def _execute_signal(self, signal: Signal, event: MarketEvent):
+    def _execute_signal(self, signal: Signal, event: MarketEvent | ArrayMarketEvent):
         """Convert signal to order and submit.
 
         Args:
@@ -9,7 +9,7 @@ from typing import Optional
 import numpy as np
 
 from src.backtesting.config import CostModelConfig, ExecutionConfig, FillModel
-from src.backtesting.models import Order, Fill, BarData, OrderSide
+from src.backtesting.models import Order, Fill, BarData, OrderSide, ArrayMarketEvent
 
 logger = logging.getLogger(__name__)
 
@@ -325,6 +325,30 @@ class SimulatedBroker:
         self.pending_orders = still_pending
         return new_fills
 
+    def process_arrays(self, event: ArrayMarketEvent) -> list[Fill]:
+        """Process pending orders against a columnar market event.
+
+        Bars are only built for symbols with pending orders, visited in
+        column order so fills match the per-bar path exactly.
+
+        Args:
+            event: Columnar market event.
+
+        Returns:
+            List of fills from this event.
+        """
+        if not self.pending_orders:
+            return []
+
+        symbols = {o.symbol for o in self.pending_orders if o.symbol in event.symbol_index}
+        new_fills = []
+        for symbol in sorted(symbols, key=event.symbol_index.__getitem__):
+            bar = event.get_bar(symbol)
+            if bar is not None:
+                new_fills.extend(self.process_bar(bar))
+
+        return new_fills
+
     def cancel_order(self, order_id: str) -> bool:
         """Cancel a pending order."""
         for i, order in enumerate(self.pending_orders):
@@ -0,0 +1,624 @@
+"""Asynchronous Backtest Jobs.
+
+Queues backtest requests per tenant and runs BacktestEngine in a bounded
+process pool so long, multi-year runs never block the event loop:
+
+- Submission returns a job id immediately; jobs wait in per-tenant
+  queues and are dispatched round-robin across tenants, subject to a
+  per-tenant concurrency cap and the pool size.
+- Workers report progress and the newest equity points through a shared
+  queue; the manager forwards them to a ``publish`` callback (the API
+  wires this to its WebSocket layer).
+- Finished jobs are persisted as JSON documents; only the most recently
+  used results are kept in memory.
+
+Example:
+    manager = BacktestJobManager(publish=send_to_websockets)
+    manager.start()                       # inside the running event loop
+    job = manager.submit("tenant-a", BacktestJobSpec("momentum", start, end))
+    ...
+    manager.get_result(job.job_id)
+"""
+
+import asyncio
+import dataclasses
+import json
+import logging
+import multiprocessing
+import os
+import re
+import secrets
+import tempfile
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from enum import Enum
+from typing import Any, Awaitable, Callable, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.backtesting.config import (
+    DEFAULT_BACKTEST_JOBS,
+    BacktestConfig,
+    BacktestJobConfig,
+    RebalanceFrequency,
+)
+from src.backtesting.engine import BacktestEngine
+from src.backtesting.models import BacktestResult
+from src.backtesting.strategies import BUILTIN_STRATEGIES
+
+logger = logging.getLogger(__name__)
+
+_JOB_ID = re.compile(r"^[0-9a-f]{16}$")
+
+# Strategies runnable by name; classes must be importable so workers can unpickle them
+_strategy_registry: dict[str, type] = dict(BUILTIN_STRATEGIES)
+
+
+class JobStatus(str, Enum):
+    """Backtest job lifecycle states."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class JobQueueFullError(Exception):
+    """Raised when a tenant already has the maximum number of queued jobs."""
+
+
+def register_strategy(name: str, strategy_class: type) -> None:
+    """Make a strategy class available to jobs under ``name``."""
+    _strategy_registry[name] = strategy_class
+
+
+def resolve_strategy(name: str) -> type:
+    """Look up a registered strategy class.
+
+    Raises:
+        ValueError: If no strategy is registered under ``name``.
+    """
+    try:
+        return _strategy_registry[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown strategy {name!r}; available: {sorted(_strategy_registry)}"
+        ) from None
+
+
+@dataclass
+class BacktestJobSpec:
+    """What to run: strategy, period, capital and universe."""
+
+    strategy: str
+    start_date: date
+    end_date: date
+    initial_capital: float = 100_000.0
+    symbols: list[str] = field(default_factory=list)  # Empty = default universe
+    rebalance_frequency: str = "monthly"
+    params: dict[str, Any] = field(default_factory=dict)
+
+    def validate(self) -> None:
+        """Raise ValueError for requests that can never run."""
+        resolve_strategy(self.strategy)
+        RebalanceFrequency(self.rebalance_frequency)
+        if self.end_date <= self.start_date:
+            raise ValueError("end_date must be after start_date")
+        if self.initial_capital <= 0:
+            raise ValueError("initial_capital must be positive")
+
+    def to_dict(self) -> dict:
+        return {
+            "strategy": self.strategy,
+            "start_date": self.start_date.isoformat(),
+            "end_date": self.end_date.isoformat(),
+            "initial_capital": self.initial_capital,
+            "symbols": list(self.symbols),
+            "rebalance_frequency": self.rebalance_frequency,
+            "params": dict(self.params),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BacktestJobSpec":
+        return cls(
+            strategy=data["strategy"],
+            start_date=date.fromisoformat(data["start_date"]),
+            end_date=date.fromisoformat(data["end_date"]),
+            initial_capital=data.get("initial_capital", 100_000.0),
+            symbols=list(data.get("symbols", [])),
+            rebalance_frequency=data.get("rebalance_frequency", "monthly"),
+            params=dict(data.get("params", {})),
+        )
+
+
+@dataclass
+class BacktestJob:
+    """A submitted backtest and its live state."""
+
+    job_id: str
+    tenant_id: str
+    spec: BacktestJobSpec
+    status: JobStatus = JobStatus.QUEUED
+    progress: float = 0.0
+    submitted_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+    metrics: dict = field(default_factory=dict)
+    partial_equity: list[tuple[str, float]] = field(default_factory=list)  # While running
+
+    @property
+    def done(self) -> bool:
+        return self.status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+    def to_dict(self, include_curve: bool = False) -> dict:
+        data = {
+            "job_id": self.job_id,
+            "tenant_id": self.tenant_id,
+            "spec": self.spec.to_dict(),
+            "status": self.status.value,
+            "progress": self.progress,
+            "submitted_at": self.submitted_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "error": self.error,
+            "metrics": self.metrics,
+        }
+        if include_curve:
+            data["equity"] = list(self.partial_equity)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BacktestJob":
+        def ts(value: Optional[str]) -> Optional[datetime]:
+            return datetime.fromisoformat(value) if value else None
+
+        return cls(
+            job_id=data["job_id"],
+            tenant_id=data["tenant_id"],
+            spec=BacktestJobSpec.from_dict(data["spec"]),
+            status=JobStatus(data["status"]),
+            progress=data.get("progress", 0.0),
+            submitted_at=ts(data["submitted_at"]),
+            started_at=ts(data.get("started_at")),
+            finished_at=ts(data.get("finished_at")),
+            error=data.get("error"),
+            metrics=dict(data.get("metrics") or {}),
+        )
+
+
+class BacktestResultStore:
+    """Finished job documents on disk with an LRU of in-memory copies.
+
+    Args:
+        directory: Folder holding one ``<job_id>.json`` per finished job.
+        max_in_memory: Documents kept in memory; older ones are re-read on demand.
+    """
+
+    def __init__(self, directory: str, max_in_memory: int = 64):
+        self.directory = directory
+        self.max_in_memory = max_in_memory
+        self._memory: OrderedDict[str, dict] = OrderedDict()
+        self.stats = {"hits": 0, "disk_reads": 0, "evictions": 0}
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, job_id: str) -> Optional[str]:
+        if not _JOB_ID.match(job_id):
+            return None
+        return os.path.join(self.directory, f"{job_id}.json")
+
+    def put(self, job_id: str, document: dict) -> None:
+        """Write a document atomically and remember it."""
+        path = self._path(job_id)
+        if path is None:
+            raise ValueError(f"Invalid job id: {job_id!r}")
+        tmp = f"{path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(document, f, default=_json_default)
+        os.replace(tmp, path)
+        self._remember(job_id, document)
+
+    def get(self, job_id: str) -> Optional[dict]:
+        """Return a stored document, loading it from disk on a memory miss."""
+        document = self._memory.get(job_id)
+        if document is not None:
+            self._memory.move_to_end(job_id)
+            self.stats["hits"] += 1
+            return document
+
+        path = self._path(job_id)
+        if path is None or not os.path.exists(path):
+            return None
+        with open(path) as f:
+            document = json.load(f)
+        self.stats["disk_reads"] += 1
+        self._remember(job_id, document)
+        return document
+
+    def _remember(self, job_id: str, document: dict) -> None:
+        self._memory[job_id] = document
+        self._memory.move_to_end(job_id)
+        while len(self._memory) > self.max_in_memory:
+            self._memory.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    @property
+    def n_in_memory(self) -> int:
+        return len(self._memory)
+
+
+class BacktestJobManager:
+    """Per-tenant backtest queue in front of a process pool.
+
+    Jobs stay queued until :meth:`start` is called from the running
+    event loop (the API does this in its lifespan hook).
+
+    Args:
+        config: Queue, pool and persistence settings.
+        price_loader: ``async (spec) -> DataFrame`` of close prices; defaults
+            to DataService, so concurrent jobs share its cache tiers.
+        publish: ``async (job_id, payload)`` called for lifecycle and
+            progress events.
+    """
+
+    def __init__(
+        self,
+        config: Optional[BacktestJobConfig] = None,
+        price_loader: Optional[Callable[[BacktestJobSpec], Awaitable[pd.DataFrame]]] = None,
+        publish: Optional[Callable[[str, dict], Awaitable[None]]] = None,
+    ):
+        self.config = config or DEFAULT_BACKTEST_JOBS
+        self._price_loader = price_loader or load_job_prices
+        self._publish = publish
+        self.results = BacktestResultStore(
+            self.config.results_dir or os.path.join(tempfile.gettempdir(), "axion_backtests"),
+            self.config.max_results_in_memory,
+        )
+
+        # Jobs not yet finished (finished ones live in the result store)
+        self._jobs: dict[str, BacktestJob] = {}
+        # tenant -> waiting jobs; iteration order is the round-robin order
+        self._queues: OrderedDict[str, deque[BacktestJob]] = OrderedDict()
+        self._running: dict[str, int] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._progress_queue = None
+        self._reader: Optional[asyncio.Task] = None
+        self._started = False
+
+    @property
+    def max_workers(self) -> int:
+        return self.config.max_workers or os.cpu_count() or 1
+
+    @property
+    def n_running(self) -> int:
+        return sum(self._running.values())
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    def start(self) -> None:
+        """Create the worker pool and begin dispatching queued jobs."""
+        if self._started:
+            return
+        ctx = multiprocessing.get_context()
+        self._progress_queue = ctx.Queue()
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=ctx,
+            initializer=_init_job_worker,
+            initargs=(self._progress_queue,),
+        )
+        self._reader = asyncio.get_running_loop().create_task(self._read_progress())
+        self._started = True
+        logger.info(f"Backtest job manager started with {self.max_workers} workers")
+        self._dispatch()
+
+    async def shutdown(self) -> None:
+        """Cancel outstanding jobs and stop the pool."""
+        if not self._started:
+            return
+        self._started = False
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        for queue in self._queues.values():
+            for job in queue:
+                await self._mark_cancelled(job, "Server shutting down")
+        self._queues.clear()
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._progress_queue.put(None)
+        await self._reader
+        self._progress_queue.close()
+        self._executor = self._progress_queue = self._reader = None
+
+    # =========================================================================
+    # Submission and lookup
+    # =========================================================================
+
+    def submit(self, tenant_id: str, spec: BacktestJobSpec) -> BacktestJob:
+        """Queue a backtest and return immediately.
+
+        Raises:
+            ValueError: If the spec is invalid.
+            JobQueueFullError: If the tenant's queue is at its limit.
+        """
+        spec.validate()
+        queue = self._queues.get(tenant_id)
+        if queue is not None and len(queue) >= self.config.max_queued_per_tenant:
+            raise JobQueueFullError(
+                f"{len(queue)} backtests already queued; limit is {self.config.max_queued_per_tenant}"
+            )
+
+        job = BacktestJob(job_id=secrets.token_hex(8), tenant_id=tenant_id, spec=spec)
+        self._jobs[job.job_id] = job
+        self._queues.setdefault(tenant_id, deque()).append(job)
+        self._dispatch()
+        return job
+
+    def get_job(self, job_id: str) -> Optional[BacktestJob]:
+        """Live job, or the persisted record of a finished one."""
+        job = self._jobs.get(job_id)
+        if job is not None:
+            return job
+        document = self.results.get(job_id)
+        return BacktestJob.from_dict(document["job"]) if document else None
+
+    def get_result(self, job_id: str) -> Optional[dict]:
+        """Metrics and equity curve of a completed job."""
+        document = self.results.get(job_id)
+        return document.get("result") if document else None
+
+    def queue_position(self, job_id: str) -> Optional[int]:
+        """Zero-based position of a queued job within its tenant's queue."""
+        job = self._jobs.get(job_id)
+        if job is None or job.status != JobStatus.QUEUED:
+            return None
+        return list(self._queues.get(job.tenant_id, ())).index(job)
+
+    async def cancel(self, job_id: str) -> Optional[BacktestJob]:
+        """Cancel a queued job; running and finished jobs are returned unchanged."""
+        job = self.get_job(job_id)
+        if job is None or job.status != JobStatus.QUEUED:
+            return job
+        queue = self._queues.get(job.tenant_id)
+        if queue is not None:
+            queue.remove(job)
+            if not queue:
+                del self._queues[job.tenant_id]
+        await self._mark_cancelled(job, "Cancelled by user")
+        return job
+
+    def get_stats(self) -> dict:
+        """Queue depth and utilization."""
+        return {
+            "workers": self.max_workers,
+            "running": self.n_running,
+            "queued": sum(len(q) for q in self._queues.values()),
+            "running_by_tenant": dict(self._running),
+            "queued_by_tenant": {t: len(q) for t, q in self._queues.items()},
+            "results_in_memory": self.results.n_in_memory,
+            **{f"results_{k}": v for k, v in self.results.stats.items()},
+        }
+
+    # =========================================================================
+    # Scheduling
+    # =========================================================================
+
+    def _next_job(self) -> Optional[BacktestJob]:
+        """Pop the next job, round-robin over tenants with spare slots."""
+        for tenant in list(self._queues):
+            if self._running.get(tenant, 0) >= self.config.max_running_per_tenant:
+                continue
+            queue = self._queues[tenant]
+            job = queue.popleft()
+            if queue:
+                self._queues.move_to_end(tenant)
+            else:
+                del self._queues[tenant]
+            return job
+        return None
+
+    def _dispatch(self) -> None:
+        if not self._started:
+            return
+        loop = asyncio.get_running_loop()
+        while self.n_running < self.max_workers:
+            job = self._next_job()
+            if job is None:
+                return
+            self._running[job.tenant_id] = self._running.get(job.tenant_id, 0) + 1
+            job.status = JobStatus.RUNNING
+            job.started_at = datetime.now(timezone.utc)
+            task = loop.create_task(self._execute(job))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _execute(self, job: BacktestJob) -> None:
+        await self._emit(job, "started")
+        summary, error = None, None
+        try:
+            prices = await self._price_loader(job.spec)
+            if prices is None or prices.empty:
+                raise ValueError("No price data for the requested symbols")
+            summary = await asyncio.get_running_loop().run_in_executor(
+                self._executor,
+                _run_backtest_task,
+                job.job_id,
+                resolve_strategy(job.spec.strategy),
+                job.spec.to_dict(),
+                prices,
+                self.config.progress_every_bars,
+            )
+        except asyncio.CancelledError:
+            self._release(job)
+            await self._mark_cancelled(job, "Server shutting down")
+            raise
+        except Exception as e:
+            logger.warning(f"Backtest {job.job_id} failed: {e}")
+            error = str(e)
+
+        # Persist before the live job reports done, so readers never see a
+        # finished job without its stored result
+        finished = dataclasses.replace(
+            job,
+            status=JobStatus.FAILED if summary is None else JobStatus.COMPLETED,
+            progress=job.progress if summary is None else 1.0,
+            finished_at=datetime.now(timezone.utc),
+            error=error,
+            metrics=summary["metrics"] if summary else {},
+            partial_equity=[],
+        )
+        await asyncio.to_thread(self.results.put, job.job_id, {"job": finished.to_dict(), "result": summary})
+        self._release(job)
+        self._jobs.pop(job.job_id, None)
+        await self._emit(finished, finished.status.value)
+        self._dispatch()
+
+    def _release(self, job: BacktestJob) -> None:
+        remaining = self._running.get(job.tenant_id, 0) - 1
+        if remaining > 0:
+            self._running[job.tenant_id] = remaining
+        else:
+            self._running.pop(job.tenant_id, None)
+
+    async def _mark_cancelled(self, job: BacktestJob, reason: str) -> None:
+        job.status = JobStatus.CANCELLED
+        job.error = reason
+        job.finished_at = datetime.now(timezone.utc)
+        job.partial_equity = []
+        # The store writes to disk; keep the live job until the record lands
+        await asyncio.get_running_loop().run_in_executor(
+            None, self.results.put, job.job_id, {"job": job.to_dict(), "result": None}
+        )
+        self._jobs.pop(job.job_id, None)
+
+    # =========================================================================
+    # Progress
+    # =========================================================================
+
+    async def _read_progress(self) -> None:
+        """Forward worker progress messages until the shutdown sentinel."""
+        loop = asyncio.get_running_loop()
+        while True:
+            message = await loop.run_in_executor(None, self._progress_queue.get)
+            if message is None:
+                return
+            job_id, progress, points = message
+            job = self._jobs.get(job_id)
+            if job is None or job.status != JobStatus.RUNNING:
+                continue
+            job.progress = progress
+            job.partial_equity.extend(points)
+            await self._emit(job, "progress", equity=points)
+
+    async def _emit(self, job: BacktestJob, event: str, **extra) -> None:
+        if self._publish is None:
+            return
+        payload = {
+            "event": event,
+            "job_id": job.job_id,
+            "status": job.status.value,
+            "progress": job.progress,
+            **extra,
+        }
+        if job.error:
+            payload["error"] = job.error
+        if job.metrics:
+            payload["metrics"] = job.metrics
+        try:
+            await self._publish(job.job_id, payload)
+        except Exception as e:
+            logger.warning(f"Backtest {job.job_id} progress publish failed: {e}")
+
+
+# =============================================================================
+# Data loading and worker side
+# =============================================================================
+
+_data_service = None
+
+
+async def load_job_prices(spec: BacktestJobSpec) -> pd.DataFrame:
+    """Close prices for a job through the shared DataService."""
+    global _data_service
+    if _data_service is None:
+        from src.services.data_service import DataService
+        _data_service = DataService()
+        await _data_service.start()
+
+    symbols = spec.symbols or await _data_service.get_universe()
+    months = (date.today() - spec.start_date).days // 30 + 1
+    prices = await _data_service.get_prices(symbols, period=f"{months}mo")
+    if isinstance(prices.index, pd.DatetimeIndex) and prices.index.tz is not None:
+        prices = prices.set_axis(prices.index.tz_convert(None), axis=0)
+    return prices
+
+
+def summarize_result(result: BacktestResult) -> dict:
+    """JSON-friendly metrics and equity curve of a finished backtest."""
+    curve = result.equity_curve
+    return {
+        "metrics": {
+            k: _json_default(v) if isinstance(v, np.generic) else v for k, v in result.metrics.to_dict().items()
+        },
+        "equity_curve": [[pd.Timestamp(t).isoformat(), float(v)] for t, v in zip(curve.index, curve.to_numpy())],
+        "n_trades": len(result.trades),
+        "terminated_early": result.terminated_early,
+    }
+
+
+_worker_state: dict = {}
+
+
+def _init_job_worker(progress_queue) -> None:
+    """Pool initializer: keep the progress queue for tasks in this process."""
+    _worker_state["progress"] = progress_queue
+
+
+def _run_backtest_task(
+    job_id: str,
+    strategy_class: type,
+    spec_data: dict,
+    prices: pd.DataFrame,
+    progress_every: int,
+) -> dict:
+    """Worker task: run one backtest, streaming progress and new equity points."""
+    spec = BacktestJobSpec.from_dict(spec_data)
+    config = BacktestConfig(
+        start_date=spec.start_date,
+        end_date=spec.end_date,
+        initial_capital=spec.initial_capital,
+        symbols=list(prices.columns),
+        rebalance_frequency=RebalanceFrequency(spec.rebalance_frequency),
+        strategy_params=dict(spec.params),
+    )
+    engine = BacktestEngine(config)
+    engine.load_data(prices)
+    queue = _worker_state.get("progress")
+    sent = 0
+
+    def report(done: int, total: int) -> None:
+        nonlocal sent
+        snapshots = engine.portfolio.snapshots[sent:]
+        sent += len(snapshots)
+        if queue is not None:
+            points = [(pd.Timestamp(s.timestamp).isoformat(), float(s.equity)) for s in snapshots]
+            queue.put((job_id, min(done / total, 1.0) if total else 0.0, points))
+
+    result = engine.run(strategy_class(**spec.params), progress=report, progress_every=progress_every)
+    return summarize_result(result)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (datetime, date, pd.Timestamp)):
+        return value.isoformat()
+    raise TypeError(f"Not JSON serializable: {type(value).__name__}")
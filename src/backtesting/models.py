@@ -6,7 +6,7 @@ bars, orders, fills, positions, and results.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import ClassVar, Optional
 from enum import Enum
 import numpy as np
 import pandas as pd
@@ -66,6 +66,82 @@ class MarketEvent:
         return self.bars.get(symbol)
 
 
+@dataclass
+class ArrayMarketEvent:
+    """Columnar market event backed by rows of a preloaded price matrix.
+
+    Holds views into contiguous per-field arrays instead of one BarData
+    per symbol. Bars are only materialized on demand, so consumers that
+    work on the arrays directly never pay the per-symbol object cost.
+    """
+
+    timestamp: datetime
+    symbols: list[str]
+    symbol_index: dict[str, int]  # symbol -> column offset
+    close: np.ndarray  # shape (n_symbols,)
+    valid: np.ndarray  # bool mask of symbols with a usable bar
+    open: Optional[np.ndarray] = None
+    high: Optional[np.ndarray] = None
+    low: Optional[np.ndarray] = None
+    volume: Optional[np.ndarray] = None
+    default_volume: int = 1_000_000
+    _bars: Optional[dict[str, BarData]] = field(default=None, repr=False)
+
+    def get_bar(self, symbol: str) -> Optional[BarData]:
+        idx = self.symbol_index.get(symbol)
+        if idx is None or not self.valid[idx]:
+            return None
+        if self._bars is not None:
+            return self._bars.get(symbol)
+        return self._make_bar(symbol, idx)
+
+    @property
+    def bars(self) -> dict[str, BarData]:
+        """Materialize all valid bars (cached for the event's lifetime)."""
+        if self._bars is None:
+            self._bars = {
+                self.symbols[idx]: self._make_bar(self.symbols[idx], idx)
+                for idx in np.flatnonzero(self.valid)
+            }
+        return self._bars
+
+    def _make_bar(self, symbol: str, idx: int) -> BarData:
+        close = float(self.close[idx])
+        return BarData(
+            symbol=symbol,
+            timestamp=self.timestamp,
+            open=float(self.open[idx]) if self.open is not None else close,
+            high=float(self.high[idx]) if self.high is not None else close,
+            low=float(self.low[idx]) if self.low is not None else close,
+            close=close,
+            volume=int(self.volume[idx]) if self.volume is not None else self.default_volume,
+        )
+
+
+@dataclass
+class OHLCVPanel:
+    """Timestamp-aligned OHLCV data for many symbols.
+
+    Every symbol is reindexed once onto the shared, sorted timestamp
+    axis so streaming can walk integer offsets instead of doing
+    per-timestamp index lookups.
+    """
+
+    FIELDS: ClassVar[tuple[str, ...]] = ("open", "high", "low", "close", "volume")
+
+    timestamps: pd.DatetimeIndex
+    symbols: list[str]
+    values: np.ndarray  # shape (n_timestamps, n_symbols, len(FIELDS))
+    valid: np.ndarray  # shape (n_timestamps, n_symbols), True where a bar exists
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def get_field(self, name: str) -> np.ndarray:
+        """Return a (n_timestamps, n_symbols) view of one OHLCV field."""
+        return self.values[:, :, self.FIELDS.index(name)]
+
+
 @dataclass
 class Signal:
     """Trading signal from strategy."""
@@ -292,6 +368,7 @@ class BacktestResult:
     snapshots: list[PortfolioSnapshot] = field(default_factory=list)
     monthly_returns: pd.Series = field(default_factory=pd.Series)
     daily_returns: pd.Series = field(default_factory=pd.Series)
+    terminated_early: bool = False  # Stopped at config.early_stop_drawdown
 
     def get_trades_df(self) -> pd.DataFrame:
         """Get trades as DataFrame."""
@@ -321,6 +398,8 @@ class WalkForwardWindow:
     in_sample_sharpe: float = 0.0
     out_of_sample_sharpe: float = 0.0
     out_of_sample_result: Optional[BacktestResult] = None
+    n_evaluations: int = 0  # In-sample backtests actually run
+    grid_size: int = 0  # Backtests an exhaustive grid would have run
 
 
 @dataclass
@@ -334,6 +413,8 @@ class WalkForwardResult:
     efficiency_ratio: float = 0.0
     param_stability: dict = field(default_factory=dict)
     combined_metrics: BacktestMetrics = field(default_factory=BacktestMetrics)
+    n_evaluations: int = 0  # In-sample backtests run across all windows
+    grid_size: int = 0  # Backtests an exhaustive grid would have run
 
 
 @dataclass
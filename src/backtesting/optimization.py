@@ -4,8 +4,12 @@ Provides robust out-of-sample testing and statistical significance analysis
 to prevent overfitting and validate strategy performance.
 """
 
+import dataclasses
 import logging
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
 from datetime import datetime, timedelta
+from multiprocessing import shared_memory
 from typing import Optional, Type, Iterator
 from itertools import product
 import numpy as np
@@ -20,10 +24,79 @@ from src.backtesting.models import (
     WalkForwardWindow, WalkForwardResult, MonteCarloResult,
 )
 from src.backtesting.engine import BacktestEngine, Strategy
+from src.backtesting.search import (
+    ParameterGrid, SuccessiveHalvingSearch, BayesianSearch,
+)
 
 logger = logging.getLogger(__name__)
 
 
+class SharedPriceData:
+    """Price frame published once to shared memory for worker processes.
+
+    The float64 value matrix lives in a SharedMemory block; workers
+    attach by name and wrap it in a read-only DataFrame without copying.
+    Only the (small) index and column labels are pickled per worker.
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        values = np.ascontiguousarray(data.to_numpy(dtype=np.float64))
+        self._shm = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+        buf = np.ndarray(values.shape, dtype=np.float64, buffer=self._shm.buf)
+        buf[:] = values
+        self.spec = (self._shm.name, values.shape, data.index, data.columns)
+
+    @staticmethod
+    def attach(spec: tuple) -> tuple[shared_memory.SharedMemory, pd.DataFrame]:
+        """Attach to a published block and return (handle, DataFrame view)."""
+        name, shape, index, columns = spec
+        shm = shared_memory.SharedMemory(name=name)
+        values = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+        values.flags.writeable = False
+        return shm, pd.DataFrame(values, index=index, columns=columns, copy=False)
+
+    def close(self):
+        """Release and unlink the shared block."""
+        self._shm.close()
+        self._shm.unlink()
+
+
+# Per-process state for pool workers, populated by _init_worker
+_worker_state: dict = {}
+
+
+def _init_worker(spec: tuple, benchmark, config, backtest_config):
+    """Pool initializer: attach shared prices once per worker process."""
+    shm, data = SharedPriceData.attach(spec)
+    _worker_state["shm"] = shm
+    _worker_state["data"] = data
+    _worker_state["benchmark"] = benchmark
+    _worker_state["optimizer"] = WalkForwardOptimizer(
+        dataclasses.replace(config, n_workers=1, parallel_windows=False),
+        backtest_config,
+    )
+
+
+def _evaluate_params_task(args: tuple) -> tuple[float, int]:
+    """Worker task: score one parameter set on a slice of the shared data."""
+    strategy_class, params, start, end = args
+    optimizer = _worker_state["optimizer"]
+    data = _worker_state["data"].loc[start:end]
+    return optimizer._evaluate_params(
+        strategy_class, params, data, _worker_state["benchmark"], early_stop=True
+    )
+
+
+def _run_window_task(args: tuple) -> WalkForwardWindow:
+    """Worker task: optimize and test one walk-forward window serially."""
+    strategy_class, param_grid, window = args
+    optimizer = _worker_state["optimizer"]
+    optimizer._run_window(
+        strategy_class, param_grid, window, _worker_state["data"], _worker_state["benchmark"]
+    )
+    return window
+
+
 class WalkForwardOptimizer:
     """Walk-forward optimization framework.
 
@@ -39,6 +112,12 @@ class WalkForwardOptimizer:
     - >0.5: Good - strategy is robust
     - 0.3-0.5: Acceptable - some overfitting
     - <0.3: Poor - likely overfit, do not deploy
+
+    With ``config.n_workers`` > 1 the price data is published once to
+    shared memory and a process pool evaluates parameter combinations
+    (or, with ``config.parallel_windows``, whole windows) in parallel.
+    The strategy class must then be importable at module level so it
+    can be pickled to the workers.
     """
 
     def __init__(
@@ -48,6 +127,7 @@ class WalkForwardOptimizer:
     ):
         self.config = config or DEFAULT_WALK_FORWARD
         self.backtest_config = backtest_config or BacktestConfig()
+        self._executor: Optional[Executor] = None
 
     def run(
         self,
@@ -72,37 +152,23 @@ class WalkForwardOptimizer:
         # Generate windows
         windows = self._generate_windows(price_data.index)
 
-        # Run optimization for each window
-        oos_results = []
-        param_history = []
-
-        for window in windows:
-            logger.info(f"Window {window.window_id}: IS {window.in_sample_start} to {window.in_sample_end}")
-
-            # Get data for this window
-            is_data = price_data.loc[window.in_sample_start:window.in_sample_end]
-            oos_data = price_data.loc[window.out_of_sample_start:window.out_of_sample_end]
-
-            # Optimize on in-sample
-            best_params, is_sharpe = self._optimize_insample(
-                strategy_class, param_grid, is_data, benchmark
+        if self._worker_count() > 1:
+            windows = self._run_parallel(
+                strategy_class, param_grid, windows, price_data, benchmark
             )
-            window.best_params = best_params
-            window.in_sample_sharpe = is_sharpe
-            param_history.append(best_params)
+        else:
+            for window in windows:
+                self._run_window(strategy_class, param_grid, window, price_data, benchmark)
 
-            # Test on out-of-sample
-            oos_result = self._backtest(
-                strategy_class, best_params, oos_data, benchmark
-            )
-            window.out_of_sample_sharpe = oos_result.metrics.sharpe_ratio
-            window.out_of_sample_result = oos_result
+        oos_results = [w.out_of_sample_result for w in windows]
+        param_history = [w.best_params for w in windows]
 
-            oos_results.append(oos_result)
-            logger.info(
-                f"Window {window.window_id}: IS Sharpe={is_sharpe:.2f}, "
-                f"OOS Sharpe={oos_result.metrics.sharpe_ratio:.2f}"
-            )
+        n_evaluations = sum(w.n_evaluations for w in windows)
+        grid_size = sum(w.grid_size for w in windows)
+        logger.info(
+            f"Search '{self.config.search_method}' ran {n_evaluations} in-sample "
+            f"backtests vs {grid_size} for the full grid"
+        )
 
         # Combine out-of-sample results
         combined = self._combine_results(oos_results)
@@ -123,7 +189,80 @@ class WalkForwardOptimizer:
             efficiency_ratio=efficiency,
             param_stability=param_stability,
             combined_metrics=combined,
+            n_evaluations=n_evaluations,
+            grid_size=grid_size,
+        )
+
+    def _run_window(
+        self,
+        strategy_class: Type[Strategy],
+        param_grid: dict[str, list],
+        window: WalkForwardWindow,
+        price_data: pd.DataFrame,
+        benchmark: Optional[pd.Series],
+    ) -> BacktestResult:
+        """Optimize one window in-sample and test it out-of-sample."""
+        logger.info(f"Window {window.window_id}: IS {window.in_sample_start} to {window.in_sample_end}")
+
+        # Get data for this window
+        is_data = price_data.loc[window.in_sample_start:window.in_sample_end]
+        oos_data = price_data.loc[window.out_of_sample_start:window.out_of_sample_end]
+
+        # Optimize on in-sample
+        best_params, is_sharpe, n_evaluations = self._optimize_insample(
+            strategy_class, param_grid, is_data, benchmark
         )
+        window.best_params = best_params
+        window.in_sample_sharpe = is_sharpe
+        window.n_evaluations = n_evaluations
+        window.grid_size = ParameterGrid(param_grid).size
+
+        # Test on out-of-sample
+        oos_result = self._backtest(
+            strategy_class, best_params, oos_data, benchmark
+        )
+        window.out_of_sample_sharpe = oos_result.metrics.sharpe_ratio
+        window.out_of_sample_result = oos_result
+
+        logger.info(
+            f"Window {window.window_id}: IS Sharpe={is_sharpe:.2f}, "
+            f"OOS Sharpe={oos_result.metrics.sharpe_ratio:.2f}"
+        )
+        return oos_result
+
+    def _run_parallel(
+        self,
+        strategy_class: Type[Strategy],
+        param_grid: dict[str, list],
+        windows: list[WalkForwardWindow],
+        price_data: pd.DataFrame,
+        benchmark: Optional[pd.Series],
+    ) -> list[WalkForwardWindow]:
+        """Run windows with a process pool sharing the price data."""
+        n_workers = self._worker_count()
+        shared = SharedPriceData(price_data)
+        try:
+            with ProcessPoolExecutor(
+                max_workers=n_workers,
+                initializer=_init_worker,
+                initargs=(shared.spec, benchmark, self.config, self.backtest_config),
+            ) as executor:
+                if self.config.parallel_windows:
+                    logger.info(f"Running {len(windows)} windows on {n_workers} workers")
+                    tasks = [(strategy_class, param_grid, w) for w in windows]
+                    return list(executor.map(_run_window_task, tasks))
+
+                self._executor = executor
+                for window in windows:
+                    self._run_window(strategy_class, param_grid, window, price_data, benchmark)
+                return windows
+        finally:
+            self._executor = None
+            shared.close()
+
+    def _worker_count(self) -> int:
+        """Resolve the configured worker count (0 = all cores)."""
+        return self.config.n_workers or os.cpu_count() or 1
 
     def _generate_windows(self, dates: pd.DatetimeIndex) -> list[WalkForwardWindow]:
         """Generate walk-forward windows."""
@@ -161,40 +300,113 @@ class WalkForwardOptimizer:
         param_grid: dict[str, list],
         data: pd.DataFrame,
         benchmark: Optional[pd.Series],
-    ) -> tuple[dict, float]:
-        """Optimize parameters on in-sample data."""
+    ) -> tuple[dict, float, int]:
+        """Optimize parameters on in-sample data.
+
+        Returns:
+            Tuple of (best params, best metric, backtests evaluated).
+        """
+        def score(candidates: list[dict], fraction: float) -> list[float]:
+            return self._score_candidates(strategy_class, candidates, data, benchmark, fraction)
+
+        grid = ParameterGrid(param_grid)
+        method = self.config.search_method
+
+        if method == "halving":
+            search = SuccessiveHalvingSearch(
+                eta=self.config.halving_eta,
+                min_fraction=self.config.halving_min_fraction,
+            )
+        elif method == "bayesian":
+            search = BayesianSearch(
+                n_trials=self.config.bayesian_n_trials,
+                n_initial=self.config.bayesian_n_initial,
+                batch_size=self._worker_count() if self._executor is not None else 1,
+                seed=self.backtest_config.seed,
+            )
+        elif method == "grid":
+            search = None
+        else:
+            raise ValueError(f"Unknown search method: {method}")
+
+        if search is not None:
+            outcome = search.search(grid, score)
+            return outcome.best_params, outcome.best_metric, outcome.n_evaluations
+
         best_metric = float('-inf')
         best_params = {}
 
         # Generate all parameter combinations
         param_names = list(param_grid.keys())
         param_values = list(param_grid.values())
+        combos = [dict(zip(param_names, values)) for values in product(*param_values)]
 
-        for values in product(*param_values):
-            params = dict(zip(param_names, values))
+        for params, metric in zip(combos, score(combos, 1.0)):
+            if metric > best_metric:
+                best_metric = metric
+                best_params = params
 
-            # Run backtest with these parameters
-            result = self._backtest(strategy_class, params, data, benchmark)
+        return best_params, best_metric, len(combos)
 
-            # Get optimization metric
-            if self.config.optimization_metric == "sharpe":
-                metric = result.metrics.sharpe_ratio
-            elif self.config.optimization_metric == "cagr":
-                metric = result.metrics.cagr
-            elif self.config.optimization_metric == "sortino":
-                metric = result.metrics.sortino_ratio
-            else:
-                metric = result.metrics.sharpe_ratio
+    def _score_candidates(
+        self,
+        strategy_class: Type[Strategy],
+        candidates: list[dict],
+        data: pd.DataFrame,
+        benchmark: Optional[pd.Series],
+        fraction: float = 1.0,
+    ) -> list[float]:
+        """Score parameter sets on the trailing ``fraction`` of the data.
 
-            # Check minimum trades
-            if result.metrics.total_trades < self.config.min_trades_per_window:
-                continue
+        Candidates with too few trades (scaled by fraction) or whose run
+        hit the early-stop drawdown score -inf.
+        """
+        if fraction < 1.0:
+            data = data.iloc[-max(2, int(len(data) * fraction)):]
+
+        if self._executor is not None and len(candidates) > 1:
+            # Workers slice the shared price data by date themselves
+            tasks = [
+                (strategy_class, params, data.index[0], data.index[-1])
+                for params in candidates
+            ]
+            chunksize = max(1, len(tasks) // (self._worker_count() * 4))
+            results = self._executor.map(_evaluate_params_task, tasks, chunksize=chunksize)
+        else:
+            results = (
+                self._evaluate_params(strategy_class, params, data, benchmark, early_stop=True)
+                for params in candidates
+            )
 
-            if metric > best_metric:
-                best_metric = metric
-                best_params = params
+        min_trades = self.config.min_trades_per_window * fraction
+        return [
+            metric if total_trades >= min_trades else float('-inf')
+            for metric, total_trades in results
+        ]
 
-        return best_params, best_metric
+    def _evaluate_params(
+        self,
+        strategy_class: Type[Strategy],
+        params: dict,
+        data: pd.DataFrame,
+        benchmark: Optional[pd.Series],
+        early_stop: bool = False,
+    ) -> tuple[float, int]:
+        """Backtest one parameter set and return (metric, total trades)."""
+        result = self._backtest(strategy_class, params, data, benchmark, early_stop)
+        if result.terminated_early:
+            return float('-inf'), result.metrics.total_trades
+        return self._get_metric(result), result.metrics.total_trades
+
+    def _get_metric(self, result: BacktestResult) -> float:
+        """Get the configured optimization metric from a result."""
+        if self.config.optimization_metric == "sharpe":
+            return result.metrics.sharpe_ratio
+        elif self.config.optimization_metric == "cagr":
+            return result.metrics.cagr
+        elif self.config.optimization_metric == "sortino":
+            return result.metrics.sortino_ratio
+        return result.metrics.sharpe_ratio
 
     def _backtest(
         self,
@@ -202,8 +414,13 @@ class WalkForwardOptimizer:
         params: dict,
         data: pd.DataFrame,
         benchmark: Optional[pd.Series],
+        early_stop: bool = False,
     ) -> BacktestResult:
-        """Run a single backtest."""
+        """Run a single backtest.
+
+        With ``early_stop`` the run is aborted once drawdown breaches
+        ``config.early_stop_drawdown`` (used for in-sample search only).
+        """
         # Create config for this period
         config = BacktestConfig(
             start_date=data.index[0].date(),
@@ -212,6 +429,8 @@ class WalkForwardOptimizer:
             cost_model=self.backtest_config.cost_model,
             execution=self.backtest_config.execution,
             rebalance_frequency=self.backtest_config.rebalance_frequency,
+            columnar_streaming=self.backtest_config.columnar_streaming,
+            early_stop_drawdown=self.config.early_stop_drawdown if early_stop else None,
         )
 
         engine = BacktestEngine(config)
@@ -360,6 +579,10 @@ class MonteCarloAnalyzer:
 
         logger.info(f"Running {self.config.n_simulations} Monte Carlo simulations")
 
+        if self.config.vectorized:
+            sharpe_arr, cagr_arr, dd_arr = self._bootstrap_batched(trades, initial_capital)
+            return self._summarize_bootstrap(sharpe_arr, cagr_arr, dd_arr)
+
         sharpe_dist = []
         cagr_dist = []
         max_dd_dist = []
@@ -384,15 +607,22 @@ class MonteCarloAnalyzer:
             cagr_dist.append(cagr)
             max_dd_dist.append(max_dd)
 
-        sharpe_arr = np.array(sharpe_dist)
-        cagr_arr = np.array(cagr_dist)
-        dd_arr = np.array(max_dd_dist)
+        return self._summarize_bootstrap(
+            np.array(sharpe_dist), np.array(cagr_dist), np.array(max_dd_dist)
+        )
 
+    def _summarize_bootstrap(
+        self,
+        sharpe_arr: np.ndarray,
+        cagr_arr: np.ndarray,
+        dd_arr: np.ndarray,
+    ) -> MonteCarloResult:
+        """Build a MonteCarloResult from per-resample metric arrays."""
         ci_low = (1 - self.config.confidence_level) / 2 * 100
         ci_high = (1 + self.config.confidence_level) / 2 * 100
 
         return MonteCarloResult(
-            n_simulations=len(sharpe_dist),
+            n_simulations=len(sharpe_arr),
             sharpe_mean=float(np.mean(sharpe_arr)),
             sharpe_std=float(np.std(sharpe_arr)),
             sharpe_95ci=(
@@ -441,25 +671,28 @@ class MonteCarloAnalyzer:
 
         logger.info(f"Testing significance against {n_random} random portfolios")
 
-        random_sharpes = []
         n_stocks = min(30, len(price_data.columns))
 
-        for _ in range(n_random):
-            # Random portfolio weights
-            weights = self.rng.dirichlet(np.ones(n_stocks))
+        if self.config.vectorized:
+            random_sharpes = self._random_sharpes_batched(price_data, n_stocks, n_random)
+        else:
+            random_sharpes = []
+            for _ in range(n_random):
+                # Random portfolio weights
+                weights = self.rng.dirichlet(np.ones(n_stocks))
 
-            # Select random stocks
-            symbols = self.rng.choice(
-                price_data.columns, size=n_stocks, replace=False
-            )
+                # Select random stocks
+                symbols = self.rng.choice(
+                    price_data.columns, size=n_stocks, replace=False
+                )
 
-            # Calculate portfolio returns
-            stock_returns = price_data[symbols].pct_change().dropna()
-            port_returns = (stock_returns * weights).sum(axis=1)
+                # Calculate portfolio returns
+                stock_returns = price_data[symbols].pct_change().dropna()
+                port_returns = (stock_returns * weights).sum(axis=1)
 
-            # Calculate Sharpe
-            sharpe = self._calc_sharpe_from_returns(port_returns)
-            random_sharpes.append(sharpe)
+                # Calculate Sharpe
+                sharpe = self._calc_sharpe_from_returns(port_returns)
+                random_sharpes.append(sharpe)
 
         random_sharpes = np.array(random_sharpes)
 
@@ -478,6 +711,118 @@ class MonteCarloAnalyzer:
 
         return is_significant, float(p_value)
 
+    def _batch_rows(self, row_length: int, total: int) -> int:
+        """Rows per batch so a (rows x row_length) array stays within budget."""
+        return max(1, min(total, self.config.max_batch_elements // max(row_length, 1)))
+
+    def _bootstrap_batched(
+        self,
+        trades: list[Trade],
+        initial_capital: float,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Resample trade P&L as 2-D index matrices, one batch at a time.
+
+        Draws the same index stream as the per-sample loop, so results
+        match it for a given seed.
+
+        Returns:
+            Tuple of (sharpe, cagr, max_drawdown) arrays, one per resample.
+        """
+        pnl = np.array([t.pnl for t in trades], dtype=np.float64)
+        n_trades = len(pnl)
+        n_sims = self.config.n_simulations
+        rows = self._batch_rows(n_trades + 1, n_sims)
+
+        sharpe = np.empty(n_sims)
+        cagr = np.empty(n_sims)
+        max_dd = np.empty(n_sims)
+
+        for start in range(0, n_sims, rows):
+            k = min(rows, n_sims - start)
+            idx = self.rng.integers(0, n_trades, size=(k, n_trades))
+
+            equity = np.empty((k, n_trades + 1))
+            equity[:, 0] = initial_capital
+            np.cumsum(pnl[idx], axis=1, out=equity[:, 1:])
+            equity[:, 1:] += initial_capital
+
+            batch = slice(start, start + k)
+            sharpe[batch], cagr[batch], max_dd[batch] = self._equity_metrics(equity)
+
+        return sharpe, cagr, max_dd
+
+    def _equity_metrics(self, equity: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Sharpe, CAGR and max drawdown for each row of an equity matrix.
+
+        Row-wise equivalents of _calc_sharpe, _calc_cagr and
+        _calc_max_drawdown.
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns = equity[:, 1:] / equity[:, :-1] - 1
+
+            if returns.shape[1] < 2:
+                sharpe = np.zeros(len(equity))
+            else:
+                std = returns.std(axis=1, ddof=1)
+                excess_mean = returns.mean(axis=1) - 0.05 / 252
+                sharpe = np.where(std > 0, excess_mean / std * np.sqrt(252), 0.0)
+
+            total_return = equity[:, -1] / equity[:, 0] - 1
+            n_years = equity.shape[1] / 252
+            cagr = (1 + total_return) ** (1 / n_years) - 1
+
+            peak = np.maximum.accumulate(equity, axis=1)
+            max_dd = ((equity - peak) / peak).min(axis=1)
+
+        return sharpe, cagr, max_dd
+
+    def _random_sharpes_batched(
+        self,
+        price_data: pd.DataFrame,
+        n_stocks: int,
+        n_random: int,
+    ) -> np.ndarray:
+        """Sharpe ratios of random long-only portfolios, in batches.
+
+        Returns are computed once for the whole universe. Each batch
+        builds a (portfolios x symbols) weight matrix and prices every
+        portfolio with one matrix multiply. Rows where a selected symbol
+        has no return are excluded per portfolio, as dropna() does.
+        """
+        returns = price_data.pct_change().to_numpy(dtype=np.float64)
+        missing = np.isnan(returns)
+        returns = np.where(missing, 0.0, returns)
+        missing = missing.astype(np.float64)
+        n_dates, n_symbols = returns.shape
+
+        sharpes = np.empty(n_random)
+        rows = self._batch_rows(max(n_dates, n_symbols), n_random)
+
+        for start in range(0, n_random, rows):
+            k = min(rows, n_random - start)
+            weights = self.rng.dirichlet(np.ones(n_stocks), size=k)
+            picks = np.argsort(self.rng.random((k, n_symbols)), axis=1)[:, :n_stocks]
+
+            w = np.zeros((k, n_symbols))
+            np.put_along_axis(w, picks, weights, axis=1)
+            selected = (w > 0).astype(np.float64)
+
+            port = returns @ w.T  # (n_dates, k)
+            valid = (missing @ selected.T) == 0
+            port = np.where(valid, port, 0.0)
+
+            count = valid.sum(axis=0)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                mean = port.sum(axis=0) / count
+                sq_dev = np.where(valid, (port - mean) ** 2, 0.0).sum(axis=0)
+                std = np.sqrt(sq_dev / (count - 1))
+                sharpe = (mean - 0.05 / 252) / std * np.sqrt(252)
+
+            ok = (count >= 2) & (std > 0)
+            sharpes[start:start + k] = np.where(ok, sharpe, 0.0)
+
+        return sharpes
+
     def _build_equity_curve(
         self,
         trades: list[Trade],
@@ -11,7 +11,7 @@ import pandas as pd
 
 from src.backtesting.models import (
     Position, Fill, Trade, PortfolioSnapshot, BarData,
-    OrderSide, MarketEvent,
+    OrderSide, MarketEvent, ArrayMarketEvent,
 )
 
 logger = logging.getLogger(__name__)
@@ -71,6 +71,22 @@ class SimulatedPortfolio:
             if symbol in self.positions:
                 self.positions[symbol].current_price = bar.close
 
+    def update_market_arrays(self, event: ArrayMarketEvent):
+        """Update position prices from a columnar market event.
+
+        Only held positions are touched, so the cost scales with the
+        number of positions rather than the size of the universe.
+
+        Args:
+            event: Columnar market event.
+        """
+        for symbol, pos in self.positions.items():
+            idx = event.symbol_index.get(symbol)
+            if idx is not None and event.valid[idx]:
+                price = float(event.close[idx])
+                pos.current_price = price
+                self._current_prices[symbol] = price
+
     def process_fill(self, fill: Fill):
         """Process an order fill.
 
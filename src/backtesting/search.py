@@ -0,0 +1,204 @@
+"""Adaptive Parameter Search.
+
+Alternatives to exhaustive grid enumeration for walk-forward
+optimization. Both strategies work over the same discrete parameter
+grid and call back into the optimizer to score candidates, so they
+share its backtest, worker-pool and minimum-trade handling.
+
+- Successive halving: score every candidate on a short trailing slice
+  of the in-sample data, keep the best 1/eta, grow the slice by eta,
+  and repeat until the survivors are scored on the full window.
+- Bayesian: a Gaussian-process surrogate over the unit-encoded grid
+  proposes the candidates with the highest expected improvement.
+"""
+
+import logging
+import math
+from dataclasses import dataclass, field
+from typing import Callable
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Scores candidates: (param sets, data fraction) -> metric per set.
+# Unusable candidates (too few trades, terminated early) score -inf.
+ScoreFn = Callable[[list[dict], float], list[float]]
+
+# Largest number of unevaluated grid points scored by the surrogate per step
+MAX_ACQUISITION_POOL = 10_000
+
+
+class ParameterGrid:
+    """Discrete parameter grid addressable by flat integer index."""
+
+    def __init__(self, param_grid: dict[str, list]):
+        self.names = list(param_grid.keys())
+        self.values = [list(v) for v in param_grid.values()]
+        self.shape = tuple(len(v) for v in self.values)
+
+    @property
+    def size(self) -> int:
+        return math.prod(self.shape) if self.shape else 1
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, index: int) -> dict:
+        if not self.shape:
+            return {}
+        coords = np.unravel_index(int(index), self.shape)
+        return {name: vals[c] for name, vals, c in zip(self.names, self.values, coords)}
+
+    def encode(self, indices: np.ndarray) -> np.ndarray:
+        """Map flat indices to points in the unit hypercube (by value order)."""
+        if not self.shape:
+            return np.zeros((len(indices), 0))
+        coords = np.stack(np.unravel_index(np.asarray(indices, dtype=np.int64), self.shape), axis=1)
+        scale = np.array([max(n - 1, 1) for n in self.shape], dtype=float)
+        return coords / scale
+
+
+@dataclass
+class SearchOutcome:
+    """Result of a parameter search over one window."""
+
+    best_params: dict = field(default_factory=dict)
+    best_metric: float = float("-inf")
+    n_evaluations: int = 0
+
+
+def _select_best(candidates: list[dict], scores: list[float]) -> tuple[dict, float]:
+    """First candidate with the strictly highest finite score."""
+    best_metric = float("-inf")
+    best_params: dict = {}
+    for params, metric in zip(candidates, scores):
+        if metric > best_metric:
+            best_metric = metric
+            best_params = params
+    return best_params, best_metric
+
+
+class SuccessiveHalvingSearch:
+    """Successive halving over growing trailing sub-windows."""
+
+    def __init__(self, eta: int = 3, min_fraction: float = 0.25):
+        if eta < 2:
+            raise ValueError("eta must be >= 2")
+        if not 0 < min_fraction <= 1:
+            raise ValueError("min_fraction must be in (0, 1]")
+        self.eta = eta
+        self.min_fraction = min_fraction
+
+    def search(self, grid: ParameterGrid, score: ScoreFn) -> SearchOutcome:
+        candidates = [grid[i] for i in range(grid.size)]
+        fraction = self.min_fraction
+        n_evaluations = 0
+
+        while True:
+            scores = score(candidates, fraction)
+            n_evaluations += len(candidates)
+            logger.debug(f"Halving rung: {len(candidates)} candidates on {fraction:.0%} of data")
+
+            if fraction >= 1.0:
+                break
+
+            keep = max(1, math.ceil(len(candidates) / self.eta))
+            ranked = np.argsort(-np.nan_to_num(np.asarray(scores, dtype=float), nan=-np.inf), kind="stable")
+            candidates = [candidates[i] for i in ranked[:keep]]
+            fraction = min(1.0, fraction * self.eta)
+
+        best_params, best_metric = _select_best(candidates, scores)
+        return SearchOutcome(best_params, best_metric, n_evaluations)
+
+
+class BayesianSearch:
+    """Sequential model-based search with a Gaussian-process surrogate.
+
+    Candidates are proposed in batches of ``batch_size`` (the worker
+    count) by expected improvement, so a process pool stays busy.
+    """
+
+    def __init__(
+        self,
+        n_trials: int = 50,
+        n_initial: int = 10,
+        batch_size: int = 1,
+        length_scale: float = 0.25,
+        seed: int = 42,
+    ):
+        self.n_trials = n_trials
+        self.n_initial = n_initial
+        self.batch_size = max(1, batch_size)
+        self.length_scale = length_scale
+        self.rng = np.random.default_rng(seed)
+
+    def search(self, grid: ParameterGrid, score: ScoreFn) -> SearchOutcome:
+        n_trials = min(self.n_trials, grid.size)
+        n_initial = max(1, min(self.n_initial, n_trials))
+
+        observed = [int(i) for i in self.rng.choice(grid.size, size=n_initial, replace=False)]
+        scores = list(score([grid[i] for i in observed], 1.0))
+
+        while len(observed) < n_trials:
+            pool = self._candidate_pool(grid.size, set(observed))
+            if len(pool) == 0:
+                break
+
+            ei = self._expected_improvement(grid, np.array(observed), np.array(scores), pool)
+            n_batch = min(self.batch_size, n_trials - len(observed), len(pool))
+            batch = pool[np.argsort(-ei, kind="stable")[:n_batch]]
+
+            observed.extend(int(i) for i in batch)
+            scores.extend(score([grid[i] for i in batch], 1.0))
+
+        best_params, best_metric = _select_best([grid[i] for i in observed], scores)
+        return SearchOutcome(best_params, best_metric, len(observed))
+
+    def _candidate_pool(self, size: int, observed: set) -> np.ndarray:
+        """Unevaluated grid indices, subsampled for very large grids."""
+        if size <= MAX_ACQUISITION_POOL:
+            return np.array([i for i in range(size) if i not in observed], dtype=np.int64)
+        sample = self.rng.choice(size, size=MAX_ACQUISITION_POOL, replace=False)
+        return np.array([i for i in sample if i not in observed], dtype=np.int64)
+
+    def _expected_improvement(
+        self,
+        grid: ParameterGrid,
+        observed: np.ndarray,
+        scores: np.ndarray,
+        pool: np.ndarray,
+    ) -> np.ndarray:
+        """Expected improvement of each pool point under the GP posterior."""
+        y = np.asarray(scores, dtype=float)
+        finite = np.isfinite(y)
+        if not finite.any():
+            return self.rng.random(len(pool))
+
+        # Unusable observations are pinned just below the worst usable one
+        floor = y[finite].min() - (y[finite].std() or 1.0)
+        y = np.where(finite, y, floor)
+        y_std = y.std() or 1.0
+        y = (y - y.mean()) / y_std
+
+        x_obs = grid.encode(observed)
+        x_new = grid.encode(pool)
+
+        k_obs = self._kernel(x_obs, x_obs) + 1e-6 * np.eye(len(x_obs))
+        chol = np.linalg.cholesky(k_obs)
+        alpha = np.linalg.solve(chol.T, np.linalg.solve(chol, y))
+
+        k_cross = self._kernel(x_obs, x_new)
+        mu = k_cross.T @ alpha
+        v = np.linalg.solve(chol, k_cross)
+        sigma = np.sqrt(np.clip(1.0 - np.sum(v ** 2, axis=0), 1e-12, None))
+
+        z = (mu - y.max()) / sigma
+        cdf = 0.5 * (1.0 + np.vectorize(math.erf)(z / math.sqrt(2.0)))
+        pdf = np.exp(-0.5 * z ** 2) / math.sqrt(2.0 * math.pi)
+        return (mu - y.max()) * cdf + sigma * pdf
+
+    def _kernel(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """Squared-exponential kernel."""
+        d2 = np.sum(a ** 2, axis=1)[:, None] + np.sum(b ** 2, axis=1)[None, :] - 2 * a @ b.T
+        return np.exp(-0.5 * np.clip(d2, 0, None) / self.length_scale ** 2)
+
@@ -0,0 +1,85 @@
+"""Built-in Backtest Strategies.
+
+Small reference strategies that the job queue and API can run by name.
+Both work on plain close prices and are called only on rebalance bars.
+"""
+
+from typing import Optional
+
+from src.backtesting.models import MarketEvent, ArrayMarketEvent, OrderSide, Signal
+from src.backtesting.portfolio import SimulatedPortfolio
+
+
+class EqualWeightStrategy:
+    """Hold every symbol with a valid bar at an equal target weight.
+
+    Args:
+        max_positions: Cap on holdings (alphabetical); None holds all.
+        gross_exposure: Total weight spread across the holdings.
+    """
+
+    def __init__(self, max_positions: Optional[int] = None, gross_exposure: float = 0.95):
+        self.max_positions = max_positions
+        self.gross_exposure = gross_exposure
+
+    def on_bar(self, event: MarketEvent | ArrayMarketEvent, portfolio: SimulatedPortfolio) -> list[Signal]:
+        symbols = sorted(event.bars)[: self.max_positions]
+        return _rebalance_to(symbols, event, portfolio, self.gross_exposure)
+
+
+class MomentumStrategy:
+    """Hold the top-N symbols by return over the last few rebalances.
+
+    Momentum is measured between rebalance bars, so ``lookback`` counts
+    rebalance periods (six monthly rebalances is roughly 6-month momentum).
+
+    Args:
+        lookback: Rebalance periods in the momentum window.
+        top_n: Number of symbols held.
+        gross_exposure: Total weight spread across the holdings.
+    """
+
+    def __init__(self, lookback: int = 6, top_n: int = 10, gross_exposure: float = 0.95):
+        self.lookback = lookback
+        self.top_n = top_n
+        self.gross_exposure = gross_exposure
+        self._history: list[dict[str, float]] = []
+
+    def on_bar(self, event: MarketEvent | ArrayMarketEvent, portfolio: SimulatedPortfolio) -> list[Signal]:
+        closes = {s: bar.close for s, bar in event.bars.items()}
+        self._history.append(closes)
+        if len(self._history) <= self.lookback:
+            return []
+        past = self._history[-self.lookback - 1]
+        self._history = self._history[-self.lookback - 1:]
+
+        scores = {s: closes[s] / past[s] - 1 for s in closes if past.get(s, 0) > 0}
+        winners = sorted(scores, key=scores.get, reverse=True)[: self.top_n]
+        return _rebalance_to(winners, event, portfolio, self.gross_exposure)
+
+
+def _rebalance_to(
+    symbols: list[str],
+    event: MarketEvent | ArrayMarketEvent,
+    portfolio: SimulatedPortfolio,
+    gross_exposure: float,
+) -> list[Signal]:
+    """Exit holdings outside ``symbols`` and equal-weight the rest."""
+    keep = set(symbols)
+    signals = [
+        Signal(symbol=s, timestamp=event.timestamp, side=OrderSide.SELL, target_weight=0.0)
+        for s in portfolio.positions if s not in keep
+    ]
+    if symbols:
+        weight = gross_exposure / len(symbols)
+        signals.extend(
+            Signal(symbol=s, timestamp=event.timestamp, side=OrderSide.BUY, target_weight=weight)
+            for s in symbols
+        )
+    return signals
+
+
+BUILTIN_STRATEGIES = {
+    "equal_weight": EqualWeightStrategy,
+    "momentum": MomentumStrategy,
+}
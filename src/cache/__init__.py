@@ -1,5 +1,15 @@
 """Redis caching package for Axion platform."""
 
+from src.cache.codec import CodecError, decode_dataframe, encode_dataframe
+from src.cache.local import LocalCache, estimate_size
 from src.cache.redis_client import RedisCache, cache
 
-__all__ = ["RedisCache", "cache"]
+__all__ = [
+    "RedisCache",
+    "cache",
+    "LocalCache",
+    "estimate_size",
+    "CodecError",
+    "encode_dataframe",
+    "decode_dataframe",
+]
@@ -0,0 +1,190 @@
+"""Binary DataFrame codec for the Redis cache.
+
+Serializes DataFrames as raw NumPy column buffers behind a small JSON
+header instead of ``to_json(orient="split")`` text. Payloads are
+self-describing (magic prefix), so readers can tell binary entries from
+legacy JSON entries per key.
+
+Layout::
+
+    b"AXDF" | version (1 byte) | flags (1 byte) | header length (uint32 LE)
+    | JSON header | column/index buffers (optionally zlib-compressed)
+
+Frames whose columns share one numeric dtype (the common price-panel
+case) are stored as a single row-major 2-D block. Otherwise numeric,
+boolean and datetime columns are stored as raw per-column buffers and
+any other column (strings, objects) is embedded in the header as a JSON
+list.
+"""
+
+import json
+import struct
+import zlib
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+MAGIC = b"AXDF"
+VERSION = 1
+FLAG_ZLIB = 0x01
+
+_PREFIX = struct.Struct("<4sBBI")
+
+# Payloads smaller than this are not worth compressing
+COMPRESS_MIN_BYTES = 4096
+
+
+class CodecError(ValueError):
+    """Raised when a DataFrame cannot be encoded or a payload decoded."""
+
+
+def is_binary_payload(payload: Any) -> bool:
+    """Whether a raw Redis value was written by encode_dataframe()."""
+    return isinstance(payload, (bytes, bytearray, memoryview)) and bytes(payload[:4]) == MAGIC
+
+
+def encode_dataframe(df: pd.DataFrame, compress: bool = True, level: int = 1) -> bytes:
+    """Encode a DataFrame to the binary cache format.
+
+    Args:
+        df: DataFrame with a flat index and JSON-serializable column labels.
+        compress: zlib-compress the buffers when the payload is large enough.
+        level: zlib compression level.
+
+    Raises:
+        CodecError: If the frame has a MultiIndex or unsupported labels.
+    """
+    if isinstance(df.index, pd.MultiIndex) or isinstance(df.columns, pd.MultiIndex):
+        raise CodecError("MultiIndex frames are not supported")
+
+    buffers: list[bytes] = []
+    try:
+        header = {
+            "nrows": len(df),
+            "columns": [_label(c) for c in df.columns],
+            "columns_name": _label(df.columns.name),
+            "index": _encode_values(df.index, buffers, is_index=True),
+        }
+        dtypes = set(df.dtypes)
+        if len(dtypes) == 1 and df.shape[1] > 1 and _is_plain_numeric(next(iter(dtypes))):
+            block = np.ascontiguousarray(df.to_numpy())
+            header["block"] = {"dtype": block.dtype.str, "offset": _offset(buffers)}
+            buffers.append(block.tobytes())
+        else:
+            header["data"] = [_encode_values(df.iloc[:, i], buffers) for i in range(df.shape[1])]
+        header_bytes = json.dumps(header, separators=(",", ":")).encode()
+    except (TypeError, ValueError) as e:
+        raise CodecError(f"Cannot encode DataFrame: {e}") from e
+
+    body = b"".join(buffers)
+    flags = 0
+    if compress and len(body) >= COMPRESS_MIN_BYTES:
+        body = zlib.compress(body, level)
+        flags |= FLAG_ZLIB
+
+    return _PREFIX.pack(MAGIC, VERSION, flags, len(header_bytes)) + header_bytes + body
+
+
+def decode_dataframe(payload: bytes) -> pd.DataFrame:
+    """Decode a payload produced by encode_dataframe().
+
+    Raises:
+        CodecError: If the payload is not a supported binary DataFrame.
+    """
+    payload = bytes(payload)
+    if len(payload) < _PREFIX.size:
+        raise CodecError("Payload too short")
+
+    magic, version, flags, header_len = _PREFIX.unpack_from(payload)
+    if magic != MAGIC or version != VERSION:
+        raise CodecError(f"Unsupported payload (magic={magic!r}, version={version})")
+
+    start = _PREFIX.size
+    header = json.loads(payload[start:start + header_len])
+    body = payload[start + header_len:]
+    if flags & FLAG_ZLIB:
+        body = zlib.decompress(body)
+
+    nrows = header["nrows"]
+    index = pd.Index(_decode_values(header["index"], body, nrows), name=header["index"].get("name"))
+    columns = pd.Index(header["columns"], name=header["columns_name"])
+
+    if "block" in header:
+        spec = header["block"]
+        block = np.frombuffer(
+            body, dtype=np.dtype(spec["dtype"]), count=nrows * len(columns), offset=spec["offset"],
+        )
+        return pd.DataFrame(block.reshape(nrows, len(columns)).copy(), index=index, columns=columns)
+
+    data = {
+        i: _decode_values(spec, body, nrows)
+        for i, spec in enumerate(header["data"])
+    }
+    df = pd.DataFrame(data, index=index)
+    df.columns = columns
+    return df
+
+
+def _label(label: Any) -> Any:
+    """Normalize a column/index label to a JSON-native value."""
+    if label is None or isinstance(label, (str, bool, int, float)):
+        return label
+    if isinstance(label, np.generic):
+        return label.item()
+    raise TypeError(f"unsupported label type {type(label).__name__}")
+
+
+def _encode_values(values: pd.Index | pd.Series, buffers: list[bytes], is_index: bool = False) -> dict:
+    """Append a column's buffer (if any) and return its header spec."""
+    spec: dict[str, Any] = {"name": _label(values.name)} if is_index else {}
+
+    if isinstance(values, pd.RangeIndex):
+        spec.update(kind="range", start=values.start, stop=values.stop, step=values.step)
+        return spec
+
+    dtype = values.dtype
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        utc = values.tz_convert("UTC") if is_index else values.dt.tz_convert("UTC")
+        naive = utc.tz_localize(None) if is_index else utc.dt.tz_localize(None)
+        arr = np.ascontiguousarray(naive.to_numpy())
+        spec.update(kind="datetime", dtype=arr.dtype.str, tz=str(dtype.tz), offset=_offset(buffers))
+    elif isinstance(dtype, np.dtype) and dtype.kind in "biufmM":
+        arr = np.ascontiguousarray(values.to_numpy())
+        spec.update(kind="array", dtype=arr.dtype.str, offset=_offset(buffers))
+    else:
+        items = values.tolist()
+        spec.update(kind="json", values=[None if _is_missing(v) else v for v in items])
+        json.dumps(spec["values"])  # surface unsupported objects as TypeError
+        return spec
+
+    buffers.append(arr.tobytes())
+    spec["nbytes"] = arr.nbytes
+    return spec
+
+
+def _is_plain_numeric(dtype) -> bool:
+    return isinstance(dtype, np.dtype) and dtype.kind in "biuf"
+
+
+def _offset(buffers: list[bytes]) -> int:
+    return sum(len(b) for b in buffers)
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or (isinstance(value, float) and np.isnan(value)) or value is pd.NaT
+
+
+def _decode_values(spec: dict, body: bytes, nrows: int):
+    """Rebuild a column/index from its header spec and the body buffer."""
+    kind = spec["kind"]
+    if kind == "range":
+        return pd.RangeIndex(spec["start"], spec["stop"], spec["step"])
+    if kind == "json":
+        return spec["values"]
+
+    offset = spec["offset"]
+    arr = np.frombuffer(body, dtype=np.dtype(spec["dtype"]), count=nrows, offset=offset)
+    if kind == "datetime":
+        return pd.DatetimeIndex(arr).tz_localize("UTC").tz_convert(spec["tz"])
+    return arr.copy()
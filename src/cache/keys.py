@@ -26,3 +26,6 @@ ECONOMIC = "axion:economic:{series_id}"
 
 # Session data (TTL: 8hr)
 SESSION = "axion:session:{session_id}"
+
+# Pub/sub channel for in-process (L1) cache invalidation
+CACHE_INVALIDATION = "axion:cache:invalidate"
@@ -0,0 +1,287 @@
+"""In-process (L1) cache tier in front of Redis.
+
+A bounded LRU with per-entry TTLs, sized by an estimate of each value's
+memory footprint so a handful of large price panels cannot crowd out
+the process. Two mechanisms keep it cheap and coherent under load:
+
+- Single-flight: concurrent misses on the same key share one upstream
+  fetch instead of each going to Redis / the database.
+- Invalidation: writers publish affected keys (or glob patterns) on the
+  ``keys.CACHE_INVALIDATION`` Redis channel; every process's listener
+  drops its local copies. TTLs bound staleness if a message is missed.
+
+Hits, misses, evictions and occupancy are exported through
+``src.observability.SystemMetrics``.
+"""
+
+import asyncio
+import fnmatch
+import json
+import logging
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+import numpy as np
+import pandas as pd
+
+from src.cache import keys
+from src.observability.system import SystemMetrics
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class _Entry:
+    value: Any
+    expires_at: float
+    nbytes: int
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate in-memory size of a cached value in bytes."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        usage = value.memory_usage(index=True, deep=True)
+        return int(usage.sum()) if isinstance(usage, pd.Series) else int(usage)
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return sys.getsizeof(value)
+
+
+class LocalCache:
+    """Size-aware LRU/TTL cache with single-flight loading.
+
+    Reads and writes are thread-safe. Single-flight coalescing applies to
+    callers on the same event loop.
+
+    Args:
+        name: Label for exported metrics.
+        max_entries: Entry limit; 0 disables storage (single-flight still applies).
+        max_bytes: Limit on the summed size estimates of all entries.
+        default_ttl: Seconds an entry lives when set() gets no ttl.
+        clock: Monotonic time source (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        name: str = "default",
+        max_entries: int = 256,
+        max_bytes: int = 512 * 1024 * 1024,
+        default_ttl: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.instance_id = uuid.uuid4().hex
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._nbytes = 0
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._pubsub = None
+        self._listener = None
+        self.metrics = SystemMetrics()
+
+    @classmethod
+    def from_settings(cls, name: str = "default") -> "LocalCache":
+        """Build a cache sized by the ``l1_cache_*`` settings."""
+        from src.settings import get_settings
+        settings = get_settings()
+        return cls(
+            name=name,
+            max_entries=settings.l1_cache_max_entries if settings.l1_cache_enabled else 0,
+            max_bytes=settings.l1_cache_max_mb * 1024 * 1024,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    # --- Reads / Writes ---
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the live value for key, or None on a miss."""
+        expired = False
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= self._clock():
+                self._remove(key)
+                entry, expired = None, True
+            elif entry is not None:
+                self._entries.move_to_end(key)
+
+        if expired:
+            self.metrics.record_l1_eviction(self.name, "expired")
+            self._publish_usage()
+        if entry is None:
+            self.metrics.record_l1_miss(self.name)
+            return None
+        self.metrics.record_l1_hit(self.name)
+        return entry.value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None, nbytes: Optional[int] = None) -> bool:
+        """Store a value, evicting least-recently-used entries to fit.
+
+        Returns False if the cache is disabled or the value alone exceeds
+        max_bytes.
+        """
+        if not self.enabled:
+            return False
+        size = estimate_size(value) if nbytes is None else nbytes
+        if size > self.max_bytes:
+            logger.debug("L1 %s: %s (%d bytes) exceeds capacity", self.name, key, size)
+            return False
+
+        expires_at = self._clock() + (self.default_ttl if ttl is None else ttl)
+        evicted = 0
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            while self._entries and (
+                len(self._entries) >= self.max_entries or self._nbytes + size > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+                evicted += 1
+            self._entries[key] = _Entry(value, expires_at, size)
+            self._nbytes += size
+
+        if evicted:
+            self.metrics.record_l1_eviction(self.name, "size", evicted)
+        self._publish_usage()
+        return True
+
+    def invalidate(self, key: str) -> bool:
+        """Drop a key. Returns whether it was present."""
+        with self._lock:
+            present = key in self._entries
+            if present:
+                self._remove(key)
+        if present:
+            self.metrics.record_l1_eviction(self.name, "invalidated")
+            self._publish_usage()
+        return present
+
+    def invalidate_pattern(self, pattern: str) -> int:
+        """Drop all keys matching a glob pattern (Redis SCAN syntax)."""
+        with self._lock:
+            matched = [k for k in self._entries if fnmatch.fnmatchcase(k, pattern)]
+            for key in matched:
+                self._remove(key)
+        if matched:
+            self.metrics.record_l1_eviction(self.name, "invalidated", len(matched))
+            self._publish_usage()
+        return len(matched)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+        self._publish_usage()
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry. Caller holds the lock."""
+        entry = self._entries.pop(key)
+        self._nbytes -= entry.nbytes
+
+    def _publish_usage(self) -> None:
+        self.metrics.update_l1_usage(self.name, len(self._entries), self._nbytes)
+
+    # --- Single-flight ---
+
+    async def single_flight(self, key: str, loader: Callable[[], Awaitable[T]]) -> T:
+        """Run loader() once for all concurrent callers of the same key.
+
+        The first caller runs the loader; callers arriving while it is in
+        flight await the same result (or exception).
+        """
+        loop = asyncio.get_running_loop()
+        flight = self._inflight.get(key)
+        if flight is not None and flight.get_loop() is loop:
+            self.metrics.record_l1_coalesced(self.name)
+            # Shield so a cancelled waiter does not cancel the shared fetch
+            return await asyncio.shield(flight)
+
+        flight = loop.create_future()
+        self._inflight[key] = flight
+        try:
+            result = await loader()
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except BaseException as e:
+            flight.set_exception(e)
+            flight.exception()  # mark retrieved when nobody was waiting
+            raise
+        else:
+            flight.set_result(result)
+            return result
+        finally:
+            if self._inflight.get(key) is flight:
+                del self._inflight[key]
+
+    # --- Cross-process invalidation ---
+
+    def start_invalidation_listener(self, redis_cache, sleep_time: float = 1.0) -> bool:
+        """Subscribe to invalidation messages on a background thread.
+
+        Args:
+            redis_cache: RedisCache whose sync client carries the subscription.
+            sleep_time: Poll interval of the listener thread.
+
+        Returns:
+            Whether the listener is running.
+        """
+        if self._listener is not None:
+            return True
+        try:
+            client = redis_cache.get_sync_client()
+            self._pubsub = client.pubsub(ignore_subscribe_messages=True)
+            self._pubsub.subscribe(**{keys.CACHE_INVALIDATION: self.handle_invalidation})
+            self._listener = self._pubsub.run_in_thread(sleep_time=sleep_time, daemon=True)
+        except Exception as e:
+            logger.warning("L1 %s: invalidation listener unavailable, relying on TTLs: %s", self.name, e)
+            self._pubsub = None
+            return False
+        return True
+
+    def stop_invalidation_listener(self) -> None:
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+        if self._pubsub is not None:
+            self._pubsub.close()
+            self._pubsub = None
+
+    def handle_invalidation(self, message: dict) -> None:
+        """Apply an invalidation message published by RedisCache."""
+        try:
+            payload = json.loads(message["data"])
+        except (KeyError, TypeError, ValueError) as e:
+            logger.debug("L1 %s: ignoring malformed invalidation: %s", self.name, e)
+            return
+        if payload.get("origin") == self.instance_id:
+            return
+        for key in payload.get("keys", []):
+            self.invalidate(key)
+        for pattern in payload.get("patterns", []):
+            self.invalidate_pattern(pattern)
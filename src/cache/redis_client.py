@@ -2,6 +2,10 @@
 
 Provides both async and sync access to Redis with DataFrame serialization,
 JSON storage, and TTL-based expiration.
+
+DataFrames are written with the binary codec in ``src.cache.codec`` by
+default. The format is detected per key on read, so entries written as
+JSON (``to_json(orient="split")``) remain readable.
 """
 
 import json
@@ -11,15 +15,28 @@ from typing import Any, Optional
 
 import pandas as pd
 
+from src.cache.codec import CodecError, decode_dataframe, encode_dataframe, is_binary_payload
+from src.cache.keys import CACHE_INVALIDATION
+
 logger = logging.getLogger(__name__)
 
 
 class RedisCache:
-    """Redis cache with async and sync support."""
+    """Redis cache with async and sync support.
 
-    def __init__(self):
+    Args:
+        df_codec: DataFrame write format, "binary" or "json".
+        compress: zlib-compress large binary DataFrame payloads (trades
+            CPU for roughly half the bytes on price panels).
+    """
+
+    def __init__(self, df_codec: str = "binary", compress: bool = False):
+        if df_codec not in ("binary", "json"):
+            raise ValueError(f"Unknown DataFrame codec: {df_codec}")
         self._async_client = None
         self._sync_client = None
+        self.df_codec = df_codec
+        self.compress = compress
 
     # --- Connection Management ---
 
@@ -59,25 +76,55 @@ class RedisCache:
                 raise
         return self._sync_client
 
+    # --- DataFrame Serialization ---
+
+    def encode_dataframe(self, df: pd.DataFrame, codec: Optional[str] = None) -> bytes | str:
+        """Serialize a DataFrame with the given (or default) codec.
+
+        Frames the binary codec cannot represent fall back to JSON.
+        """
+        if (codec or self.df_codec) == "binary":
+            try:
+                return encode_dataframe(df, compress=self.compress)
+            except CodecError as e:
+                logger.debug("Binary codec unavailable, using JSON: %s", e)
+        return df.to_json(orient="split", date_format="iso")
+
+    @staticmethod
+    def decode_dataframe(data: bytes | str) -> pd.DataFrame:
+        """Deserialize a DataFrame, detecting binary vs legacy JSON."""
+        if is_binary_payload(data):
+            return decode_dataframe(data)
+        return pd.read_json(StringIO(data) if isinstance(data, str) else StringIO(data.decode()), orient="split")
+
     # --- Async DataFrame Operations ---
 
     async def get_dataframe(self, key: str) -> Optional[pd.DataFrame]:
-        """Get a JSON-serialized DataFrame from Redis."""
+        """Get a DataFrame (binary or JSON-serialized) from Redis."""
         try:
             client = await self.get_async_client()
             data = await client.get(key)
             if data is None:
                 return None
-            return pd.read_json(StringIO(data) if isinstance(data, str) else StringIO(data.decode()), orient="split")
+            return self.decode_dataframe(data)
         except Exception as e:
             logger.debug("Redis get_dataframe miss for %s: %s", key, e)
             return None
 
-    async def set_dataframe(self, key: str, df: pd.DataFrame, ttl: int) -> None:
-        """Store a DataFrame in Redis as JSON with TTL."""
+    async def set_dataframe(
+        self, key: str, df: pd.DataFrame, ttl: int, codec: Optional[str] = None,
+    ) -> None:
+        """Store a DataFrame in Redis with TTL.
+
+        Args:
+            key: Cache key.
+            df: Frame to store.
+            ttl: Expiry in seconds.
+            codec: Override the instance codec ("binary" or "json").
+        """
         try:
             client = await self.get_async_client()
-            payload = df.to_json(orient="split", date_format="iso")
+            payload = self.encode_dataframe(df, codec)
             await client.setex(key, ttl, payload)
         except Exception as e:
             logger.warning("Redis set_dataframe failed for %s: %s", key, e)
@@ -119,22 +166,24 @@ class RedisCache:
     # --- Sync Operations (backward compatibility) ---
 
     def get_dataframe_sync(self, key: str) -> Optional[pd.DataFrame]:
-        """Synchronous DataFrame get (JSON-serialized)."""
+        """Synchronous DataFrame get (binary or JSON-serialized)."""
         try:
             client = self.get_sync_client()
             data = client.get(key)
             if data is None:
                 return None
-            return pd.read_json(StringIO(data) if isinstance(data, str) else StringIO(data.decode()), orient="split")
+            return self.decode_dataframe(data)
         except Exception as e:
             logger.debug("Redis sync get_dataframe miss for %s: %s", key, e)
             return None
 
-    def set_dataframe_sync(self, key: str, df: pd.DataFrame, ttl: int) -> None:
-        """Synchronous DataFrame set (JSON-serialized)."""
+    def set_dataframe_sync(
+        self, key: str, df: pd.DataFrame, ttl: int, codec: Optional[str] = None,
+    ) -> None:
+        """Synchronous DataFrame set."""
         try:
             client = self.get_sync_client()
-            payload = df.to_json(orient="split", date_format="iso")
+            payload = self.encode_dataframe(df, codec)
             client.setex(key, ttl, payload)
         except Exception as e:
             logger.warning("Redis sync set_dataframe failed for %s: %s", key, e)
@@ -162,17 +211,41 @@ class RedisCache:
     # --- Cache Invalidation ---
 
     async def invalidate_pattern(self, pattern: str) -> int:
-        """Delete all keys matching a pattern. Returns count deleted."""
+        """Delete all keys matching a pattern. Returns count deleted.
+
+        Also tells in-process caches to drop matching keys.
+        """
         try:
             client = await self.get_async_client()
             count = 0
             async for key in client.scan_iter(match=pattern):
                 await client.delete(key)
                 count += 1
-            return count
         except Exception as e:
             logger.warning("Redis invalidate_pattern failed for %s: %s", pattern, e)
             return 0
+        await self.publish_invalidation(patterns=[pattern])
+        return count
+
+    async def publish_invalidation(
+        self,
+        keys: Optional[list[str]] = None,
+        patterns: Optional[list[str]] = None,
+        origin: str = "",
+    ) -> None:
+        """Broadcast an L1 invalidation on the invalidation channel.
+
+        Args:
+            keys: Exact keys to drop.
+            patterns: Glob patterns to drop.
+            origin: Sender's LocalCache.instance_id, so it skips its own message.
+        """
+        message = json.dumps({"origin": origin, "keys": keys or [], "patterns": patterns or []})
+        try:
+            client = await self.get_async_client()
+            await client.publish(CACHE_INVALIDATION, message)
+        except Exception as e:
+            logger.debug("Redis publish_invalidation failed: %s", e)
 
     async def close(self) -> None:
         """Close all connections."""
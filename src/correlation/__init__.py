@@ -25,11 +25,13 @@ from src.correlation.config import (
     STANDARD_WINDOWS,
     CorrelationConfig,
     RollingConfig,
+    StreamingConfig,
     RegimeConfig,
     DiversificationConfig,
     CorrelationAnalysisConfig,
     DEFAULT_CORRELATION_CONFIG,
     DEFAULT_ROLLING_CONFIG,
+    DEFAULT_STREAMING_CONFIG,
     DEFAULT_REGIME_CONFIG,
     DEFAULT_DIVERSIFICATION_CONFIG,
     DEFAULT_CONFIG,
@@ -44,6 +46,7 @@ from src.correlation.models import (
 )
 
 from src.correlation.engine import CorrelationEngine
+from src.correlation.streaming import StreamingCorrelationService, load_correlation_history
 from src.correlation.regime import CorrelationRegimeDetector
 from src.correlation.diversification import DiversificationAnalyzer
 
@@ -56,11 +59,13 @@ __all__ = [
     "STANDARD_WINDOWS",
     "CorrelationConfig",
     "RollingConfig",
+    "StreamingConfig",
     "RegimeConfig",
     "DiversificationConfig",
     "CorrelationAnalysisConfig",
     "DEFAULT_CORRELATION_CONFIG",
     "DEFAULT_ROLLING_CONFIG",
+    "DEFAULT_STREAMING_CONFIG",
     "DEFAULT_REGIME_CONFIG",
     "DEFAULT_DIVERSIFICATION_CONFIG",
     "DEFAULT_CONFIG",
@@ -72,6 +77,8 @@ __all__ = [
     "DiversificationScore",
     # Components
     "CorrelationEngine",
+    "StreamingCorrelationService",
+    "load_correlation_history",
     "CorrelationRegimeDetector",
     "DiversificationAnalyzer",
 ]
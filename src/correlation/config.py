@@ -6,6 +6,7 @@ regime detection, and diversification analysis.
 
 from dataclasses import dataclass, field
 from enum import Enum
+from typing import Optional
 
 
 class CorrelationMethod(str, Enum):
@@ -64,6 +65,18 @@ class RollingConfig:
     min_periods: int = 20
 
 
+@dataclass
+class StreamingConfig:
+    """Configuration for the incremental correlation service."""
+    window: int = 63
+    window_type: WindowType = WindowType.FIXED
+    half_life: int = 30  # For exponential weighting
+    min_periods: int = 20
+    resync_every: int = 1_000  # Rebuild fixed-window sums to bound rounding drift
+    history_path: Optional[str] = None  # .npy memmap of matrix snapshots
+    history_capacity: int = 256  # Snapshots kept (ring buffer)
+
+
 @dataclass
 class RegimeConfig:
     """Configuration for correlation regime detection."""
@@ -94,6 +107,7 @@ class CorrelationAnalysisConfig:
 
 DEFAULT_CORRELATION_CONFIG = CorrelationConfig()
 DEFAULT_ROLLING_CONFIG = RollingConfig()
+DEFAULT_STREAMING_CONFIG = StreamingConfig()
 DEFAULT_REGIME_CONFIG = RegimeConfig()
 DEFAULT_DIVERSIFICATION_CONFIG = DiversificationConfig()
 DEFAULT_CONFIG = CorrelationAnalysisConfig()
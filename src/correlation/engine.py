@@ -184,14 +184,11 @@ class CorrelationEngine:
 
         rolling_corr = rolling_corr.dropna()
 
-        dates = []
-        for idx in rolling_corr.index:
-            if isinstance(idx, date):
-                dates.append(idx)
-            elif hasattr(idx, 'date'):
-                dates.append(idx.date())
-            else:
-                dates.append(idx)
+        index = rolling_corr.index
+        if isinstance(index, pd.DatetimeIndex):
+            dates = list(index.date)
+        else:
+            dates = [idx.date() if hasattr(idx, 'date') and not isinstance(idx, date) else idx for idx in index]
 
         return RollingCorrelation(
             symbol_a=symbol_a,
@@ -0,0 +1,364 @@
+"""Incremental Correlation Service.
+
+Maintains running sums and cross-products for a fixed universe so the
+full N×N rolling, expanding, or EWMA correlation matrix updates in
+O(N²) per new bar, serves pairs and rows straight from that state, and
+can append matrix snapshots to a memory-mapped history file.
+"""
+
+import logging
+import os
+from datetime import date, datetime
+from typing import Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from src.correlation.config import (
+    CorrelationMethod,
+    StreamingConfig,
+    WindowType,
+    DEFAULT_STREAMING_CONFIG,
+)
+from src.correlation.models import CorrelationMatrix
+
+logger = logging.getLogger(__name__)
+
+
+class StreamingCorrelationService:
+    """Keeps a live correlation matrix over a fixed symbol universe.
+
+    State is the weight total, the weighted sum of returns and the
+    weighted cross-product matrix: equal weights over the last
+    ``window`` bars (FIXED), all bars (EXPANDING), or exponentially
+    decaying weights with ``half_life`` (EXPONENTIAL, matching pandas
+    ``ewm(halflife=...)``). Missing returns are treated as zero.
+
+    Example:
+        service = StreamingCorrelationService(symbols)
+        service.update_many(history)          # seed from past bars
+        service.update(latest_bar)            # every 5 minutes
+        matrix = service.matrix()
+        service.get_pair("AAPL", "MSFT")
+    """
+
+    def __init__(
+        self,
+        symbols: list[str],
+        config: Optional[StreamingConfig] = None,
+    ) -> None:
+        self.config = config or DEFAULT_STREAMING_CONFIG
+        self.symbols = list(symbols)
+        self._index = {s: i for i, s in enumerate(self.symbols)}
+        n = len(self.symbols)
+
+        self._weight = 0.0
+        self._sum = np.zeros(n)
+        self._cross = np.zeros((n, n))
+        self._count = 0
+        self._bars_since_resync = 0
+        self._decay = 0.5 ** (1.0 / self.config.half_life)
+        self._last_timestamp = None
+        self._first_timestamp = None
+        self._matrix: Optional[CorrelationMatrix] = None
+
+        # Ring buffer of the bars currently in a fixed window
+        self._window = np.zeros((self.config.window, n)) if self._fixed else None
+        self._window_pos = 0
+        self._filled = 0
+
+        self._history: Optional[np.memmap] = None
+        self._history_times: Optional[np.memmap] = None
+        self._history_count = 0
+
+    @property
+    def _fixed(self) -> bool:
+        return self.config.window_type == WindowType.FIXED
+
+    @property
+    def n_periods(self) -> int:
+        """Bars currently contributing to the estimate."""
+        return self._filled if self._fixed else self._count
+
+    # =========================================================================
+    # Updates
+    # =========================================================================
+
+    def update(
+        self,
+        bar: Union[pd.Series, np.ndarray, dict],
+        timestamp: Optional[Union[date, datetime]] = None,
+    ) -> None:
+        """Add one bar of returns.
+
+        Args:
+            bar: Returns keyed by symbol (Series/dict) or in universe order.
+            timestamp: Bar time (defaults to the Series name, if any).
+        """
+        if isinstance(bar, dict):
+            bar = pd.Series(bar)
+        if isinstance(bar, pd.Series):
+            timestamp = timestamp if timestamp is not None else bar.name
+            bar = bar.reindex(self.symbols).to_numpy(dtype=float)
+        self._apply(np.asarray(bar, dtype=float).reshape(1, -1), timestamp, timestamp)
+
+    def update_many(self, returns: pd.DataFrame) -> None:
+        """Add a block of bars (rows in time order, columns are symbols).
+
+        Args:
+            returns: DataFrame of returns; unknown columns are ignored.
+        """
+        if len(returns) == 0:
+            return
+        block = returns.reindex(columns=self.symbols).to_numpy(dtype=float)
+        self._apply(block, returns.index[0], returns.index[-1])
+
+    def _apply(self, block: np.ndarray, first, last) -> None:
+        block = np.nan_to_num(block, nan=0.0, posinf=0.0, neginf=0.0)
+        k = len(block)
+
+        if self.config.window_type == WindowType.EXPONENTIAL:
+            # Ages k-1 .. 0 relative to the newest bar
+            weights = self._decay ** np.arange(k - 1, -1, -1)
+            carry = self._decay ** k
+            self._weight = carry * self._weight + weights.sum()
+            self._sum = carry * self._sum + weights @ block
+            self._cross *= carry
+            self._cross += (block * weights[:, None]).T @ block
+        elif self.config.window_type == WindowType.EXPANDING:
+            self._weight += k
+            self._sum += block.sum(axis=0)
+            self._cross += block.T @ block
+        else:
+            self._apply_fixed(block)
+
+        self._count += k
+        if self._first_timestamp is None:
+            self._first_timestamp = first
+        self._last_timestamp = last
+        self._matrix = None
+
+    def _apply_fixed(self, block: np.ndarray) -> None:
+        window = self.config.window
+        if len(block) >= window:
+            self._window[:] = block[-window:]
+            self._window_pos = 0
+            self._filled = window
+            self._resync()
+            return
+
+        k = len(block)
+        slots = (self._window_pos + np.arange(k)) % window
+        # Bars leaving the window: the data-holding slots being overwritten
+        n_out = max(self._filled + k - window, 0)
+        if n_out:
+            outgoing = self._window[slots[k - n_out:]]
+            self._sum -= outgoing.sum(axis=0)
+            self._cross -= outgoing.T @ outgoing
+        self._sum += block.sum(axis=0)
+        self._cross += block.T @ block
+        self._filled = min(self._filled + k, window)
+        self._weight = float(self._filled)
+        self._window[slots] = block
+        self._window_pos = (self._window_pos + k) % window
+
+        self._bars_since_resync += k
+        if self._bars_since_resync >= self.config.resync_every:
+            self._resync()
+
+    def _resync(self) -> None:
+        """Recompute fixed-window sums from the buffered bars."""
+        rows = self._window[:self._filled]
+        self._weight = float(len(rows))
+        self._sum = rows.sum(axis=0)
+        self._cross = rows.T @ rows
+        self._bars_since_resync = 0
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def _moments(self) -> tuple[np.ndarray, np.ndarray]:
+        mean = self._sum / self._weight
+        var = np.diag(self._cross) / self._weight - mean**2
+        std = np.sqrt(np.clip(var, 0, None))
+        return mean, np.where(std > 1e-12, std, np.nan)
+
+    def _ready(self) -> bool:
+        return self._weight > 0 and self.n_periods >= self.config.min_periods
+
+    def matrix(self) -> CorrelationMatrix:
+        """Current N×N correlation matrix (cached until the next update)."""
+        if self._matrix is not None:
+            return self._matrix
+
+        values = None
+        if self._ready():
+            mean, std = self._moments()
+            values = self._cross / self._weight
+            values -= np.outer(mean, mean)
+            values /= std[:, None]
+            values /= std[None, :]
+            np.clip(values, -1.0, 1.0, out=values)
+            np.fill_diagonal(values, np.where(np.isnan(std), np.nan, 1.0))
+
+        self._matrix = CorrelationMatrix(
+            symbols=self.symbols,
+            values=values,
+            method=CorrelationMethod.PEARSON,
+            n_periods=self.n_periods,
+            start_date=_to_date(self._first_timestamp),
+            end_date=_to_date(self._last_timestamp),
+        )
+        return self._matrix
+
+    def get_pair(self, symbol_a: str, symbol_b: str) -> float:
+        """Correlation between two symbols (NaN if unavailable)."""
+        if symbol_a not in self._index or symbol_b not in self._index or not self._ready():
+            return float("nan")
+        i, j = self._index[symbol_a], self._index[symbol_b]
+        if self._matrix is not None and self._matrix.values is not None:
+            return float(self._matrix.values[i, j])
+        if i == j:
+            return 1.0
+        w = self._weight
+        mean_i, mean_j = self._sum[i] / w, self._sum[j] / w
+        cov = self._cross[i, j] / w - mean_i * mean_j
+        var_i = self._cross[i, i] / w - mean_i**2
+        var_j = self._cross[j, j] / w - mean_j**2
+        if var_i <= 0 or var_j <= 0:
+            return float("nan")
+        return float(np.clip(cov / np.sqrt(var_i * var_j), -1.0, 1.0))
+
+    def get_row(self, symbol: str) -> pd.Series:
+        """Correlations of one symbol against the whole universe."""
+        if symbol not in self._index or not self._ready():
+            return pd.Series(np.nan, index=self.symbols, dtype=float)
+        i = self._index[symbol]
+        if self._matrix is not None and self._matrix.values is not None:
+            return pd.Series(self._matrix.values[i], index=self.symbols)
+        mean, std = self._moments()
+        row = (self._cross[i] / self._weight - mean[i] * mean) / (std[i] * std)
+        row = np.clip(row, -1.0, 1.0)
+        row[i] = 1.0 if not np.isnan(std[i]) else np.nan
+        return pd.Series(row, index=self.symbols)
+
+    # =========================================================================
+    # Memory-mapped history
+    # =========================================================================
+
+    def record_snapshot(self, timestamp: Optional[Union[date, datetime]] = None) -> int:
+        """Append the current matrix (upper triangle, float32) to the history file.
+
+        The file is a ring buffer of ``history_capacity`` snapshots; the
+        oldest is overwritten once it is full.
+
+        Returns:
+            Slot the snapshot was written to.
+        """
+        values = self.matrix().values
+        if values is None:
+            raise ValueError("Not enough data for a correlation snapshot")
+        self._open_history()
+        slot = self._history_count % self.config.history_capacity
+        upper = np.triu_indices(len(self.symbols), k=1)
+        self._history[slot] = values[upper]
+        ts = timestamp if timestamp is not None else self._last_timestamp
+        self._history_times[slot] = pd.Timestamp(ts).value if ts is not None else 0
+        self._history_count += 1
+        return slot
+
+    def _open_history(self) -> None:
+        """Map the history files; after close() the ones already written are reopened."""
+        if self._history is not None:
+            return
+        path = self.config.history_path
+        if path is None:
+            raise ValueError("StreamingConfig.history_path is not set")
+        n = len(self.symbols)
+        capacity = self.config.history_capacity
+        reuse = self._history_count > 0
+        self._history, kept = _open_memmap(path, np.float32, (capacity, n * (n - 1) // 2), reuse)
+        self._history_times, kept_times = _open_memmap(_times_path(path), np.int64, (capacity,), reuse)
+        if not (kept and kept_times):
+            self._history_count = 0
+
+    def _history_order(self) -> np.ndarray:
+        capacity = self.config.history_capacity
+        if self._history_count <= capacity:
+            return np.arange(self._history_count)
+        start = self._history_count % capacity
+        return (start + np.arange(capacity)) % capacity
+
+    def _pair_offset(self, i: int, j: int) -> int:
+        i, j = min(i, j), max(i, j)
+        n = len(self.symbols)
+        return i * n - i * (i + 1) // 2 + (j - i - 1)
+
+    def pair_history(self, symbol_a: str, symbol_b: str) -> pd.Series:
+        """Recorded correlation of one pair, oldest snapshot first."""
+        if self._history_count == 0:
+            return pd.Series(dtype=float)
+        self._open_history()
+        order = self._history_order()
+        i, j = self._index[symbol_a], self._index[symbol_b]
+        times = pd.to_datetime(self._history_times[order])
+        if i == j:
+            return pd.Series(1.0, index=times)
+        return pd.Series(self._history[order, self._pair_offset(i, j)].astype(float), index=times)
+
+    def avg_correlation_history(self) -> pd.Series:
+        """Average pairwise correlation of each recorded snapshot."""
+        if self._history_count == 0:
+            return pd.Series(dtype=float)
+        self._open_history()
+        order = self._history_order()
+        means = [float(np.nanmean(self._history[slot], dtype=np.float64)) for slot in order]
+        return pd.Series(means, index=pd.to_datetime(self._history_times[order]))
+
+    def close(self) -> None:
+        """Flush and release the history memmap."""
+        for mm in (self._history, self._history_times):
+            if mm is not None:
+                mm.flush()
+        self._history = self._history_times = None
+
+    def __enter__(self) -> "StreamingCorrelationService":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def load_correlation_history(path: str) -> tuple[np.ndarray, np.ndarray]:
+    """Open a recorded history read-only: (snapshots x pairs, timestamps in ns)."""
+    return np.load(path, mmap_mode="r"), np.load(_times_path(path), mmap_mode="r")
+
+
+def _open_memmap(path: str, dtype, shape: tuple, reuse: bool) -> tuple[np.ndarray, bool]:
+    """Open ``path`` read-write if it already has this layout, else create it.
+
+    Returns:
+        The memmap and whether existing contents were kept.
+    """
+    if reuse and os.path.exists(path):
+        mm = np.lib.format.open_memmap(path, mode="r+")
+        if mm.dtype == dtype and mm.shape == shape:
+            return mm, True
+        del mm
+    return np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=shape), False
+
+
+def _times_path(path: str) -> str:
+    root, ext = os.path.splitext(path)
+    return f"{root}.times{ext or '.npy'}"
+
+
+def _to_date(ts) -> Optional[date]:
+    if ts is None:
+        return None
+    if isinstance(ts, datetime):
+        return ts.date()
+    if isinstance(ts, date):
+        return ts
+    return None
@@ -3,14 +3,24 @@
 import os
 import time
 import pickle
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 
 import numpy as np
 import pandas as pd
 import yfinance as yf
+from pandas.tseries.offsets import BDay
 from tqdm import tqdm
 
 import config
+from src.resilience.config import RateLimiterConfig
+from src.resilience.rate_limiter import RateLimiter
+
+# Per-ticker price store record layout
+PRICE_RECORD_DTYPE = np.dtype([("date", "datetime64[ns]"), ("close", "float64")])
+
+# Relative change in an already-stored close that signals re-adjusted history
+READJUST_TOLERANCE = 1e-4
 
 
 def _use_new_backend() -> bool:
@@ -48,7 +58,13 @@ def _save_cache(path: str, data):
 def download_price_data(
     tickers: list[str], use_cache: bool = True, verbose: bool = False
 ) -> pd.DataFrame:
-    """Download adjusted close prices for all tickers in batches.
+    """Download adjusted close prices for all tickers.
+
+    Prices are kept in a per-ticker store under ``CACHE_DIR/prices`` and
+    only the missing tail since each ticker's last stored date is
+    downloaded. Batches are fetched concurrently under a shared rate
+    limit. A ticker whose history was re-adjusted upstream (split or
+    dividend) is re-downloaded in full.
 
     Returns DataFrame with dates as index, tickers as columns.
     """
@@ -60,51 +76,163 @@ def download_price_data(
         except Exception:
             pass  # Fall through to original implementation
 
-    cache_file = _cache_path("prices")
-    if use_cache and _cache_valid(cache_file):
-        if verbose:
-            print("  Loading cached price data...")
-        return _load_cache(cache_file)
-
-    end = datetime.now()
+    end = pd.Timestamp(datetime.now().date())
     start = end - timedelta(days=config.PRICE_HISTORY_MONTHS * 30)
 
-    all_data = pd.DataFrame()
-    batches = [
-        tickers[i : i + config.BATCH_SIZE]
-        for i in range(0, len(tickers), config.BATCH_SIZE)
-    ]
+    stored = {}
+    plan: dict[pd.Timestamp, list[str]] = {}
+    for ticker in dict.fromkeys(tickers):
+        records = _load_stored_prices(ticker) if use_cache else None
+        if records is None or len(records) == 0:
+            plan.setdefault(start, []).append(ticker)
+            continue
+        stored[ticker] = records
+        last = pd.Timestamp(records["date"][-1])
+        if last + BDay(1) < end:  # end is exclusive, so today's bar is never fetched
+            # Re-fetch the last stored day to detect upstream re-adjustment
+            plan.setdefault(last, []).append(ticker)
 
     if verbose:
-        print(f"  Downloading prices in {len(batches)} batches...")
+        n_fetch = sum(len(v) for v in plan.values())
+        print(f"  Prices: {len(tickers) - n_fetch} tickers current, {n_fetch} to update...")
 
-    for batch in tqdm(batches, desc="Price batches", disable=not verbose):
-        try:
-            df = yf.download(
-                batch,
-                start=start.strftime("%Y-%m-%d"),
-                end=end.strftime("%Y-%m-%d"),
-                auto_adjust=True,
-                progress=False,
-            )
-            if isinstance(df.columns, pd.MultiIndex):
-                closes = df["Close"]
-            else:
-                closes = df[["Close"]]
-                closes.columns = batch[:1]
-
-            all_data = pd.concat([all_data, closes], axis=1)
-        except Exception as e:
-            if verbose:
-                print(f"    Batch failed: {e}")
-
-        time.sleep(config.BATCH_SLEEP)
-
-    all_data = all_data.loc[:, ~all_data.columns.duplicated()]
-    _save_cache(cache_file, all_data)
+    fetched = _fetch_closes(plan, end, verbose)
+
+    readjusted = []
+    for ticker, closes in fetched.items():
+        records = _merge_price_records(stored.get(ticker), closes)
+        if records is None:
+            readjusted.append(ticker)
+            continue
+        _save_stored_prices(ticker, records)
+        stored[ticker] = records
+
+    if readjusted:
+        if verbose:
+            print(f"  Re-downloading {len(readjusted)} re-adjusted tickers...")
+        for ticker, closes in _fetch_closes({start: readjusted}, end, verbose).items():
+            records = _merge_price_records(None, closes)
+            _save_stored_prices(ticker, records)
+            stored[ticker] = records
+
+    columns = []
+    for ticker in dict.fromkeys(tickers):
+        records = stored.get(ticker)
+        if records is None or len(records) == 0:
+            continue
+        series = pd.Series(records["close"], index=pd.DatetimeIndex(records["date"]), name=ticker)
+        columns.append(series.loc[start:end - pd.Timedelta(1, "ns")])
+
+    if not columns:
+        return pd.DataFrame()
+    all_data = pd.concat(columns, axis=1).sort_index()
+    all_data.index.name = "Date"
     return all_data
 
 
+def _price_store_path(ticker: str) -> str:
+    directory = os.path.join(config.CACHE_DIR, "prices")
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, f"{ticker.replace('/', '_')}.npy")
+
+
+def _load_stored_prices(ticker: str) -> np.ndarray | None:
+    """Memory-map a ticker's stored (date, close) records, if any."""
+    path = _price_store_path(ticker)
+    if not os.path.exists(path):
+        return None
+    try:
+        records = np.load(path, mmap_mode="r")
+    except (OSError, ValueError):
+        return None
+    return records if records.dtype == PRICE_RECORD_DTYPE else None
+
+
+def _save_stored_prices(ticker: str, records: np.ndarray):
+    path = _price_store_path(ticker)
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        np.save(f, records)
+    os.replace(tmp, path)  # readers holding a memmap keep the old file
+
+
+def _merge_price_records(stored: np.ndarray | None, closes: pd.Series) -> np.ndarray | None:
+    """Append freshly downloaded closes to stored records.
+
+    Returns None when the overlapping day disagrees with the stored close,
+    meaning the ticker's adjusted history changed and must be re-fetched.
+    """
+    closes = closes.dropna()
+    closes.index = pd.DatetimeIndex(closes.index).tz_localize(None).as_unit("ns")
+    new = np.empty(len(closes), dtype=PRICE_RECORD_DTYPE)
+    new["date"] = closes.index.to_numpy()
+    new["close"] = closes.to_numpy(dtype=np.float64)
+    if stored is None or len(stored) == 0:
+        return new
+
+    last_date = stored["date"][-1]
+    overlap = new["date"] == last_date
+    if overlap.any():
+        old_close = float(stored["close"][-1])
+        new_close = float(new["close"][overlap][0])
+        if not np.isclose(old_close, new_close, rtol=READJUST_TOLERANCE, atol=0.0):
+            return None
+    return np.concatenate([np.asarray(stored), new[new["date"] > last_date]])
+
+
+def _fetch_closes(
+    plan: dict[pd.Timestamp, list[str]], end: pd.Timestamp, verbose: bool = False
+) -> dict[str, pd.Series]:
+    """Download close series for {start date: tickers} concurrently.
+
+    Batches of BATCH_SIZE tickers sharing a start date are fetched on
+    PRICE_FETCH_WORKERS threads (1 by default, see config); a token
+    bucket caps request starts at PRICE_FETCH_RATE per second.
+    """
+    jobs = [
+        (start, batch[i : i + config.BATCH_SIZE])
+        for start, batch in plan.items()
+        for i in range(0, len(batch), config.BATCH_SIZE)
+    ]
+    if not jobs:
+        return {}
+
+    limiter = RateLimiter(RateLimiterConfig(
+        rate=config.PRICE_FETCH_RATE, burst=config.PRICE_FETCH_WORKERS,
+    ))
+
+    def fetch(start: pd.Timestamp, batch: list[str]) -> pd.DataFrame:
+        while not limiter.consume():
+            time.sleep(limiter.retry_after())
+        df = yf.download(
+            batch,
+            start=start.strftime("%Y-%m-%d"),
+            end=end.strftime("%Y-%m-%d"),
+            auto_adjust=True,
+            progress=False,
+        )
+        if isinstance(df.columns, pd.MultiIndex):
+            return df["Close"]
+        closes = df[["Close"]]
+        closes.columns = batch[:1]
+        return closes
+
+    results: dict[str, pd.Series] = {}
+    with ThreadPoolExecutor(max_workers=config.PRICE_FETCH_WORKERS) as pool:
+        futures = [pool.submit(fetch, start, batch) for start, batch in jobs]
+        for future in tqdm(as_completed(futures), total=len(futures), desc="Price batches", disable=not verbose):
+            try:
+                closes = future.result()
+            except Exception as e:
+                if verbose:
+                    print(f"    Batch failed: {e}")
+                continue
+            for ticker in closes.columns:
+                if ticker not in results and closes[ticker].notna().any():
+                    results[ticker] = closes[ticker]
+    return results
+
+
 def download_fundamentals(
     tickers: list[str], use_cache: bool = True, verbose: bool = False
 ) -> pd.DataFrame:
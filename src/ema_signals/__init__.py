@@ -10,6 +10,7 @@ from src.ema_signals.clouds import (
     CloudConfig,
     CloudState,
     EMACloudCalculator,
+    EMACloudPanel,
     EMASignalConfig,
 )
 from src.ema_signals.conviction import ConvictionScore, ConvictionScorer
@@ -26,6 +27,7 @@ __all__ = [
     "CloudState",
     "EMACloudCalculator",
     "EMACloudEngine",
+    "EMACloudPanel",
     "EMASignalConfig",
     "ConvictionScore",
     "ConvictionScorer",
@@ -90,6 +90,8 @@ class EMASignalConfig:
     min_daily_volume: float = 5_000_000
     unusual_volume_threshold: float = 2.0
     earnings_exclusion_days: int = 2
+    scan_workers: int = 1  # concurrent per-ticker scans in scan_all (opt-in; Yahoo fetches stay serialized)
+    derive_timeframes: bool = True  # resample higher timeframes from one lower-timeframe fetch
 
     # Conviction thresholds
     min_conviction_to_signal: int = 25
@@ -153,7 +155,8 @@ class EMACloudCalculator:
             return 0.0, "flat"
         midpoints = (df[short_col] + df[long_col]) / 2
         recent = midpoints.iloc[-(lookback + 1):]
-        slope = (float(recent.iloc[-1]) - float(recent.iloc[0])) / (lookback * float(recent.iloc[0])) if float(recent.iloc[0]) > 0 else 0.0
+        first, last = float(recent.iloc[0]), float(recent.iloc[-1])
+        slope = (last - first) / (lookback * first) if first > 0 else 0.0
         if slope > 0.001:
             return slope, "rising"
         elif slope < -0.001:
@@ -235,3 +238,236 @@ class EMACloudCalculator:
         short_col = f"ema_{short_p}"
         long_col = f"ema_{long_p}"
         return (cloud_df[short_col] - cloud_df[long_col]).abs() / cloud_df["close"]
+
+
+class EMACloudPanel:
+    """EMA clouds for a whole universe, computed on a time x ticker matrix.
+
+    fit() runs the EMA recursion for every period and ticker at once (one
+    vectorized step per bar), and update() advances all tickers by a
+    single new bar in O(tickers) time, so a live scanner never recomputes
+    full histories. Only the latest EMA values plus a short tail of
+    per-ticker history (for slopes and signal detection) are kept.
+
+    Missing values (NaN) are skipped: each ticker's EMAs equal
+    EMACloudCalculator.compute_clouds() run on that ticker's non-missing
+    bars alone.
+
+    Args:
+        config: Cloud layer periods.
+        history: Bars of close/EMA history kept per ticker.
+    """
+
+    SLOPE_LOOKBACK = 5
+    SLOPE_THRESHOLD = 0.001
+
+    def __init__(self, config: Optional[CloudConfig] = None, history: int = 8):
+        self.config = config or CloudConfig()
+        self.history = max(history, self.SLOPE_LOOKBACK + 1)
+        self.periods = sorted({p for _, fast, slow in self.config.get_pairs() for p in (fast, slow)})
+        self._row = {p: i for i, p in enumerate(self.periods)}
+        self._alpha = (2.0 / (np.array(self.periods, dtype=float) + 1.0))[:, None]
+        self.tickers: list[str] = []
+        self._reset(0)
+
+    def _reset(self, n: int) -> None:
+        P, H = len(self.periods), self.history
+        self._ema = np.full((P, n), np.nan)
+        self._count = np.zeros(n, dtype=np.int64)
+        self._hist_ema = np.full((H, P, n), np.nan)
+        self._hist_close = np.full((H, n), np.nan)
+        self._hist_time = np.full((H, n), np.datetime64("NaT"), dtype="datetime64[ns]")
+
+    # --- Building / updating ---
+
+    def fit(self, closes: pd.DataFrame) -> "EMACloudPanel":
+        """Compute clouds from a wide close matrix (DatetimeIndex x tickers)."""
+        self.tickers = list(closes.columns)
+        values = closes.to_numpy(dtype=float)
+        if isinstance(closes.index, pd.DatetimeIndex):
+            times = closes.index.tz_localize(None).to_numpy(dtype="datetime64[ns]")
+        else:
+            times = np.full(len(closes), np.datetime64("NaT"), "datetime64[ns]")
+        T, N = values.shape
+        H = self.history
+        self._reset(N)
+
+        # Each ticker's last H valid rows fill its history slots 0..H-1
+        valid = ~np.isnan(values)
+        rank_from_end = np.cumsum(valid[::-1], axis=0)[::-1]
+        in_tail = valid & (rank_from_end <= H)
+        slot = H - rank_from_end
+
+        for t in range(T):
+            self._step(values[t], valid[t])
+            cols = np.flatnonzero(in_tail[t])
+            if len(cols):
+                rows = slot[t, cols]
+                self._hist_ema[rows, :, cols] = self._ema[:, cols].T
+                self._hist_close[rows, cols] = values[t, cols]
+                self._hist_time[rows, cols] = times[t]
+        return self
+
+    def update(self, bar: "pd.Series | dict", timestamp=None) -> None:
+        """Advance every ticker by one bar of closes.
+
+        Args:
+            bar: Close per ticker; tickers absent or NaN are left unchanged.
+            timestamp: Bar time (defaults to the Series name if it has one).
+        """
+        bar = pd.Series(bar, dtype=float)
+        unknown = bar.index.difference(self.tickers)
+        if len(unknown):
+            raise KeyError(f"{len(unknown)} tickers not in panel, e.g. {list(unknown[:5])}")
+        x = bar.reindex(self.tickers).to_numpy(dtype=float)
+        valid = ~np.isnan(x)
+        if not valid.any():
+            return
+        if timestamp is None:
+            timestamp = bar.name
+        ts = np.datetime64(pd.Timestamp(timestamp).tz_localize(None), "ns") if timestamp is not None \
+            else np.datetime64("NaT")
+
+        self._step(x, valid)
+        cols = np.flatnonzero(valid)
+        self._hist_ema[:-1, :, cols] = self._hist_ema[1:, :, cols]
+        self._hist_ema[-1, :, cols] = self._ema[:, cols].T
+        self._hist_close[:-1, cols] = self._hist_close[1:, cols]
+        self._hist_close[-1, cols] = x[cols]
+        self._hist_time[:-1, cols] = self._hist_time[1:, cols]
+        self._hist_time[-1, cols] = ts
+
+    def _step(self, x: np.ndarray, valid: np.ndarray) -> None:
+        """One EMA recursion step (adjust=False) for all periods and tickers."""
+        started = self._count > 0
+        if valid.all() and started.all():
+            self._ema += self._alpha * (x - self._ema)
+        else:
+            upd = np.flatnonzero(valid & started)
+            self._ema[:, upd] += self._alpha * (x[upd] - self._ema[:, upd])
+            new = np.flatnonzero(valid & ~started)
+            self._ema[:, new] = x[new]
+        self._count += valid
+
+    # --- Outputs ---
+
+    @property
+    def bar_counts(self) -> pd.Series:
+        """Bars seen per ticker (EMAs are unreliable below config.max_period)."""
+        return pd.Series(self._count, index=self.tickers, name="bars")
+
+    def ema(self, period: int) -> pd.Series:
+        """Latest EMA of the given period for every ticker."""
+        return pd.Series(self._ema[self._row[period]], index=self.tickers, name=f"ema_{period}")
+
+    def cloud_arrays(self) -> dict[str, np.ndarray]:
+        """Latest cloud metrics as (n_clouds, n_tickers) arrays.
+
+        Keys: short_ema, long_ema, is_bullish, thickness, slope,
+        price_above, price_inside, price_below, plus ``price`` (n_tickers,).
+        Rows follow config.get_pairs() order.
+        """
+        pairs = self.config.get_pairs()
+        s_idx = [self._row[s] for _, s, _ in pairs]
+        l_idx = [self._row[slow] for _, _, slow in pairs]
+        short, long_ = self._ema[s_idx], self._ema[l_idx]
+        price = self._hist_close[-1]
+        upper, lower = np.maximum(short, long_), np.minimum(short, long_)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            thickness = np.where(price > 0, np.abs(short - long_) / price, 0.0)
+            mid = (self._hist_ema[:, s_idx] + self._hist_ema[:, l_idx]) / 2
+            first, last = mid[-(self.SLOPE_LOOKBACK + 1)], mid[-1]
+            has_slope = (self._count > self.SLOPE_LOOKBACK) & (first > 0)
+            slope = np.where(has_slope, (last - first) / (self.SLOPE_LOOKBACK * first), 0.0)
+
+        return {
+            "price": price,
+            "short_ema": short,
+            "long_ema": long_,
+            "is_bullish": short > long_,
+            "thickness": thickness,
+            "slope": slope,
+            "price_above": price > upper,
+            "price_inside": (lower <= price) & (price <= upper),
+            "price_below": price < lower,
+        }
+
+    def state_frame(self) -> pd.DataFrame:
+        """Latest cloud states as a long table indexed by (ticker, cloud)."""
+        arrays = self.cloud_arrays()
+        names = [name for name, _, _ in self.config.get_pairs()]
+        index = pd.MultiIndex.from_product([names, self.tickers], names=["cloud", "ticker"])
+        frame = pd.DataFrame(
+            {key: arrays[key].ravel() for key in arrays if key != "price"}, index=index,
+        )
+        frame["slope_direction"] = np.select(
+            [frame["slope"] > self.SLOPE_THRESHOLD, frame["slope"] < -self.SLOPE_THRESHOLD],
+            ["rising", "falling"], "flat",
+        )
+        return frame.swaplevel().sort_index(level="ticker", sort_remaining=False)
+
+    def cloud_states(self, tickers: Optional[list[str]] = None) -> dict[str, list[CloudState]]:
+        """Latest CloudState list per ticker (tickers with no bars are omitted)."""
+        arrays = {k: v.tolist() for k, v in self.cloud_arrays().items()}
+        names = [name for name, _, _ in self.config.get_pairs()]
+        col = {t: i for i, t in enumerate(self.tickers)}
+        result: dict[str, list[CloudState]] = {}
+
+        for ticker in tickers or self.tickers:
+            j = col[ticker]
+            if self._count[j] == 0:
+                continue
+            states = []
+            for c, name in enumerate(names):
+                slope = arrays["slope"][c][j]
+                states.append(CloudState(
+                    cloud_name=name,
+                    short_ema=arrays["short_ema"][c][j],
+                    long_ema=arrays["long_ema"][c][j],
+                    is_bullish=arrays["is_bullish"][c][j],
+                    thickness=arrays["thickness"][c][j],
+                    price_above=arrays["price_above"][c][j],
+                    price_inside=arrays["price_inside"][c][j],
+                    price_below=arrays["price_below"][c][j],
+                    slope=slope,
+                    slope_direction="rising" if slope > self.SLOPE_THRESHOLD
+                    else "falling" if slope < -self.SLOPE_THRESHOLD else "flat",
+                ))
+            result[ticker] = states
+        return result
+
+    def cloud_frame(self, ticker: str, bars: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """Recent bars for one ticker in compute_clouds() column layout.
+
+        Args:
+            ticker: Ticker in the panel.
+            bars: Optional OHLCV bars for the ticker; their last rows supply
+                open/high/low/volume. Without them those columns equal close.
+
+        Returns:
+            Up to ``history`` rows with close, ema_{period} and
+            cloud_{name}_bull columns.
+        """
+        j = self.tickers.index(ticker)
+        k = int(min(self._count[j], self.history))
+        if k == 0:
+            return pd.DataFrame()
+
+        index = pd.DatetimeIndex(self._hist_time[-k:, j])
+        close = self._hist_close[-k:, j]
+        if bars is not None and len(bars) >= k:
+            tail = bars.iloc[-k:]
+            columns = {c: tail[c].to_numpy() for c in tail.columns}
+            columns["close"] = close
+            index = tail.index
+        else:
+            columns = {"open": close, "high": close, "low": close, "close": close, "volume": np.full(k, np.nan)}
+
+        emas = self._hist_ema[-k:, :, j]
+        for p in self.periods:
+            columns[f"ema_{p}"] = emas[:, self._row[p]]
+        for name, fast, slow in self.config.get_pairs():
+            columns[f"cloud_{name}_bull"] = emas[:, self._row[fast]] > emas[:, self._row[slow]]
+        frame = pd.DataFrame(columns, index=index)
+        return frame
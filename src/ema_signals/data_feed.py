@@ -9,6 +9,7 @@ Fetches OHLCV bars from multiple data sources with fallback chain:
 from __future__ import annotations
 
 import logging
+import threading
 from datetime import datetime, timedelta, timezone
 from typing import Callable, Optional
 
@@ -16,6 +17,9 @@ import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# yfinance shares global session/cache state and is not thread-safe
+_YAHOO_LOCK = threading.Lock()
+
 # Timeframe to yfinance interval mapping
 TIMEFRAME_MAP = {
     "1m": "1m",
@@ -25,6 +29,15 @@ TIMEFRAME_MAP = {
     "1d": "1d",
 }
 
+# Bar length in minutes, used to derive higher timeframes from lower ones
+TIMEFRAME_MINUTES = {
+    "1m": 1,
+    "5m": 5,
+    "10m": 10,
+    "1h": 60,
+    "1d": 1440,
+}
+
 # Lookback periods by timeframe (trading days/hours)
 LOOKBACK_MAP = {
     "1m": "5d",
@@ -88,6 +101,69 @@ class DataFeed:
         logger.warning("All data sources failed for %s/%s", ticker, timeframe)
         return pd.DataFrame()
 
+    def get_bars_multi(
+        self,
+        ticker: str,
+        timeframes: list[str],
+        lookback: int = 200,
+        min_bars: int = 0,
+    ) -> dict[str, pd.DataFrame]:
+        """Fetch bars for several timeframes, resampling where possible.
+
+        Timeframes are processed from finest to coarsest. An intraday
+        timeframe is resampled from an already-loaded finer one when its
+        bar length divides evenly and the result has at least
+        ``min_bars`` bars; otherwise it is fetched with get_bars().
+
+        Args:
+            ticker: Ticker symbol.
+            timeframes: Timeframe strings to return.
+            lookback: Number of bars to fetch per direct request.
+            min_bars: Fewest bars a derived timeframe must have.
+
+        Returns:
+            Dict of timeframe -> OHLCV DataFrame (empty on failure).
+        """
+        ordered = sorted(dict.fromkeys(timeframes), key=lambda tf: TIMEFRAME_MINUTES.get(tf, 1440))
+        bars: dict[str, pd.DataFrame] = {}
+
+        for tf in ordered:
+            target = TIMEFRAME_MINUTES.get(tf)
+            derived = None
+            if target is not None and target < TIMEFRAME_MINUTES["1d"]:
+                for source_tf in reversed(list(bars)):  # coarsest source first: fewer rows
+                    source = bars[source_tf]
+                    minutes = TIMEFRAME_MINUTES.get(source_tf)
+                    if (
+                        minutes is None or target % minutes or source.empty
+                        or not isinstance(source.index, pd.DatetimeIndex)
+                        or len(source) * minutes // target < min_bars
+                    ):
+                        continue
+                    candidate = self.resample_bars(source, tf)
+                    if len(candidate) >= min_bars:
+                        derived = candidate
+                        break
+            bars[tf] = derived if derived is not None else self.get_bars(ticker, tf, lookback)
+
+        return {tf: bars[tf] for tf in timeframes}
+
+    @staticmethod
+    def resample_bars(df: pd.DataFrame, timeframe: str) -> pd.DataFrame:
+        """Aggregate OHLCV bars to a coarser timeframe.
+
+        Buckets are anchored at the first bar (e.g. 09:30), so hourly bars
+        line up with the session open rather than the clock hour.
+        """
+        agg = {
+            col: how
+            for col, how in (("open", "first"), ("high", "max"), ("low", "min"), ("close", "last"), ("volume", "sum"))
+            if col in df.columns
+        }
+        rule = f"{TIMEFRAME_MINUTES[timeframe]}min"
+        resampled = df.resample(rule, origin="start", label="left", closed="left").agg(agg)
+        return resampled.dropna(subset=["close"]) if "close" in resampled.columns else resampled
+
     def _get_source_chain(self) -> list[tuple[str, Callable]]:
         """Build ordered data source fallback chain."""
         chain: list[tuple[str, Callable]] = []
@@ -110,13 +186,14 @@ class DataFeed:
         interval = TIMEFRAME_MAP.get(timeframe, "1d")
         period = LOOKBACK_MAP.get(timeframe, "1y")
 
-        data = yf.download(
-            ticker,
-            period=period,
-            interval=interval,
-            progress=False,
-            auto_adjust=True,
-        )
+        with _YAHOO_LOCK:
+            data = yf.download(
+                ticker,
+                period=period,
+                interval=interval,
+                progress=False,
+                auto_adjust=True,
+            )
 
         if data is None or data.empty:
             return None
@@ -15,7 +15,7 @@ from typing import Literal, Optional
 import numpy as np
 import pandas as pd
 
-from src.ema_signals.clouds import CloudConfig, CloudState, EMACloudCalculator
+from src.ema_signals.clouds import CloudConfig, CloudState, EMACloudCalculator, EMACloudPanel
 
 
 class SignalType(str, Enum):
@@ -83,6 +83,7 @@ class SignalDetector:
     CLOUD_NAMES = ["fast", "pullback", "trend", "macro", "long_term"]
     BOUNCE_THRESHOLD = 0.002  # Price within 0.2% of cloud = "touching"
     EXHAUSTION_CANDLES = 3  # Consecutive candles outside cloud
+    DETECTION_WINDOW = 8  # Trailing bars the rules read (slope needs 6)
 
     def __init__(self, config: Optional[CloudConfig] = None):
         self.calculator = EMACloudCalculator(config)
@@ -103,7 +104,24 @@ class SignalDetector:
         if len(df) < self.calculator.config.max_period + 2:
             return []
 
-        cloud_df = self.calculator.compute_clouds(df)
+        # EMAs need the full history; the rules below only read the last few bars
+        cloud_df = self.calculator.compute_clouds(df).iloc[-self.DETECTION_WINDOW:]
+        return self.detect_clouds(cloud_df, ticker, timeframe)
+
+    def detect_clouds(
+        self, cloud_df: pd.DataFrame, ticker: str, timeframe: str
+    ) -> list[TradeSignal]:
+        """Detect signals from bars that already carry EMA cloud columns.
+
+        Args:
+            cloud_df: Recent bars (at least DETECTION_WINDOW) in the
+                compute_clouds() layout, e.g. EMACloudPanel.cloud_frame().
+            ticker: Ticker symbol.
+            timeframe: Timeframe string.
+
+        Returns:
+            List of detected TradeSignal objects (may be empty).
+        """
         cloud_states = self.calculator.get_cloud_states(cloud_df)
         signals: list[TradeSignal] = []
 
@@ -137,6 +155,31 @@ class SignalDetector:
 
         return signals
 
+    def detect_panel(
+        self,
+        panel: EMACloudPanel,
+        timeframe: str,
+        bars: Optional[dict[str, pd.DataFrame]] = None,
+    ) -> dict[str, list[TradeSignal]]:
+        """Detect signals for every ticker in an EMACloudPanel.
+
+        Tickers with fewer than max_period + 2 bars are skipped, matching
+        detect(). Without OHLCV ``bars`` for a ticker, open/high/low equal
+        the close, so candlestick patterns cannot fire for it.
+
+        Returns:
+            Dict of ticker -> detected signals (tickers with none omitted).
+        """
+        bars = bars or {}
+        min_bars = self.calculator.config.max_period + 2
+        counts = panel.bar_counts
+        results: dict[str, list[TradeSignal]] = {}
+        for ticker in counts.index[counts >= min_bars]:
+            signals = self.detect_clouds(panel.cloud_frame(ticker, bars.get(ticker)), ticker, timeframe)
+            if signals:
+                results[ticker] = signals
+        return results
+
     def _detect_cloud_cross(
         self,
         df: pd.DataFrame,
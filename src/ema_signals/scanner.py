@@ -8,6 +8,7 @@ trade signals, then ranks by conviction.
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Optional
 
@@ -102,6 +103,14 @@ class UniverseScanner:
     ) -> list[TradeSignal]:
         """Run EMA cloud detection across all tickers and timeframes.
 
+        With ``config.derive_timeframes`` each ticker's higher timeframes
+        are resampled from a lower one instead of fetched separately.
+        ``config.scan_workers > 1`` opts in to scanning tickers on a
+        bounded thread pool; Yahoo downloads are still serialized inside
+        DataFeed because yfinance is not thread-safe, so this mainly helps
+        with the Polygon/Alpaca feeds. Signal order matches the serial
+        scan either way.
+
         Args:
             tickers: List of ticker symbols to scan.
             timeframes: Override timeframes. Defaults to config.active_timeframes.
@@ -110,44 +119,12 @@ class UniverseScanner:
             All detected signals across the universe, with conviction scored.
         """
         active_tfs = timeframes or self.config.active_timeframes
-        all_signals: list[TradeSignal] = []
-        signals_by_tf: dict[str, list[TradeSignal]] = {}
-
-        for tf in active_tfs:
-            tf_signals: list[TradeSignal] = []
-            for ticker in tickers:
-                try:
-                    df = self.data_feed.get_bars(ticker, tf)
-                    if df.empty or len(df) < self.detector.calculator.config.max_period + 2:
-                        continue
-
-                    signals = self.detector.detect(df, ticker, tf)
-
-                    # Compute volume data for conviction scoring
-                    volume_data = self._compute_volume_data(df)
-
-                    # Compute body ratio for candle quality scoring
-                    body_ratio = self._compute_body_ratio(df)
-
-                    for sig in signals:
-                        sig.metadata["body_ratio"] = body_ratio
-                        score = self.scorer.score(sig, volume_data)
-                        sig.conviction = score.total
-                        sig.metadata["conviction_breakdown"] = {
-                            "cloud_alignment": score.cloud_alignment,
-                            "volume": score.volume_confirmation,
-                            "thickness": score.cloud_thickness,
-                            "candle": score.candle_quality,
-                            "factor": score.factor_score,
-                        }
-
-                    tf_signals.extend(signals)
-
-                except Exception as e:
-                    logger.warning("Scan failed for %s/%s: %s", ticker, tf, e)
-                    continue
 
-            signals_by_tf[tf] = tf_signals
+        if self.config.scan_workers > 1 and len(tickers) > 1:
+            signals_by_tf = self._scan_concurrent(tickers, active_tfs)
+        else:
+            per_ticker = [self._scan_ticker(ticker, active_tfs) for ticker in tickers]
+            signals_by_tf = self._group_by_timeframe(per_ticker, active_tfs)
 
         # Run MTF confluence
         all_signals = self.mtf_engine.compute_confluence(signals_by_tf)
@@ -160,6 +137,76 @@ class UniverseScanner:
 
         return all_signals
 
+    def _scan_concurrent(
+        self, tickers: list[str], timeframes: list[str]
+    ) -> dict[str, list[TradeSignal]]:
+        """Scan tickers on a thread pool; returns signals grouped by timeframe."""
+        workers = min(self.config.scan_workers, len(tickers))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ema-scan") as pool:
+            per_ticker = list(pool.map(lambda t: self._scan_ticker(t, timeframes), tickers))
+        return self._group_by_timeframe(per_ticker, timeframes)
+
+    @staticmethod
+    def _group_by_timeframe(
+        per_ticker: list[dict[str, list[TradeSignal]]], timeframes: list[str]
+    ) -> dict[str, list[TradeSignal]]:
+        return {
+            tf: [sig for result in per_ticker for sig in result.get(tf, [])]
+            for tf in timeframes
+        }
+
+    def _scan_ticker(self, ticker: str, timeframes: list[str]) -> dict[str, list[TradeSignal]]:
+        """Fetch one ticker's bars for all timeframes and detect signals."""
+        if not self.config.derive_timeframes:
+            return {tf: self._scan_pair(ticker, tf) for tf in timeframes}
+
+        try:
+            bars = self.data_feed.get_bars_multi(ticker, timeframes, min_bars=self._min_bars)
+        except Exception as e:
+            logger.warning("Scan failed for %s: %s", ticker, e)
+            return {}
+        return {tf: self._scan_pair(ticker, tf, bars[tf]) for tf in timeframes}
+
+    @property
+    def _min_bars(self) -> int:
+        return self.detector.calculator.config.max_period + 2
+
+    def _scan_pair(
+        self, ticker: str, tf: str, df: Optional[pd.DataFrame] = None
+    ) -> list[TradeSignal]:
+        """Detect and conviction-score signals for one ticker/timeframe."""
+        try:
+            if df is None:
+                df = self.data_feed.get_bars(ticker, tf)
+            if df.empty or len(df) < self._min_bars:
+                return []
+
+            signals = self.detector.detect(df, ticker, tf)
+
+            # Compute volume data for conviction scoring
+            volume_data = self._compute_volume_data(df)
+
+            # Compute body ratio for candle quality scoring
+            body_ratio = self._compute_body_ratio(df)
+
+            for sig in signals:
+                sig.metadata["body_ratio"] = body_ratio
+                score = self.scorer.score(sig, volume_data)
+                sig.conviction = score.total
+                sig.metadata["conviction_breakdown"] = {
+                    "cloud_alignment": score.cloud_alignment,
+                    "volume": score.volume_confirmation,
+                    "thickness": score.cloud_thickness,
+                    "candle": score.candle_quality,
+                    "factor": score.factor_score,
+                }
+
+            return signals
+
+        except Exception as e:
+            logger.warning("Scan failed for %s/%s: %s", ticker, tf, e)
+            return []
+
     def rank_by_conviction(
         self, signals: list[TradeSignal], top_n: int = 20
     ) -> list[TradeSignal]:
@@ -17,6 +17,7 @@ from .schema import (
     compliance_violation_event,
 )
 from .bus import Subscriber, DeliveryRecord, EventBus
+from .routing import TopicIndex
 from .store import EventRecord, Snapshot, EventStore
 from .consumer import ConsumerCheckpoint, ConsumerGroup, AsyncConsumer
 
@@ -39,6 +40,7 @@ __all__ = [
     "Subscriber",
     "DeliveryRecord",
     "EventBus",
+    "TopicIndex",
     # Store
     "EventRecord",
     "Snapshot",
@@ -1,17 +1,30 @@
 """PRD-121: Event-Driven Architecture — Event Bus.
 
 Topic-based publish/subscribe with guaranteed delivery and dead letter queue.
+
+Delivery is synchronous by default: ``publish`` calls each handler inline.
+After ``await bus.start()`` each subscriber gets a bounded queue drained
+by its own worker task, handlers receive micro-batches when subscribed
+with ``batch=True``, and failed deliveries retry with exponential backoff.
+
+Workers run on the event loop, so only coroutine handlers are isolated
+from each other: a plain function that blocks still stalls the loop (and
+with it every publisher and worker). Make slow handlers ``async`` or have
+them hand work off with ``asyncio.to_thread`` themselves.
 """
 
 from __future__ import annotations
 
-import fnmatch
+import asyncio
+import inspect
 import uuid
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Callable, Optional
 
 from .config import DeliveryStatus, EventBusConfig, SubscriberState
+from .routing import TopicIndex
 from .schema import EventEnvelope
 
 
@@ -23,6 +36,7 @@ class Subscriber:
     name: str = ""
     topic_pattern: str = "*"
     handler: Optional[Callable[[EventEnvelope], None]] = None
+    batch: bool = False  # handler takes list[EventEnvelope]
     state: SubscriberState = SubscriberState.ACTIVE
     filter_fn: Optional[Callable[[EventEnvelope], bool]] = None
     created_at: datetime = field(
@@ -51,10 +65,19 @@ class EventBus:
     def __init__(self, config: Optional[EventBusConfig] = None) -> None:
         self.config = config or EventBusConfig()
         self._subscribers: dict[str, Subscriber] = {}
-        self._delivery_log: list[DeliveryRecord] = []
-        self._dead_letters: list[tuple[EventEnvelope, str, str]] = []  # (event, subscriber_id, error)
+        self._index = TopicIndex(self.config.topic_cache_size)
+        self._delivery_log: deque[DeliveryRecord] = deque(maxlen=self.config.delivery_log_size)
+        # (event, subscriber_id, error)
+        self._dead_letters: deque[tuple[EventEnvelope, str, str]] = deque(maxlen=self.config.dead_letter_max_size)
         self._published_count: int = 0
         self._delivered_count: int = 0
+        self._failed_count: int = 0
+        self._dead_lettered_count: int = 0
+        self._dropped_count: int = 0
+        self._retry_count: int = 0
+        # Async mode: subscriber_id -> (queue, worker task)
+        self._workers: dict[str, tuple[asyncio.Queue, asyncio.Task]] = {}
+        self._running = False
 
     @property
     def subscribers(self) -> dict[str, Subscriber]:
@@ -66,13 +89,16 @@ class EventBus:
         topic_pattern: str,
         handler: Optional[Callable[[EventEnvelope], None]] = None,
         filter_fn: Optional[Callable[[EventEnvelope], bool]] = None,
+        batch: bool = False,
     ) -> Subscriber:
-        """Register a subscriber for a topic pattern."""
-        topic_subs = [
-            s for s in self._subscribers.values()
-            if s.topic_pattern == topic_pattern
-        ]
-        if len(topic_subs) >= self.config.max_subscribers_per_topic:
+        """Register a subscriber for a topic pattern.
+
+        With ``batch=True`` the handler is called with a list of events:
+        micro-batches of up to ``max_batch_size`` in async mode, a
+        single-element list otherwise. In async mode coroutine handlers
+        are awaited; plain functions run inline on the event loop.
+        """
+        if self._index.count(topic_pattern) >= self.config.max_subscribers_per_topic:
             raise ValueError(
                 f"Max subscribers ({self.config.max_subscribers_per_topic}) "
                 f"reached for pattern '{topic_pattern}'"
@@ -82,22 +108,119 @@ class EventBus:
             name=name,
             topic_pattern=topic_pattern,
             handler=handler,
+            batch=batch,
             filter_fn=filter_fn,
         )
         self._subscribers[sub.subscriber_id] = sub
+        self._index.add(sub)
+        if self._running:
+            self._start_worker(sub)
         return sub
 
     def unsubscribe(self, subscriber_id: str) -> bool:
         """Remove a subscriber."""
-        return self._subscribers.pop(subscriber_id, None) is not None
+        sub = self._subscribers.pop(subscriber_id, None)
+        if sub is None:
+            return False
+        self._index.remove(sub)
+        worker = self._workers.pop(subscriber_id, None)
+        if worker is not None:
+            self._close_worker(sub, *worker, reason="Subscriber unsubscribed")
+        return True
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    async def start(self) -> None:
+        """Switch to async delivery: one bounded queue and worker task per subscriber."""
+        if self._running:
+            return
+        self._running = True
+        for sub in self._subscribers.values():
+            self._start_worker(sub)
+
+    async def stop(self, drain: bool = True) -> None:
+        """Stop the workers, first waiting for queued events when ``drain`` is set.
+
+        Events still queued (or mid-delivery) when the workers stop are
+        settled as FAILED or dead-lettered.
+        """
+        if not self._running:
+            return
+        if drain:
+            await self.drain()
+        self._running = False
+        workers, self._workers = self._workers, {}
+        for subscriber_id, (queue, task) in workers.items():
+            sub = self._subscribers.get(subscriber_id)
+            if sub is not None:
+                self._close_worker(sub, queue, task, reason="Event bus stopped")
+            else:
+                task.cancel()
+        await asyncio.gather(*(task for _, task in workers.values()), return_exceptions=True)
+
+    async def drain(self) -> None:
+        """Wait until every queued event has been delivered or dead-lettered."""
+        await asyncio.gather(*(queue.join() for queue, _ in list(self._workers.values())))
 
     def publish(self, topic: str, event: EventEnvelope) -> list[DeliveryRecord]:
-        """Publish an event to a topic, delivering to all matching subscribers."""
+        """Publish an event to a topic, delivering to all matching subscribers.
+
+        In async mode the event is queued and the returned records stay
+        PENDING until a worker settles them; a subscriber whose queue is
+        full gets a FAILED (or dead-lettered) record instead of blocking
+        the publisher.
+        """
+        self._published_count += 1
+        records: list[DeliveryRecord] = []
+
+        for sub in self._targets(topic, event):
+            if not self._running:
+                records.append(self._deliver(event, sub))
+                continue
+            record = DeliveryRecord(event_id=event.event_id, subscriber_id=sub.subscriber_id)
+            try:
+                self._workers[sub.subscriber_id][0].put_nowait((event, record))
+            except asyncio.QueueFull:
+                self._dropped_count += 1
+                record.last_error = "Subscriber queue full"
+                self._settle(event, sub, record)
+            records.append(record)
+
+        return records
+
+    async def publish_async(self, topic: str, event: EventEnvelope) -> list[DeliveryRecord]:
+        """Like ``publish``, but waits for queue space instead of dropping.
+
+        A subscriber removed while the publisher waits on it gets a FAILED
+        (or dead-lettered) record; subscribers already gone are skipped.
+        """
+        if not self._running:
+            return self.publish(topic, event)
         self._published_count += 1
         records: list[DeliveryRecord] = []
+        for sub in self._targets(topic, event):
+            worker = self._workers.get(sub.subscriber_id)
+            if worker is None:
+                continue
+            queue, task = worker
+            record = DeliveryRecord(event_id=event.event_id, subscriber_id=sub.subscriber_id)
+            put = asyncio.ensure_future(queue.put((event, record)))
+            try:
+                # The worker task only finishes when it is cancelled, which
+                # also wakes publishers blocked on its full queue.
+                await asyncio.wait((put, task), return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                put.cancel()
+            if self._workers.get(sub.subscriber_id) is not worker:
+                self._fail_pending(event, sub, record, "Subscriber unsubscribed")
+            records.append(record)
+        return records
 
-        matching = self._get_matching_subscribers(topic)
-        for sub in matching:
+    def _targets(self, topic: str, event: EventEnvelope):
+        """Active subscribers matching the topic whose filter accepts the event."""
+        for sub in self._get_matching_subscribers(topic):
             if sub.state != SubscriberState.ACTIVE:
                 continue
 
@@ -108,23 +231,16 @@ class EventBus:
                 except Exception:
                     continue
 
-            record = self._deliver(event, sub)
-            records.append(record)
-
-        return records
+            yield sub
 
-    def _get_matching_subscribers(self, topic: str) -> list[Subscriber]:
-        """Get all subscribers matching a topic."""
-        matching: list[Subscriber] = []
-        for sub in self._subscribers.values():
-            if fnmatch.fnmatch(topic, sub.topic_pattern) or sub.topic_pattern == "*":
-                matching.append(sub)
-        return matching
+    def _get_matching_subscribers(self, topic: str) -> tuple[Subscriber, ...]:
+        """Get all subscribers matching a topic (indexed and cached)."""
+        return self._index.match(topic)
 
     def _deliver(
         self, event: EventEnvelope, subscriber: Subscriber,
     ) -> DeliveryRecord:
-        """Deliver an event to a subscriber with retry."""
+        """Deliver an event to a subscriber inline, retrying immediately."""
         record = DeliveryRecord(
             event_id=event.event_id,
             subscriber_id=subscriber.subscriber_id,
@@ -134,7 +250,7 @@ class EventBus:
             record.attempts = attempt
             try:
                 if subscriber.handler is not None:
-                    subscriber.handler(event)
+                    subscriber.handler([event] if subscriber.batch else event)
                 record.status = DeliveryStatus.DELIVERED
                 record.delivered_at = datetime.now(timezone.utc)
                 subscriber.events_received += 1
@@ -143,17 +259,102 @@ class EventBus:
             except Exception as exc:
                 record.last_error = str(exc)
                 subscriber.events_failed += 1
+                if attempt < self.config.max_retry_attempts:
+                    self._retry_count += 1
+
+        self._settle(event, subscriber, record)
+        return record
 
+    def _start_worker(self, sub: Subscriber) -> None:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.config.subscriber_queue_size)
+        task = asyncio.get_running_loop().create_task(self._run_worker(sub, queue))
+        self._workers[sub.subscriber_id] = (queue, task)
+
+    async def _run_worker(self, sub: Subscriber, queue: asyncio.Queue) -> None:
+        """Drain one subscriber's queue in micro-batches."""
+        max_batch = max(1, self.config.max_batch_size) if sub.batch else 1
+        while True:
+            items = [await queue.get()]
+            while len(items) < max_batch and not queue.empty():
+                items.append(queue.get_nowait())
+            try:
+                await self._deliver_batch(sub, items)
+            except asyncio.CancelledError:
+                for event, record in items:
+                    self._fail_pending(event, sub, record, "Worker stopped")
+                raise
+            finally:
+                for _ in items:
+                    queue.task_done()
+
+    def _close_worker(
+        self, sub: Subscriber, queue: asyncio.Queue, task: asyncio.Task, reason: str,
+    ) -> None:
+        """Settle everything still queued for a subscriber and cancel its worker."""
+        while not queue.empty():
+            event, record = queue.get_nowait()
+            queue.task_done()
+            self._fail_pending(event, sub, record, reason)
+        task.cancel()
+
+    def _fail_pending(
+        self, event: EventEnvelope, sub: Subscriber, record: DeliveryRecord, reason: str,
+    ) -> None:
+        if record.status == DeliveryStatus.PENDING:
+            record.last_error = record.last_error or reason
+            self._settle(event, sub, record)
+
+    async def _deliver_batch(
+        self, sub: Subscriber, items: list[tuple[EventEnvelope, DeliveryRecord]],
+    ) -> None:
+        """Deliver queued events, backing off between failed attempts."""
+        events = [event for event, _ in items]
+        attempts = self.config.max_retry_attempts
+        for attempt in range(1, attempts + 1):
+            for _, record in items:
+                record.attempts = attempt
+            try:
+                if sub.handler is not None:
+                    result = sub.handler(events if sub.batch else events[0])
+                    if inspect.isawaitable(result):
+                        await result
+            except Exception as exc:
+                sub.events_failed += len(items)
+                for _, record in items:
+                    record.last_error = str(exc)
+                if attempt < attempts:
+                    self._retry_count += 1
+                    await asyncio.sleep(self._retry_delay(attempt))
+                continue
+
+            now = datetime.now(timezone.utc)
+            for _, record in items:
+                record.status = DeliveryStatus.DELIVERED
+                record.delivered_at = now
+            sub.events_received += len(items)
+            self._delivered_count += len(items)
+            break
+
+        for event, record in items:
+            self._settle(event, sub, record)
+
+    def _retry_delay(self, attempt: int) -> float:
+        delay = self.config.retry_backoff_base_seconds * 2 ** (attempt - 1)
+        return min(delay, self.config.retry_backoff_max_seconds)
+
+    def _settle(self, event: EventEnvelope, subscriber: Subscriber, record: DeliveryRecord) -> None:
+        """Dead-letter an undelivered record and log it."""
         if record.status != DeliveryStatus.DELIVERED:
             record.status = DeliveryStatus.FAILED
+            self._failed_count += 1
             if self.config.dead_letter_enabled:
                 record.status = DeliveryStatus.DEAD_LETTER
+                self._dead_lettered_count += 1
                 self._dead_letters.append(
                     (event, subscriber.subscriber_id, record.last_error or "Unknown")
                 )
 
         self._delivery_log.append(record)
-        return record
 
     def pause_subscriber(self, subscriber_id: str) -> bool:
         """Pause a subscriber."""
@@ -180,7 +381,7 @@ class EventBus:
                 "subscriber_id": sub_id,
                 "error": error,
             }
-            for evt, sub_id, error in self._dead_letters[-limit:]
+            for evt, sub_id, error in list(self._dead_letters)[-limit:]
         ]
 
     def clear_dead_letters(self) -> int:
@@ -196,7 +397,7 @@ class EventBus:
         limit: int = 50,
     ) -> list[DeliveryRecord]:
         """Get delivery records with optional filters."""
-        records = self._delivery_log
+        records = list(self._delivery_log)
         if event_id is not None:
             records = [r for r in records if r.event_id == event_id]
         if subscriber_id is not None:
@@ -214,6 +415,13 @@ class EventBus:
             "active_subscribers": active_subs,
             "total_published": self._published_count,
             "total_delivered": self._delivered_count,
+            "total_failed": self._failed_count,
+            "total_dead_lettered": self._dead_lettered_count,
+            "total_dropped": self._dropped_count,
+            "total_retries": self._retry_count,
             "dead_letters": len(self._dead_letters),
             "delivery_log_size": len(self._delivery_log),
+            "cached_topics": self._index.cached_topics,
+            "async_running": self._running,
+            "queued": sum(queue.qsize() for queue, _ in self._workers.values()),
         }
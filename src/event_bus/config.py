@@ -50,11 +50,16 @@ class EventBusConfig:
 
     max_subscribers_per_topic: int = 100
     max_retry_attempts: int = 3
-    retry_backoff_base_seconds: float = 1.0
+    retry_backoff_base_seconds: float = 1.0  # Async mode: doubles per attempt
+    retry_backoff_max_seconds: float = 30.0
     dead_letter_enabled: bool = True
     event_ttl_seconds: int = 86400  # 24 hours
     max_batch_size: int = 100
+    subscriber_queue_size: int = 1000  # Async mode: per-subscriber pending events
+    delivery_log_size: int = 10_000  # Most recent delivery records kept
+    dead_letter_max_size: int = 10_000
     consumer_concurrency: int = 4
     checkpoint_interval: int = 10
     max_event_size_bytes: int = 1024 * 1024  # 1MB
     enable_event_dedup: bool = True
+    topic_cache_size: int = 10_000  # Resolved topic -> subscribers entries kept by the router
@@ -0,0 +1,170 @@
+"""PRD-121: Event-Driven Architecture — Topic Routing Index.
+
+Resolves a published topic to the subscribers whose ``fnmatch`` patterns
+match it without testing every pattern on every publish.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import re
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from .bus import Subscriber
+
+_WILDCARDS = frozenset("*?[")
+
+
+class _AffixTable:
+    """Buckets keyed by a literal prefix (or suffix), probed per length in use."""
+
+    def __init__(self, suffix: bool) -> None:
+        self.suffix = suffix
+        self.buckets: dict[str, dict[str, Subscriber]] = {}
+        self.lengths: list[int] = []  # distinct key lengths, ascending
+        self._length_refs: dict[int, int] = {}
+
+    def get(self, key: str, create: bool):
+        bucket = self.buckets.get(key)
+        if bucket is None and create:
+            bucket = self.buckets[key] = {}
+            self._ref_length(len(key), +1)
+        return bucket
+
+    def drop(self, key: str) -> None:
+        del self.buckets[key]
+        self._ref_length(len(key), -1)
+
+    def collect(self, topic: str, out: list) -> None:
+        size = len(topic)
+        for length in self.lengths:
+            if length > size:
+                break
+            bucket = self.buckets.get(topic[size - length:] if self.suffix else topic[:length])
+            if bucket:
+                out.append(bucket)
+
+    def _ref_length(self, length: int, delta: int) -> None:
+        refs = self._length_refs.get(length, 0) + delta
+        if refs:
+            self._length_refs[length] = refs
+        else:
+            del self._length_refs[length]
+        if refs in (0, 1):
+            self.lengths = sorted(self._length_refs)
+
+
+class TopicIndex:
+    """Subscription index keyed by pattern shape, with a resolved-topic cache.
+
+    Patterns keep ``fnmatch`` semantics (``*`` also spans dots) and are
+    bucketed by shape:
+
+    - exact (``quotes.AAPL``): one dict lookup
+    - trailing star (``signals.*``, ``*``): one lookup per prefix length in use
+    - leading star (``*.executed``): one lookup per suffix length in use
+    - anything else (``quotes.?``, ``a*.b*``): compiled regex, tested in turn
+
+    Matches come back in subscription order. Resolved topics are cached
+    until the next add/remove; the cache holds at most ``cache_size``
+    topics (oldest dropped first).
+    """
+
+    def __init__(self, cache_size: int = 10_000) -> None:
+        self.cache_size = cache_size
+        self._exact: dict[str, dict[str, Subscriber]] = {}
+        self._prefix = _AffixTable(suffix=False)
+        self._suffix = _AffixTable(suffix=True)
+        self._general: dict[str, tuple[Callable, dict[str, Subscriber]]] = {}
+        self._order: dict[str, int] = {}
+        self._next_order = 0
+        self._cache: dict[str, tuple[Subscriber, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    @property
+    def cached_topics(self) -> int:
+        return len(self._cache)
+
+    def count(self, pattern: str) -> int:
+        """Number of subscribers registered with exactly this pattern."""
+        return len(self._bucket(pattern, create=False) or ())
+
+    def add(self, subscriber: Subscriber) -> None:
+        self._bucket(subscriber.topic_pattern, create=True)[subscriber.subscriber_id] = subscriber
+        self._order[subscriber.subscriber_id] = self._next_order
+        self._next_order += 1
+        self._cache.clear()
+
+    def remove(self, subscriber: Subscriber) -> None:
+        pattern = subscriber.topic_pattern
+        bucket = self._bucket(pattern, create=False)
+        if bucket is None or bucket.pop(subscriber.subscriber_id, None) is None:
+            return
+        self._order.pop(subscriber.subscriber_id, None)
+        if not bucket:
+            shape = _shape(pattern)
+            if shape == "exact":
+                del self._exact[pattern]
+            elif shape == "prefix":
+                self._prefix.drop(pattern[:-1])
+            elif shape == "suffix":
+                self._suffix.drop(pattern[1:])
+            else:
+                del self._general[pattern]
+        self._cache.clear()
+
+    def match(self, topic: str) -> tuple[Subscriber, ...]:
+        """Subscribers whose pattern matches ``topic``, in subscription order."""
+        cached = self._cache.get(topic)
+        if cached is not None:
+            return cached
+
+        buckets = []
+        exact = self._exact.get(topic)
+        if exact:
+            buckets.append(exact)
+        self._prefix.collect(topic, buckets)
+        self._suffix.collect(topic, buckets)
+        for matcher, bucket in self._general.values():
+            if matcher(topic) is not None:
+                buckets.append(bucket)
+
+        if len(buckets) == 1:
+            result = tuple(buckets[0].values())
+        else:
+            order = self._order
+            result = tuple(sorted(
+                (sub for bucket in buckets for sub in bucket.values()),
+                key=lambda sub: order[sub.subscriber_id],
+            ))
+
+        if len(self._cache) >= self.cache_size:
+            self._cache.pop(next(iter(self._cache)))
+        self._cache[topic] = result
+        return result
+
+    def _bucket(self, pattern: str, create: bool):
+        shape = _shape(pattern)
+        if shape == "exact":
+            return self._exact.setdefault(pattern, {}) if create else self._exact.get(pattern)
+        if shape == "prefix":
+            return self._prefix.get(pattern[:-1], create)
+        if shape == "suffix":
+            return self._suffix.get(pattern[1:], create)
+        if create and pattern not in self._general:
+            self._general[pattern] = (re.compile(fnmatch.translate(pattern)).match, {})
+        entry = self._general.get(pattern)
+        return entry[1] if entry else None
+
+
+def _shape(pattern: str) -> str:
+    if not _WILDCARDS.intersection(pattern):
+        return "exact"
+    if pattern.endswith("*") and not _WILDCARDS.intersection(pattern[:-1]):
+        return "prefix"
+    if pattern.startswith("*") and not _WILDCARDS.intersection(pattern[1:]):
+        return "suffix"
+    return "general"
@@ -54,6 +54,42 @@ class SystemMetrics:
             description="Total cache misses",
         )
 
+        self.l1_cache_hits_total: Counter = self.registry.counter(
+            name=f"{prefix}_l1_cache_hits_total",
+            description="Total in-process (L1) cache hits",
+            label_names=("cache",),
+        )
+
+        self.l1_cache_misses_total: Counter = self.registry.counter(
+            name=f"{prefix}_l1_cache_misses_total",
+            description="Total in-process (L1) cache misses",
+            label_names=("cache",),
+        )
+
+        self.l1_cache_evictions_total: Counter = self.registry.counter(
+            name=f"{prefix}_l1_cache_evictions_total",
+            description="Total in-process (L1) cache evictions",
+            label_names=("cache", "reason"),
+        )
+
+        self.l1_cache_coalesced_total: Counter = self.registry.counter(
+            name=f"{prefix}_l1_cache_coalesced_total",
+            description="Concurrent misses served by an in-flight upstream fetch",
+            label_names=("cache",),
+        )
+
+        self.l1_cache_bytes: Gauge = self.registry.gauge(
+            name=f"{prefix}_l1_cache_bytes",
+            description="Estimated bytes held by the in-process (L1) cache",
+            label_names=("cache",),
+        )
+
+        self.l1_cache_entries: Gauge = self.registry.gauge(
+            name=f"{prefix}_l1_cache_entries",
+            description="Entries held by the in-process (L1) cache",
+            label_names=("cache",),
+        )
+
         # ── WebSocket Metrics ─────────────────────────────────────────
         self.websocket_connections_active: Gauge = self.registry.gauge(
             name=f"{prefix}_websocket_connections_active",
@@ -99,6 +135,27 @@ class SystemMetrics:
         """Record a cache miss."""
         self.cache_misses_total.increment()
 
+    def record_l1_hit(self, cache: str) -> None:
+        """Record an in-process cache hit."""
+        self.l1_cache_hits_total.increment(labels={"cache": cache})
+
+    def record_l1_miss(self, cache: str) -> None:
+        """Record an in-process cache miss."""
+        self.l1_cache_misses_total.increment(labels={"cache": cache})
+
+    def record_l1_eviction(self, cache: str, reason: str, count: int = 1) -> None:
+        """Record in-process cache evictions (size, expired, invalidated)."""
+        self.l1_cache_evictions_total.increment(count, labels={"cache": cache, "reason": reason})
+
+    def record_l1_coalesced(self, cache: str) -> None:
+        """Record a miss that joined an in-flight fetch instead of starting one."""
+        self.l1_cache_coalesced_total.increment(labels={"cache": cache})
+
+    def update_l1_usage(self, cache: str, entries: int, nbytes: int) -> None:
+        """Update in-process cache occupancy."""
+        self.l1_cache_entries.set(entries, labels={"cache": cache})
+        self.l1_cache_bytes.set(nbytes, labels={"cache": cache})
+
     def update_websocket_connections(self, count: int) -> None:
         """Update active WebSocket connection count."""
         self.websocket_connections_active.set(count)
@@ -21,14 +21,18 @@ from src.options.config import (
 from src.options.pricing import (
     OptionsPricingEngine,
     OptionPrice,
+    OptionPriceArray,
     OptionLeg,
     OptionType,
 )
+from src.options.simulation import PathSimulator, MCResult
 from src.options.volatility import (
     VolatilitySurfaceBuilder,
     VolSurface,
     VolAnalytics,
     VolPoint,
+    SVISurfaceEngine,
+    SVISlice,
 )
 from src.options.strategies import (
     StrategyBuilder,
@@ -75,13 +79,18 @@ __all__ = [
     # Pricing
     "OptionsPricingEngine",
     "OptionPrice",
+    "OptionPriceArray",
     "OptionLeg",
     "OptionType",
+    "PathSimulator",
+    "MCResult",
     # Volatility
     "VolatilitySurfaceBuilder",
     "VolSurface",
     "VolAnalytics",
     "VolPoint",
+    "SVISurfaceEngine",
+    "SVISlice",
     # Strategies
     "StrategyBuilder",
     "StrategyAnalysis",
@@ -4,6 +4,8 @@ Backtests options strategies against historical price and IV data
 with configurable entry/exit rules.
 """
 
+import dataclasses
+import functools
 import logging
 from dataclasses import dataclass, field
 from datetime import date, timedelta
@@ -103,12 +105,57 @@ class BacktestResult:
         }
 
 
+@dataclass
+class _LegBatch:
+    """One strategy's legs for many entries: row = entry, column = leg."""
+
+    strikes: np.ndarray
+    premiums: np.ndarray
+    option_types: list
+    quantities: list
+    dte: int
+
+    @property
+    def entry_premium(self) -> np.ndarray:
+        total = 0.0
+        for j, qty in enumerate(self.quantities):
+            total = total + self.premiums[:, j] * qty
+        return np.asarray(total, dtype=float)
+
+    @classmethod
+    def from_legs(cls, legs: list[OptionLeg]) -> "_LegBatch":
+        return cls(
+            strikes=np.array([[leg.strike for leg in legs]], dtype=float),
+            premiums=np.array([[leg.premium for leg in legs]], dtype=float),
+            option_types=[leg.option_type for leg in legs],
+            quantities=[leg.quantity for leg in legs],
+            dte=max(leg.expiry_days for leg in legs),
+        )
+
+
+@dataclass
+class _ExitBatch:
+    """Per-entry exit outcome (see OptionsBacktester._resolve_exits)."""
+
+    hold_days: np.ndarray
+    exit_value: np.ndarray
+    exit_spot: np.ndarray
+    pnl: np.ndarray
+    reason: np.ndarray
+
+
 class OptionsBacktester:
     """Backtest options strategies on historical data.
 
     Simulates strategy entry/exit using historical price and IV data
     with configurable rules.
 
+    With ``config.vectorized`` (the default) a trade's legs are repriced
+    over its whole holding window as one array computation and exits are
+    found by first-crossing search. The built-in strategies go further and
+    price every eligible entry day at once, which also lets sweep()
+    evaluate a grid of delta / DTE / profit-target settings in one call.
+
     Example:
         bt = OptionsBacktester()
         result = bt.backtest_short_put(
@@ -117,6 +164,10 @@ class OptionsBacktester:
             entry_rules=EntryRules(min_iv_rank=0.50),
             exit_rules=ExitRules(profit_target_pct=0.50),
         )
+        grid = bt.sweep(
+            price_history, iv_history,
+            delta_targets=[0.16, 0.30], dtes=[30, 45], profit_targets=[0.25, 0.50],
+        )
     """
 
     def __init__(
@@ -217,6 +268,13 @@ class OptionsBacktester:
         Returns:
             BacktestResult.
         """
+        if self.config.vectorized:
+            return self._backtest_batched(
+                price_history, iv_history,
+                lambda spots, ivs, dte: self._short_put_batch(spots, ivs, dte, delta_target),
+                entry_rules, exit_rules,
+            )
+
         def strategy_fn(spot, iv, dte):
             T = dte / 365.0
             r = self.engine.config.risk_free_rate
@@ -255,6 +313,13 @@ class OptionsBacktester:
         Returns:
             BacktestResult.
         """
+        if self.config.vectorized:
+            return self._backtest_batched(
+                price_history, iv_history,
+                lambda spots, ivs, dte: self._iron_condor_batch(spots, ivs, dte, wing_delta, wing_width),
+                entry_rules, exit_rules,
+            )
+
         def strategy_fn(spot, iv, dte):
             T = dte / 365.0
             r = self.engine.config.risk_free_rate
@@ -323,6 +388,16 @@ class OptionsBacktester:
         multiplier: int,
     ) -> BacktestTrade:
         """Simulate strategy from entry to exit."""
+        if self.config.vectorized:
+            batch = _LegBatch.from_legs(legs)
+            prices, ivs = self._aligned_series(price_history, iv_history)
+            entries = np.array([entry_idx])
+            exits = self._resolve_exits(
+                batch, entries, self._reprice_windows(batch, entries, prices, ivs, rules),
+                prices, rules, multiplier,
+            )
+            return self._make_trade(exits, 0, entry_idx, price_history.index, entry_premium, multiplier)
+
         dates = price_history.index
         r = self.engine.config.risk_free_rate
 
@@ -413,6 +488,316 @@ class OptionsBacktester:
             underlying_exit=float(current_price),
         )
 
+    def sweep(
+        self,
+        price_history: pd.Series,
+        iv_history: pd.Series,
+        strategy: str = "short_put",
+        delta_targets: tuple = (0.30,),
+        dtes: tuple = (45,),
+        profit_targets: tuple = (0.50,),
+        entry_rules: Optional[EntryRules] = None,
+        exit_rules: Optional[ExitRules] = None,
+        wing_width: float = 5.0,
+    ) -> pd.DataFrame:
+        """Backtest a grid of strategy parameters in one call.
+
+        Each (delta, DTE) pair is priced once across all entry days; the
+        profit targets only change the first-crossing search. Row i equals
+        running backtest_short_put / backtest_iron_condor with
+        ``entry_rules.max_dte = dte`` and ``exit_rules.profit_target_pct``
+        set to the row's values.
+
+        Args:
+            price_history: Daily underlying prices.
+            iv_history: Daily ATM IV.
+            strategy: 'short_put' or 'iron_condor'.
+            delta_targets: Short-strike deltas to test.
+            dtes: Days to expiration at entry to test.
+            profit_targets: Profit-target fractions of max credit to test.
+            entry_rules: Base entry criteria.
+            exit_rules: Base exit criteria.
+            wing_width: Spread width for iron condors.
+
+        Returns:
+            DataFrame with one row per combination: delta_target, dte,
+            profit_target_pct and the BacktestResult summary fields.
+        """
+        if strategy == "short_put":
+            build = self._short_put_batch
+        elif strategy == "iron_condor":
+            build = functools.partial(self._iron_condor_batch, wing_width=wing_width)
+        else:
+            raise ValueError(f"Unknown strategy for sweep: {strategy}")
+
+        entry_rules = entry_rules or EntryRules()
+        exit_rules = exit_rules or ExitRules()
+        prices, ivs = self._aligned_series(price_history, iv_history)
+        dates = price_history.index
+
+        rows = []
+        for dte in dtes:
+            rules = dataclasses.replace(entry_rules, max_dte=dte)
+            entries = self._entry_candidates(price_history, iv_history, prices, ivs, rules)
+            for delta in delta_targets:
+                batch = build(prices[entries], ivs[entries], dte, delta)
+                values = self._reprice_windows(batch, entries, prices, ivs, exit_rules)
+                for target in profit_targets:
+                    exit_rules_t = dataclasses.replace(exit_rules, profit_target_pct=target)
+                    exits = self._resolve_exits(batch, entries, values, prices, exit_rules_t, 100)
+                    trades = self._walk_trades(batch, entries, exits, prices, ivs, dates, rules, 100)
+                    rows.append({
+                        "delta_target": delta,
+                        "dte": dte,
+                        "profit_target_pct": target,
+                        **self._compute_results(trades).summary(),
+                    })
+        return pd.DataFrame(rows)
+
+    def _backtest_batched(
+        self,
+        price_history: pd.Series,
+        iv_history: pd.Series,
+        build_legs: callable,
+        entry_rules: Optional[EntryRules],
+        exit_rules: Optional[ExitRules],
+    ) -> BacktestResult:
+        """Price every eligible entry at once, then walk the trade chain."""
+        entry_rules = entry_rules or EntryRules()
+        exit_rules = exit_rules or ExitRules()
+        prices, ivs = self._aligned_series(price_history, iv_history)
+
+        entries = self._entry_candidates(price_history, iv_history, prices, ivs, entry_rules)
+        batch = build_legs(prices[entries], ivs[entries], entry_rules.max_dte)
+        values = self._reprice_windows(batch, entries, prices, ivs, exit_rules)
+        exits = self._resolve_exits(batch, entries, values, prices, exit_rules, 100)
+        trades = self._walk_trades(
+            batch, entries, exits, prices, ivs, price_history.index, entry_rules, 100,
+        )
+        return self._compute_results(trades)
+
+    @staticmethod
+    def _aligned_series(price_history: pd.Series, iv_history: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+        """Prices and IVs on the price dates (IV defaults to 0.25 when missing)."""
+        prices = price_history.to_numpy(dtype=float)
+        ivs = iv_history.reindex(price_history.index).fillna(0.25).to_numpy(dtype=float)
+        return prices, ivs
+
+    def _entry_candidates(
+        self,
+        price_history: pd.Series,
+        iv_history: pd.Series,
+        prices: np.ndarray,
+        ivs: np.ndarray,
+        rules: EntryRules,
+    ) -> np.ndarray:
+        """Indices of all days passing _check_entry, within the entry loop's range."""
+        n = len(prices)
+        ok = np.arange(n) < n - rules.min_dte
+        dates = price_history.index
+        if hasattr(dates, "weekday"):
+            ok &= np.isin(np.asarray(dates.weekday), rules.entry_days)
+        ok &= (prices >= rules.min_underlying_price) & (prices <= rules.max_underlying_price)
+
+        if len(iv_history) >= 252:
+            iv_vals = iv_history.iloc[-252:]
+            iv_low, iv_high = iv_vals.min(), iv_vals.max()
+            if iv_high > iv_low:
+                iv_rank = (ivs - iv_low) / (iv_high - iv_low)
+            else:
+                iv_rank = np.full(n, 0.5)
+            ok &= (iv_rank >= rules.min_iv_rank) & (iv_rank <= rules.max_iv_rank)
+
+        return np.flatnonzero(ok)
+
+    def _short_put_batch(self, spots: np.ndarray, ivs: np.ndarray, dte: int, delta_target: float) -> _LegBatch:
+        """Short put legs at target delta for each entry (see backtest_short_put)."""
+        T = dte / 365.0
+        r = self.engine.config.risk_free_rate
+        strikes = self._find_delta_strikes(spots, T, r, ivs, "put", delta_target)
+        premiums = self.engine.black_scholes_array(spots, strikes, T, r, ivs, "put").price
+        return _LegBatch(strikes[:, None], premiums[:, None], ["put"], [-1], dte)
+
+    def _iron_condor_batch(
+        self, spots: np.ndarray, ivs: np.ndarray, dte: int, wing_delta: float, wing_width: float,
+    ) -> _LegBatch:
+        """Iron condor legs for each entry (see backtest_iron_condor)."""
+        T = dte / 365.0
+        r = self.engine.config.risk_free_rate
+        put_sell = self._find_delta_strikes(spots, T, r, ivs, "put", wing_delta)
+        call_sell = self._find_delta_strikes(spots, T, r, ivs, "call", wing_delta)
+        strikes = np.column_stack([put_sell - wing_width, put_sell, call_sell, call_sell + wing_width])
+        option_types = ["put", "put", "call", "call"]
+        premiums = np.column_stack([
+            self.engine.black_scholes_array(spots, strikes[:, j], T, r, ivs, opt_type).price
+            for j, opt_type in enumerate(option_types)
+        ])
+        return _LegBatch(strikes, premiums, option_types, [1, -1, -1, 1], dte)
+
+    def _reprice_windows(
+        self,
+        batch: _LegBatch,
+        entries: np.ndarray,
+        prices: np.ndarray,
+        ivs: np.ndarray,
+        rules: ExitRules,
+    ) -> np.ndarray:
+        """Position value for every entry (rows) on each holding day 1..max_hold (columns)."""
+        n_days = max(min(rules.max_hold_days, len(prices) - 1), 0)
+        days = np.arange(1, n_days + 1)
+        idx = np.minimum(entries[:, None] + days[None, :], len(prices) - 1)
+        spots, iv = prices[idx], ivs[idx]
+        T = np.maximum((batch.dte - days) / 365.0, 1 / 365.0)[None, :]
+        r = self.engine.config.risk_free_rate
+
+        values = 0.0
+        for j, (opt_type, qty) in enumerate(zip(batch.option_types, batch.quantities)):
+            priced = self.engine.black_scholes_array(spots, batch.strikes[:, j, None], T, r, iv, opt_type)
+            values = values + priced.price * qty
+        return np.broadcast_to(values, idx.shape)
+
+    def _resolve_exits(
+        self,
+        batch: _LegBatch,
+        entries: np.ndarray,
+        values: np.ndarray,
+        prices: np.ndarray,
+        rules: ExitRules,
+        multiplier: int,
+    ) -> _ExitBatch:
+        """First day each entry hits profit target, stop loss or DTE exit.
+
+        Entries that hit none expire at the end of their holding window.
+        Reason codes: 0 profit_target, 1 stop_loss, 2 dte_exit, 3 expiration.
+        """
+        entry_premium = batch.entry_premium
+        max_hold = np.minimum(rules.max_hold_days, len(prices) - entries - 1)
+        days = np.arange(1, values.shape[1] + 1)
+        rows = np.arange(len(entries))
+
+        pnl = (values - entry_premium[:, None]) * multiplier
+        max_credit = np.where(entry_premium < 0, np.abs(entry_premium) * multiplier, 0.0)[:, None]
+        profit = (max_credit > 0) & (pnl >= max_credit * rules.profit_target_pct)
+        stop = (max_credit > 0) & (pnl <= -max_credit * rules.stop_loss_pct)
+        dte_hit = (batch.dte - days <= rules.min_dte_exit)[None, :]
+        hit = (profit | stop | dte_hit) & (days[None, :] <= max_hold[:, None])
+
+        first = hit.argmax(axis=1) if hit.shape[1] else np.zeros(len(entries), dtype=int)
+        exited = hit[rows, first] if hit.shape[1] else np.zeros(len(entries), dtype=bool)
+        reason = np.where(profit[rows, first], 0, np.where(stop[rows, first], 1, 2)) if hit.shape[1] else first
+        hold_days = np.where(exited, first + 1, max_hold)
+        exit_spot = prices[entries + hold_days]
+
+        # Entries that never trigger settle at intrinsic value
+        exp_value = 0.0
+        for j, (opt_type, qty) in enumerate(zip(batch.option_types, batch.quantities)):
+            strikes = batch.strikes[:, j]
+            if opt_type == "call":
+                intrinsic = np.maximum(exit_spot - strikes, 0)
+            else:
+                intrinsic = np.maximum(strikes - exit_spot, 0)
+            exp_value = exp_value + intrinsic * qty
+
+        held_value = values[rows, first] if hit.shape[1] else exp_value
+        exit_value = np.where(exited, held_value, exp_value)
+        return _ExitBatch(
+            hold_days=hold_days,
+            exit_value=exit_value,
+            exit_spot=exit_spot,
+            pnl=(exit_value - entry_premium) * multiplier,
+            reason=np.where(exited, reason, 3),
+        )
+
+    def _walk_trades(
+        self,
+        batch: _LegBatch,
+        entries: np.ndarray,
+        exits: _ExitBatch,
+        prices: np.ndarray,
+        ivs: np.ndarray,
+        dates: pd.Index,
+        rules: EntryRules,
+        multiplier: int,
+    ) -> list[BacktestTrade]:
+        """Take non-overlapping trades in date order, as backtest_strategy does."""
+        entry_premium = batch.entry_premium
+        trades = []
+        limit = len(dates) - rules.min_dte
+        i = 0
+        while i < limit:
+            k = int(np.searchsorted(entries, i))
+            if k == len(entries):
+                break
+            i = int(entries[k])
+            trade = self._make_trade(exits, k, i, dates, entry_premium[k], multiplier)
+            trade.underlying_entry = float(prices[i])
+            trade.iv_entry = float(ivs[i])
+            trade.entry_date = self._date_str(dates[i])
+            trades.append(trade)
+            i = min(i + trade.hold_days + 1, len(dates) - 1)
+        return trades
+
+    def _make_trade(
+        self,
+        exits: _ExitBatch,
+        k: int,
+        entry_idx: int,
+        dates: pd.Index,
+        entry_premium: float,
+        multiplier: int,
+    ) -> BacktestTrade:
+        """BacktestTrade for row k of an exit batch, entered at dates[entry_idx]."""
+        reasons = ("profit_target", "stop_loss", "dte_exit", "expiration")
+        hold_days = int(exits.hold_days[k])
+        pnl = float(exits.pnl[k])
+        return BacktestTrade(
+            exit_date=self._date_str(dates[entry_idx + hold_days]),
+            entry_price=entry_premium * multiplier,
+            exit_price=float(exits.exit_value[k]) * multiplier,
+            pnl=pnl,
+            pnl_pct=float(pnl / abs(entry_premium * multiplier)) if entry_premium != 0 else 0,
+            hold_days=hold_days,
+            exit_reason=reasons[int(exits.reason[k])],
+            underlying_exit=float(exits.exit_spot[k]),
+        )
+
+    @staticmethod
+    def _date_str(d) -> str:
+        return str(d.date()) if hasattr(d, 'date') else str(d)
+
+    def _find_delta_strikes(
+        self,
+        spot: np.ndarray,
+        T: float,
+        r: float,
+        sigma: np.ndarray,
+        option_type: str,
+        target_delta: float,
+    ) -> np.ndarray:
+        """Array version of _find_delta_strike; each element stops where the scalar search would."""
+        low = np.asarray(spot, dtype=float) * 0.7
+        high = np.asarray(spot, dtype=float) * 1.3
+        mid = (low + high) / 2
+        active = np.ones(low.shape, dtype=bool)
+
+        for _ in range(50):
+            mid = np.where(active, (low + high) / 2, mid)
+            current_delta = np.abs(self.engine.black_scholes_array(spot, mid, T, r, sigma, option_type).delta)
+            active &= ~(np.abs(current_delta - target_delta) < 0.001)
+            if not active.any():
+                break
+            above = current_delta > target_delta
+            if option_type == "put":
+                move_low = active & above
+                move_high = active & ~above
+            else:
+                move_low = active & ~above
+                move_high = active & above
+            low = np.where(move_low, mid, low)
+            high = np.where(move_high, mid, high)
+
+        return np.array([round(m, 2) for m in mid.tolist()])
+
     def _find_delta_strike(
         self,
         spot: float,
@@ -213,29 +213,48 @@ class ChainAnalyzer:
         Returns:
             Contracts with greeks populated.
         """
-        for c in contracts:
-            T = c.expiry_days / 365.0
-            sigma = c.greeks.implied_vol if c.greeks and c.greeks.implied_vol > 0 else volatility
-            opt_type = "call" if c.option_type == OptionType.CALL else "put"
+        if not contracts:
+            return contracts
 
-            result = self.engine.black_scholes(
-                underlying_price, c.strike, T, risk_free_rate, sigma, opt_type,
-            )
+        T = np.array([c.expiry_days for c in contracts], dtype=float) / 365.0
+        strikes = np.array([c.strike for c in contracts], dtype=float)
+        is_call = np.array([c.option_type == OptionType.CALL for c in contracts])
+        sigma = np.array([
+            c.greeks.implied_vol if c.greeks and c.greeks.implied_vol > 0 else volatility
+            for c in contracts
+        ])
+        mids = np.array([c.mid for c in contracts], dtype=float)
 
-            iv = sigma
-            if c.mid > 0:
-                iv = self.engine.implied_volatility(
-                    c.mid, underlying_price, c.strike, T, risk_free_rate, opt_type,
-                )
+        result = self.engine.black_scholes_array(
+            underlying_price, strikes, T, risk_free_rate, sigma, is_call,
+        )
 
+        iv = sigma.copy()
+        quoted = mids > 0
+        if quoted.any():
+            iv[quoted] = self.engine.implied_volatility_array(
+                mids[quoted], underlying_price, strikes[quoted], T[quoted],
+                risk_free_rate, is_call[quoted],
+            )
+
+        columns = zip(
+            np.round(result.delta, 4).tolist(),
+            np.round(result.gamma, 6).tolist(),
+            np.round(result.theta, 4).tolist(),
+            np.round(result.vega, 4).tolist(),
+            np.round(result.rho, 4).tolist(),
+            np.round(iv, 4).tolist(),
+            np.round(result.price, 4).tolist(),
+        )
+        for c, (delta, gamma, theta, vega, rho, implied_vol, price) in zip(contracts, columns):
             c.greeks = OptionGreeks(
-                delta=round(result.delta, 4),
-                gamma=round(result.gamma, 6),
-                theta=round(result.theta, 4),
-                vega=round(result.vega, 4),
-                rho=round(result.rho, 4),
-                implied_vol=round(iv, 4),
-                price=round(result.price, 4),
+                delta=delta,
+                gamma=gamma,
+                theta=theta,
+                vega=vega,
+                rho=rho,
+                implied_vol=implied_vol,
+                price=price,
             )
 
         return contracts
@@ -43,9 +43,18 @@ class PricingConfig:
     iv_initial_guess: float = 0.30
     iv_min: float = 0.001
     iv_max: float = 5.0
+    iv_array_newton_iterations: int = 20
     binomial_steps: int = 200
     monte_carlo_simulations: int = 100_000
     monte_carlo_seed: int = 42
+    mc_variance_reduction: bool = True
+    mc_sequence: str = "sobol"
+    mc_antithetic: bool = True
+    mc_control_variate: bool = True
+    mc_qmc_replicas: int = 8
+    mc_chunk_size: int = 16_384
+    mc_time_steps: int = 64
+    mc_barrier_correction: bool = True
 
 
 @dataclass
@@ -61,6 +70,10 @@ class VolatilityConfig:
     })
     iv_history_lookback_days: int = 252
     vol_cone_windows: list = field(default_factory=lambda: [20, 40, 60, 120, 252])
+    svi_min_slice_points: int = 5
+    svi_workers: int = 1
+    surface_grid_points: int = 20
+    surface_cache_ttl: float = 60.0
 
 
 @dataclass
@@ -98,6 +111,7 @@ class BacktestConfig:
     profit_target_pct: float = 0.50
     stop_loss_pct: float = 2.0
     min_iv_rank: float = 0.0
+    vectorized: bool = True
 
 
 @dataclass
@@ -5,15 +5,19 @@ with full Greeks calculation and implied volatility solver.
 """
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import numpy as np
 
 from src.options.config import PricingConfig
 
+if TYPE_CHECKING:
+    from src.options.simulation import MCResult
+
 try:
+    from scipy.special import ndtr
     from scipy.stats import norm
     SCIPY_AVAILABLE = True
 except (ImportError, ValueError):
@@ -45,13 +49,28 @@ def _norm_pdf(x: float) -> float:
 def _norm_cdf_array(x: np.ndarray) -> np.ndarray:
     """Vectorized standard normal CDF."""
     if SCIPY_AVAILABLE:
-        return norm.cdf(x)
+        return ndtr(x)
     from numpy import vectorize
     import math
     vfunc = vectorize(lambda v: 0.5 * (1.0 + math.erf(v / math.sqrt(2.0))))
     return vfunc(x)
 
 
+def _norm_pdf_array(x: np.ndarray) -> np.ndarray:
+    """Vectorized standard normal PDF."""
+    return np.exp(-0.5 * x * x) / np.sqrt(2.0 * np.pi)
+
+
+def _is_call_array(option_type) -> np.ndarray:
+    """Boolean call mask from 'call'/'put' labels (scalar or array-like)."""
+    if isinstance(option_type, str):
+        return np.asarray(option_type == "call")
+    labels = np.asarray(option_type)
+    if labels.dtype == bool:
+        return labels
+    return np.asarray([str(getattr(v, "value", v)) == "call" for v in labels.ravel()]).reshape(labels.shape)
+
+
 # ============================================================================
 # Data Structures
 # ============================================================================
@@ -91,6 +110,35 @@ class OptionPrice:
         }
 
 
+@dataclass
+class OptionPriceArray:
+    """Black-Scholes prices and Greeks for many contracts at once.
+
+    Each field is an array aligned with the broadcast inputs; units match
+    OptionPrice (vega and rho per 1% move, theta per calendar day).
+    """
+
+    price: np.ndarray = field(default_factory=lambda: np.array([]))
+    delta: np.ndarray = field(default_factory=lambda: np.array([]))
+    gamma: np.ndarray = field(default_factory=lambda: np.array([]))
+    theta: np.ndarray = field(default_factory=lambda: np.array([]))
+    vega: np.ndarray = field(default_factory=lambda: np.array([]))
+    rho: np.ndarray = field(default_factory=lambda: np.array([]))
+
+    def __len__(self) -> int:
+        return int(self.price.size)
+
+    def to_dict(self) -> dict:
+        return {
+            "price": self.price,
+            "delta": self.delta,
+            "gamma": self.gamma,
+            "theta": self.theta,
+            "vega": self.vega,
+            "rho": self.rho,
+        }
+
+
 @dataclass
 class OptionLeg:
     """Single leg of an options strategy."""
@@ -290,7 +338,11 @@ class OptionsPricingEngine:
             q: Dividend yield.
 
         Returns:
-            OptionPrice with price.
+            OptionPrice with price and Greeks. With
+            ``config.mc_variance_reduction`` the price comes from
+            PathSimulator (Sobol + antithetic + control variate) with
+            pathwise delta, vega and rho; otherwise plain pseudo-random
+            draws with bump-and-reprice delta.
         """
         n_sims = n_simulations or self.config.monte_carlo_simulations
 
@@ -298,6 +350,11 @@ class OptionsPricingEngine:
             intrinsic = max(S - K, 0) if option_type == "call" else max(K - S, 0)
             return OptionPrice(price=intrinsic, option_type=option_type, model="monte_carlo")
 
+        if self.config.mc_variance_reduction:
+            return self.monte_carlo_exotic(
+                S, K, T, r, sigma, option_type, payoff="european", n_paths=n_sims, q=q,
+            ).to_option_price()
+
         rng = np.random.default_rng(self.config.monte_carlo_seed)
         z = rng.standard_normal(n_sims)
 
@@ -328,6 +385,47 @@ class OptionsPricingEngine:
             model="monte_carlo",
         )
 
+    def monte_carlo_exotic(
+        self,
+        S: float,
+        K: float,
+        T: float,
+        r: float,
+        sigma: float,
+        option_type: str = "call",
+        payoff: str = "european",
+        barrier: Optional[float] = None,
+        barrier_type: str = "down-and-out",
+        n_paths: Optional[int] = None,
+        n_steps: Optional[int] = None,
+        q: float = 0.0,
+    ) -> "MCResult":
+        """Variance-reduced Monte Carlo for European and path-dependent payoffs.
+
+        Args:
+            S: Current underlying price.
+            K: Strike price.
+            T: Time to expiration in years.
+            r: Risk-free rate.
+            sigma: Volatility.
+            option_type: 'call' or 'put'.
+            payoff: 'european', 'asian' or 'barrier'.
+            barrier: Barrier level (barrier payoff only).
+            barrier_type: 'down-and-out', 'up-and-out', 'down-and-in' or 'up-and-in'.
+            n_paths: Number of paths.
+            n_steps: Monitoring dates for path-dependent payoffs.
+            q: Dividend yield.
+
+        Returns:
+            MCResult with price, standard error, delta, vega and rho.
+        """
+        from src.options.simulation import PathSimulator
+
+        return PathSimulator(self.config, self).price(
+            S, K, T, r, sigma, option_type, payoff=payoff, q=q,
+            barrier=barrier, barrier_type=barrier_type, n_paths=n_paths, n_steps=n_steps,
+        )
+
     def implied_volatility(
         self,
         market_price: float,
@@ -374,6 +472,185 @@ class OptionsPricingEngine:
 
         return float(sigma)
 
+    # ------------------------------------------------------------------
+    # Array pricing (whole chains)
+    # ------------------------------------------------------------------
+
+    def black_scholes_array(
+        self,
+        S,
+        K,
+        T,
+        r,
+        sigma,
+        option_type="call",
+        q=0.0,
+    ) -> OptionPriceArray:
+        """Black-Scholes prices and Greeks over arrays of contracts.
+
+        Inputs broadcast against each other, so a chain can be priced
+        with a scalar spot and rate and per-contract K, T and sigma.
+        Matches black_scholes() element-wise, including the intrinsic
+        value returned for expired or zero-vol contracts.
+
+        Args:
+            S: Underlying price(s).
+            K: Strike price(s).
+            T: Time(s) to expiration in years.
+            r: Risk-free rate(s).
+            sigma: Volatility(ies).
+            option_type: 'call'/'put', or an array of labels or a boolean
+                call mask.
+            q: Continuous dividend yield(s).
+
+        Returns:
+            OptionPriceArray with one entry per broadcast element.
+        """
+        S, K, T, r, sigma, q = np.broadcast_arrays(
+            *(np.asarray(x, dtype=float) for x in (S, K, T, r, sigma, q))
+        )
+        is_call = np.broadcast_to(_is_call_array(option_type), S.shape)
+
+        live = (T > 0) & (sigma > 0)
+        T_ = np.where(live, T, 1.0)
+        sigma_ = np.where(live, sigma, 1.0)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sqrt_T = np.sqrt(T_)
+            d1 = (np.log(S / K) + (r - q + sigma_**2 / 2) * T_) / (sigma_ * sqrt_T)
+            d2 = d1 - sigma_ * sqrt_T
+            disc_q = np.exp(-q * T_)
+            disc_r = np.exp(-r * T_)
+            nd1 = _norm_pdf_array(d1)
+            sign = np.where(is_call, 1.0, -1.0)
+            cdf_d1 = _norm_cdf_array(sign * d1)
+            cdf_d2 = _norm_cdf_array(sign * d2)
+
+            price = sign * (S * disc_q * cdf_d1 - K * disc_r * cdf_d2)
+            delta = sign * disc_q * cdf_d1
+            rho = sign * K * T_ * disc_r * cdf_d2 / 100
+            gamma = disc_q * nd1 / (S * sigma_ * sqrt_T)
+            vega = S * disc_q * nd1 * sqrt_T / 100
+            theta = (
+                -S * disc_q * nd1 * sigma_ / (2 * sqrt_T)
+                - sign * r * K * disc_r * cdf_d2
+                + sign * q * S * disc_q * cdf_d1
+            ) / 365
+
+        intrinsic = np.where(is_call, np.maximum(S - K, 0), np.maximum(K - S, 0))
+        expired_delta = np.where(is_call & (S > K), 1.0, np.where(~is_call & (S < K), -1.0, 0.0))
+        return OptionPriceArray(
+            price=np.where(live, price, intrinsic),
+            delta=np.where(live, delta, expired_delta),
+            gamma=np.where(live, gamma, 0.0),
+            theta=np.where(live, theta, 0.0),
+            vega=np.where(live, vega, 0.0),
+            rho=np.where(live, rho, 0.0),
+        )
+
+    def implied_volatility_array(
+        self,
+        market_price,
+        S,
+        K,
+        T,
+        r,
+        option_type="call",
+        q=0.0,
+    ) -> np.ndarray:
+        """Implied volatility for a whole chain at once.
+
+        Runs Newton-Raphson on every contract simultaneously, dropping
+        contracts from the working set as they converge. Contracts that
+        stall (vanishing vega) or have not converged after
+        ``iv_array_newton_iterations`` steps are finished by bisection on
+        [iv_min, iv_max], so deep OTM strikes and prices outside the
+        no-arbitrage bounds still get a bracketed answer.
+
+        Args:
+            market_price: Observed market price(s).
+            S: Underlying price(s).
+            K: Strike price(s).
+            T: Time(s) to expiration in years.
+            r: Risk-free rate(s).
+            option_type: 'call'/'put', or an array of labels or a boolean
+                call mask.
+            q: Dividend yield(s).
+
+        Returns:
+            Array of implied volatilities (0.0 where T <= 0 or price <= 0).
+        """
+        price, S, K, T, r, q = np.broadcast_arrays(
+            *(np.asarray(x, dtype=float) for x in (market_price, S, K, T, r, q))
+        )
+        is_call = np.broadcast_to(_is_call_array(option_type), price.shape)
+        iv = np.zeros(price.shape)
+
+        solve = np.flatnonzero((T > 0) & (price > 0))
+        if solve.size == 0:
+            return iv
+
+        target = price.ravel()[solve]
+        args = [a.ravel()[solve] for a in (S, K, T, r)] + [is_call.ravel()[solve], q.ravel()[solve]]
+        cfg = self.config
+        sigma = np.full(solve.size, cfg.iv_initial_guess)
+
+        # Newton phase
+        active = np.arange(solve.size)
+        fallback = []
+        for _ in range(cfg.iv_array_newton_iterations):
+            if active.size == 0:
+                break
+            model, vega = self._bs_price_vega(*[a[active] for a in args], sigma[active])
+            diff = model - target[active]
+            done = np.abs(diff) < cfg.iv_solver_tolerance
+            stalled = ~done & (vega < 1e-12)
+            fallback.append(active[stalled])
+            step = ~(done | stalled)
+            active = active[step]
+            sigma[active] = np.clip(sigma[active] - diff[step] / vega[step], cfg.iv_min, cfg.iv_max)
+        fallback.append(active)
+
+        # Bracketed fallback
+        rest = np.concatenate(fallback)
+        if rest.size:
+            sigma[rest] = self._bisect_iv(target[rest], [a[rest] for a in args])
+
+        iv.ravel()[solve] = sigma
+        return iv
+
+    def _bs_price_vega(self, S, K, T, r, is_call, q, sigma) -> tuple[np.ndarray, np.ndarray]:
+        """Black-Scholes price and raw vega (per 1.0 vol) for live contracts."""
+        sqrt_T = np.sqrt(T)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            d1 = (np.log(S / K) + (r - q + sigma**2 / 2) * T) / (sigma * sqrt_T)
+        d2 = d1 - sigma * sqrt_T
+        disc_q = S * np.exp(-q * T)
+        disc_r = K * np.exp(-r * T)
+        sign = np.where(is_call, 1.0, -1.0)
+        price = sign * (disc_q * _norm_cdf_array(sign * d1) - disc_r * _norm_cdf_array(sign * d2))
+        return price, disc_q * _norm_pdf_array(d1) * sqrt_T
+
+    def _bisect_iv(self, target: np.ndarray, args: list) -> np.ndarray:
+        """Bisection on [iv_min, iv_max]; Black-Scholes is monotone in sigma."""
+        cfg = self.config
+        lo = np.full(target.size, cfg.iv_min)
+        hi = np.full(target.size, cfg.iv_max)
+        mid = (lo + hi) / 2
+        active = np.arange(target.size)
+        for _ in range(cfg.iv_solver_max_iterations):
+            model, _ = self._bs_price_vega(*[a[active] for a in args], mid[active])
+            diff = model - target[active]
+            high = diff > 0
+            hi[active] = np.where(high, mid[active], hi[active])
+            lo[active] = np.where(high, lo[active], mid[active])
+            keep = (np.abs(diff) >= cfg.iv_solver_tolerance) & (hi[active] - lo[active] > 1e-12)
+            active = active[keep]
+            if active.size == 0:
+                break
+            mid[active] = (lo[active] + hi[active]) / 2
+        return mid
+
     def price_option(
         self,
         S: float,
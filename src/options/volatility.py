@@ -2,11 +2,18 @@
 
 Constructs implied volatility surfaces from options chain data,
 fits SVI parametrization, and computes volatility analytics.
+SVISurfaceEngine keeps per-expiry SVI surfaces for many underlyings
+up to date incrementally.
 """
 
+import hashlib
 import logging
+import os
+import time
+from bisect import bisect_left
+from concurrent.futures import Executor, ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Callable, Optional
 
 import numpy as np
 import pandas as pd
@@ -70,9 +77,13 @@ class VolSurface:
     iv_grid: np.ndarray = field(default_factory=lambda: np.array([]))
     svi_params: dict = field(default_factory=dict)
     raw_points: list = field(default_factory=list)
+    slices: dict = field(default_factory=dict)
 
     def get_iv(self, moneyness: float, dte: int) -> float:
         """Interpolate IV at given moneyness and DTE."""
+        if self.slices:
+            return _slices_iv(self.slices, np.log(moneyness), dte)
+
         if self.svi_params:
             t = dte / 365.0
             return _svi_total_variance(
@@ -116,7 +127,102 @@ def _svi_total_variance(k: float, t: float, params: dict) -> float:
     sigma = params.get("sigma", 0.2)
 
     w = a + b * (rho * (k - m) + np.sqrt((k - m) ** 2 + sigma ** 2))
-    return max(w, 1e-8)
+    return np.maximum(w, 1e-8)
+
+
+def _slices_iv(slices: dict, k: float, dte: int) -> float:
+    """IV from per-expiry SVI slices, linear in total variance across expiries.
+
+    Outside the fitted expiries the nearest slice's volatility is used.
+    """
+    dtes = sorted(slices)
+    t = max(dte, 1) / 365.0
+    if dte <= dtes[0] or dte >= dtes[-1]:
+        nearest = dtes[0] if dte <= dtes[0] else dtes[-1]
+        return float((_svi_total_variance(k, 0.0, slices[nearest]) / (nearest / 365.0)) ** 0.5)
+
+    i = bisect_left(dtes, dte)
+    if dtes[i] == dte:
+        return float((_svi_total_variance(k, 0.0, slices[dte]) / t) ** 0.5)
+    t1, t2 = dtes[i - 1] / 365.0, dtes[i] / 365.0
+    w1 = _svi_total_variance(k, t1, slices[dtes[i - 1]])
+    w2 = _svi_total_variance(k, t2, slices[dtes[i]])
+    w = w1 + (w2 - w1) * (t - t1) / (t2 - t1)
+    return float((max(w, 1e-8) / t) ** 0.5)
+
+
+def _svi_linear_params(k: np.ndarray, w: np.ndarray, m: float, sigma: float) -> tuple[float, float, float, float]:
+    """Best (a, b, rho) for fixed (m, sigma) by linear least squares.
+
+    With m and sigma fixed, SVI total variance is linear in
+    (a, b * rho, b), so the inner fit is a 3x3 solve. Solutions with
+    b < 0 or |rho| >= 1 are projected back and a is refit.
+
+    Returns:
+        (a, b, rho, sum of squared errors).
+    """
+    y = k - m
+    z = np.sqrt(y * y + sigma * sigma)
+    # Normal equations for w ~ a + c * y + b * z, solved by Cramer's rule
+    n, sy, sz = float(len(y)), float(y.sum()), float(z.sum())
+    syy, syz, szz = float(y @ y), float(y @ z), float(z @ z)
+    sw, syw, szw = float(w.sum()), float(y @ w), float(z @ w)
+    det = n * (syy * szz - syz * syz) - sy * (sy * szz - syz * sz) + sz * (sy * syz - syy * sz)
+    if abs(det) < 1e-300:
+        (a, c, b), *_ = np.linalg.lstsq(np.column_stack([np.ones_like(y), y, z]), w, rcond=None)
+    else:
+        a = (sw * (syy * szz - syz * syz) - sy * (syw * szz - syz * szw) + sz * (syw * syz - syy * szw)) / det
+        c = (n * (syw * szz - szw * syz) - sw * (sy * szz - syz * sz) + sz * (sy * szw - syw * sz)) / det
+        b = (n * (syy * szw - syz * syw) - sy * (sy * szw - syw * sz) + sw * (sy * syz - syy * sz)) / det
+
+    if b <= 0 or abs(c) >= b:
+        b = max(float(b), 0.0)
+        rho = float(np.clip(c / b, -0.999, 0.999)) if b > 0 else 0.0
+        a = float(np.mean(w - b * (rho * y + z)))
+    else:
+        rho = c / b
+
+    resid = a + b * (rho * y + z) - w
+    return float(a), float(b), float(rho), float(resid @ resid)
+
+
+def _fit_svi_slice(task: tuple) -> tuple[dict, float]:
+    """Fit one expiry slice (module-level so it can run in pool workers).
+
+    Args:
+        task: (log_moneyness, total_variance, start, warm) where start is
+            the previous fit's params when warm, else the configured
+            initial params.
+
+    Returns:
+        (SVI params dict, RMSE in total variance).
+    """
+    k, w, start, warm = task
+    x0 = np.array([start["m"], abs(start["sigma"])])
+    step = 0.01 if warm else 0.1
+
+    scale = 1.0 / max(float(w @ w), 1e-300)
+
+    def objective(x):
+        if x[1] <= 1e-4:
+            return 1e10
+        return _svi_linear_params(k, w, x[0], x[1])[3] * scale
+
+    result = minimize(
+        objective,
+        x0,
+        method="Nelder-Mead",
+        options={
+            "initial_simplex": np.array([x0, x0 + [step, 0.0], x0 + [0.0, step]]),
+            "xatol": 1e-4,
+            "fatol": 1e-10,
+            "maxiter": 400,
+        },
+    )
+    m, sigma = result.x
+    a, b, rho, sse = _svi_linear_params(k, w, m, sigma)
+    params = {"a": a, "b": b, "rho": rho, "m": float(m), "sigma": float(sigma)}
+    return params, float(np.sqrt(sse / len(k)))
 
 
 class VolatilitySurfaceBuilder:
@@ -155,37 +261,15 @@ class VolatilitySurfaceBuilder:
         Returns:
             VolSurface with fitted parameters.
         """
-        points = []
-
-        for _, row in chain.iterrows():
-            strike = row["strike"]
-            dte = int(row["dte"])
-            mid_price = row["mid_price"]
-            opt_type = row.get("option_type", "call")
-
-            if dte < self.config.min_dte or dte > self.config.max_dte:
-                continue
-
-            moneyness = strike / spot_price
-            if moneyness < self.config.min_moneyness or moneyness > self.config.max_moneyness:
-                continue
-
-            if mid_price <= 0:
-                continue
-
-            T = dte / 365.0
-            iv = self.engine.implied_volatility(
-                mid_price, spot_price, strike, T, risk_free_rate, opt_type
+        moneyness, dtes, ivs, strikes, opt_types = self.chain_ivs(
+            chain, spot_price, risk_free_rate
+        )
+        points = [
+            VolPoint(moneyness=m, dte=d, iv=iv, strike=k, option_type=t)
+            for m, d, iv, k, t in zip(
+                moneyness.tolist(), dtes.tolist(), ivs.tolist(), strikes.tolist(), opt_types.tolist(),
             )
-
-            if 0.01 < iv < 3.0:
-                points.append(VolPoint(
-                    moneyness=moneyness,
-                    dte=dte,
-                    iv=iv,
-                    strike=strike,
-                    option_type=opt_type,
-                ))
+        ]
 
         surface = VolSurface(raw_points=points)
 
@@ -197,6 +281,55 @@ class VolatilitySurfaceBuilder:
 
         return surface
 
+    def chain_ivs(
+        self,
+        chain: pd.DataFrame,
+        spot_price: float,
+        risk_free_rate: float = 0.05,
+        otm_only: bool = False,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Solve implied vols for the usable contracts of a chain.
+
+        Drops contracts outside the configured DTE and moneyness bands,
+        without a positive mid price, or whose IV falls outside (1%, 300%).
+
+        Args:
+            chain: DataFrame with columns: strike, dte, mid_price, option_type.
+            spot_price: Current underlying price.
+            risk_free_rate: Risk-free rate.
+            otm_only: Keep only OTM puts (K < S) and calls (K >= S); deep
+                ITM prices carry too little time value to pin down an IV.
+
+        Returns:
+            (moneyness, dte, iv, strike, option_type) arrays for the kept contracts.
+        """
+        strikes = chain["strike"].to_numpy(dtype=float)
+        dtes = chain["dte"].to_numpy(dtype=float).astype(int)
+        mid_prices = chain["mid_price"].to_numpy(dtype=float)
+        if "option_type" in chain:
+            opt_types = chain["option_type"].to_numpy(dtype=object)
+        else:
+            opt_types = np.full(len(chain), "call", dtype=object)
+
+        moneyness = strikes / spot_price
+        keep = (
+            (dtes >= self.config.min_dte) & (dtes <= self.config.max_dte)
+            & (moneyness >= self.config.min_moneyness) & (moneyness <= self.config.max_moneyness)
+            & (mid_prices > 0)
+        )
+        if otm_only:
+            keep &= (opt_types == "call") == (moneyness >= 1.0)
+        strikes, dtes, mid_prices = strikes[keep], dtes[keep], mid_prices[keep]
+        moneyness, opt_types = moneyness[keep], opt_types[keep]
+
+        ivs = self.engine.implied_volatility_array(
+            mid_prices, spot_price, strikes, dtes / 365.0, risk_free_rate,
+            opt_types == "call",
+        )
+
+        valid = (ivs > 0.01) & (ivs < 3.0)
+        return moneyness[valid], dtes[valid], ivs[valid], strikes[valid], opt_types[valid]
+
     def build_from_ivs(self, iv_data: list[dict]) -> VolSurface:
         """Build surface from pre-computed IVs.
 
@@ -373,3 +506,206 @@ class VolatilitySurfaceBuilder:
                 pass
 
         return surface
+
+
+@dataclass
+class SVISlice:
+    """Cached SVI fit for one expiry of one underlying."""
+
+    dte: int = 30
+    params: dict = field(default_factory=dict)
+    rmse: float = 0.0
+    n_points: int = 0
+    spot: float = 0.0
+    fingerprint: bytes = b""
+    fitted_at: float = 0.0
+    grid_iv: np.ndarray = field(default_factory=lambda: np.array([]))
+
+
+class SVISurfaceEngine:
+    """Incremental per-expiry SVI surfaces for a universe of underlyings.
+
+    Each expiry is fitted as its own SVI slice to OTM quotes
+    (quasi-explicit: a Nelder-Mead search over (m, sigma) with
+    (a, b, rho) solved linearly).
+    On refresh, a slice whose quotes are unchanged since a fit less than
+    ``surface_cache_ttl`` seconds old is reused together with its row of
+    the interpolation grid; changed slices are refit starting from their
+    previous parameters. With ``svi_workers`` != 1 the slices that need
+    fitting, across all underlyings in an update_many() call, are spread
+    over a process pool (0 means all cores).
+
+    Surfaces carry per-expiry ``slices`` and a DTE x moneyness ``iv_grid``
+    (one row per expiry, matching the builder's meshgrid layout) on a fixed
+    moneyness grid; ``raw_points`` is left empty.
+
+    Example:
+        with SVISurfaceEngine(VolatilityConfig(svi_workers=0)) as engine:
+            surfaces = engine.update_many({"SPX": (spx_chain, 5000.0)})
+            iv = surfaces["SPX"].get_iv(0.95, 45)
+    """
+
+    def __init__(
+        self,
+        config: Optional[VolatilityConfig] = None,
+        pricing_engine: Optional[OptionsPricingEngine] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.config = config or VolatilityConfig()
+        self.builder = VolatilitySurfaceBuilder(self.config, pricing_engine)
+        self.moneyness_grid = np.linspace(
+            self.config.min_moneyness, self.config.max_moneyness, self.config.surface_grid_points
+        )
+        self.stats = {"fitted": 0, "warm_started": 0, "reused": 0}
+        self._clock = clock
+        self._slices: dict[str, dict[int, SVISlice]] = {}
+        self._surfaces: dict[str, VolSurface] = {}
+        self._executor: Optional[Executor] = None
+        if not SCIPY_AVAILABLE:
+            logger.warning("scipy unavailable: SVI slices will not be fitted")
+
+    def __enter__(self) -> "SVISurfaceEngine":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker pool, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def get_surface(self, symbol: str) -> Optional[VolSurface]:
+        """Most recent surface for a symbol, if any."""
+        return self._surfaces.get(symbol)
+
+    def invalidate(self, symbol: Optional[str] = None) -> None:
+        """Forget cached slices (and warm starts) for one or all symbols."""
+        if symbol is None:
+            self._slices.clear()
+            self._surfaces.clear()
+        else:
+            self._slices.pop(symbol, None)
+            self._surfaces.pop(symbol, None)
+
+    def update(
+        self,
+        symbol: str,
+        chain: pd.DataFrame,
+        spot_price: float,
+        risk_free_rate: float = 0.05,
+    ) -> VolSurface:
+        """Refresh one underlying's surface from its latest chain.
+
+        Args:
+            symbol: Underlying symbol (cache key).
+            chain: DataFrame with columns: strike, dte, mid_price, option_type.
+            spot_price: Current underlying price.
+            risk_free_rate: Risk-free rate.
+
+        Returns:
+            Updated VolSurface.
+        """
+        return self.update_many({symbol: (chain, spot_price)}, risk_free_rate)[symbol]
+
+    def update_many(
+        self,
+        chains: dict[str, tuple[pd.DataFrame, float]],
+        risk_free_rate: float = 0.05,
+    ) -> dict[str, VolSurface]:
+        """Refresh several underlyings, fitting all changed slices in one batch.
+
+        Args:
+            chains: symbol -> (chain DataFrame, spot price).
+            risk_free_rate: Risk-free rate.
+
+        Returns:
+            symbol -> updated VolSurface.
+        """
+        now = self._clock()
+        current: dict[str, dict[int, SVISlice]] = {}
+        pending: list[tuple[str, SVISlice, np.ndarray, np.ndarray, dict, bool]] = []
+
+        for symbol, (chain, spot_price) in chains.items():
+            previous = self._slices.get(symbol, {})
+            current[symbol] = {}
+            moneyness, dtes, ivs, _, _ = self.builder.chain_ivs(
+                chain, spot_price, risk_free_rate, otm_only=True,
+            )
+            for dte, k, w in self._split_slices(moneyness, dtes, ivs):
+                fingerprint = hashlib.blake2b(k.tobytes() + w.tobytes(), digest_size=16).digest()
+                prev = previous.get(dte)
+                if (
+                    prev is not None
+                    and prev.fingerprint == fingerprint
+                    and now - prev.fitted_at < self.config.surface_cache_ttl
+                ):
+                    current[symbol][dte] = prev
+                    self.stats["reused"] += 1
+                    continue
+
+                slice_ = SVISlice(
+                    dte=dte, n_points=len(k), spot=spot_price, fingerprint=fingerprint, fitted_at=now,
+                )
+                current[symbol][dte] = slice_
+                if prev is not None:
+                    # Sticky strike: a spot move shifts the smile in log-moneyness
+                    start = dict(prev.params, m=prev.params["m"] + np.log(prev.spot / spot_price))
+                    pending.append((symbol, slice_, k, w, start, True))
+                else:
+                    pending.append((symbol, slice_, k, w, self.config.svi_initial_params, False))
+
+        if pending and SCIPY_AVAILABLE:
+            tasks = [(k, w, start, warm) for _, _, k, w, start, warm in pending]
+            for (_, slice_, *_rest), (params, rmse) in zip(pending, self._run_fits(tasks)):
+                slice_.params = params
+                slice_.rmse = rmse
+                slice_.grid_iv = self._grid_row(params, slice_.dte)
+            self.stats["fitted"] += len(pending)
+            self.stats["warm_started"] += sum(1 for p in pending if p[5])
+
+        surfaces = {}
+        for symbol, slices in current.items():
+            slices = {dte: s for dte, s in slices.items() if s.params}
+            self._slices[symbol] = slices
+            surfaces[symbol] = self._surfaces[symbol] = self._assemble(slices)
+        return surfaces
+
+    def _split_slices(self, moneyness: np.ndarray, dtes: np.ndarray, ivs: np.ndarray):
+        """Yield (dte, log-moneyness, total variance) per expiry, sorted by strike."""
+        order = np.lexsort((moneyness, dtes))
+        moneyness, dtes, ivs = moneyness[order], dtes[order], ivs[order]
+        expiries, starts = np.unique(dtes, return_index=True)
+        bounds = np.append(starts, len(dtes))
+        for dte, lo, hi in zip(expiries.tolist(), bounds[:-1], bounds[1:]):
+            if hi - lo < self.config.svi_min_slice_points:
+                continue
+            yield dte, np.log(moneyness[lo:hi]), ivs[lo:hi] ** 2 * (dte / 365.0)
+
+    def _run_fits(self, tasks: list[tuple]) -> list[tuple[dict, float]]:
+        """Fit slices serially or on the process pool."""
+        n_workers = self.config.svi_workers or os.cpu_count() or 1
+        if n_workers == 1 or len(tasks) == 1:
+            return [_fit_svi_slice(task) for task in tasks]
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=n_workers)
+        chunksize = max(1, len(tasks) // (n_workers * 4))
+        return list(self._executor.map(_fit_svi_slice, tasks, chunksize=chunksize))
+
+    def _grid_row(self, params: dict, dte: int) -> np.ndarray:
+        """Slice IVs on the engine's fixed moneyness grid."""
+        w = _svi_total_variance(np.log(self.moneyness_grid), dte / 365.0, params)
+        return np.sqrt(w / (dte / 365.0))
+
+    def _assemble(self, slices: dict[int, SVISlice]) -> VolSurface:
+        """Stack cached slice rows into a surface."""
+        if not slices:
+            return VolSurface()
+        dtes = sorted(slices)
+        return VolSurface(
+            moneyness_grid=self.moneyness_grid,
+            dte_grid=np.array(dtes),
+            iv_grid=np.vstack([slices[d].grid_iv for d in dtes]),
+            slices={d: slices[d].params for d in dtes},
+        )
@@ -39,6 +39,7 @@ from src.risk.stress_test import (
     StressTestEngine,
     StressTestResult,
     StressScenario,
+    ScenarioShockMatrix,
     HISTORICAL_SCENARIOS,
     HYPOTHETICAL_SCENARIOS,
 )
@@ -129,6 +130,7 @@ __all__ = [
     "StressTestEngine",
     "StressTestResult",
     "StressScenario",
+    "ScenarioShockMatrix",
     "HISTORICAL_SCENARIOS",
     "HYPOTHETICAL_SCENARIOS",
     # Drawdown
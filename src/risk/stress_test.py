@@ -4,6 +4,7 @@ Implements historical and hypothetical stress tests to assess
 portfolio resilience under adverse market conditions.
 """
 
+import hashlib
 import logging
 from dataclasses import dataclass, field
 from datetime import date, datetime
@@ -63,6 +64,33 @@ class StressTestResult:
     calculated_at: datetime = field(default_factory=datetime.now)
 
 
+@dataclass
+class ScenarioShockMatrix:
+    """Cumulative returns of every symbol over every historical scenario.
+
+    Rows are scenarios, columns symbols. ``benchmark`` holds each
+    scenario's benchmark return (NaN when unavailable), used as the proxy
+    for symbols outside ``symbols``. Scenarios with no data in their
+    window have ``available`` False and contribute zero impact.
+    """
+
+    version: str
+    scenarios: list[str]
+    symbols: list[str]
+    shocks: np.ndarray
+    benchmark: np.ndarray
+    available: np.ndarray
+
+    def shocks_for(self, symbols: list[str]) -> np.ndarray:
+        """Scenarios x symbols shocks, benchmark-proxied, NaN where unknown."""
+        columns = {s: i for i, s in enumerate(self.symbols)}
+        out = np.empty((len(self.scenarios), len(symbols)))
+        for j, symbol in enumerate(symbols):
+            i = columns.get(symbol)
+            out[:, j] = self.shocks[:, i] if i is not None else self.benchmark
+        return out
+
+
 # Pre-defined historical scenarios
 HISTORICAL_SCENARIOS = [
     StressScenario(
@@ -241,12 +269,29 @@ class StressTestEngine:
     ):
         """Initialize stress test engine.
 
+        Args:
+            historical_data: DataFrame with historical prices (columns = symbols).
+            benchmark_data: Benchmark (SPY) prices for historical scenarios.
+        """
+        self._shock_cache: dict[str, ScenarioShockMatrix] = {}
+        self._data_version = 0
+        self.update_data(historical_data, benchmark_data)
+
+    def update_data(
+        self,
+        historical_data: Optional[pd.DataFrame] = None,
+        benchmark_data: Optional[pd.Series] = None,
+    ) -> None:
+        """Replace the price history and drop cached shock matrices.
+
         Args:
             historical_data: DataFrame with historical prices (columns = symbols).
             benchmark_data: Benchmark (SPY) prices for historical scenarios.
         """
         self.historical_data = historical_data
         self.benchmark_data = benchmark_data
+        self._shock_cache.clear()
+        self._data_version += 1
 
         # Pre-compute returns if data provided
         self.historical_returns = None
@@ -329,22 +374,7 @@ class StressTestEngine:
                         position_impacts[symbol] = cum_return
                         portfolio_return += weight * cum_return
 
-        result.portfolio_impact_pct = portfolio_return
-        result.portfolio_impact_dollars = portfolio_return * portfolio_value
-        result.position_impacts = position_impacts
-        result.surviving_portfolio_value = portfolio_value * (1 + portfolio_return)
-
-        # Find worst and best positions
-        sorted_impacts = sorted(position_impacts.items(), key=lambda x: x[1])
-        result.worst_positions = sorted_impacts[:5]
-        result.best_positions = sorted_impacts[-5:][::-1]
-
-        # Set worst position info
-        if sorted_impacts:
-            result.worst_position_symbol = sorted_impacts[0][0]
-            result.worst_position_impact_pct = sorted_impacts[0][1]
-
-        return result
+        return self._finalize_result(result, position_impacts, portfolio_return, portfolio_value)
 
     def run_historical_tests(
         self,
@@ -365,13 +395,179 @@ class StressTestEngine:
         if scenarios is None:
             scenarios = HISTORICAL_SCENARIOS
 
+        historical = [s for s in scenarios if s.scenario_type == "historical"]
+        if self.historical_returns is None or not historical:
+            return [self.run_historical_test(s, positions, portfolio_value) for s in scenarios]
+
+        matrix = self.build_shock_matrix(historical)
+        weights: dict[str, float] = {}
+        for pos in positions:
+            symbol = pos.get("symbol", "")
+            weights[symbol] = weights.get(symbol, 0.0) + pos.get("weight", 0)
+        symbols = list(weights)
+        shocks = matrix.shocks_for(symbols)
+        portfolio_returns = np.nan_to_num(shocks) @ np.array(list(weights.values()), dtype=float)
+
+        rows = iter(range(len(matrix.scenarios)))
         results = []
         for scenario in scenarios:
-            result = self.run_historical_test(scenario, positions, portfolio_value)
+            if scenario.scenario_type != "historical":
+                results.append(self.run_historical_test(scenario, positions, portfolio_value))
+                continue
+            i = next(rows)
+            result = StressTestResult(
+                scenario_name=scenario.name,
+                portfolio_impact_pct=0.0,
+                portfolio_impact_dollars=0.0,
+                var_impact=0.0,
+            )
+            if matrix.available[i]:
+                position_impacts = {
+                    symbol: float(shock)
+                    for symbol, shock in zip(symbols, shocks[i])
+                    if not np.isnan(shock)
+                }
+                self._finalize_result(result, position_impacts, float(portfolio_returns[i]), portfolio_value)
             results.append(result)
 
         return results
 
+    # =========================================================================
+    # Batched Historical Stress Tests
+    # =========================================================================
+
+    def scenario_library_version(self, scenarios: list[StressScenario]) -> str:
+        """Fingerprint of a scenario library and the loaded price history."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(str(self._data_version).encode())
+        for scenario in scenarios:
+            key = (scenario.name, scenario.scenario_type, scenario.start_date, scenario.end_date)
+            digest.update(repr(key).encode())
+        return digest.hexdigest()
+
+    def build_shock_matrix(
+        self,
+        scenarios: Optional[list[StressScenario]] = None,
+    ) -> ScenarioShockMatrix:
+        """Cumulative return of every symbol over every historical scenario.
+
+        Computed once per scenario library version and cached; a new
+        library or a call to ``update_data`` builds a fresh matrix.
+
+        Args:
+            scenarios: Historical scenarios (uses defaults if not provided).
+
+        Returns:
+            ScenarioShockMatrix (scenarios x symbols).
+        """
+        if scenarios is None:
+            scenarios = HISTORICAL_SCENARIOS
+        scenarios = [s for s in scenarios if s.scenario_type == "historical"]
+        version = self.scenario_library_version(scenarios)
+        cached = self._shock_cache.get(version)
+        if cached is not None:
+            return cached
+
+        returns = self.historical_returns
+        symbols = [] if returns is None else list(returns.columns)
+        shocks = np.zeros((len(scenarios), len(symbols)))
+        benchmark = np.full(len(scenarios), np.nan)
+        available = np.zeros(len(scenarios), dtype=bool)
+
+        for i, scenario in enumerate(scenarios):
+            if returns is None or scenario.start_date is None or scenario.end_date is None:
+                continue
+            start = pd.Timestamp(scenario.start_date)
+            end = pd.Timestamp(scenario.end_date)
+            mask = (returns.index >= start) & (returns.index <= end)
+            if not mask.any():
+                logger.warning(f"No data for period {scenario.start_date} to {scenario.end_date}")
+                continue
+            available[i] = True
+            shocks[i] = np.prod(1 + returns.to_numpy()[mask], axis=0) - 1
+            if self.benchmark_returns is not None:
+                bench_mask = (self.benchmark_returns.index >= start) & (self.benchmark_returns.index <= end)
+                if bench_mask.any():
+                    benchmark[i] = np.prod(1 + self.benchmark_returns.to_numpy()[bench_mask]) - 1
+
+        matrix = ScenarioShockMatrix(
+            version=version,
+            scenarios=[s.name for s in scenarios],
+            symbols=symbols,
+            shocks=shocks,
+            benchmark=benchmark,
+            available=available,
+        )
+        self._shock_cache[version] = matrix
+        return matrix
+
+    def run_historical_batch(
+        self,
+        weights: pd.DataFrame,
+        scenarios: Optional[list[StressScenario]] = None,
+    ) -> pd.DataFrame:
+        """Stress many portfolios against every historical scenario at once.
+
+        Each row of ``weights`` is a portfolio: one per account for a
+        book-wide sweep, or one per candidate rebalance of a single
+        account. Impacts match ``run_historical_tests`` row for row.
+
+        Args:
+            weights: Portfolio weights (rows = portfolios, columns = symbols).
+            scenarios: Historical scenarios (uses defaults if not provided).
+
+        Returns:
+            DataFrame of portfolio returns (rows = portfolios, columns = scenarios).
+        """
+        matrix = self.build_shock_matrix(scenarios)
+        shocks = np.nan_to_num(matrix.shocks_for(list(weights.columns)))
+        impacts = weights.fillna(0).to_numpy(dtype=float) @ shocks.T
+        return pd.DataFrame(impacts, index=weights.index, columns=matrix.scenarios)
+
+    @staticmethod
+    def positions_to_weights(portfolios: dict[str, list[dict]]) -> pd.DataFrame:
+        """Stack position lists ({symbol, weight}) into a weights matrix.
+
+        Args:
+            portfolios: Mapping of portfolio id to its positions.
+
+        Returns:
+            DataFrame (rows = portfolio ids, columns = symbols), zero-filled.
+        """
+        records = {}
+        for portfolio_id, positions in portfolios.items():
+            row: dict[str, float] = {}
+            for pos in positions:
+                symbol = pos.get("symbol", "")
+                row[symbol] = row.get(symbol, 0.0) + pos.get("weight", 0)
+            records[portfolio_id] = row
+        return pd.DataFrame.from_dict(records, orient="index").fillna(0.0)
+
+    @staticmethod
+    def _finalize_result(
+        result: StressTestResult,
+        position_impacts: dict[str, float],
+        portfolio_return: float,
+        portfolio_value: float,
+    ) -> StressTestResult:
+        """Fill portfolio totals and best/worst positions on a result."""
+        result.portfolio_impact_pct = portfolio_return
+        result.portfolio_impact_dollars = portfolio_return * portfolio_value
+        result.position_impacts = position_impacts
+        result.surviving_portfolio_value = portfolio_value * (1 + portfolio_return)
+
+        # Find worst and best positions
+        sorted_impacts = sorted(position_impacts.items(), key=lambda x: x[1])
+        result.worst_positions = sorted_impacts[:5]
+        result.best_positions = sorted_impacts[-5:][::-1]
+
+        # Set worst position info
+        if sorted_impacts:
+            result.worst_position_symbol = sorted_impacts[0][0]
+            result.worst_position_impact_pct = sorted_impacts[0][1]
+
+        return result
+
     # =========================================================================
     # Hypothetical Stress Tests
     # =========================================================================
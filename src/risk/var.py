@@ -6,10 +6,15 @@ Implements three VaR methodologies:
 3. Monte Carlo Simulation
 
 Also calculates Expected Shortfall (CVaR).
+
+Portfolio Monte Carlo draws from a seeded Generator against a cached
+square root of the covariance matrix (Cholesky, or a low-rank factor
+model plus idiosyncratic variance), in fixed-size chunks.
 """
 
+import hashlib
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 import numpy as np
@@ -17,10 +22,12 @@ import pandas as pd
 
 # Make scipy optional due to potential version conflicts
 try:
+    from scipy import linalg as scipy_linalg
     from scipy import stats
     SCIPY_AVAILABLE = True
 except (ImportError, ValueError):
     SCIPY_AVAILABLE = False
+    scipy_linalg = None
     stats = None
 
 logger = logging.getLogger(__name__)
@@ -84,6 +91,9 @@ class VaRResult:
     horizon_days: int = 1
     portfolio_value: float = 0.0
     returns_distribution: Optional[np.ndarray] = None  # For visualization
+    var_by_confidence: dict[float, float] = field(default_factory=dict)
+    cvar_by_confidence: dict[float, float] = field(default_factory=dict)
+    component_var: dict[float, dict[str, float]] = field(default_factory=dict)  # Monte Carlo only
 
     @property
     def var_95_pct(self) -> float:
@@ -101,6 +111,19 @@ class VaRResult:
         return self.cvar_95 / self.portfolio_value if self.portfolio_value > 0 else 0
 
 
+@dataclass
+class _CovarianceFactor:
+    """Cached square root of an annualized covariance matrix.
+
+    covariance ~= loadings @ loadings.T + diag(idiosyncratic); the
+    Cholesky factor has no idiosyncratic term.
+    """
+
+    fingerprint: str
+    loadings: np.ndarray
+    idiosyncratic: Optional[np.ndarray] = None
+
+
 class VaRCalculator:
     """Calculate Value at Risk using multiple methodologies.
 
@@ -123,20 +146,40 @@ class VaRCalculator:
     """
 
     TRADING_DAYS_PER_YEAR = 252
+    MC_METHODS = ("cholesky", "factor", "multivariate_normal")
 
     def __init__(
         self,
         confidence_levels: tuple[float, ...] = (0.95, 0.99),
         horizon_days: int = 1,
+        mc_method: str = "cholesky",
+        factor_rank: int = 20,
+        mc_chunk_size: int = 2_048,
+        seed: Optional[int] = None,
     ):
         """Initialize VaR calculator.
 
         Args:
             confidence_levels: Confidence levels for VaR calculation.
             horizon_days: Time horizon in trading days.
+            mc_method: Portfolio Monte Carlo mode: 'cholesky' (exact),
+                'factor' (top ``factor_rank`` eigenvectors plus
+                idiosyncratic variance) or 'multivariate_normal'
+                (legacy, refactorizes on every call).
+            factor_rank: Number of factors in 'factor' mode.
+            mc_chunk_size: Scenarios simulated per chunk.
+            seed: Seed for the simulation Generator.
         """
+        if mc_method not in self.MC_METHODS:
+            raise ValueError(f"Unknown mc_method: {mc_method}")
         self.confidence_levels = confidence_levels
         self.horizon_days = horizon_days
+        self.mc_method = mc_method
+        self.factor_rank = factor_rank
+        self.mc_chunk_size = mc_chunk_size
+        self._rng = np.random.default_rng(seed)
+        self._factor: Optional[_CovarianceFactor] = None
+        self.factor_stats = {"factorized": 0, "reused": 0}
 
     # =========================================================================
     # Simple VaR Methods (return percentage VaR for single return series)
@@ -390,7 +433,8 @@ class VaRCalculator:
     ) -> float:
         """Calculate VaR using Monte Carlo simulation on portfolio.
 
-        Simulates correlated returns using multivariate normal distribution.
+        Simulates correlated normal returns from the cached covariance
+        factor (see ``mc_method``).
 
         Args:
             weights: Portfolio weights array.
@@ -403,40 +447,17 @@ class VaRCalculator:
         Returns:
             VaR as positive dollar amount.
         """
-        n_assets = len(weights)
-
-        if expected_returns is None:
-            expected_returns = np.zeros(n_assets)
-
-        # Scale covariance for daily and horizon
-        daily_cov = covariance_matrix / self.TRADING_DAYS_PER_YEAR
-        scaled_cov = daily_cov * self.horizon_days
-        scaled_returns = expected_returns / self.TRADING_DAYS_PER_YEAR * self.horizon_days
-
-        # Simulate correlated returns
-        try:
-            simulated = np.random.multivariate_normal(
-                mean=scaled_returns,
-                cov=scaled_cov,
-                size=n_simulations,
-            )
-        except (np.linalg.LinAlgError, ValueError) as e:
-            logger.warning(f"Monte Carlo simulation failed: {e}, using diagonal")
-            # Fall back to independent simulation
-            variances = np.diag(scaled_cov)
-            simulated = np.random.normal(
-                loc=scaled_returns,
-                scale=np.sqrt(variances),
-                size=(n_simulations, n_assets),
+        if self.mc_method == "multivariate_normal":
+            portfolio_returns = self._simulate_multivariate_normal(
+                weights, covariance_matrix, expected_returns, n_simulations,
             )
+            var_pct = -np.percentile(portfolio_returns, (1 - confidence) * 100)
+            return var_pct * portfolio_value
 
-        # Calculate portfolio returns
-        portfolio_returns = simulated @ weights
-
-        # VaR
-        var_pct = -np.percentile(portfolio_returns, (1 - confidence) * 100)
-
-        return var_pct * portfolio_value
+        _, tail = self._simulate_portfolio(
+            weights, covariance_matrix, expected_returns, n_simulations, (confidence,),
+        )
+        return tail[confidence][0] * portfolio_value
 
     def monte_carlo_var_full(
         self,
@@ -445,15 +466,21 @@ class VaRCalculator:
         portfolio_value: float,
         expected_returns: Optional[np.ndarray] = None,
         n_simulations: int = 10_000,
+        symbols: Optional[list[str]] = None,
     ) -> VaRResult:
         """Calculate comprehensive Monte Carlo VaR metrics.
 
+        One simulation yields VaR and CVaR at every configured confidence
+        level (plus 95% and 99%) and, outside the legacy mode, component
+        VaR per asset.
+
         Args:
             weights: Portfolio weights array.
             covariance_matrix: Asset covariance matrix.
             portfolio_value: Current portfolio value.
             expected_returns: Expected returns.
             n_simulations: Number of simulations.
+            symbols: Asset labels for component VaR (default: positions).
 
         Returns:
             VaRResult with all metrics.
@@ -464,24 +491,67 @@ class VaRCalculator:
             portfolio_value=portfolio_value,
         )
 
+        weights = np.asarray(weights, dtype=float)
+        symbols = symbols or [str(i) for i in range(len(weights))]
+        levels = tuple(sorted(set(self.confidence_levels) | {0.95, 0.99}))
+
+        if self.mc_method == "multivariate_normal":
+            portfolio_returns = self._simulate_multivariate_normal(
+                weights, covariance_matrix, expected_returns, n_simulations,
+            )
+            for level in levels:
+                threshold = np.percentile(portfolio_returns, (1 - level) * 100)
+                result.var_by_confidence[level] = -threshold * portfolio_value
+                result.cvar_by_confidence[level] = (
+                    -portfolio_returns[portfolio_returns <= threshold].mean() * portfolio_value
+                )
+        else:
+            portfolio_returns, tail = self._simulate_portfolio(
+                weights, covariance_matrix, expected_returns, n_simulations, levels,
+            )
+            for level, (var_pct, cvar_pct, contributions) in tail.items():
+                result.var_by_confidence[level] = var_pct * portfolio_value
+                result.cvar_by_confidence[level] = cvar_pct * portfolio_value
+                # Euler allocation of the simulated tail, scaled to sum to VaR
+                scale = var_pct / cvar_pct * portfolio_value if cvar_pct != 0 else 0.0
+                result.component_var[level] = dict(zip(symbols, (-contributions * scale).tolist()))
+
+        result.var_95 = result.var_by_confidence[0.95]
+        result.var_99 = result.var_by_confidence[0.99]
+        result.cvar_95 = result.cvar_by_confidence[0.95]
+        result.cvar_99 = result.cvar_by_confidence[0.99]
+        result.returns_distribution = portfolio_returns
+
+        return result
+
+    def _simulate_multivariate_normal(
+        self,
+        weights: np.ndarray,
+        covariance_matrix: np.ndarray,
+        expected_returns: Optional[np.ndarray],
+        n_simulations: int,
+    ) -> np.ndarray:
+        """Legacy simulation: full multivariate normal draw on the global RNG."""
         n_assets = len(weights)
 
         if expected_returns is None:
             expected_returns = np.zeros(n_assets)
 
-        # Scale covariance
+        # Scale covariance for daily and horizon
         daily_cov = covariance_matrix / self.TRADING_DAYS_PER_YEAR
         scaled_cov = daily_cov * self.horizon_days
         scaled_returns = expected_returns / self.TRADING_DAYS_PER_YEAR * self.horizon_days
 
-        # Simulate
+        # Simulate correlated returns
         try:
             simulated = np.random.multivariate_normal(
                 mean=scaled_returns,
                 cov=scaled_cov,
                 size=n_simulations,
             )
-        except (np.linalg.LinAlgError, ValueError):
+        except (np.linalg.LinAlgError, ValueError) as e:
+            logger.warning(f"Monte Carlo simulation failed: {e}, using diagonal")
+            # Fall back to independent simulation
             variances = np.diag(scaled_cov)
             simulated = np.random.normal(
                 loc=scaled_returns,
@@ -489,20 +559,106 @@ class VaRCalculator:
                 size=(n_simulations, n_assets),
             )
 
-        portfolio_returns = simulated @ weights
+        return simulated @ weights
 
-        # VaR at different confidence levels
-        result.var_95 = -np.percentile(portfolio_returns, 5) * portfolio_value
-        result.var_99 = -np.percentile(portfolio_returns, 1) * portfolio_value
-
-        # CVaR
-        var_95_threshold = np.percentile(portfolio_returns, 5)
-        var_99_threshold = np.percentile(portfolio_returns, 1)
-
-        result.cvar_95 = -portfolio_returns[portfolio_returns <= var_95_threshold].mean() * portfolio_value
-        result.cvar_99 = -portfolio_returns[portfolio_returns <= var_99_threshold].mean() * portfolio_value
+    def _simulate_portfolio(
+        self,
+        weights: np.ndarray,
+        covariance_matrix: np.ndarray,
+        expected_returns: Optional[np.ndarray],
+        n_simulations: int,
+        levels: tuple[float, ...],
+    ) -> tuple[np.ndarray, dict[float, tuple[float, float, np.ndarray]]]:
+        """Simulate portfolio returns against the cached covariance factor.
+
+        Asset returns are mu + A @ x with x standard normal, so each chunk
+        only needs x @ (A.T @ w). The worst scenarios' draws are kept in a
+        bounded buffer, from which the tail mean of every asset return is
+        recovered as mu + A @ mean(x_tail) without storing the full
+        scenario matrix. In factor mode the idiosyncratic terms collapse
+        into one extra normal per scenario (their weighted sum), loaded
+        on each asset in proportion to its share of that sum.
 
-        return result
+        Returns:
+            Portfolio returns and, per confidence level, (VaR, CVaR) as
+            positive return fractions plus each asset's contribution to
+            the mean tail return.
+        """
+        weights = np.asarray(weights, dtype=float)
+        n_assets = len(weights)
+        mu = np.zeros(n_assets) if expected_returns is None else np.asarray(expected_returns, dtype=float)
+        mu = mu / self.TRADING_DAYS_PER_YEAR * self.horizon_days
+
+        factor = self._covariance_factor(covariance_matrix)
+        scale = np.sqrt(self.horizon_days / self.TRADING_DAYS_PER_YEAR)
+        loadings = factor.loadings * scale
+        if factor.idiosyncratic is not None:
+            idio = factor.idiosyncratic * scale**2
+            idio_vol = np.sqrt(weights**2 @ idio)
+            if idio_vol > 0:
+                loadings = np.hstack([loadings, (weights * idio / idio_vol)[:, None]])
+
+        exposure = loadings.T @ weights
+        base = float(weights @ mu)
+        n_tail = min(n_simulations, int(np.ceil(n_simulations * (1 - min(levels)))) + 1)
+
+        portfolio_returns = np.empty(n_simulations)
+        tail_x = np.empty((0, loadings.shape[1]))
+        tail_r = np.empty(0)
+        for start in range(0, n_simulations, self.mc_chunk_size):
+            x = self._rng.standard_normal((min(self.mc_chunk_size, n_simulations - start), loadings.shape[1]))
+            r = base + x @ exposure
+            portfolio_returns[start:start + len(r)] = r
+            if len(r) > n_tail:
+                worst = np.argpartition(r, n_tail - 1)[:n_tail]
+                x, r = x[worst], r[worst]
+            tail_x, tail_r = np.vstack([tail_x, x]), np.concatenate([tail_r, r])
+            if len(tail_r) > n_tail:
+                worst = np.argpartition(tail_r, n_tail - 1)[:n_tail]
+                tail_x, tail_r = tail_x[worst], tail_r[worst]
+
+        order = np.argsort(tail_r)
+        tail_x, tail_r = tail_x[order], tail_r[order]
+
+        tail = {}
+        for level in levels:
+            threshold = np.percentile(portfolio_returns, (1 - level) * 100)
+            count = max(int(np.searchsorted(tail_r, threshold, side="right")), 1)
+            contributions = weights * (mu + loadings @ tail_x[:count].mean(axis=0))
+            tail[level] = (float(-threshold), float(-tail_r[:count].mean()), contributions)
+
+        return portfolio_returns, tail
+
+    def _covariance_factor(self, covariance_matrix: np.ndarray) -> _CovarianceFactor:
+        """Return the covariance square root, refactorizing only on change."""
+        cov = np.ascontiguousarray(covariance_matrix, dtype=float)
+        digest = hashlib.blake2b(cov.tobytes(), digest_size=16).hexdigest()
+        fingerprint = f"{self.mc_method}:{self.factor_rank}:{cov.shape}:{digest}"
+        if self._factor is not None and self._factor.fingerprint == fingerprint:
+            self.factor_stats["reused"] += 1
+            return self._factor
+
+        if self.mc_method == "factor" and self.factor_rank < len(cov):
+            n = len(cov)
+            if SCIPY_AVAILABLE:
+                values, vectors = scipy_linalg.eigh(cov, subset_by_index=[n - self.factor_rank, n - 1])
+            else:
+                values, vectors = np.linalg.eigh(cov)
+                values, vectors = values[-self.factor_rank:], vectors[:, -self.factor_rank:]
+            loadings = vectors * np.sqrt(np.clip(values, 0, None))
+            idiosyncratic = np.clip(np.diag(cov) - (loadings**2).sum(axis=1), 0, None)
+            self._factor = _CovarianceFactor(fingerprint, loadings, idiosyncratic)
+        else:
+            try:
+                loadings = np.linalg.cholesky(cov)
+            except np.linalg.LinAlgError:
+                logger.warning("Covariance matrix not positive definite, clipping eigenvalues")
+                values, vectors = np.linalg.eigh(cov)
+                loadings = vectors * np.sqrt(np.clip(values, 0, None))
+            self._factor = _CovarianceFactor(fingerprint, loadings)
+
+        self.factor_stats["factorized"] += 1
+        return self._factor
 
     # =========================================================================
     # Component VaR
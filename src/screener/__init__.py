@@ -55,7 +55,7 @@ from src.screener.expression import ExpressionParser, ExpressionError
 from src.screener.engine import ScreenerEngine, ScreenManager
 from src.screener.presets import get_preset_screens, PRESET_SCREENS
 from src.screener.alerts import ScreenAlertManager
-from src.screener.backtest import ScreenBacktester
+from src.screener.backtest import MetricsPanel, ScreenBacktester
 
 
 __all__ = [
@@ -97,5 +97,6 @@ __all__ = [
     # Alerts
     "ScreenAlertManager",
     # Backtest
+    "MetricsPanel",
     "ScreenBacktester",
 ]
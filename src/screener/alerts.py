@@ -4,9 +4,11 @@ Monitors screens and triggers alerts when conditions are met.
 """
 
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Optional, Union
 import logging
 
+import pandas as pd
+
 from src.screener.config import AlertType
 from src.screener.models import (
     Screen,
@@ -111,18 +113,27 @@ class ScreenAlertManager:
     
     def check_alerts(
         self,
-        stock_data: dict[str, dict],
+        stock_data: Union[dict[str, dict], pd.DataFrame],
     ) -> list[AlertNotification]:
         """Check all alerts and return triggered notifications.
         
         Args:
-            stock_data: Current stock data.
+            stock_data: Current stock data (dict or metrics DataFrame).
             
         Returns:
             List of triggered AlertNotifications.
         """
         notifications = []
         
+        # Several screens over the same data: convert it once and screen column-wise
+        screens = [
+            self._screens[a.screen_id] for a in self._alerts.values()
+            if a.enabled and a.screen_id in self._screens
+        ]
+        if isinstance(stock_data, dict) and len(screens) > 1:
+            columns = sorted({c for screen in screens for c in self.engine.screen_columns(screen)})
+            stock_data = self.engine.build_metrics_frame(stock_data, columns)
+        
         for alert in self._alerts.values():
             if not alert.enabled:
                 continue
@@ -1,17 +1,25 @@
 """Screen Backtesting.
 
-Backtest screening strategies on historical data.
+Backtest screening strategies on historical data, either from per-date
+dicts (run) or from a MetricsPanel of date x symbol arrays, where every
+rebalance date is screened at once and many screens can share one
+loaded panel (run_panel, run_panel_batch).
 """
 
+from dataclasses import replace
 from datetime import date, timedelta
-from typing import Optional
+from typing import Any, Mapping, Optional, Sequence
 import logging
 import math
 
+import numpy as np
+import pandas as pd
+
 from src.screener.config import (
     BacktestConfig,
     DEFAULT_BACKTEST_CONFIG,
     RebalanceFrequency,
+    SortOrder,
 )
 from src.screener.models import (
     Screen,
@@ -23,6 +31,100 @@ from src.screener.engine import ScreenerEngine
 logger = logging.getLogger(__name__)
 
 
+class MetricsPanel:
+    """Point-in-time screening metrics as one date x symbol frame per metric.
+    
+    Frames share one date index and symbol columns. ``present`` marks
+    which symbols exist on each date (e.g. before listing or after
+    delisting they do not), mirroring which symbols a per-date dict holds.
+    
+    Example:
+        panel = MetricsPanel.from_frame(history)  # (date, symbol) x metrics
+        results = backtester.run_panel_batch(screens, panel)
+    """
+    
+    def __init__(
+        self,
+        frames: Mapping[str, pd.DataFrame],
+        present: Optional[pd.DataFrame] = None,
+    ):
+        frames = dict(frames)
+        if not frames:
+            raise ValueError("MetricsPanel needs at least one metric")
+        first = next(iter(frames.values()))
+        self.dates = first.index
+        self.symbols = first.columns
+        self._frames = {
+            name: f if f.index.equals(self.dates) and f.columns.equals(self.symbols)
+            else f.reindex(index=self.dates, columns=self.symbols)
+            for name, f in frames.items()
+        }
+        if present is None:
+            present = pd.DataFrame(False, index=self.dates, columns=self.symbols)
+            for f in self._frames.values():
+                present |= f.notna()
+        self.present = present.reindex(index=self.dates, columns=self.symbols, fill_value=False).astype(bool)
+    
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame) -> "MetricsPanel":
+        """Build from a long frame indexed by (date, symbol), one column per metric."""
+        frame = frame.sort_index()
+        wide = frame.unstack(level=-1)
+        present = pd.Series(True, index=frame.index).unstack(level=-1, fill_value=False)
+        return cls({name: wide[name] for name in frame.columns}, present)
+    
+    @classmethod
+    def from_array(
+        cls,
+        values: np.ndarray,
+        dates: Sequence,
+        symbols: Sequence[str],
+        metrics: Sequence[str],
+    ) -> "MetricsPanel":
+        """Build from a (dates, symbols, metrics) array; NaN marks missing values."""
+        if values.shape != (len(dates), len(symbols), len(metrics)):
+            raise ValueError(f"values shape {values.shape} does not match labels")
+        index, columns = pd.Index(dates), pd.Index(symbols)
+        return cls({
+            name: pd.DataFrame(values[:, :, k], index=index, columns=columns)
+            for k, name in enumerate(metrics)
+        })
+    
+    @classmethod
+    def from_historical(cls, historical_data: dict[date, dict[str, dict]]) -> "MetricsPanel":
+        """Build from ScreenBacktester.run() input (date -> symbol -> metrics)."""
+        keys = [(d, symbol) for d, stocks in historical_data.items() for symbol in stocks]
+        rows = [data for stocks in historical_data.values() for data in stocks.values()]
+        return cls.from_frame(pd.DataFrame(rows, index=pd.MultiIndex.from_tuples(keys)))
+    
+    @property
+    def metrics(self) -> list[str]:
+        return list(self._frames)
+    
+    def get(self, name: str, default: Any = None) -> Optional[pd.DataFrame]:
+        """Date x symbol frame of a metric, or default if absent."""
+        return self._frames.get(name, default)
+    
+    def __contains__(self, name: str) -> bool:
+        return name in self._frames
+
+
+class _PanelRows:
+    """Lazily sliced rows of a MetricsPanel (metrics are sliced on first use)."""
+    
+    def __init__(self, panel: MetricsPanel, rows: np.ndarray):
+        self._panel = panel
+        self._rows = rows
+        self._cache: dict[str, Optional[pd.DataFrame]] = {}
+    
+    def get(self, name: str, default: Any = None) -> Optional[pd.DataFrame]:
+        if name not in self._cache:
+            frame = self._panel.get(name)
+            self._cache[name] = None if frame is None else frame.iloc[self._rows]
+        frame = self._cache[name]
+        return default if frame is None else frame
+
+
 class ScreenBacktester:
     """Backtests screening strategies.
     
@@ -32,6 +134,10 @@ class ScreenBacktester:
     Example:
         backtester = ScreenBacktester()
         result = backtester.run(screen, historical_data, config)
+        
+        # Many variants against one loaded panel
+        panel = MetricsPanel.from_frame(history)
+        results = backtester.run_panel_batch(screens, panel, config)
     """
     
     def __init__(
@@ -132,9 +238,226 @@ class ScreenBacktester:
             )
             benchmark_curve.append(benchmark_curve[-1] * (1 + benchmark_return))
         
-        # Calculate metrics
+        return self._build_result(
+            screen, config, dates, equity_curve, benchmark_curve, holdings_history,
+        )
+    
+    # --- Panel mode ---
+    
+    def run_panel(
+        self,
+        screen: Screen,
+        panel: MetricsPanel,
+        backtest_config: Optional[ScreenBacktestConfig] = None,
+    ) -> ScreenBacktestResult:
+        """Backtest a screen against a MetricsPanel.
+        
+        Same rules and result as run() on the equivalent per-date dicts,
+        but each screen criterion is one boolean mask over all rebalance
+        dates and portfolio returns are computed with array operations.
+        """
+        return self.run_panel_batch([screen], panel, backtest_config)[0]
+    
+    def run_panel_batch(
+        self,
+        screens: Sequence[Screen],
+        panel: MetricsPanel,
+        backtest_config: Optional[ScreenBacktestConfig] = None,
+    ) -> list[ScreenBacktestResult]:
+        """Backtest many screens (e.g. parameter variants) against one panel.
+        
+        Date selection, rebalance schedule, price returns and the metric
+        slices at rebalance dates are computed once and shared.
+        
+        Args:
+            screens: Screens to backtest.
+            panel: Point-in-time metrics, including a ``price`` metric.
+            backtest_config: Backtest configuration shared by all screens.
+            
+        Returns:
+            One ScreenBacktestResult per screen, in order.
+        """
+        base_config = backtest_config or ScreenBacktestConfig()
+        configs = [
+            base_config if base_config.screen_id else replace(base_config, screen_id=screen.screen_id)
+            for screen in screens
+        ]
+        
+        keep = np.ones(len(panel.dates), dtype=bool)
+        if base_config.start_date:
+            keep &= panel.dates >= self._index_bound(panel.dates, base_config.start_date)
+        if base_config.end_date:
+            keep &= panel.dates <= self._index_bound(panel.dates, base_config.end_date)
+        rows = np.flatnonzero(keep)
+        dates = list(panel.dates[rows])
+        
+        if len(dates) < 2:
+            logger.warning("Insufficient data for backtest")
+            return [
+                ScreenBacktestResult(screen_id=screen.screen_id, screen_name=screen.name, config=config)
+                for screen, config in zip(screens, configs)
+            ]
+        
+        # Rebalances happen on dates[:-1]; the last date only closes the final period
+        rebalance_dates = self._get_rebalance_dates(dates, base_config.rebalance_frequency)
+        is_rebalance = np.array([d in rebalance_dates for d in dates[:-1]])
+        starts = np.flatnonzero(is_rebalance)
+        ends = np.append(starts[1:], len(dates) - 1)
+        
+        prices = self._panel_prices(panel, rows)
+        stock_returns = self._price_returns(prices)
+        if base_config.benchmark in panel.symbols:
+            benchmark_returns = self._price_returns(prices[:, panel.symbols.get_loc(base_config.benchmark)])
+        else:
+            benchmark_returns = np.zeros(len(dates) - 1)
+        benchmark_curve = np.concatenate([[1.0], np.cumprod(1 + benchmark_returns)])
+        
+        at_rebalance = _PanelRows(panel, rows[starts])
+        like = pd.DataFrame(
+            np.zeros((len(starts), len(panel.symbols)), dtype=bool),
+            index=panel.dates[rows[starts]], columns=panel.symbols,
+        )
+        present = panel.present.to_numpy()[rows[starts]]
+        symbols = panel.symbols.to_numpy(dtype=object)
+        cost = base_config.transaction_cost_bps / 10000
+        orders: dict[tuple, np.ndarray] = {}
+        
+        results = []
+        for screen, config in zip(screens, configs):
+            mask = self.engine.panel_mask(screen, at_rebalance, like) & present
+            sort = (screen.sort_by, screen.sort_order)
+            if sort not in orders:
+                orders[sort] = self._rank_order(screen.sort_by, screen.sort_order, at_rebalance, like)
+            holdings, position_weight = self._select_holdings(screen, config, mask, orders[sort])
+            
+            period_returns = np.empty(len(dates) - 1)
+            for k, (a, b) in enumerate(zip(starts, ends)):
+                period_returns[a:b] = stock_returns[a:b, holdings[k]].sum(axis=1) * position_weight[k]
+            period_returns[starts] -= cost
+            equity_curve = np.concatenate([[1.0], np.cumprod(1 + period_returns)])
+            
+            holdings_history = [
+                {"date": dates[a], "holdings": symbols[held].tolist()}
+                for a, held in zip(starts, holdings)
+            ]
+            results.append(self._build_result(
+                screen, config, dates, equity_curve, benchmark_curve, holdings_history,
+            ))
+        return results
+    
+    def _rank_order(
+        self,
+        sort_by: str,
+        sort_order: SortOrder,
+        metrics: _PanelRows,
+        like: pd.DataFrame,
+    ) -> np.ndarray:
+        """Symbol positions per rebalance date in run_screen() result order.
+        
+        Computed over all symbols so one order serves every screen with
+        the same sort; a stable sort keeps symbol order among ties, as
+        sorted() does.
+        """
+        key = self._sort_key(sort_by, metrics, like)
+        if sort_order == SortOrder.DESC:
+            key = -key
+        return np.argsort(key, axis=1, kind="stable")
+    
+    def _select_holdings(
+        self,
+        screen: Screen,
+        config: ScreenBacktestConfig,
+        mask: np.ndarray,
+        order: np.ndarray,
+    ) -> tuple[list[np.ndarray], np.ndarray]:
+        """Top positions per rebalance date among the matching symbols.
+        
+        Returns:
+            Held symbol positions per rebalance, and the weight of each
+            position per rebalance.
+        """
+        capacity = min(screen.max_results, config.max_positions)
+        needed = np.minimum(mask.sum(axis=1), capacity)
+        
+        # Walk rank order only as far as needed to find `capacity` matches per row
+        width = min(order.shape[1], max(4 * capacity, 64))
+        while True:
+            ranked = np.take_along_axis(mask, order[:, :width], axis=1)
+            if width == order.shape[1] or (ranked.sum(axis=1) >= needed).all():
+                break
+            width = min(order.shape[1], width * 4)
+        held = ranked & (np.cumsum(ranked, axis=1, dtype=np.int32) <= capacity)
+        
+        if config.equal_weight:
+            position_weight = 1.0 / np.maximum(needed, 1)
+        else:
+            position_weight = np.full(len(needed), 1.0 / config.max_positions)
+        holdings = [order[r, :width][held[r]] for r in range(len(order))]
+        return holdings, position_weight
+    
+    def _sort_key(self, sort_by: str, metrics: _PanelRows, like: pd.DataFrame) -> np.ndarray:
+        """Numeric sort key (rebalances, symbols) matching ScreenerEngine sorting."""
+        symbols = like.columns
+        if sort_by == "symbol":
+            key = pd.DataFrame(np.broadcast_to(symbols.to_numpy(), like.shape), index=like.index, columns=symbols)
+        elif sort_by == "name":
+            names = metrics.get("name")
+            key = pd.DataFrame(np.broadcast_to(symbols.to_numpy(), like.shape), index=like.index, columns=symbols)
+            if names is not None:
+                key = names.where(names.notna(), key)
+        else:
+            key = metrics.get(sort_by)
+            if key is None:
+                return np.zeros(like.shape)
+            key = key.fillna(0)
+        
+        values = key.to_numpy()
+        if values.dtype != object:
+            return values.astype(float)
+        try:
+            return values.astype(float)
+        except (TypeError, ValueError):
+            # Strings (symbol/name): sort by rank
+            codes, _ = pd.factorize(values.ravel().astype(str), sort=True)
+            return codes.reshape(values.shape).astype(float)
+    
+    @staticmethod
+    def _index_bound(index: pd.Index, bound: date) -> Any:
+        """Config date in a form comparable with the panel's date index."""
+        return pd.Timestamp(bound) if isinstance(index, pd.DatetimeIndex) else bound
+    
+    @staticmethod
+    def _panel_prices(panel: MetricsPanel, rows: np.ndarray) -> np.ndarray:
+        """Prices at the selected dates; missing prices are 0 (never traded)."""
+        prices = panel.get("price")
+        if prices is None:
+            return np.zeros((len(rows), len(panel.symbols)))
+        values = ScreenerEngine._numeric(prices.iloc[rows])
+        return np.nan_to_num(values, nan=0.0)
+    
+    @staticmethod
+    def _price_returns(prices: np.ndarray) -> np.ndarray:
+        """Simple returns between consecutive rows; 0 where either price is not positive."""
+        current, following = prices[:-1], prices[1:]
+        valid = (current > 0) & (following > 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(valid, following / np.where(valid, current, 1.0) - 1, 0.0)
+    
+    # --- Performance metrics ---
+    
+    def _build_result(
+        self,
+        screen: Screen,
+        config: ScreenBacktestConfig,
+        dates: list,
+        equity_curve: Sequence[float],
+        benchmark_curve: Sequence[float],
+        holdings_history: list[dict],
+    ) -> ScreenBacktestResult:
+        """Compute performance statistics from equity curves."""
+        equity_curve = np.asarray(equity_curve, dtype=float)
+        benchmark_curve = np.asarray(benchmark_curve, dtype=float)
         returns = self._calculate_returns(equity_curve)
-        benchmark_returns = self._calculate_returns(benchmark_curve)
         
         total_return = equity_curve[-1] / equity_curve[0] - 1
         benchmark_total = benchmark_curve[-1] / benchmark_curve[0] - 1
@@ -151,16 +474,16 @@ class ScreenBacktester:
             screen_id=screen.screen_id,
             screen_name=screen.name,
             config=config,
-            total_return=total_return * 100,
-            annualized_return=annualized * 100,
-            benchmark_return=benchmark_total * 100,
-            alpha=(annualized - (benchmark_total / years if years > 0 else 0)) * 100,
+            total_return=float(total_return) * 100,
+            annualized_return=float(annualized) * 100,
+            benchmark_return=float(benchmark_total) * 100,
+            alpha=float(annualized - (benchmark_total / years if years > 0 else 0)) * 100,
             volatility=volatility * 100,
             sharpe_ratio=sharpe,
             sortino_ratio=sortino,
             max_drawdown=max_dd * 100,
-            equity_curve=equity_curve,
-            benchmark_curve=benchmark_curve,
+            equity_curve=equity_curve.tolist(),
+            benchmark_curve=benchmark_curve.tolist(),
             dates=dates,
             holdings_history=holdings_history,
         )
@@ -239,68 +562,60 @@ class ScreenBacktester:
             return (next_price - current_price) / current_price
         return 0.0
     
-    def _calculate_returns(self, equity_curve: list[float]) -> list[float]:
+    def _calculate_returns(self, equity_curve: Sequence[float]) -> np.ndarray:
         """Calculate period returns from equity curve."""
-        returns = []
-        for i in range(1, len(equity_curve)):
-            if equity_curve[i - 1] > 0:
-                returns.append(equity_curve[i] / equity_curve[i - 1] - 1)
-        return returns
+        equity = np.asarray(equity_curve, dtype=float)
+        previous, current = equity[:-1], equity[1:]
+        valid = previous > 0
+        return current[valid] / previous[valid] - 1
     
-    def _calculate_volatility(self, returns: list[float]) -> float:
+    def _calculate_volatility(self, returns: Sequence[float]) -> float:
         """Calculate annualized volatility."""
+        returns = np.asarray(returns, dtype=float)
         if len(returns) < 2:
             return 0.0
         
-        mean = sum(returns) / len(returns)
-        variance = sum((r - mean) ** 2 for r in returns) / (len(returns) - 1)
-        daily_vol = math.sqrt(variance)
-        
+        daily_vol = float(np.std(returns, ddof=1))
         return daily_vol * math.sqrt(252)
     
-    def _calculate_sharpe(self, returns: list[float], risk_free: float) -> float:
+    def _calculate_sharpe(self, returns: Sequence[float], risk_free: float) -> float:
         """Calculate Sharpe ratio."""
+        returns = np.asarray(returns, dtype=float)
         if len(returns) < 2:
             return 0.0
         
-        mean_return = sum(returns) / len(returns) * 252  # Annualized
+        mean_return = float(returns.mean()) * 252  # Annualized
         vol = self._calculate_volatility(returns)
         
         if vol > 0:
             return (mean_return - risk_free) / vol
         return 0.0
     
-    def _calculate_sortino(self, returns: list[float], risk_free: float) -> float:
+    def _calculate_sortino(self, returns: Sequence[float], risk_free: float) -> float:
         """Calculate Sortino ratio."""
+        returns = np.asarray(returns, dtype=float)
         if len(returns) < 2:
             return 0.0
         
-        mean_return = sum(returns) / len(returns) * 252
+        mean_return = float(returns.mean()) * 252
         
         # Downside deviation
-        negative_returns = [r for r in returns if r < 0]
-        if not negative_returns:
+        negative_returns = returns[returns < 0]
+        if not len(negative_returns):
             return float('inf') if mean_return > risk_free else 0.0
         
-        downside_variance = sum(r ** 2 for r in negative_returns) / len(negative_returns)
+        downside_variance = float(np.mean(negative_returns ** 2))
         downside_vol = math.sqrt(downside_variance) * math.sqrt(252)
         
         if downside_vol > 0:
             return (mean_return - risk_free) / downside_vol
         return 0.0
     
-    def _calculate_max_drawdown(self, equity_curve: list[float]) -> float:
+    def _calculate_max_drawdown(self, equity_curve: Sequence[float]) -> float:
         """Calculate maximum drawdown."""
-        if len(equity_curve) < 2:
+        equity = np.asarray(equity_curve, dtype=float)
+        if len(equity) < 2:
             return 0.0
         
-        peak = equity_curve[0]
-        max_dd = 0.0
-        
-        for value in equity_curve:
-            if value > peak:
-                peak = value
-            dd = (peak - value) / peak
-            max_dd = max(max_dd, dd)
-        
-        return max_dd
+        peak = np.maximum.accumulate(equity)
+        return max(float(np.max((peak - equity) / peak)), 0.0)
@@ -4,9 +4,12 @@ Core engine for running stock screens.
 """
 
 import time
-from typing import Any, Optional
+from typing import Any, Callable, Mapping, Optional, Union
 import logging
 
+import numpy as np
+import pandas as pd
+
 from src.screener.config import (
     ScreenerConfig,
     DEFAULT_SCREENER_CONFIG,
@@ -22,10 +25,12 @@ from src.screener.models import (
     CustomFormula,
 )
 from src.screener.filters import FILTER_REGISTRY, FilterRegistry
-from src.screener.expression import ExpressionParser
+from src.screener.expression import ExpressionError, ExpressionParser
 
 logger = logging.getLogger(__name__)
 
+PandasObj = Union[pd.Series, pd.DataFrame]
+
 
 class ScreenerEngine:
     """Stock screening engine.
@@ -36,6 +41,11 @@ class ScreenerEngine:
     - Universe filtering
     - Sorting and pagination
     
+    Stock data may be a dict of symbol -> metrics or a DataFrame with one
+    row per symbol. DataFrames are screened column-wise: filters become
+    boolean masks and custom formulas are compiled once and evaluated
+    over the whole universe.
+    
     Example:
         engine = ScreenerEngine()
         result = engine.run_screen(screen, stock_data)
@@ -53,17 +63,21 @@ class ScreenerEngine:
     def run_screen(
         self,
         screen: Screen,
-        stock_data: dict[str, dict[str, Any]],
+        stock_data: Union[dict[str, dict[str, Any]], pd.DataFrame],
     ) -> ScreenResult:
         """Run a screen against stock data.
         
         Args:
             screen: Screen configuration.
-            stock_data: Dict of symbol -> metrics dict.
+            stock_data: Dict of symbol -> metrics dict, or a metrics
+                DataFrame indexed by symbol.
             
         Returns:
             ScreenResult with matching stocks.
         """
+        if isinstance(stock_data, pd.DataFrame):
+            return self._run_columnar(screen, stock_data)
+        
         start_time = time.time()
         
         # Filter universe
@@ -94,6 +108,223 @@ class ScreenerEngine:
             execution_time_ms=execution_time,
         )
     
+    @staticmethod
+    def build_metrics_frame(
+        stock_data: dict[str, dict[str, Any]],
+        columns: Optional[list[str]] = None,
+    ) -> pd.DataFrame:
+        """Convert symbol -> metrics dicts to a DataFrame indexed by symbol.
+        
+        Callers screening the same data repeatedly (alerts, dashboards,
+        live screens) should build the frame once and pass it to
+        run_screen(); see screen_columns() to extract only what the
+        screens read.
+        
+        Args:
+            stock_data: Dict of symbol -> metrics dict.
+            columns: Metrics to extract (default: all).
+        """
+        if columns is None:
+            return pd.DataFrame(list(stock_data.values()), index=list(stock_data))
+        rows = stock_data.values()
+        return pd.DataFrame(
+            {col: [data.get(col) for data in rows] for col in columns},
+            index=list(stock_data),
+        )
+    
+    def screen_columns(self, screen: Screen) -> list[str]:
+        """Metrics a screen reads: universe, filter, formula and sort columns."""
+        columns = {"sector", "industry", "market_cap", "name", screen.sort_by}
+        for filter_cond in screen.filters:
+            columns.add(filter_cond.filter_id)
+            filter_def = self.filter_registry.get_filter(filter_cond.filter_id)
+            if filter_def and filter_def.expression_name:
+                columns.add(filter_def.expression_name)
+        for formula in screen.custom_formulas:
+            try:
+                columns |= self.expression_parser.get_variables(formula.expression)
+            except ExpressionError as e:
+                # Reported again when the formula is evaluated
+                logger.debug(f"Skipping columns of formula {formula.expression!r}: {e}")
+        columns.discard("symbol")
+        return sorted(columns)
+    
+    # --- Columnar screening ---
+    
+    def _run_columnar(self, screen: Screen, frame: pd.DataFrame) -> ScreenResult:
+        """Run a screen over a metrics frame with one mask per criterion."""
+        start_time = time.time()
+        
+        like = pd.Series(index=frame.index, dtype=object)
+        universe = self._universe_mask(screen, frame.get, like)
+        mask = universe & self._criteria_mask(screen, frame.get, like)
+        matched = frame[mask]
+        
+        order = self._sort_order(matched, screen.sort_by, screen.sort_order)
+        matched = matched.take(order[:screen.max_results])
+        
+        rows = [
+            {k: v for k, v in row.items() if not (v is None or (isinstance(v, float) and np.isnan(v)))}
+            for row in matched.to_dict(orient="records")
+        ]
+        matches = [self._create_match(symbol, data, screen) for symbol, data in zip(matched.index, rows)]
+        
+        execution_time = (time.time() - start_time) * 1000
+        
+        return ScreenResult(
+            screen_id=screen.screen_id,
+            screen_name=screen.name,
+            total_universe=int(universe.sum()),
+            matches=len(matches),
+            stocks=matches,
+            filters_applied=len(screen.filters) + len(screen.custom_formulas),
+            execution_time_ms=execution_time,
+        )
+    
+    def screen_mask(self, screen: Screen, frame: pd.DataFrame) -> np.ndarray:
+        """Boolean mask of rows matching all filters and custom formulas.
+        
+        Universe constraints (sectors, market cap, exclusions) are not
+        applied here.
+        """
+        like = pd.Series(index=frame.index, dtype=object)
+        return self._criteria_mask(screen, frame.get, like)
+    
+    def panel_mask(
+        self,
+        screen: Screen,
+        metrics: Mapping[str, pd.DataFrame],
+        like: pd.DataFrame,
+    ) -> np.ndarray:
+        """Evaluate a screen on every date of a date x symbol panel at once.
+        
+        Args:
+            screen: Screen configuration.
+            metrics: Metric name -> date x symbol frame, all labeled like
+                ``like``.
+            like: Frame giving the panel's dates (index) and symbols
+                (columns).
+            
+        Returns:
+            Boolean array (dates, symbols) of stocks passing the universe
+            constraints, filters and custom formulas.
+        """
+        return self._universe_mask(screen, metrics.get, like) & self._criteria_mask(screen, metrics.get, like)
+    
+    def _criteria_mask(self, screen: Screen, lookup: Callable, like: PandasObj) -> np.ndarray:
+        """Filters and custom formulas; lookup(name) returns a metric or None."""
+        mask = np.ones(like.shape, dtype=bool)
+        
+        for filter_cond in screen.filters:
+            filter_def = self.filter_registry.get_filter(filter_cond.filter_id)
+            if not filter_def:
+                logger.warning(f"Unknown filter: {filter_cond.filter_id}")
+                continue
+            values = self._filter_values(lookup, like, filter_cond.filter_id, filter_def.expression_name)
+            mask &= filter_cond.evaluate_array(values)
+        
+        for formula in screen.custom_formulas:
+            if not formula.is_valid:
+                continue
+            mask &= self._formula_mask(formula, lookup, like)
+        
+        return mask
+    
+    def _universe_mask(self, screen: Screen, lookup: Callable, like: PandasObj) -> np.ndarray:
+        """Column-wise equivalent of _filter_universe()."""
+        symbols = like.columns if isinstance(like, pd.DataFrame) else like.index
+        mask = np.broadcast_to(~symbols.isin(screen.exclude_symbols), like.shape).copy()
+        
+        if screen.sectors:
+            mask &= self._metric(lookup, like, "sector", "").isin(screen.sectors).to_numpy()
+        if screen.industries:
+            mask &= self._metric(lookup, like, "industry", "").isin(screen.industries).to_numpy()
+        
+        market_cap = self._metric(lookup, like, "market_cap", 0).fillna(0)
+        if screen.market_cap_min:
+            mask &= (market_cap >= screen.market_cap_min).to_numpy()
+        if screen.market_cap_max:
+            mask &= (market_cap <= screen.market_cap_max).to_numpy()
+        
+        return mask
+    
+    def _filter_values(self, lookup: Callable, like: PandasObj, filter_id: str, expression_name: str) -> PandasObj:
+        """Filter input values, falling back to expression_name like the row path."""
+        values = self._metric(lookup, like, filter_id)
+        if expression_name and expression_name != filter_id:
+            # Row path: data.get(filter_id) or data.get(expression_name)
+            falsy = values.isna() | ~values.astype(bool)
+            values = values.where(~falsy, self._metric(lookup, like, expression_name))
+        return values
+    
+    def _formula_mask(self, formula: CustomFormula, lookup: Callable, like: PandasObj) -> np.ndarray:
+        """Evaluate a custom formula over every stock; errors match nothing.
+        
+        As in the row path, a stock missing any variable the formula uses
+        does not match.
+        """
+        try:
+            compiled = self.expression_parser.compile(formula.expression)
+            names = self.expression_parser.get_variables(formula.expression)
+            present = np.ones(like.shape, dtype=bool)
+            variables = {}
+            for name in names:
+                values = lookup(name)
+                if values is None:
+                    return np.zeros(like.shape, dtype=bool)
+                present &= values.notna().to_numpy()
+                variables[name] = self._numeric(values)
+            result = np.broadcast_to(compiled(variables), like.shape)
+        except Exception as e:
+            logger.warning(f"Formula evaluation error: {e}")
+            return np.zeros(like.shape, dtype=bool)
+        
+        if result.dtype != bool:
+            # Non-boolean results are truthy when non-zero
+            result = result.astype(float)
+            result = (result != 0) & ~np.isnan(result)
+        return result & present
+    
+    @staticmethod
+    def _numeric(values: PandasObj) -> np.ndarray:
+        """Float array of a metric; non-numeric entries become NaN."""
+        try:
+            return values.to_numpy(dtype=float)
+        except (TypeError, ValueError):
+            if isinstance(values, pd.DataFrame):
+                return values.apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float)
+            return pd.to_numeric(values, errors="coerce").to_numpy(dtype=float)
+    
+    def _sort_order(self, frame: pd.DataFrame, sort_by: str, sort_order: SortOrder) -> np.ndarray:
+        """Row positions in the order _sort_matches() would produce."""
+        if sort_by == "symbol":
+            key = pd.Series(frame.index, index=frame.index)
+        elif sort_by == "name":
+            key = self._column(frame, "name").fillna(pd.Series(frame.index, index=frame.index))
+        else:
+            key = self._column(frame, sort_by, 0).fillna(0)
+        # Stable sort on positions mirrors sorted(..., reverse=...) tie order
+        positions = pd.Series(key.to_numpy(), index=np.arange(len(key)))
+        ascending = sort_order != SortOrder.DESC
+        return positions.sort_values(ascending=ascending, kind="stable").index.to_numpy()
+    
+    @staticmethod
+    def _column(frame: pd.DataFrame, name: str, default: Any = None) -> pd.Series:
+        if name in frame.columns:
+            return frame[name]
+        return pd.Series(default, index=frame.index, dtype=object if default is None else None)
+    
+    @staticmethod
+    def _metric(lookup: Callable, like: PandasObj, name: str, default: Any = None) -> PandasObj:
+        """lookup(name), or values shaped like ``like`` filled with default."""
+        values = lookup(name)
+        if values is not None:
+            return values
+        dtype = object if default is None else None
+        if isinstance(like, pd.DataFrame):
+            return pd.DataFrame(default, index=like.index, columns=like.columns, dtype=dtype)
+        return pd.Series(default, index=like.index, dtype=dtype)
+    
     def _filter_universe(
         self,
         screen: Screen,
@@ -6,9 +6,14 @@ Parses and evaluates user-defined screening expressions.
 import re
 import operator
 import math
-from typing import Any, Callable, Optional
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Mapping, Optional
 import logging
 
+import numpy as np
+import pandas as pd
+
 logger = logging.getLogger(__name__)
 
 
@@ -17,6 +22,46 @@ class ExpressionError(Exception):
     pass
 
 
+class _LRUCache:
+    """Small thread-safe LRU map with hit/miss counters."""
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get_or_create(self, key: str, factory: Callable[[], Any]) -> Any:
+        """Return the cached value for key, building it with factory() on a miss.
+        
+        Exceptions from factory() propagate and nothing is cached.
+        """
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+        
+        value = factory()
+        if self.maxsize > 0:
+            with self._lock:
+                self._data[key] = value
+                self._data.move_to_end(key)
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+        return value
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+
 class ExpressionParser:
     """Parses and evaluates custom formula expressions.
     
@@ -26,12 +71,19 @@ class ExpressionParser:
     - Logical: and, or, not
     - Functions: abs, min, max, avg, sqrt, log, if
     
+    Parsed ASTs and compiled formulas are kept in bounded LRU caches
+    keyed by expression text, so re-evaluating a saved formula skips
+    tokenizing and parsing.
+    
     Example:
         parser = ExpressionParser()
         result = parser.evaluate(
             "pe_ratio < 20 and revenue_growth > 0.10",
             {"pe_ratio": 15, "revenue_growth": 0.15}
         )
+        
+        # Whole universe (or a date x symbol panel) at once
+        mask = parser.evaluate_array("pe_ratio < 20", {"pe_ratio": pe_frame})
     """
     
     # Token patterns
@@ -87,13 +139,45 @@ class ExpressionParser:
         '!=': operator.ne,
     }
     
+    # Array counterparts used by compile()
+    VECTOR_FUNCTIONS: dict[str, Callable] = {
+        'abs': np.abs,
+        'min': lambda *args: np.minimum.reduce(np.broadcast_arrays(*args)),
+        'max': lambda *args: np.maximum.reduce(np.broadcast_arrays(*args)),
+        'sqrt': np.sqrt,
+        'log': lambda x, base=None: np.log(x) if base is None else np.log(x) / np.log(base),
+        'log10': np.log10,
+        'exp': np.exp,
+        'pow': np.power,
+        'round': np.round,
+        'floor': np.floor,
+        'ceil': np.ceil,
+    }
+    
+    VECTOR_OPERATORS: dict[str, Callable] = {
+        '+': np.add,
+        '-': np.subtract,
+        '*': np.multiply,
+        '/': lambda a, b: np.where(np.equal(b, 0), np.nan, np.true_divide(a, b)),
+        '%': np.mod,
+        '^': np.power,
+        '>': np.greater,
+        '<': np.less,
+        '>=': np.greater_equal,
+        '<=': np.less_equal,
+        '==': np.equal,
+        '!=': np.not_equal,
+    }
+    
     # Keywords
     KEYWORDS = {'and', 'or', 'not', 'if', 'true', 'false'}
     
-    def __init__(self):
+    def __init__(self, cache_size: int = 512):
         self._token_regex = re.compile(
             '|'.join(f'(?P<{name}>{pattern})' for pattern, name in self.TOKEN_PATTERNS)
         )
+        self._ast_cache = _LRUCache(cache_size)
+        self._compiled_cache = _LRUCache(cache_size)
     
     def tokenize(self, expression: str) -> list[tuple[str, Any]]:
         """Tokenize an expression string.
@@ -132,12 +216,18 @@ class ExpressionParser:
     def parse(self, expression: str) -> 'ASTNode':
         """Parse an expression into an AST.
         
+        Results are cached by expression text; the returned tree is
+        shared and must not be modified.
+        
         Args:
             expression: Expression string.
             
         Returns:
             Root AST node.
         """
+        return self._ast_cache.get_or_create(expression, lambda: self._parse(expression))
+    
+    def _parse(self, expression: str) -> 'ASTNode':
         tokens = self.tokenize(expression)
         parser = _Parser(tokens, self.FUNCTIONS)
         return parser.parse()
@@ -163,6 +253,89 @@ class ExpressionParser:
             logger.error(f"Expression error: {e}")
             raise ExpressionError(f"Failed to evaluate '{expression}': {e}")
     
+    def compile(self, expression: str) -> Callable[[Mapping[str, Any]], Any]:
+        """Compile an expression into a function over arrays.
+        
+        The returned callable takes a mapping of variable name to NumPy
+        array (all the same shape, e.g. one value per symbol or a date x
+        symbol panel) and evaluates the whole expression with array
+        operations, without per-element Python dispatch. Compiled
+        formulas are cached by expression text. Division by zero yields NaN instead of raising, and NaN
+        compares False.
+        
+        Args:
+            expression: Expression string.
+            
+        Returns:
+            Callable of variables -> result array (or scalar for constant
+            expressions).
+        """
+        return self._compiled_cache.get_or_create(expression, lambda: self._compile(expression))
+    
+    def _compile(self, expression: str) -> Callable[[Mapping[str, Any]], Any]:
+        try:
+            fn = self.parse(expression).compile(self.VECTOR_FUNCTIONS, self.VECTOR_OPERATORS)
+        except Exception as e:
+            raise ExpressionError(f"Failed to compile '{expression}': {e}") from e
+        
+        def evaluate(variables: Mapping[str, Any]) -> Any:
+            with np.errstate(all='ignore'):
+                return fn(variables)
+        
+        return evaluate
+    
+    def evaluate_array(
+        self,
+        expression: str,
+        variables: Mapping[str, Any],
+    ) -> Any:
+        """Evaluate an expression over arrays, Series or DataFrames.
+        
+        Labeled inputs must share one shape and labels (e.g. a date x
+        symbol panel per metric); they are not aligned. The result
+        carries the labels of the first labeled input.
+        
+        Args:
+            expression: Expression string.
+            variables: Variable name -> array-like values.
+            
+        Returns:
+            Result with the shape (and labels) of the inputs.
+        """
+        compiled = self.compile(expression)
+        template = None
+        arrays = {}
+        for name, value in variables.items():
+            if isinstance(value, (pd.Series, pd.DataFrame)):
+                template = value if template is None else template
+                value = value.to_numpy()
+            arrays[name] = value
+        
+        result = compiled(arrays)
+        if template is None:
+            return result
+        result = np.broadcast_to(result, template.shape)
+        if isinstance(template, pd.DataFrame):
+            return pd.DataFrame(result, index=template.index, columns=template.columns)
+        return pd.Series(result, index=template.index, name=template.name)
+    
+    def cache_info(self) -> dict[str, int]:
+        """Hit/miss counts and sizes of the AST and compiled-formula caches."""
+        return {
+            "ast_hits": self._ast_cache.hits,
+            "ast_misses": self._ast_cache.misses,
+            "ast_size": len(self._ast_cache),
+            "compiled_hits": self._compiled_cache.hits,
+            "compiled_misses": self._compiled_cache.misses,
+            "compiled_size": len(self._compiled_cache),
+            "max_size": self._ast_cache.maxsize,
+        }
+    
+    def clear_cache(self) -> None:
+        """Drop all cached ASTs and compiled formulas."""
+        self._ast_cache.clear()
+        self._compiled_cache.clear()
+    
     def validate(self, expression: str) -> tuple[bool, Optional[str]]:
         """Validate an expression.
         
@@ -216,6 +389,14 @@ class ASTNode:
         operators: dict[str, Callable],
     ) -> Any:
         raise NotImplementedError
+    
+    def compile(
+        self,
+        functions: dict[str, Callable],
+        operators: dict[str, Callable],
+    ) -> Callable[[Mapping[str, Any]], Any]:
+        """Build a closure evaluating this subtree over array variables."""
+        raise NotImplementedError
 
 
 class NumberNode(ASTNode):
@@ -226,6 +407,10 @@ class NumberNode(ASTNode):
     
     def evaluate(self, variables, functions, operators) -> float:
         return self.value
+    
+    def compile(self, functions, operators):
+        value = self.value
+        return lambda variables: value
 
 
 class BooleanNode(ASTNode):
@@ -236,6 +421,10 @@ class BooleanNode(ASTNode):
     
     def evaluate(self, variables, functions, operators) -> bool:
         return self.value
+    
+    def compile(self, functions, operators):
+        value = self.value
+        return lambda variables: value
 
 
 class VariableNode(ASTNode):
@@ -248,6 +437,16 @@ class VariableNode(ASTNode):
         if self.name not in variables:
             raise ExpressionError(f"Unknown variable: {self.name}")
         return variables[self.name]
+    
+    def compile(self, functions, operators):
+        name = self.name
+        
+        def load(variables):
+            if name not in variables:
+                raise ExpressionError(f"Unknown variable: {name}")
+            return variables[name]
+        
+        return load
 
 
 class BinaryOpNode(ASTNode):
@@ -270,6 +469,18 @@ class BinaryOpNode(ASTNode):
             return operators[self.op](left_val, right_val)
         else:
             raise ExpressionError(f"Unknown operator: {self.op}")
+    
+    def compile(self, functions, operators):
+        left = self.left.compile(functions, operators)
+        right = self.right.compile(functions, operators)
+        if self.op == 'and':
+            return lambda variables: np.logical_and(left(variables), right(variables))
+        if self.op == 'or':
+            return lambda variables: np.logical_or(left(variables), right(variables))
+        if self.op not in operators:
+            raise ExpressionError(f"Unknown operator: {self.op}")
+        op = operators[self.op]
+        return lambda variables: op(left(variables), right(variables))
 
 
 class UnaryOpNode(ASTNode):
@@ -288,6 +499,14 @@ class UnaryOpNode(ASTNode):
             return not bool(val)
         else:
             raise ExpressionError(f"Unknown unary operator: {self.op}")
+    
+    def compile(self, functions, operators):
+        operand = self.operand.compile(functions, operators)
+        if self.op == '-':
+            return lambda variables: np.negative(operand(variables))
+        if self.op == 'not':
+            return lambda variables: np.logical_not(operand(variables))
+        raise ExpressionError(f"Unknown unary operator: {self.op}")
 
 
 class FunctionNode(ASTNode):
@@ -303,6 +522,13 @@ class FunctionNode(ASTNode):
         
         arg_values = [arg.evaluate(variables, functions, operators) for arg in self.args]
         return functions[self.name](*arg_values)
+    
+    def compile(self, functions, operators):
+        if self.name not in functions:
+            raise ExpressionError(f"Unknown function: {self.name}")
+        func = functions[self.name]
+        args = [arg.compile(functions, operators) for arg in self.args]
+        return lambda variables: func(*[arg(variables) for arg in args])
 
 
 class IfNode(ASTNode):
@@ -317,6 +543,12 @@ class IfNode(ASTNode):
         if self.condition.evaluate(variables, functions, operators):
             return self.true_val.evaluate(variables, functions, operators)
         return self.false_val.evaluate(variables, functions, operators)
+    
+    def compile(self, functions, operators):
+        condition = self.condition.compile(functions, operators)
+        true_val = self.true_val.compile(functions, operators)
+        false_val = self.false_val.compile(functions, operators)
+        return lambda variables: np.where(condition(variables), true_val(variables), false_val(variables))
 
 
 # =============================================================================
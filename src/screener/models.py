@@ -8,6 +8,9 @@ from datetime import datetime, date, timezone
 from typing import Any, Optional
 import uuid
 
+import numpy as np
+import pandas as pd
+
 from src.screener.config import (
     FilterCategory,
     DataType,
@@ -93,6 +96,39 @@ class FilterCondition:
             return False
         
         return False
+    
+    def evaluate_array(self, values: "pd.Series | pd.DataFrame") -> np.ndarray:
+        """Evaluate this condition over a column (or date x symbol panel) at once.
+        
+        Missing values (None/NaN) never match, as in evaluate(). Values
+        the comparison cannot handle as a whole (e.g. mixed types) fall
+        back to evaluate() per element.
+        """
+        present = values.notna().to_numpy()
+        try:
+            if self.operator == Operator.EQ:
+                result = values == self.value
+            elif self.operator == Operator.NE:
+                result = values != self.value
+            elif self.operator in (Operator.GT, Operator.ABOVE, Operator.CROSSES_ABOVE):
+                result = values > self.value
+            elif self.operator == Operator.GTE:
+                result = values >= self.value
+            elif self.operator in (Operator.LT, Operator.BELOW, Operator.CROSSES_BELOW):
+                result = values < self.value
+            elif self.operator == Operator.LTE:
+                result = values <= self.value
+            elif self.operator == Operator.BETWEEN:
+                result = (values >= self.value) & (values <= self.value2)
+            elif self.operator == Operator.IN:
+                result = values.isin(self.value)
+            elif self.operator == Operator.NOT_IN:
+                result = ~values.isin(self.value)
+            else:
+                return np.zeros(values.shape, dtype=bool)
+            return result.to_numpy(dtype=bool, na_value=False) & present
+        except (TypeError, ValueError):
+            return np.frompyfunc(self.evaluate, 1, 1)(values.to_numpy()).astype(bool) & present
 
 
 @dataclass
@@ -1,34 +1,121 @@
 """Central data access layer for the Axion platform.
 
 All data flows through DataService. Resolution order:
+0. In-process L1 cache (prices and quotes, microseconds)
 1. Redis cache (hot, sub-ms)
 2. PostgreSQL / TimescaleDB (warm, ms)
 3. External API (cold, seconds) — writes back to DB + cache
 
+Concurrent identical price/quote requests are coalesced so only one
+of them walks layers 1-3.
+
 Output formats are designed to match existing DataFrame schemas
 so downstream code (factor_model, portfolio, backtest) works unchanged.
 """
 
 import asyncio
+import hashlib
 import logging
-from datetime import date, datetime, timedelta
-from typing import Optional
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import AsyncIterator, Optional
 
+import numpy as np
 import pandas as pd
 from sqlalchemy import select, text
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
+from src.cache.local import LocalCache
 from src.cache.redis_client import cache
 from src.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
+# L1 lifetimes are short: Redis stays the source of truth across processes
+L1_PRICES_TTL = 30.0
+L1_QUOTE_TTL = 1.0
+# Minimum wait before start() retries a failed invalidation subscription
+L1_LISTENER_RETRY_SECONDS = 60.0
+# With copy-on-write a shallow copy already isolates callers from the cached frame
+_COPY_ON_WRITE = int(pd.__version__.split(".")[0]) >= 3 or pd.options.mode.copy_on_write is True
+
+FUNDAMENTAL_COLUMNS = {
+    "trailing_pe": "trailingPE",
+    "price_to_book": "priceToBook",
+    "dividend_yield": "dividendYield",
+    "ev_to_ebitda": "enterpriseToEbitda",
+    "return_on_equity": "returnOnEquity",
+    "debt_to_equity": "debtToEquity",
+    "revenue_growth": "revenueGrowth",
+    "earnings_growth": "earningsGrowth",
+    "market_cap": "marketCap",
+    "current_price": "currentPrice",
+}
+
+# Tables bulk_upsert may write, with their writable columns. Table and
+# column names are interpolated into the SQL, so nothing else is accepted.
+BULK_UPSERT_COLUMNS = {
+    "price_bars": frozenset({"time", "instrument_id", "open", "high", "low", "close", "volume", "adj_close"}),
+    "financials": frozenset({"instrument_id", "as_of_date", *FUNDAMENTAL_COLUMNS}),
+    "economic_indicators": frozenset({"series_id", "date", "value"}),
+}
+
+# Bar sizes served from price_bars; coarse ones are downsampled with time_bucket
+TIMEFRAME_BUCKETS = {
+    "1d": None,
+    "1w": "1 week",
+    "1mo": "1 month",
+    "1q": "3 months",
+}
+TIMEFRAME_DAYS = {"1d": 1, "1w": 7, "1mo": 30, "1q": 91}
+# pandas equivalents (bucket-start labels, Monday weeks) for daily data from providers
+TIMEFRAME_RESAMPLE = {"1w": "W-MON", "1mo": "MS", "1q": "QS"}
+PRICE_STREAM_CHUNK_ROWS = 50_000
+
+# Binary COPY tuple of (timestamptz, int4, float8): field count, then length + value per field
+_COPY_ROW = np.dtype([
+    ("nfields", ">i2"),
+    ("time_len", ">i4"), ("time", ">i8"),
+    ("id_len", ">i4"), ("id", ">i4"),
+    ("value_len", ">i4"), ("value", ">f8"),
+])
+_COPY_SIGNATURE = b"PGCOPY\n\xff\r\n\x00"
+_PG_EPOCH_US = 946_684_800_000_000  # 2000-01-01 UTC in Unix microseconds
+
 
 class DataService:
-    """Async data service with multi-layer resolution."""
+    """Async data service with multi-layer resolution.
 
-    def __init__(self):
+    Args:
+        local_cache: In-process cache tier; defaults to one sized by settings.
+    """
+
+    def __init__(self, local_cache: Optional[LocalCache] = None):
         self.settings = get_settings()
+        self.local_cache = local_cache if local_cache is not None else LocalCache.from_settings("data_service")
+        self._listener_started = False
+        self._listener_retry_at = 0.0
+
+    async def start(self) -> bool:
+        """Subscribe the L1 tier to cross-process invalidations.
+
+        Call once when the service starts. The Redis subscription is set
+        up on a worker thread; if it fails, L1 entries only expire on
+        their TTLs and a later call retries (at most once per
+        L1_LISTENER_RETRY_SECONDS).
+
+        Returns:
+            Whether the invalidation listener is running.
+        """
+        if self._listener_started or not self.local_cache.enabled:
+            return self._listener_started
+        now = time.monotonic()
+        if now < self._listener_retry_at:
+            return False
+        self._listener_started = await asyncio.to_thread(self.local_cache.start_invalidation_listener, cache)
+        if not self._listener_started:
+            self._listener_retry_at = now + L1_LISTENER_RETRY_SECONDS
+        return self._listener_started
 
     # =========================================================================
     # Universe
@@ -72,40 +159,79 @@ class DataService:
         self,
         tickers: list[str],
         period: str = "14mo",
+        timeframe: str = "1d",
     ) -> pd.DataFrame:
         """Get historical close prices.
 
         Returns DataFrame[dates x tickers] matching download_price_data() format.
+        The frame is the caller's own: cached panels are copied on the way out.
+
+        Args:
+            tickers: Tickers to load.
+            period: Lookback such as ``"14mo"``.
+            timeframe: Bar size, one of TIMEFRAME_BUCKETS; coarser bars are
+                labelled by bucket start and hold each bucket's last close.
         """
-        cache_key = "axion:prices:bulk:all"
+        if timeframe not in TIMEFRAME_BUCKETS:
+            raise ValueError(f"Unknown timeframe {timeframe!r}; expected one of {list(TIMEFRAME_BUCKETS)}")
+        cache_key = f"axion:prices:bulk:all:{timeframe}"
+
+        # 0. In-process L1
+        cached = self.local_cache.get(cache_key)
+        if cached is not None:
+            if cached.columns.equals(pd.Index(tickers)):
+                return _caller_copy(cached)
+            available = [t for t in tickers if t in cached.columns]
+            if len(available) > len(tickers) * 0.9:
+                return cached[available]
 
+        request_key = ",".join([period, timeframe, *sorted(tickers)]).encode()
+        request_hash = hashlib.blake2b(request_key, digest_size=8).hexdigest()
+        prices = await self.local_cache.single_flight(
+            f"axion:prices:bulk:{request_hash}",
+            lambda: self._load_prices(tickers, period, timeframe, cache_key),
+        )
+        # The loaded frame is shared by L1 and every coalesced waiter
+        return _caller_copy(prices)
+
+    async def _load_prices(self, tickers: list[str], period: str, timeframe: str, cache_key: str) -> pd.DataFrame:
+        """Resolve prices from Redis → DB → YFinance, filling the L1 tier."""
         # 1. Redis
         cached = await cache.get_dataframe(cache_key)
         if cached is not None and not cached.empty:
             available = [t for t in tickers if t in cached.columns]
             if len(available) > len(tickers) * 0.9:  # 90% coverage
+                self.local_cache.set(cache_key, cached, L1_PRICES_TTL)
                 return cached[available]
 
         # 2. Database
         if self.settings.use_database:
-            df = await self._get_prices_from_db(tickers, period)
+            df = await self._get_prices_from_db(tickers, period, timeframe)
             if df is not None and not df.empty:
-                await cache.set_dataframe(cache_key, df, 300)  # 5 min cache
+                await self._store_prices(cache_key, df)
                 return df
 
         # 3. YFinance fallback
         if self.settings.fallback_to_yfinance:
             from src.services.providers.yfinance_provider import YFinanceProvider
             provider = YFinanceProvider()
-            df = await provider.fetch_prices(tickers, period)
-            if not df.empty:
-                await cache.set_dataframe(cache_key, df, 300)
-                if self.settings.use_database:
-                    asyncio.create_task(self._persist_prices(df))
+            daily = await provider.fetch_prices(tickers, period)
+            if daily.empty:
+                return daily
+            if self.settings.use_database:
+                asyncio.create_task(self._persist_prices(daily))
+            df = _downsample_prices(daily, timeframe)
+            await self._store_prices(cache_key, df)
             return df
 
         return pd.DataFrame()
 
+    async def _store_prices(self, cache_key: str, df: pd.DataFrame) -> None:
+        """Write a fresh panel to Redis and L1, and evict it from other processes' L1."""
+        await cache.set_dataframe(cache_key, df, 300)  # 5 min cache
+        self.local_cache.set(cache_key, df, L1_PRICES_TTL)
+        await cache.publish_invalidation([cache_key], origin=self.local_cache.instance_id)
+
     # =========================================================================
     # Fundamentals
     # =========================================================================
@@ -149,10 +275,23 @@ class DataService:
     # =========================================================================
 
     async def get_quote(self, ticker: str) -> dict:
-        """Get real-time quote. Redis → Polygon → YFinance."""
+        """Get real-time quote. L1 → Redis → Polygon → YFinance."""
+        cache_key = f"axion:quote:{ticker}"
+
+        # 0. In-process L1
+        cached = self.local_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+
+        quote = await self.local_cache.single_flight(cache_key, lambda: self._load_quote(ticker, cache_key))
+        return dict(quote)
+
+    async def _load_quote(self, ticker: str, cache_key: str) -> dict:
+        """Resolve a quote from Redis → Polygon → YFinance, filling the L1 tier."""
         # 1. Redis
         cached = await cache.get_quote(ticker)
         if cached:
+            self.local_cache.set(cache_key, cached, L1_QUOTE_TTL)
             return cached
 
         # 2. Polygon
@@ -162,6 +301,7 @@ class DataService:
             quote = await provider.get_quote(ticker)
             if quote and quote.get("price"):
                 await cache.set_quote(ticker, quote)
+                self.local_cache.set(cache_key, quote, L1_QUOTE_TTL)
                 return quote
 
         # 3. YFinance
@@ -171,6 +311,7 @@ class DataService:
             quote = await provider.get_quote(ticker)
             if quote:
                 await cache.set_quote(ticker, quote)
+                self.local_cache.set(cache_key, quote, L1_QUOTE_TTL)
                 return quote
 
         return {"ticker": ticker, "price": None, "source": "unavailable"}
@@ -266,43 +407,152 @@ class DataService:
             logger.warning("DB universe fetch failed: %s", e)
             return []
 
-    async def _get_prices_from_db(self, tickers: list[str], period: str) -> Optional[pd.DataFrame]:
-        """Get price history from TimescaleDB."""
+    async def _get_prices_from_db(
+        self,
+        tickers: list[str],
+        period: str,
+        timeframe: str = "1d",
+    ) -> Optional[pd.DataFrame]:
+        """Get price history from TimescaleDB.
+
+        Rows are streamed in time order and written straight into a
+        preallocated time x ticker array, so no intermediate row objects
+        or pandas pivot are built.
+        """
         try:
-            from src.db.engine import get_async_engine
-            engine = get_async_engine()
-
-            # Parse period to start date
-            months = int(period.replace("mo", ""))
-            start_date = datetime.now() - timedelta(days=months * 30)
-
-            query = text("""
-                SELECT pb.time, i.ticker, pb.adj_close
-                FROM price_bars pb
-                JOIN instruments i ON pb.instrument_id = i.id
-                WHERE i.ticker = ANY(:tickers)
-                  AND pb.time >= :start_date
-                ORDER BY pb.time
-            """)
+            ticker_ids = await self._get_ticker_id_map(tickers)
+            if not ticker_ids:
+                return None
 
-            async with engine.connect() as conn:
-                result = await conn.execute(
-                    query,
-                    {"tickers": tickers, "start_date": start_date},
-                )
-                rows = result.fetchall()
+            columns = sorted(ticker_ids)
+            grid = _PriceGrid(
+                [ticker_ids[t] for t in columns],
+                self._expected_periods(period, timeframe),
+            )
+            async for chunk in self._stream_price_rows(list(ticker_ids.values()), period, timeframe):
+                grid.add(*chunk)
 
-            if not rows:
+            if grid.n_rows == 0:
                 return None
-
-            df = pd.DataFrame(rows, columns=["time", "ticker", "adj_close"])
-            pivot = df.pivot(index="time", columns="ticker", values="adj_close")
-            return pivot
+            return grid.frame(columns, drop_empty=True)
 
         except Exception as e:
             logger.warning("DB prices fetch failed: %s", e)
             return None
 
+    async def iter_prices(
+        self,
+        tickers: list[str],
+        period: str = "14mo",
+        timeframe: str = "1d",
+        chunk_rows: int = PRICE_STREAM_CHUNK_ROWS,
+    ) -> AsyncIterator[pd.DataFrame]:
+        """Stream price history from the database as consecutive frames.
+
+        Each frame is a dates x tickers block (columns are every known
+        ticker, sorted) holding only complete timestamps, so consumers
+        such as a backtester can start on the first block while later
+        ones are still arriving. Bypasses the caches.
+
+        Args:
+            tickers: Tickers to load.
+            period: Lookback such as ``"14mo"``.
+            timeframe: Bar size, one of TIMEFRAME_BUCKETS; anything coarser
+                than ``"1d"`` is downsampled in the database.
+            chunk_rows: Approximate database rows per frame.
+        """
+        ticker_ids = await self._get_ticker_id_map(tickers)
+        if not ticker_ids:
+            return
+
+        columns = sorted(ticker_ids)
+        ids = [ticker_ids[t] for t in columns]
+        carry = None
+        async for times, chunk_ids, values in self._stream_price_rows(
+            list(ticker_ids.values()), period, timeframe, chunk_rows,
+        ):
+            if carry is not None:
+                times, chunk_ids, values = (np.concatenate(pair) for pair in zip(carry, (times, chunk_ids, values)))
+            # The newest timestamp may continue in the next chunk; hold it back
+            cut = int(np.searchsorted(times, times[-1]))
+            carry = (times[cut:], chunk_ids[cut:], values[cut:])
+            if cut:
+                grid = _PriceGrid(ids, cut)
+                grid.add(times[:cut], chunk_ids[:cut], values[:cut])
+                yield grid.frame(columns)
+
+        if carry is not None:
+            grid = _PriceGrid(ids, 1)
+            grid.add(*carry)
+            yield grid.frame(columns)
+
+    async def _stream_price_rows(
+        self,
+        instrument_ids: list[int],
+        period: str,
+        timeframe: str,
+        chunk_rows: int = PRICE_STREAM_CHUNK_ROWS,
+    ) -> AsyncIterator[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Yield time-ordered (unix microseconds, instrument_id, adj_close) array chunks.
+
+        On asyncpg the rows come through binary COPY TO and are decoded
+        with a fixed-width NumPy dtype; other drivers use a server-side
+        cursor read in partitions.
+        """
+        if timeframe not in TIMEFRAME_BUCKETS:
+            raise ValueError(f"Unknown timeframe {timeframe!r}; expected one of {list(TIMEFRAME_BUCKETS)}")
+
+        from src.db.engine import get_async_engine
+        engine = get_async_engine()
+
+        months = int(period.replace("mo", ""))
+        start_date = datetime.now(timezone.utc) - timedelta(days=months * 30)
+
+        async with engine.connect() as conn:
+            raw = await conn.get_raw_connection()
+            driver = getattr(raw, "driver_connection", None)
+
+            if hasattr(driver, "copy_from_query"):
+                query = self._price_stream_sql(timeframe, "$1", "$2")
+                async for chunk in _copy_price_rows(driver, query, (instrument_ids, start_date), chunk_rows):
+                    yield chunk
+                return
+
+            result = await conn.stream(
+                text(self._price_stream_sql(timeframe, ":ids", ":start_date")),
+                {"ids": instrument_ids, "start_date": start_date},
+            )
+            async for rows in result.partitions(chunk_rows):
+                times = pd.DatetimeIndex(pd.to_datetime([r[0] for r in rows], utc=True)).as_unit("us")
+                yield (
+                    times.asi8,
+                    np.fromiter((r[1] for r in rows), dtype=np.int64, count=len(rows)),
+                    np.fromiter((r[2] for r in rows), dtype=np.float64, count=len(rows)),
+                )
+
+    @staticmethod
+    def _price_stream_sql(timeframe: str, ids_param: str, start_param: str) -> str:
+        """Time-ordered (time, instrument_id, adj_close) query, bucketed for coarse timeframes."""
+        where = f"instrument_id = ANY({ids_param}) AND time >= {start_param} AND adj_close IS NOT NULL"
+        bucket = TIMEFRAME_BUCKETS[timeframe]
+        # Only bind-parameter names and a fixed TIMEFRAME_BUCKETS interval are interpolated
+        if bucket is None:
+            select = "SELECT time, instrument_id, CAST(adj_close AS double precision)"
+            return f"{select} FROM price_bars WHERE {where} ORDER BY time"  # noqa: S608
+        select = (
+            f"SELECT time_bucket(INTERVAL '{bucket}', time) AS bucket, instrument_id, "
+            "CAST(last(adj_close, time) AS double precision)"
+        )
+        return f"{select} FROM price_bars WHERE {where} GROUP BY bucket, instrument_id ORDER BY bucket"  # noqa: S608
+
+    @staticmethod
+    def _expected_periods(period: str, timeframe: str) -> int:
+        """Rough row count for preallocating a price grid (it grows if short)."""
+        days = int(period.replace("mo", "")) * 30
+        if timeframe == "1d":
+            return days * 5 // 7 + 1
+        return days // TIMEFRAME_DAYS.get(timeframe, 1) + 2
+
     async def _get_fundamentals_from_db(self, tickers: list[str]) -> Optional[pd.DataFrame]:
         """Get latest fundamentals from database."""
         try:
@@ -437,106 +687,196 @@ class DataService:
         except Exception as e:
             logger.warning("Failed to persist universe: %s", e)
 
-    async def _persist_prices(self, df: pd.DataFrame) -> None:
-        """Persist price DataFrame to price_bars table."""
-        try:
-            from src.db.engine import get_async_engine
-            engine = get_async_engine()
+    async def _persist_prices(self, df: pd.DataFrame) -> int:
+        """Persist price DataFrame to price_bars table.
 
-            # Get instrument_id mapping
+        Returns:
+            Number of rows upserted.
+        """
+        try:
             ticker_ids = await self._get_ticker_id_map(list(df.columns))
-
-            async with engine.begin() as conn:
-                for dt_idx in df.index:
-                    for ticker in df.columns:
-                        if ticker not in ticker_ids:
-                            continue
-                        price = df.loc[dt_idx, ticker]
-                        if pd.isna(price):
-                            continue
-                        stmt = text("""
-                            INSERT INTO price_bars (time, instrument_id, close, adj_close, source)
-                            VALUES (:time, :instrument_id, :close, :adj_close, 'yfinance')
-                            ON CONFLICT (time, instrument_id) DO UPDATE SET
-                                close = EXCLUDED.close,
-                                adj_close = EXCLUDED.adj_close
-                        """)
-                        await conn.execute(stmt, {
-                            "time": dt_idx,
-                            "instrument_id": ticker_ids[ticker],
-                            "close": float(price),
-                            "adj_close": float(price),
-                        })
-            logger.info("Persisted prices for %d tickers", len(df.columns))
+            records = self.price_records(df, ticker_ids)
+
+            started = time.perf_counter()
+            n = await self.bulk_upsert(
+                "price_bars",
+                ["time", "instrument_id", "close", "adj_close"],
+                records,
+                conflict=["time", "instrument_id"],
+                update=["close", "adj_close"],
+                source="yfinance",
+            )
+            self._log_ingest("prices", n, started)
+            return n
         except Exception as e:
             logger.warning("Failed to persist prices: %s", e)
+            return 0
 
-    async def _persist_fundamentals(self, df: pd.DataFrame) -> None:
-        """Persist fundamentals DataFrame to financials table."""
-        try:
-            from src.db.engine import get_async_engine
-            engine = get_async_engine()
+    async def _persist_fundamentals(self, df: pd.DataFrame) -> int:
+        """Persist fundamentals DataFrame to financials table.
 
+        Returns:
+            Number of rows upserted.
+        """
+        try:
             ticker_ids = await self._get_ticker_id_map(list(df.index))
-            today = date.today()
-
-            async with engine.begin() as conn:
-                for ticker in df.index:
-                    if ticker not in ticker_ids:
-                        continue
-                    row = df.loc[ticker]
-                    stmt = text("""
-                        INSERT INTO financials
-                            (instrument_id, as_of_date, trailing_pe, price_to_book,
-                             dividend_yield, ev_to_ebitda, return_on_equity,
-                             debt_to_equity, revenue_growth, earnings_growth,
-                             market_cap, current_price, source)
-                        VALUES
-                            (:iid, :date, :pe, :pb, :dy, :ev, :roe, :de, :rg, :eg, :mc, :cp, 'yfinance')
-                        ON CONFLICT (instrument_id, as_of_date) DO UPDATE SET
-                            trailing_pe = EXCLUDED.trailing_pe,
-                            price_to_book = EXCLUDED.price_to_book,
-                            current_price = EXCLUDED.current_price
-                    """)
-                    await conn.execute(stmt, {
-                        "iid": ticker_ids[ticker],
-                        "date": today,
-                        "pe": self._safe_float(row.get("trailingPE")),
-                        "pb": self._safe_float(row.get("priceToBook")),
-                        "dy": self._safe_float(row.get("dividendYield")),
-                        "ev": self._safe_float(row.get("enterpriseToEbitda")),
-                        "roe": self._safe_float(row.get("returnOnEquity")),
-                        "de": self._safe_float(row.get("debtToEquity")),
-                        "rg": self._safe_float(row.get("revenueGrowth")),
-                        "eg": self._safe_float(row.get("earningsGrowth")),
-                        "mc": self._safe_int(row.get("marketCap")),
-                        "cp": self._safe_float(row.get("currentPrice")),
-                    })
-            logger.info("Persisted fundamentals for %d tickers", len(df))
+            records = self._fundamental_records(df, ticker_ids, date.today())
+
+            started = time.perf_counter()
+            n = await self.bulk_upsert(
+                "financials",
+                ["instrument_id", "as_of_date", *FUNDAMENTAL_COLUMNS],
+                records,
+                conflict=["instrument_id", "as_of_date"],
+                update=["trailing_pe", "price_to_book", "current_price"],
+                source="yfinance",
+            )
+            self._log_ingest("fundamentals", n, started)
+            return n
         except Exception as e:
             logger.warning("Failed to persist fundamentals: %s", e)
+            return 0
+
+    async def _persist_economic(self, series_id: str, series: pd.Series) -> int:
+        """Persist FRED series to economic_indicators table.
 
-    async def _persist_economic(self, series_id: str, series: pd.Series) -> None:
-        """Persist FRED series to economic_indicators table."""
+        Returns:
+            Number of rows upserted.
+        """
         try:
-            from src.db.engine import get_async_engine
-            engine = get_async_engine()
+            series = series.dropna()
+            series = series[~series.index.duplicated(keep="last")]
+            records = [
+                (series_id, dt.date() if hasattr(dt, "date") else dt, float(val))
+                for dt, val in zip(series.index, series.to_numpy(dtype=float))
+            ]
 
-            async with engine.begin() as conn:
-                for dt, val in series.dropna().items():
-                    stmt = text("""
-                        INSERT INTO economic_indicators (series_id, date, value, source)
-                        VALUES (:sid, :date, :value, 'fred')
-                        ON CONFLICT (series_id, date) DO UPDATE SET value = EXCLUDED.value
-                    """)
-                    await conn.execute(stmt, {
-                        "sid": series_id,
-                        "date": dt.date() if hasattr(dt, "date") else dt,
-                        "value": float(val),
-                    })
-            logger.info("Persisted %d observations for %s", len(series.dropna()), series_id)
+            started = time.perf_counter()
+            n = await self.bulk_upsert(
+                "economic_indicators",
+                ["series_id", "date", "value"],
+                records,
+                conflict=["series_id", "date"],
+                update=["value"],
+                source="fred",
+            )
+            self._log_ingest(f"economic {series_id}", n, started)
+            return n
         except Exception as e:
             logger.warning("Failed to persist economic data: %s", e)
+            return 0
+
+    async def bulk_upsert(
+        self,
+        table: str,
+        columns: list[str],
+        records: list[tuple],
+        conflict: list[str],
+        update: list[str],
+        source: str,
+    ) -> int:
+        """Upsert records in one transaction with a single set-based statement.
+
+        On asyncpg the records are streamed with binary COPY into a
+        temporary staging table and merged with one INSERT ... SELECT ...
+        ON CONFLICT. Other drivers fall back to one executemany batch.
+
+        Args:
+            table: Target table, one of BULK_UPSERT_COLUMNS.
+            columns: Column names, in record order.
+            records: Row tuples.
+            conflict: Unique key columns for ON CONFLICT.
+            update: Columns overwritten when the key already exists.
+            source: Value for the ``source`` column.
+
+        Returns:
+            Number of records written.
+
+        Raises:
+            ValueError: If the table or a column is not in BULK_UPSERT_COLUMNS.
+        """
+        allowed = BULK_UPSERT_COLUMNS.get(table)
+        if allowed is None:
+            raise ValueError(f"bulk_upsert: unsupported table {table!r}")
+        unknown = sorted({*columns, *conflict, *update} - allowed)
+        if unknown:
+            raise ValueError(f"bulk_upsert: unsupported columns for {table}: {unknown}")
+        if not records:
+            return 0
+
+        from src.db.engine import get_async_engine
+        engine = get_async_engine()
+
+        column_list = ", ".join(columns)
+        updates = ", ".join(f"{c} = EXCLUDED.{c}" for c in update)
+        on_conflict = f"ON CONFLICT ({', '.join(conflict)}) DO UPDATE SET {updates}"
+
+        async with engine.connect() as conn:
+            raw = await conn.get_raw_connection()
+            driver = getattr(raw, "driver_connection", None)
+
+            # Table and column names were checked against BULK_UPSERT_COLUMNS; values are bound
+            if hasattr(driver, "copy_records_to_table"):
+                stage = f"_stage_{table}"
+                create = f"CREATE TEMP TABLE {stage} ON COMMIT DROP AS SELECT {column_list} FROM {table} WITH NO DATA"  # noqa: S608
+                insert = f"INSERT INTO {table} ({column_list}, source) SELECT {column_list}, $1 FROM {stage} "  # noqa: S608
+                async with driver.transaction():
+                    await driver.execute(create)
+                    await driver.copy_records_to_table(stage, records=records, columns=columns)
+                    await driver.execute(insert + on_conflict, source)
+                return len(records)
+
+            placeholders = ", ".join(f":{c}" for c in columns)
+            stmt = text(
+                f"INSERT INTO {table} ({column_list}, source) VALUES ({placeholders}, :source) {on_conflict}"  # noqa: S608
+            )
+            await conn.execute(stmt, [{**dict(zip(columns, r)), "source": source} for r in records])
+            await conn.commit()
+        return len(records)
+
+    @staticmethod
+    def price_records(df: pd.DataFrame, ticker_ids: dict[str, int]) -> list[tuple]:
+        """Melt a dates x tickers frame into (time, instrument_id, close, adj_close) rows."""
+        df = df[~df.index.duplicated(keep="last")]
+        tickers = [t for t in df.columns if t in ticker_ids]
+        if not tickers or df.empty:
+            return []
+
+        values = df[tickers].to_numpy(dtype=float)
+        rows, cols = np.nonzero(~np.isnan(values))
+        times = np.asarray(pd.DatetimeIndex(df.index).to_pydatetime(), dtype=object)[rows]
+        ids = np.array([ticker_ids[t] for t in tickers])[cols]
+        prices = values[rows, cols].tolist()
+        return list(zip(times.tolist(), ids.tolist(), prices, prices))
+
+    @classmethod
+    def _fundamental_records(
+        cls,
+        df: pd.DataFrame,
+        ticker_ids: dict[str, int],
+        as_of: date,
+    ) -> list[tuple]:
+        """(instrument_id, as_of_date, *FUNDAMENTAL_COLUMNS) rows for known tickers."""
+        df = df[~df.index.duplicated(keep="last")]
+        df = df[[t in ticker_ids for t in df.index]]
+        values = df.reindex(columns=list(FUNDAMENTAL_COLUMNS.values()))
+        records = []
+        for ticker, row in zip(df.index, values.itertuples(index=False)):
+            *floats, market_cap, current_price = row
+            records.append((
+                ticker_ids[ticker],
+                as_of,
+                *(cls._safe_float(v) for v in floats),
+                cls._safe_int(market_cap),
+                cls._safe_float(current_price),
+            ))
+        return records
+
+    @staticmethod
+    def _log_ingest(label: str, n_rows: int, started: float) -> None:
+        elapsed = time.perf_counter() - started
+        rate = n_rows / elapsed if elapsed > 0 else float("inf")
+        logger.info("Persisted %d %s rows in %.2fs (%.0f rows/s)", n_rows, label, elapsed, rate)
 
     # =========================================================================
     # Private: Helpers
@@ -582,3 +922,159 @@ class DataService:
             return int(val)
         except (ValueError, TypeError):
             return None
+
+
+def _caller_copy(df: pd.DataFrame) -> pd.DataFrame:
+    """A frame the caller may mutate without touching the cached one."""
+    return df.copy(deep=not _COPY_ON_WRITE)
+
+
+def _downsample_prices(prices: pd.DataFrame, timeframe: str) -> pd.DataFrame:
+    """Last close per bucket, labelled like time_bucket (bucket start)."""
+    rule = TIMEFRAME_RESAMPLE.get(timeframe)
+    if rule is None:
+        return prices
+    return prices.resample(rule, label="left", closed="left").last().dropna(how="all")
+
+
+class _PriceGrid:
+    """Time x instrument array filled in place from time-ordered row chunks.
+
+    Args:
+        instrument_ids: Instrument id of each column, in column order.
+        expected_rows: Initial row capacity; doubles when exceeded.
+    """
+
+    def __init__(self, instrument_ids: list[int], expected_rows: int):
+        ids = np.asarray(instrument_ids, dtype=np.int64)
+        self._order = np.argsort(ids)
+        self._sorted_ids = ids[self._order]
+        capacity = max(int(expected_rows), 1)
+        self._values = np.full((capacity, len(ids)), np.nan)
+        self._times = np.empty(capacity, dtype=np.int64)
+        self._seen = np.zeros(len(ids), dtype=bool)
+        self.n_rows = 0
+
+    def add(self, times: np.ndarray, ids: np.ndarray, values: np.ndarray) -> None:
+        """Write one chunk; rows must continue the time order of earlier chunks."""
+        if len(times) == 0:
+            return
+        starts = np.empty(len(times), dtype=bool)
+        starts[0] = self.n_rows == 0 or times[0] != self._times[self.n_rows - 1]
+        np.not_equal(times[1:], times[:-1], out=starts[1:])
+        rows = self.n_rows - 1 + np.cumsum(starts)
+        needed = int(rows[-1]) + 1
+        if needed > len(self._times):
+            self._grow(max(needed, 2 * len(self._times)))
+
+        pos = np.searchsorted(self._sorted_ids, ids)
+        known = pos < len(self._sorted_ids)
+        known[known] = self._sorted_ids[pos[known]] == ids[known]
+        cols = self._order[pos[known]]
+        self._times[rows[starts]] = times[starts]
+        self._values[rows[known], cols] = values[known]
+        self._seen[cols] = True
+        self.n_rows = needed
+
+    def _grow(self, capacity: int) -> None:
+        values = np.full((capacity, self._values.shape[1]), np.nan)
+        values[:self.n_rows] = self._values[:self.n_rows]
+        times = np.empty(capacity, dtype=np.int64)
+        times[:self.n_rows] = self._times[:self.n_rows]
+        self._values, self._times = values, times
+
+    def frame(self, columns: list[str], drop_empty: bool = False) -> pd.DataFrame:
+        """Dates x tickers frame over the filled rows (a view when nothing is dropped)."""
+        values = self._values[:self.n_rows]
+        if drop_empty and not self._seen.all():
+            values = values[:, self._seen]
+            columns = [c for c, seen in zip(columns, self._seen) if seen]
+        index = pd.DatetimeIndex(pd.to_datetime(self._times[:self.n_rows], unit="us", utc=True), name="time")
+        return pd.DataFrame(values, index=index, columns=pd.Index(columns, name="ticker"), copy=False)
+
+
+class _PgBinaryCopyParser:
+    """Decodes fixed-width binary COPY tuples from arbitrarily split chunks."""
+
+    def __init__(self):
+        self._buffer = b""
+        self._header_done = False
+
+    def feed(self, data: bytes) -> np.ndarray:
+        """Return the complete tuples now available as a ``_COPY_ROW`` array."""
+        buf = self._buffer + data
+        pos = 0
+        if not self._header_done:
+            if len(buf) < 19:
+                self._buffer = buf
+                return np.empty(0, dtype=_COPY_ROW)
+            if not buf.startswith(_COPY_SIGNATURE):
+                raise ValueError("Not a binary COPY stream")
+            pos = 19 + int.from_bytes(buf[15:19], "big")
+            if len(buf) < pos:
+                self._buffer = buf
+                return np.empty(0, dtype=_COPY_ROW)
+            self._header_done = True
+
+        # Whatever is left over (a partial tuple or the 2-byte trailer) waits for more data
+        n = (len(buf) - pos) // _COPY_ROW.itemsize
+        rows = np.frombuffer(buf, dtype=_COPY_ROW, count=n, offset=pos)
+        if n and (rows["nfields"] != 3).any():
+            raise ValueError("Unexpected binary COPY tuple layout")
+        self._buffer = buf[pos + n * _COPY_ROW.itemsize:]
+        return rows
+
+
+async def _copy_price_rows(
+    driver,
+    query: str,
+    args: tuple,
+    chunk_rows: int,
+) -> AsyncIterator[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Run a binary COPY TO in the background and yield decoded chunks.
+
+    At most a few network buffers are queued ahead of the consumer, so
+    memory stays bounded however large the result is.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    slots = asyncio.Semaphore(8)
+
+    async def sink(data: bytes) -> None:
+        await slots.acquire()
+        queue.put_nowait(bytes(data))
+
+    async def run() -> None:
+        try:
+            await driver.copy_from_query(query, *args, output=sink, format="binary")
+        finally:
+            queue.put_nowait(None)
+
+    task = asyncio.create_task(run())
+    parser = _PgBinaryCopyParser()
+    pending, n_pending = [], 0
+    try:
+        while (data := await queue.get()) is not None:
+            slots.release()
+            rows = parser.feed(data)
+            if len(rows):
+                pending.append(rows)
+                n_pending += len(rows)
+            if n_pending >= chunk_rows:
+                yield _decode_copy_rows(pending)
+                pending, n_pending = [], 0
+        await task
+        if n_pending:
+            yield _decode_copy_rows(pending)
+    finally:
+        if not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+
+def _decode_copy_rows(parts: list[np.ndarray]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    rows = np.concatenate(parts) if len(parts) > 1 else parts[0]
+    return (
+        rows["time"].astype(np.int64) + _PG_EPOCH_US,
+        rows["id"].astype(np.int64),
+        rows["value"].astype(np.float64),
+    )
@@ -32,6 +32,18 @@ class SyncDataService:
         self._service = DataService()
         self._loop: Optional[asyncio.AbstractEventLoop] = None
 
+    def _serve(self, coro):
+        """Run a service call, starting the service first.
+
+        Once the L1 invalidation listener is up (or while a failed
+        attempt is backing off) the start is a no-op.
+        """
+        async def started():
+            await self._service.start()
+            return await coro
+
+        return self._run(started())
+
     def _run(self, coro):
         """Run an async coroutine synchronously."""
         try:
@@ -48,7 +60,7 @@ class SyncDataService:
 
     def build_universe(self, verbose: bool = False) -> list[str]:
         """Get stock universe. Replaces universe.build_universe()."""
-        return self._run(self._service.get_universe())
+        return self._serve(self._service.get_universe())
 
     def download_price_data(
         self,
@@ -57,7 +69,7 @@ class SyncDataService:
         verbose: bool = False,
     ) -> pd.DataFrame:
         """Get historical prices. Replaces data_fetcher.download_price_data()."""
-        return self._run(self._service.get_prices(tickers))
+        return self._serve(self._service.get_prices(tickers))
 
     def download_fundamentals(
         self,
@@ -66,19 +78,19 @@ class SyncDataService:
         verbose: bool = False,
     ) -> pd.DataFrame:
         """Get fundamentals. Replaces data_fetcher.download_fundamentals()."""
-        return self._run(self._service.get_fundamentals(tickers))
+        return self._serve(self._service.get_fundamentals(tickers))
 
     def get_quote(self, ticker: str) -> dict:
         """Get real-time quote for a single ticker."""
-        return self._run(self._service.get_quote(ticker))
+        return self._serve(self._service.get_quote(ticker))
 
     def get_economic_indicator(self, series_id: str, start: Optional[str] = None) -> pd.Series:
         """Get FRED economic indicator."""
-        return self._run(self._service.get_economic_indicator(series_id, start))
+        return self._serve(self._service.get_economic_indicator(series_id, start))
 
     def get_scores(self, tickers: Optional[list[str]] = None) -> pd.DataFrame:
         """Get pre-computed factor scores from database."""
-        return self._run(self._service.get_scores(tickers))
+        return self._serve(self._service.get_scores(tickers))
 
     @staticmethod
     def compute_price_returns(prices: pd.DataFrame) -> pd.DataFrame:
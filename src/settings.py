@@ -40,6 +40,11 @@ class Settings(BaseSettings):
     redis_fundamental_ttl: int = 14400
     redis_universe_ttl: int = 86400
 
+    # --- In-process (L1) cache ---
+    l1_cache_enabled: bool = True
+    l1_cache_max_entries: int = 256
+    l1_cache_max_mb: int = 512
+
     # --- Polygon.io ---
     polygon_api_key: str = ""
     polygon_ws_url: str = "wss://socket.polygon.io/stocks"
@@ -710,6 +710,49 @@ class TestFastAPIRoutes:
         assert resp.status_code == 200
 
 
+class TestBacktestProgressFanOut:
+    """Progress events go to all subscribed sockets at once."""
+
+    def test_sockets_are_sent_concurrently(self, monkeypatch):
+        import asyncio
+
+        from src.api.config import WebSocketChannel
+        from src.api.routes import backtesting as routes
+
+        manager = WebSocketManager()
+        monkeypatch.setattr(routes, "_ws_manager", manager)
+        monkeypatch.setattr(routes, "_sockets", {})
+        received = []
+
+        class _Socket:
+            """Each live socket finishes only once both live sends are in flight."""
+
+            def __init__(self, name, fail=False):
+                self.name, self.fail = name, fail
+
+            async def send_text(self, message):
+                if self.fail:
+                    raise RuntimeError("closed")
+                in_flight.append(self.name)
+                while len(in_flight) < 2:
+                    await asyncio.sleep(0)
+                received.append(self.name)
+
+        in_flight = []
+        for name, fail in [("a", False), ("dead", True), ("b", False)]:
+            manager.connect(name, "user")
+            manager.subscribe(name, WebSocketChannel.BACKTESTS.value, ["job1"])
+            routes._sockets[name] = _Socket(name, fail)
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(asyncio.wait_for(routes._publish("job1", {"event": "progress"}), 1.0))
+        finally:
+            loop.close()
+        assert sorted(received) == ["a", "b"]
+        assert set(routes._sockets) == {"a", "b"}
+
+
 # =============================================================================
 # Module Import Tests
 # =============================================================================
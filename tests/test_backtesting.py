@@ -29,6 +29,7 @@ from src.backtesting.config import (
 from src.backtesting.models import (
     BarData,
     MarketEvent,
+    ArrayMarketEvent,
     Signal,
     Order,
     Fill,
@@ -59,6 +60,20 @@ from src.backtesting.reporting import (
     TearSheetGenerator,
     StrategyComparator,
 )
+from src.backtesting.search import (
+    ParameterGrid,
+    SuccessiveHalvingSearch,
+    BayesianSearch,
+)
+from src.backtesting.config import BacktestJobConfig
+from src.backtesting.jobs import (
+    BacktestJobManager,
+    BacktestJobSpec,
+    BacktestResultStore,
+    JobQueueFullError,
+    JobStatus,
+)
+from src.backtesting.strategies import MomentumStrategy
 
 
 # =============================================================================
@@ -66,6 +81,21 @@ from src.backtesting.reporting import (
 # =============================================================================
 
 
+class EqualWeightStrategy:
+    """Module-level strategy so it can be pickled to optimizer workers."""
+
+    def __init__(self, weight: float = 0.10, n_symbols: int = 2):
+        self.weight = weight
+        self.n_symbols = n_symbols
+
+    def on_bar(self, event, portfolio):
+        symbols = sorted(event.bars)[: self.n_symbols]
+        return [
+            Signal(symbol=s, timestamp=event.timestamp, side=OrderSide.BUY, target_weight=self.weight)
+            for s in symbols
+        ]
+
+
 @pytest.fixture
 def sample_bar():
     """Create sample bar data."""
@@ -387,6 +417,24 @@ class TestSimulatedBroker:
         assert result is True
         assert len(broker.pending_orders) == 0
 
+    def test_process_arrays(self):
+        """Test processing pending orders against a columnar event."""
+        broker = SimulatedBroker(ExecutionConfig(fill_model=FillModel.IMMEDIATE))
+        broker.submit_order(Order(order_id="", symbol="MSFT", side=OrderSide.BUY, qty=100))
+
+        event = ArrayMarketEvent(
+            timestamp=datetime(2024, 1, 15),
+            symbols=["AAPL", "MSFT"],
+            symbol_index={"AAPL": 0, "MSFT": 1},
+            close=np.array([186.5, 390.0]),
+            valid=np.array([True, True]),
+        )
+        fills = broker.process_arrays(event)
+
+        assert len(fills) == 1
+        assert fills[0].price == 390.0
+        assert len(broker.pending_orders) == 0
+
 
 # =============================================================================
 # Portfolio Tests
@@ -534,6 +582,81 @@ class TestBacktestEngine:
         assert len(result.snapshots) > 0
         assert not result.equity_curve.empty
 
+    def test_stream_arrays_matches_stream_bars(self, backtest_config, price_data):
+        """Columnar events carry the same bars as the per-bar stream."""
+        data = price_data.copy()
+        data.iloc[5, 1] = np.nan
+        handler = HistoricalDataHandler(backtest_config)
+        handler.load_data(data)
+
+        bar_events = list(handler.stream_bars())
+        array_events = list(handler.stream_arrays())
+
+        assert len(array_events) == len(bar_events)
+        assert isinstance(array_events[0], ArrayMarketEvent)
+        assert array_events[5].get_bar("MSFT") is None
+        assert set(array_events[5].bars) == set(bar_events[5].bars)
+        assert array_events[5].get_bar("AAPL").close == bar_events[5].bars["AAPL"].close
+
+    def test_align_ohlcv_panel(self, backtest_config):
+        """OHLCV frames are aligned onto a shared axis with a validity mask."""
+        idx = pd.date_range("2024-01-01", periods=4, freq="D")
+        ohlcv = {
+            "AAPL": pd.DataFrame({
+                "Open": [1.0, 2.0, 3.0, 4.0],
+                "High": [1.5, 2.5, 3.5, 4.5],
+                "Low": [0.5, 1.5, 2.5, 3.5],
+                "Close": [1.2, 2.2, 3.2, 4.2],
+                "Volume": [100, 200, 300, 400],
+            }, index=idx),
+            "MSFT": pd.DataFrame({"close": [10.0, 30.0]}, index=idx[[0, 2]]),
+        }
+        handler = HistoricalDataHandler(backtest_config)
+
+        panel = handler.align_ohlcv(ohlcv)
+
+        assert panel.values.shape == (4, 2, 5)
+        assert panel.valid[:, 1].tolist() == [True, False, True, False]
+        assert panel.get_field("close")[2, 1] == 30.0
+        assert panel.get_field("open")[2, 1] == 30.0  # falls back to close
+        assert panel.get_field("volume")[0, 1] == 1_000_000
+
+        events = list(handler.stream_ohlcv_bars(ohlcv))
+        assert len(events) == 4
+        assert set(events[1].bars) == {"AAPL"}
+        bar = events[3].bars["AAPL"]
+        assert (bar.open, bar.high, bar.low, bar.close, bar.volume) == (4.0, 4.5, 3.5, 4.2, 400)
+
+    def test_columnar_streaming_matches_per_bar(self, price_data):
+        """Columnar mode produces the same results as the per-bar path."""
+        class RotateStrategy:
+            def on_bar(self, event, portfolio):
+                month = event.timestamp.month
+                symbol = ["AAPL", "MSFT", "GOOGL"][month % 3]
+                signals = [
+                    Signal(symbol=s, timestamp=event.timestamp, side=OrderSide.SELL, target_weight=0.0)
+                    for s in portfolio.positions if s != symbol
+                ]
+                signals.append(Signal(
+                    symbol=symbol, timestamp=event.timestamp, side=OrderSide.BUY, target_weight=0.10,
+                ))
+                return signals
+
+        results = []
+        for columnar in (False, True):
+            config = BacktestConfig(
+                start_date=date(2020, 1, 1),
+                end_date=date(2021, 12, 31),
+                columnar_streaming=columnar,
+            )
+            engine = BacktestEngine(config)
+            engine.load_data(price_data)
+            results.append(engine.run(RotateStrategy()))
+
+        per_bar, columnar = results
+        assert len(columnar.trades) == len(per_bar.trades) > 0
+        pd.testing.assert_series_equal(columnar.equity_curve, per_bar.equity_curve)
+
 
 class TestBacktestRiskManager:
     """Test backtest risk manager."""
@@ -608,6 +731,36 @@ class TestMonteCarloAnalyzer:
         assert isinstance(is_sig, (bool, np.bool_))
         assert 0 <= p_value <= 1
 
+    def test_vectorized_bootstrap_matches_loop(self, sample_trades):
+        """Batched bootstrap reproduces the per-sample loop for a seed."""
+        loop = MonteCarloAnalyzer(MonteCarloConfig(n_simulations=200, vectorized=False))
+        batched = MonteCarloAnalyzer(MonteCarloConfig(n_simulations=200, max_batch_elements=50))
+
+        expected = loop.bootstrap_analysis(sample_trades)
+        result = batched.bootstrap_analysis(sample_trades)
+
+        assert result.n_simulations == 200
+        np.testing.assert_allclose(result.sharpe_distribution, expected.sharpe_distribution)
+        np.testing.assert_allclose(result.cagr_distribution, expected.cagr_distribution)
+        np.testing.assert_allclose(result.dd_distribution, expected.dd_distribution)
+
+    def test_batched_random_sharpes_match_pandas(self, price_data):
+        """Matrix-priced random portfolios match the pandas computation."""
+        data = price_data.iloc[:300].copy()
+        data.iloc[10:20, 1] = np.nan
+        analyzer = MonteCarloAnalyzer()
+        analyzer.rng = np.random.default_rng(7)
+
+        sharpes = analyzer._random_sharpes_batched(data, n_stocks=3, n_random=4)
+
+        rng = np.random.default_rng(7)
+        weights = rng.dirichlet(np.ones(3), size=4)
+        picks = np.argsort(rng.random((4, 5)), axis=1)[:, :3]
+        for k in range(4):
+            stock_returns = data[data.columns[picks[k]]].pct_change().dropna()
+            port_returns = (stock_returns * weights[k]).sum(axis=1)
+            assert sharpes[k] == pytest.approx(analyzer._calc_sharpe_from_returns(port_returns))
+
 
 class TestWalkForwardOptimizer:
     """Test walk-forward optimization."""
@@ -627,6 +780,99 @@ class TestWalkForwardOptimizer:
             assert w.out_of_sample_start < w.out_of_sample_end
 
 
+    @pytest.mark.parametrize("parallel_windows", [False, True])
+    def test_parallel_matches_serial(self, price_data, parallel_windows):
+        """Process-pool search selects the same parameters as serial search."""
+        param_grid = {"weight": [0.05, 0.10], "n_symbols": [1, 3]}
+        data = price_data.loc["2020-01-01":"2021-12-31"]
+
+        results = []
+        for n_workers in (1, 2):
+            config = WalkForwardConfig(
+                n_windows=2,
+                min_trades_per_window=0,
+                n_workers=n_workers,
+                parallel_windows=parallel_windows,
+            )
+            optimizer = WalkForwardOptimizer(config)
+            results.append(optimizer.run(EqualWeightStrategy, param_grid, data))
+
+        serial, parallel = results
+        assert [w.best_params for w in parallel.windows] == [w.best_params for w in serial.windows]
+        assert parallel.out_of_sample_sharpe == pytest.approx(serial.out_of_sample_sharpe)
+
+
+    @pytest.mark.parametrize("method,expected", [("halving", 2 * (20 + 7 + 3)), ("bayesian", 2 * 8)])
+    def test_adaptive_search_reports_evaluations(self, price_data, method, expected):
+        """Adaptive searches report backtests run alongside the grid size."""
+        param_grid = {"weight": [0.02, 0.05, 0.08, 0.10], "n_symbols": [1, 2, 3, 4, 5]}
+        config = WalkForwardConfig(
+            n_windows=2,
+            min_trades_per_window=0,
+            search_method=method,
+            bayesian_n_trials=8,
+            bayesian_n_initial=4,
+        )
+        optimizer = WalkForwardOptimizer(config)
+
+        result = optimizer.run(EqualWeightStrategy, param_grid, price_data.loc["2020":"2021"])
+
+        assert result.grid_size == 2 * 20
+        assert result.n_evaluations == expected
+        for w in result.windows:
+            assert w.best_params
+
+
+class TestParameterSearch:
+    """Test adaptive parameter search strategies."""
+
+    @staticmethod
+    def _quadratic_score(candidates, fraction):
+        return [-(p["x"] - 7) ** 2 - (p["y"] - 3) ** 2 for p in candidates]
+
+    def test_parameter_grid_indexing(self):
+        grid = ParameterGrid({"a": [1, 2, 3], "b": ["x", "y"]})
+
+        assert grid.size == 6
+        assert grid[0] == {"a": 1, "b": "x"}
+        assert grid[5] == {"a": 3, "b": "y"}
+        assert grid.encode(np.array([0, 5])).tolist() == [[0.0, 0.0], [1.0, 1.0]]
+
+    def test_successive_halving_finds_optimum(self):
+        grid = ParameterGrid({"x": list(range(10)), "y": list(range(5))})
+        search = SuccessiveHalvingSearch(eta=3, min_fraction=0.25)
+
+        outcome = search.search(grid, self._quadratic_score)
+
+        assert outcome.best_params == {"x": 7, "y": 3}
+        # 50 + 17 + 6 candidates across three rungs
+        assert outcome.n_evaluations == 73
+
+    def test_bayesian_search_respects_budget(self):
+        grid = ParameterGrid({"x": list(range(20)), "y": list(range(10))})
+        search = BayesianSearch(n_trials=30, n_initial=8, seed=1)
+
+        outcome = search.search(grid, self._quadratic_score)
+
+        assert outcome.n_evaluations == 30
+        assert outcome.best_metric >= -2
+
+    def test_early_stop_drawdown(self, price_data):
+        """Backtests abort once the early-stop drawdown is breached."""
+        config = BacktestConfig(
+            start_date=date(2020, 1, 1),
+            end_date=date(2024, 12, 31),
+            early_stop_drawdown=-0.001,
+        )
+        engine = BacktestEngine(config)
+        engine.load_data(price_data)
+
+        result = engine.run(EqualWeightStrategy(weight=0.15, n_symbols=5))
+
+        assert result.terminated_early
+        assert result.equity_curve.index[-1] < pd.Timestamp("2024-12-31")
+
+
 # =============================================================================
 # Reporting Tests
 # =============================================================================
@@ -822,5 +1068,141 @@ class TestBacktestIntegration:
         assert "Monte Carlo" in tearsheet
 
 
+# =============================================================================
+# Backtest Job Queue Tests
+# =============================================================================
+
+
+class TestBacktestJobs:
+    """Tests for the per-tenant backtest job queue."""
+
+    @pytest.fixture
+    def job_config(self, tmp_path):
+        return BacktestJobConfig(
+            max_workers=1,
+            max_running_per_tenant=1,
+            max_queued_per_tenant=2,
+            progress_every_bars=63,
+            results_dir=str(tmp_path),
+            max_results_in_memory=1,
+        )
+
+    @staticmethod
+    def _spec(strategy="equal_weight", **kwargs):
+        return BacktestJobSpec(strategy, date(2021, 1, 1), date(2022, 12, 31), **kwargs)
+
+    def test_submit_returns_queued_job_without_running(self, job_config):
+        manager = BacktestJobManager(job_config)
+        job = manager.submit("tenant-a", self._spec())
+        assert job.status == JobStatus.QUEUED
+        assert manager.get_job(job.job_id) is job
+        assert manager.queue_position(job.job_id) == 0
+
+    def test_rejects_invalid_spec_and_full_queue(self, job_config):
+        manager = BacktestJobManager(job_config)
+        with pytest.raises(ValueError):
+            manager.submit("tenant-a", self._spec("no_such_strategy"))
+        with pytest.raises(ValueError):
+            manager.submit("tenant-a", self._spec(rebalance_frequency="hourly"))
+
+        manager.submit("tenant-a", self._spec())
+        manager.submit("tenant-a", self._spec())
+        with pytest.raises(JobQueueFullError):
+            manager.submit("tenant-a", self._spec())
+        # Limits are per tenant
+        manager.submit("tenant-b", self._spec())
+
+    def test_dispatch_round_robins_tenants_within_caps(self, job_config):
+        job_config.max_queued_per_tenant = 5
+        manager = BacktestJobManager(job_config)
+        a = [manager.submit("a", self._spec()) for _ in range(3)]
+        b = [manager.submit("b", self._spec()) for _ in range(2)]
+
+        assert manager._next_job() is a[0]
+        manager._running["a"] = 1
+        # Tenant a is at its cap, so b goes next even though a queued first
+        assert manager._next_job() is b[0]
+        manager._running["b"] = 1
+        assert manager._next_job() is None
+
+    def test_cancel_queued_job_persists_record(self, job_config):
+        import asyncio
+
+        manager = BacktestJobManager(job_config)
+        job = manager.submit("tenant-a", self._spec())
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(manager.cancel(job.job_id))
+        finally:
+            loop.close()
+        assert manager.get_stats()["queued"] == 0
+        reloaded = BacktestJobManager(job_config).get_job(job.job_id)
+        assert reloaded.status == JobStatus.CANCELLED
+
+    def test_result_store_evicts_to_disk(self, tmp_path):
+        store = BacktestResultStore(str(tmp_path), max_in_memory=2)
+        ids = [f"{i:016x}" for i in range(3)]
+        for i, job_id in enumerate(ids):
+            store.put(job_id, {"result": {"value": i}})
+        assert store.n_in_memory == 2
+        assert store.stats["evictions"] == 1
+        assert store.get(ids[0]) == {"result": {"value": 0}}
+        assert store.stats["disk_reads"] == 1
+        assert store.get("../../etc/passwd") is None
+
+    def test_jobs_run_in_pool_and_stream_progress(self, job_config, price_data):
+        import asyncio
+
+        events = []
+
+        async def loader(spec):
+            return price_data
+
+        async def publish(job_id, payload):
+            events.append((job_id, payload))
+
+        async def run():
+            manager = BacktestJobManager(job_config, price_loader=loader, publish=publish)
+            jobs = [
+                manager.submit("a", self._spec(params={"gross_exposure": 0.5})),
+                manager.submit("b", self._spec("momentum", params={"lookback": 3, "gross_exposure": 0.5})),
+            ]
+            manager.start()
+            try:
+                while not all(manager.get_job(j.job_id).done for j in jobs):
+                    await asyncio.sleep(0.02)
+            finally:
+                await manager.shutdown()
+            return manager, jobs
+
+        # A private loop, so the main thread's default loop is left in place for other tests
+        loop = asyncio.new_event_loop()
+        try:
+            manager, jobs = loop.run_until_complete(run())
+        finally:
+            loop.close()
+        for job in jobs:
+            finished = manager.get_job(job.job_id)
+            assert finished.status == JobStatus.COMPLETED
+            assert finished.metrics["total_trades"] > 0
+            assert len(manager.get_result(job.job_id)["equity_curve"]) > 400
+
+        first = [p for job_id, p in events if job_id == jobs[0].job_id]
+        kinds = [p["event"] for p in first]
+        assert kinds[0] == "started" and kinds[-1] == "completed"
+        progress = [p for p in first if p["event"] == "progress"]
+        assert progress and all(len(p["equity"]) == 63 for p in progress[:-1])
+        assert progress[-1]["progress"] > progress[0]["progress"]
+
+    def test_engine_progress_callback(self, backtest_config, price_data):
+        calls = []
+        engine = BacktestEngine(backtest_config)
+        engine.load_data(price_data)
+        engine.run(MomentumStrategy(top_n=5), progress=lambda done, total: calls.append((done, total)), progress_every=100)
+        total = engine.data_handler.n_bars()
+        assert calls[0] == (100, total)
+        assert calls[-1] == (total, total)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
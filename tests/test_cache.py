@@ -19,7 +19,9 @@ import pandas as pd
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from src.cache.local import LocalCache, estimate_size
 from src.cache.redis_client import RedisCache
+from src.cache.codec import CodecError, decode_dataframe, encode_dataframe, is_binary_payload
 from src.cache import keys
 
 
@@ -54,7 +56,7 @@ class TestCacheAsyncDataFrame(unittest.TestCase):
     def test_set_dataframe_calls_setex_with_json(self):
         df = pd.DataFrame({"close": [150.0]})
         self.mock_client.setex = AsyncMock()
-        self._run(self.cache.set_dataframe("k", df, 300))
+        self._run(self.cache.set_dataframe("k", df, 300, codec="json"))
         self.mock_client.setex.assert_awaited_once()
         args = self.mock_client.setex.call_args
         self.assertEqual(args[0][0], "k")
@@ -76,12 +78,72 @@ class TestCacheAsyncDataFrame(unittest.TestCase):
     def test_set_dataframe_uses_json_split_format(self):
         df = pd.DataFrame({"a": [1]})
         self.mock_client.setex = AsyncMock()
-        self._run(self.cache.set_dataframe("k", df, 10))
+        self._run(self.cache.set_dataframe("k", df, 10, codec="json"))
         raw = self.mock_client.setex.call_args[0][2]
         from io import StringIO
         self.assertEqual(pd.read_json(StringIO(raw), orient="split").iloc[0, 0], 1)
 
 
+    def test_set_dataframe_defaults_to_binary_codec(self):
+        idx = pd.date_range("2024-01-01", periods=3, name="date")
+        df = pd.DataFrame({"AAPL": [1.0, 2.0, 3.0], "MSFT": [4.0, 5.0, 6.0]}, index=idx)
+        self.mock_client.setex = AsyncMock()
+        self._run(self.cache.set_dataframe("k", df, 10))
+        raw = self.mock_client.setex.call_args[0][2]
+        self.assertTrue(is_binary_payload(raw))
+
+        self.mock_client.get = AsyncMock(return_value=raw)
+        result = self._run(self.cache.get_dataframe("k"))
+        pd.testing.assert_frame_equal(result, df, check_freq=False)
+
+
+class TestDataFrameCodec(unittest.TestCase):
+    """Tests for the binary DataFrame codec."""
+
+    def test_roundtrip_price_panel(self):
+        idx = pd.bdate_range("2023-01-02", periods=300, name="date")
+        df = pd.DataFrame(
+            np.random.default_rng(0).random((300, 50)) * 100,
+            index=idx,
+            columns=[f"T{i}" for i in range(50)],
+        )
+        restored = decode_dataframe(encode_dataframe(df))
+        pd.testing.assert_frame_equal(restored, df, check_freq=False)
+
+    def test_roundtrip_mixed_dtypes(self):
+        df = pd.DataFrame({
+            "n": [1, 2, 3],
+            "flag": [True, False, True],
+            "name": ["a", None, "c"],
+            "ts": pd.to_datetime(["2024-01-01", None, "2024-01-03"]).tz_localize("US/Eastern"),
+        })
+        restored = decode_dataframe(encode_dataframe(df, compress=False))
+        pd.testing.assert_frame_equal(restored, df)
+
+    def test_compression_flag_for_large_payloads(self):
+        df = pd.DataFrame({"a": np.zeros(10_000)})
+        compressed = encode_dataframe(df, compress=True)
+        raw = encode_dataframe(df, compress=False)
+        self.assertLess(len(compressed), len(raw))
+        pd.testing.assert_frame_equal(decode_dataframe(compressed), df)
+
+    def test_multiindex_rejected(self):
+        df = pd.DataFrame({"a": [1, 2]}, index=pd.MultiIndex.from_tuples([("x", 1), ("y", 2)]))
+        with self.assertRaises(CodecError):
+            encode_dataframe(df)
+
+    def test_multiindex_falls_back_to_json_in_cache(self):
+        df = pd.DataFrame({"a": [1, 2]}, index=pd.MultiIndex.from_tuples([("x", 1), ("y", 2)]))
+        payload = RedisCache().encode_dataframe(df)
+        self.assertIsInstance(payload, str)
+
+    def test_legacy_json_still_decodes(self):
+        df = pd.DataFrame({"close": [1.0, 2.0]})
+        payload = df.to_json(orient="split", date_format="iso").encode()
+        self.assertFalse(is_binary_payload(payload))
+        pd.testing.assert_frame_equal(RedisCache.decode_dataframe(payload), df, check_dtype=False)
+
+
 # =============================================================================
 # RedisCache — Async JSON Operations
 # =============================================================================
@@ -311,6 +373,149 @@ class TestCacheInvalidation(unittest.TestCase):
         count = self._run(self.cache.invalidate_pattern("axion:nothing:*"))
         self.assertEqual(count, 0)
 
+    def test_invalidate_pattern_publishes_to_local_caches(self):
+        async def scan_iter_mock(match=None):
+            yield b"axion:quote:AAPL"
+
+        self.mock_client.scan_iter = scan_iter_mock
+        self.mock_client.delete = AsyncMock()
+        self.mock_client.publish = AsyncMock()
+        self._run(self.cache.invalidate_pattern("axion:quote:*"))
+        channel, message = self.mock_client.publish.await_args.args
+        self.assertEqual(channel, keys.CACHE_INVALIDATION)
+        self.assertEqual(json.loads(message)["patterns"], ["axion:quote:*"])
+
+
+# =============================================================================
+# LocalCache — In-process L1 Tier
+# =============================================================================
+
+
+class TestLocalCache(unittest.TestCase):
+    """Tests for the in-process LRU/TTL tier."""
+
+    def setUp(self):
+        self.now = 0.0
+        self.l1 = LocalCache(name="test", max_entries=3, max_bytes=1000, default_ttl=10.0, clock=lambda: self.now)
+
+    def _run(self, coro):
+        return asyncio.get_event_loop().run_until_complete(coro)
+
+    def test_get_set_roundtrip(self):
+        self.l1.set("a", {"price": 1.0})
+        self.assertEqual(self.l1.get("a"), {"price": 1.0})
+        self.assertIsNone(self.l1.get("missing"))
+
+    def test_entry_expires_after_ttl(self):
+        self.l1.set("a", "x", ttl=5.0)
+        self.now = 4.9
+        self.assertEqual(self.l1.get("a"), "x")
+        self.now = 5.0
+        self.assertIsNone(self.l1.get("a"))
+        self.assertEqual(len(self.l1), 0)
+
+    def test_evicts_least_recently_used_by_count(self):
+        for key in ("a", "b", "c"):
+            self.l1.set(key, key)
+        self.l1.get("a")  # "b" becomes least recently used
+        self.l1.set("d", "d")
+        self.assertIsNone(self.l1.get("b"))
+        self.assertEqual(self.l1.get("a"), "a")
+
+    def test_evicts_by_size(self):
+        self.l1.set("a", b"x" * 400)
+        self.l1.set("b", b"x" * 400)
+        self.l1.set("c", b"x" * 400)
+        self.assertIsNone(self.l1.get("a"))
+        self.assertLessEqual(self.l1.nbytes, 1000)
+
+    def test_rejects_oversized_value(self):
+        self.assertFalse(self.l1.set("big", b"x" * 2000))
+        self.assertEqual(len(self.l1), 0)
+
+    def test_disabled_cache_stores_nothing(self):
+        l1 = LocalCache(max_entries=0)
+        self.assertFalse(l1.enabled)
+        self.assertFalse(l1.set("a", 1))
+        self.assertIsNone(l1.get("a"))
+
+    def test_estimate_size_of_dataframe(self):
+        df = pd.DataFrame(np.zeros((100, 10)))
+        self.assertGreaterEqual(estimate_size(df), 100 * 10 * 8)
+
+    def test_invalidate_pattern(self):
+        self.l1.set("axion:quote:AAPL", 1)
+        self.l1.set("axion:quote:MSFT", 2)
+        self.l1.set("axion:prices:bulk:all", 3)
+        self.assertEqual(self.l1.invalidate_pattern("axion:quote:*"), 2)
+        self.assertEqual(self.l1.get("axion:prices:bulk:all"), 3)
+
+    def test_single_flight_coalesces_concurrent_loads(self):
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "value"
+
+        async def fan_out():
+            return await asyncio.gather(*[self.l1.single_flight("k", loader) for _ in range(20)])
+
+        results = self._run(fan_out())
+        self.assertEqual(results, ["value"] * 20)
+        self.assertEqual(len(calls), 1)
+
+    def test_single_flight_propagates_errors_to_all_waiters(self):
+        async def loader():
+            await asyncio.sleep(0.01)
+            raise ConnectionError("down")
+
+        async def fan_out():
+            return await asyncio.gather(
+                *[self.l1.single_flight("k", loader) for _ in range(3)], return_exceptions=True,
+            )
+
+        results = self._run(fan_out())
+        self.assertTrue(all(isinstance(r, ConnectionError) for r in results))
+        # The failed flight is cleared so the next call retries
+        async def ok():
+            return 1
+        self.assertEqual(self._run(self.l1.single_flight("k", ok)), 1)
+
+    def test_handle_invalidation_message(self):
+        self.l1.set("axion:prices:bulk:all", 1)
+        self.l1.set("axion:quote:AAPL", 2)
+        message = {"data": json.dumps({"origin": "other", "keys": ["axion:prices:bulk:all"],
+                                       "patterns": ["axion:quote:*"]}).encode()}
+        self.l1.handle_invalidation(message)
+        self.assertEqual(len(self.l1), 0)
+
+    def test_ignores_own_invalidation_messages(self):
+        self.l1.set("a", 1)
+        message = {"data": json.dumps({"origin": self.l1.instance_id, "keys": ["a"]})}
+        self.l1.handle_invalidation(message)
+        self.assertEqual(self.l1.get("a"), 1)
+
+    def test_listener_failure_falls_back_to_ttl(self):
+        redis_cache = MagicMock()
+        redis_cache.get_sync_client.side_effect = ConnectionError
+        self.assertFalse(self.l1.start_invalidation_listener(redis_cache))
+
+    def test_metrics_recorded(self):
+        l1 = LocalCache(name="metrics_test", max_entries=1)
+        hits = l1.metrics.l1_cache_hits_total.get({"cache": "metrics_test"})
+        misses = l1.metrics.l1_cache_misses_total.get({"cache": "metrics_test"})
+        evictions = l1.metrics.l1_cache_evictions_total.get({"cache": "metrics_test", "reason": "size"})
+        l1.set("a", 1)
+        l1.get("a")
+        l1.get("b")
+        l1.set("b", 2)
+        self.assertEqual(l1.metrics.l1_cache_hits_total.get({"cache": "metrics_test"}), hits + 1)
+        self.assertEqual(l1.metrics.l1_cache_misses_total.get({"cache": "metrics_test"}), misses + 1)
+        self.assertEqual(
+            l1.metrics.l1_cache_evictions_total.get({"cache": "metrics_test", "reason": "size"}), evictions + 1,
+        )
+
 
 # =============================================================================
 # Cache Key Templates
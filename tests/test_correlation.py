@@ -12,6 +12,7 @@ from src.correlation.config import (
     WindowType,
     CorrelationConfig,
     RollingConfig,
+    StreamingConfig,
     RegimeConfig,
     DiversificationConfig,
     CorrelationAnalysisConfig,
@@ -26,6 +27,7 @@ from src.correlation.models import (
     DiversificationScore,
 )
 from src.correlation.engine import CorrelationEngine
+from src.correlation.streaming import StreamingCorrelationService, load_correlation_history
 from src.correlation.regime import CorrelationRegimeDetector
 from src.correlation.diversification import DiversificationAnalyzer
 
@@ -316,6 +318,90 @@ class TestCorrelationEngine:
         assert matrix.n_assets == 0
 
 
+# =========================================================================
+# Streaming Correlation Tests
+# =========================================================================
+
+
+class TestStreamingCorrelationService:
+    @pytest.mark.parametrize("window_type", list(WindowType))
+    def test_matches_full_recompute(self, window_type):
+        returns = _make_returns(150, 5)
+        config = StreamingConfig(window=40, window_type=window_type, half_life=15, resync_every=25)
+        service = StreamingCorrelationService(list(returns.columns), config)
+        service.update_many(returns.iloc[:30])
+        for ts, bar in returns.iloc[30:120].iterrows():
+            service.update(bar)
+        service.update_many(returns.iloc[120:])
+
+        if window_type == WindowType.FIXED:
+            expected = returns.iloc[-40:].corr()
+        elif window_type == WindowType.EXPANDING:
+            expected = returns.corr()
+        else:
+            expected = returns.ewm(halflife=15).corr().loc[returns.index[-1]]
+
+        matrix = service.matrix()
+        np.testing.assert_allclose(matrix.values, expected.values, atol=1e-10)
+        assert matrix.end_date == returns.index[-1].date()
+        assert service.get_pair("SYM0", "SYM3") == pytest.approx(expected.loc["SYM0", "SYM3"])
+        np.testing.assert_allclose(service.get_row("SYM2").values, expected.loc["SYM2"].values, atol=1e-10)
+
+    def test_pair_and_row_before_matrix(self):
+        returns = _make_returns(60, 3)
+        service = StreamingCorrelationService(list(returns.columns), StreamingConfig(window=30))
+        assert np.isnan(service.get_pair("SYM0", "SYM1"))
+        assert service.matrix().values is None
+
+        service.update_many(returns)
+        expected = returns.iloc[-30:].corr()
+        assert service.get_pair("SYM0", "SYM1") == pytest.approx(expected.loc["SYM0", "SYM1"])
+        np.testing.assert_allclose(service.get_row("SYM1").values, expected.loc["SYM1"].values)
+        assert np.isnan(service.get_pair("SYM0", "MISSING"))
+
+    def test_history_memmap(self, tmp_path):
+        returns = _make_returns(60, 3)
+        path = str(tmp_path / "corr.npy")
+        config = StreamingConfig(window=30, history_path=path, history_capacity=4)
+        with StreamingCorrelationService(list(returns.columns), config) as service:
+            service.update_many(returns.iloc[:30])
+            for ts, bar in returns.iloc[30:36].iterrows():
+                service.update(bar)
+                service.record_snapshot()
+
+            history = service.pair_history("SYM0", "SYM2")
+            expected = returns["SYM0"].rolling(30).corr(returns["SYM2"]).iloc[32:36]
+            assert list(history.index) == list(expected.index)
+            np.testing.assert_allclose(history.values, expected.values, atol=1e-6)
+            assert len(service.avg_correlation_history()) == 4
+
+        snapshots, times = load_correlation_history(path)
+        assert snapshots.shape == (4, 3)
+        assert len(times) == 4
+
+    def test_history_survives_close_and_reopen(self, tmp_path):
+        returns = _make_returns(60, 3)
+        path = str(tmp_path / "corr.npy")
+        config = StreamingConfig(window=30, history_path=path, history_capacity=4)
+        service = StreamingCorrelationService(list(returns.columns), config)
+        service.update_many(returns.iloc[:30])
+        for ts, bar in returns.iloc[30:33].iterrows():
+            service.update(bar)
+            service.record_snapshot()
+        before = service.pair_history("SYM0", "SYM1")
+        service.close()
+
+        assert service.pair_history("SYM0", "SYM1").equals(before)
+        service.update(returns.iloc[33])
+        service.record_snapshot()
+        history = service.pair_history("SYM0", "SYM1")
+        service.close()
+
+        expected = returns["SYM0"].rolling(30).corr(returns["SYM1"]).iloc[30:34]
+        assert list(history.index) == list(expected.index)
+        np.testing.assert_allclose(history.values, expected.values, atol=1e-6)
+
+
 # =========================================================================
 # Regime Detection Tests
 # =========================================================================
@@ -0,0 +1,106 @@
+"""Tests for the incremental per-ticker price store in src/data_fetcher.py."""
+
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import config
+from src import data_fetcher
+
+
+class FakeYahoo:
+    """Stands in for yf.download, serving a deterministic close series."""
+
+    def __init__(self, scale: float = 1.0):
+        self.scale = scale
+        self.calls: list[tuple[tuple, str]] = []
+
+    def download(self, tickers, start, end, **kwargs):
+        self.calls.append((tuple(tickers), start))
+        dates = pd.bdate_range(start, end, inclusive="left")
+        closes = {
+            t: self.scale * (100 + i + (dates - pd.Timestamp("2020-01-01")).days / 10)
+            for i, t in enumerate(tickers)
+        }
+        close = pd.DataFrame(closes, index=dates)
+        return pd.concat({"Close": close}, axis=1)
+
+
+@pytest.fixture
+def fake_yahoo(tmp_path, monkeypatch):
+    yahoo = FakeYahoo()
+    monkeypatch.setattr(config, "CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(config, "PRICE_FETCH_RATE", 1000.0)
+    monkeypatch.setattr(data_fetcher, "_use_new_backend", lambda: False)
+    with patch.object(data_fetcher.yf, "download", side_effect=yahoo.download):
+        yield yahoo
+
+
+def _age_store(ticker: str, days: int):
+    """Drop the last `days` business days from a ticker's stored records."""
+    records = np.array(data_fetcher._load_stored_prices(ticker))
+    data_fetcher._save_stored_prices(ticker, records[:-days])
+
+
+class TestIncrementalPriceStore:
+    def test_cold_start_downloads_full_history(self, fake_yahoo):
+        prices = data_fetcher.download_price_data(["AAA", "BBB"])
+        assert list(prices.columns) == ["AAA", "BBB"]
+        assert len(prices) > 250
+        assert len(fake_yahoo.calls) == 1
+
+    def test_current_store_skips_download(self, fake_yahoo):
+        first = data_fetcher.download_price_data(["AAA", "BBB"])
+        second = data_fetcher.download_price_data(["AAA", "BBB"])
+        assert len(fake_yahoo.calls) == 1
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_fetches_only_missing_tail(self, fake_yahoo):
+        full = data_fetcher.download_price_data(["AAA", "BBB"])
+        _age_store("AAA", 5)
+        _age_store("BBB", 5)
+        refreshed = data_fetcher.download_price_data(["AAA", "BBB"])
+
+        tickers, start = fake_yahoo.calls[-1]
+        assert tickers == ("AAA", "BBB")
+        assert pd.Timestamp(start) == full.index[-6]
+        pd.testing.assert_frame_equal(refreshed, full)
+
+    def test_readjusted_history_is_refetched(self, fake_yahoo):
+        data_fetcher.download_price_data(["AAA"])
+        _age_store("AAA", 3)
+        fake_yahoo.scale = 0.5  # e.g. a 2:1 split re-adjusts all history
+        prices = data_fetcher.download_price_data(["AAA"])
+
+        assert len(fake_yahoo.calls) == 3  # initial, tail, full re-fetch
+        expected = data_fetcher.download_price_data(["AAA"], use_cache=False)
+        pd.testing.assert_frame_equal(prices, expected)
+
+    def test_use_cache_false_refetches_everything(self, fake_yahoo):
+        data_fetcher.download_price_data(["AAA"])
+        data_fetcher.download_price_data(["AAA"], use_cache=False)
+        assert len(fake_yahoo.calls) == 2
+
+    def test_batches_split_by_batch_size(self, fake_yahoo, monkeypatch):
+        monkeypatch.setattr(config, "BATCH_SIZE", 2)
+        prices = data_fetcher.download_price_data(["A", "B", "C", "D", "E"])
+        assert len(fake_yahoo.calls) == 3
+        assert list(prices.columns) == ["A", "B", "C", "D", "E"]
+
+    def test_concurrent_batches(self, fake_yahoo, monkeypatch):
+        assert config.PRICE_FETCH_WORKERS == 1
+        monkeypatch.setattr(config, "PRICE_FETCH_WORKERS", 4)
+        monkeypatch.setattr(config, "BATCH_SIZE", 1)
+        tickers = ["A", "B", "C", "D", "E", "F"]
+        prices = data_fetcher.download_price_data(tickers)
+        assert sorted(t for (t,), _ in fake_yahoo.calls) == tickers
+        assert list(prices.columns) == tickers
+        expected = data_fetcher.download_price_data(tickers, use_cache=False)
+        pd.testing.assert_frame_equal(prices, expected)
+
+    def test_failed_batch_is_skipped(self, fake_yahoo):
+        with patch.object(data_fetcher.yf, "download", side_effect=ConnectionError("down")):
+            prices = data_fetcher.download_price_data(["AAA"])
+        assert prices.empty
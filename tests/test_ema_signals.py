@@ -1,5 +1,7 @@
 """Tests for PRD-134: EMA Cloud Signal Engine."""
 
+import threading
+import time
 from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
@@ -11,6 +13,7 @@ from src.ema_signals.clouds import (
     CloudConfig,
     CloudState,
     EMACloudCalculator,
+    EMACloudPanel,
     EMASignalConfig,
 )
 from src.ema_signals.conviction import ConvictionScore, ConvictionScorer
@@ -50,6 +53,25 @@ def _make_ohlcv(n: int = 100, trend: str = "up") -> pd.DataFrame:
     })
 
 
+def _make_intraday(days: int = 5, seed: int = 7) -> pd.DataFrame:
+    """Generate 1-minute regular-session bars (09:30-16:00) over several days."""
+    rng = np.random.default_rng(seed)
+    sessions = pd.bdate_range("2024-03-04", periods=days)
+    index = pd.DatetimeIndex([
+        ts for day in sessions
+        for ts in pd.date_range(day + pd.Timedelta("9h30min"), periods=390, freq="1min")
+    ])
+    closes = 100 + np.cumsum(rng.normal(0, 0.05, len(index)))
+    opens = np.concatenate([[100.0], closes[:-1]])
+    return pd.DataFrame({
+        "open": opens,
+        "high": np.maximum(opens, closes) + 0.02,
+        "low": np.minimum(opens, closes) - 0.02,
+        "close": closes,
+        "volume": rng.integers(1_000, 5_000, len(index)).astype(float),
+    }, index=index)
+
+
 def _make_crossover_data() -> pd.DataFrame:
     """Generate data with a clear bullish EMA crossover in the last 2 bars.
 
@@ -297,6 +319,129 @@ class TestSignalDetector:
         assert len(bullish_signals) >= 1 or len(signals) >= 0  # May not always trigger on synthetic data
 
 
+# ═══════════════════════════════════════════════════════════════════════
+# TestEMACloudPanel
+# ═══════════════════════════════════════════════════════════════════════
+
+
+def _make_closes(n_bars: int = 150, n_tickers: int = 6, seed: int = 3) -> pd.DataFrame:
+    """Random-walk close matrix with a few missing values."""
+    rng = np.random.default_rng(seed)
+    closes = pd.DataFrame(
+        100 + np.cumsum(rng.normal(0, 0.5, (n_bars, n_tickers)), axis=0),
+        index=pd.date_range("2024-01-02 09:30", periods=n_bars, freq="10min"),
+        columns=[f"T{i}" for i in range(n_tickers)],
+    )
+    closes.iloc[rng.integers(0, n_bars, 10), 1] = np.nan
+    closes.iloc[:40, 2] = np.nan  # late listing
+    return closes
+
+
+class TestEMACloudPanel:
+    """Test the batched universe cloud panel."""
+
+    def test_states_match_per_ticker_calculator(self):
+        closes = _make_closes()
+        panel = EMACloudPanel().fit(closes)
+        calc = EMACloudCalculator()
+        states = panel.cloud_states()
+
+        for ticker in closes.columns:
+            df = closes[[ticker]].dropna().rename(columns={ticker: "close"})
+            expected = calc.get_cloud_states(calc.compute_clouds(df))
+            for got, exp in zip(states[ticker], expected):
+                assert got.cloud_name == exp.cloud_name
+                assert got.short_ema == pytest.approx(exp.short_ema, rel=1e-10)
+                assert got.long_ema == pytest.approx(exp.long_ema, rel=1e-10)
+                assert got.slope == pytest.approx(exp.slope, abs=1e-12)
+                assert got.is_bullish == exp.is_bullish
+                assert got.price_above == exp.price_above
+                assert got.price_below == exp.price_below
+                assert got.slope_direction == exp.slope_direction
+
+    def test_update_matches_refit(self):
+        closes = _make_closes()
+        panel = EMACloudPanel().fit(closes.iloc[:-5])
+        for ts, row in closes.iloc[-5:].iterrows():
+            panel.update(row, ts)
+        refit = EMACloudPanel().fit(closes)
+
+        for key, values in panel.cloud_arrays().items():
+            np.testing.assert_allclose(values, refit.cloud_arrays()[key], rtol=1e-12)
+        pd.testing.assert_frame_equal(panel.cloud_frame("T1"), refit.cloud_frame("T1"))
+
+    def test_update_skips_missing_tickers(self):
+        closes = _make_closes()
+        panel = EMACloudPanel().fit(closes)
+        before = panel.ema(50).copy()
+        panel.update({"T0": 123.0}, closes.index[-1] + pd.Timedelta("10min"))
+        after = panel.ema(50)
+        assert after["T0"] != before["T0"]
+        pd.testing.assert_series_equal(after.drop("T0"), before.drop("T0"))
+        assert panel.bar_counts["T0"] == len(closes) + 1
+
+    def test_update_unknown_ticker_raises(self):
+        panel = EMACloudPanel().fit(_make_closes())
+        with pytest.raises(KeyError):
+            panel.update({"ZZZ": 1.0})
+
+    def test_cloud_frame_matches_compute_clouds_tail(self):
+        closes = _make_closes()
+        panel = EMACloudPanel().fit(closes)
+        df = closes[["T0"]].rename(columns={"T0": "close"})
+        expected = EMACloudCalculator().compute_clouds(df).iloc[-panel.history:]
+        frame = panel.cloud_frame("T0")
+
+        assert list(frame.index) == list(expected.index)
+        for col in [c for c in expected.columns if c.startswith(("ema_", "cloud_"))]:
+            np.testing.assert_allclose(frame[col].astype(float), expected[col].astype(float), rtol=1e-10)
+
+    def test_state_frame_layout(self):
+        panel = EMACloudPanel().fit(_make_closes(n_tickers=3))
+        frame = panel.state_frame()
+        assert frame.index.names == ["ticker", "cloud"]
+        assert len(frame) == 3 * len(panel.config.get_pairs())
+        assert set(frame["slope_direction"]) <= {"rising", "falling", "flat"}
+
+    def test_detect_on_tail_matches_full_history(self):
+        detector = SignalDetector()
+        for seed in range(5):
+            rng = np.random.default_rng(seed)
+            close = 100 + np.cumsum(rng.normal(0, 0.8, 120))
+            df = pd.DataFrame({
+                "open": close + rng.normal(0, 0.3, 120),
+                "high": close + 0.6,
+                "low": close - 0.6,
+                "close": close,
+                "volume": np.full(120, 1e6),
+            })
+            full = detector.calculator.compute_clouds(df)
+            expected = detector.detect_clouds(full, "X", "10m")
+            got = detector.detect(df, "X", "10m")
+            assert [(s.signal_type, s.direction) for s in got] == \
+                [(s.signal_type, s.direction) for s in expected]
+
+    def test_detect_panel_matches_per_ticker_detect(self):
+        closes = _make_closes(n_bars=200, n_tickers=8, seed=11)
+        closes.iloc[:, 3] = closes.iloc[:, 3].where(closes.index >= closes.index[170])
+        panel = EMACloudPanel().fit(closes)
+        detector = SignalDetector()
+        bars = {}
+        for ticker in closes.columns:
+            c = closes[ticker].dropna()
+            bars[ticker] = pd.DataFrame(
+                {"open": c.shift(1).fillna(c), "high": c + 0.3, "low": c - 0.3, "close": c, "volume": 1e6}
+            )
+
+        results = detector.detect_panel(panel, "10m", bars)
+        assert "T3" not in results  # too few bars
+        for ticker, df in bars.items():
+            expected = detector.detect(df, ticker, "10m")
+            got = results.get(ticker, [])
+            assert [(s.signal_type, s.entry_price) for s in got] == \
+                [(s.signal_type, s.entry_price) for s in expected]
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # TestConvictionScorer
 # ═══════════════════════════════════════════════════════════════════════
@@ -604,6 +749,83 @@ class TestUniverseScanner:
         # body = |104-100| = 4, range = 105-98 = 7, ratio ≈ 0.571
         assert abs(ratio - 4 / 7) < 0.001
 
+    def test_concurrent_scan_matches_serial(self):
+        tickers = ["AAPL", "MSFT", "NVDA", "AMD", "TSLA"]
+        # Built up front: _make_ohlcv reseeds the global RNG, which is not thread-safe
+        frames = {
+            (t, tf): _make_ohlcv(120, "up" if (i + j) % 2 else "down")
+            for i, t in enumerate(tickers) for j, tf in enumerate(["5m", "1h"])
+        }
+        serial = UniverseScanner(EMASignalConfig(scan_workers=1, derive_timeframes=False))
+        concurrent = UniverseScanner(EMASignalConfig(scan_workers=4, derive_timeframes=False))
+        for scanner in (serial, concurrent):
+            scanner.data_feed.get_bars = MagicMock(side_effect=lambda t, tf, lookback=200: frames[(t, tf)].copy())
+
+        expected = serial.scan_all(tickers, ["5m", "1h"])
+        result = concurrent.scan_all(tickers, ["5m", "1h"])
+        assert [(s.ticker, s.timeframe, s.signal_type, s.conviction) for s in result] == [
+            (s.ticker, s.timeframe, s.signal_type, s.conviction) for s in expected
+        ]
+        assert concurrent.data_feed.get_bars.call_count == 10
+
+    def test_concurrent_scan_derives_higher_timeframes(self):
+        scanner = UniverseScanner(EMASignalConfig(scan_workers=4))
+        intraday, daily = _make_intraday(), _make_ohlcv(120)
+        fetched = []
+
+        def get_bars(ticker, tf, lookback=200):
+            fetched.append(tf)
+            return intraday.copy() if tf == "1m" else daily.copy()
+
+        scanner.data_feed.get_bars = MagicMock(side_effect=get_bars)
+        scanner.scan_all(["AAPL", "MSFT"], ["1m", "5m", "10m", "1h"])
+        # 5m and 10m come from the 1m fetch; 1h needs more history than 5 days of 1m bars
+        assert sorted(fetched) == ["1h", "1h", "1m", "1m"]
+
+    def test_scan_is_serial_by_default(self):
+        assert EMASignalConfig().scan_workers == 1
+        scanner = UniverseScanner()
+        with patch("src.ema_signals.scanner.ThreadPoolExecutor") as pool:
+            scanner.data_feed.get_bars = MagicMock(return_value=_make_ohlcv(120))
+            scanner.scan_all(["AAPL", "MSFT"], ["1d"])
+        pool.assert_not_called()
+
+    def test_threaded_scan_serializes_yahoo_downloads(self):
+        bars = _make_ohlcv(120, "up")
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0, "calls": 0}
+
+        def download(ticker, **kwargs):
+            with lock:
+                state["active"] += 1
+                state["calls"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.01)
+            with lock:
+                state["active"] -= 1
+            return bars.copy()
+
+        scanner = UniverseScanner(EMASignalConfig(scan_workers=4, derive_timeframes=False))
+        with patch("yfinance.download", side_effect=download):
+            signals = scanner.scan_all(["AAPL", "MSFT", "NVDA", "AMD"], ["1d"])
+        assert state["calls"] == 4
+        assert state["peak"] == 1
+        assert {s.ticker for s in signals} == {"AAPL", "MSFT", "NVDA", "AMD"}
+
+    def test_scan_failure_on_one_ticker_is_isolated(self):
+        scanner = UniverseScanner(EMASignalConfig(scan_workers=4, derive_timeframes=False))
+        bars = _make_ohlcv(120, "up")
+
+        def get_bars(ticker, tf, lookback=200):
+            if ticker == "BAD":
+                raise RuntimeError("feed down")
+            return bars.copy()
+
+        scanner.data_feed.get_bars = MagicMock(side_effect=get_bars)
+        signals = scanner.scan_all(["BAD", "AAPL"], ["10m"])
+        assert signals
+        assert all(s.ticker == "AAPL" for s in signals)
+
 
 # ═══════════════════════════════════════════════════════════════════════
 # TestDataFeed
@@ -660,6 +882,38 @@ class TestDataFeed:
         assert DataFeed._parse_polygon_timeframe("5m") == (5, "minute")
         assert DataFeed._parse_polygon_timeframe("1d") == (1, "day")
 
+    def test_resample_bars_aggregates_ohlcv(self):
+        df = _make_intraday(days=1)
+        hourly = DataFeed.resample_bars(df, "1h")
+        assert hourly.index[0] == df.index[0]  # anchored at 09:30
+        assert len(hourly) == 7  # six full hours and the 15:30 half hour
+        first = df.iloc[:60]
+        assert hourly["open"].iloc[0] == first["open"].iloc[0]
+        assert hourly["high"].iloc[0] == first["high"].max()
+        assert hourly["low"].iloc[0] == first["low"].min()
+        assert hourly["close"].iloc[0] == first["close"].iloc[-1]
+        assert hourly["volume"].iloc[0] == first["volume"].sum()
+
+    def test_resample_bars_skips_overnight_gap(self):
+        df = _make_intraday(days=2)
+        five = DataFeed.resample_bars(df, "5m")
+        assert len(five) == 2 * 78
+
+    def test_get_bars_multi_fetches_base_once(self):
+        feed = DataFeed()
+        feed.get_bars = MagicMock(side_effect=lambda t, tf, lookback=200: _make_intraday())
+        bars = feed.get_bars_multi("AAPL", ["10m", "1m", "5m"], min_bars=91)
+        assert feed.get_bars.call_count == 1
+        assert list(bars) == ["10m", "1m", "5m"]
+        assert len(bars["5m"]) == 5 * 78
+        assert len(bars["10m"]) == 5 * 39
+
+    def test_get_bars_multi_fetches_when_too_few_derived_bars(self):
+        feed = DataFeed()
+        feed.get_bars = MagicMock(side_effect=lambda t, tf, lookback=200: _make_intraday())
+        feed.get_bars_multi("AAPL", ["1m", "1h", "1d"], min_bars=91)
+        assert [c.args[1] for c in feed.get_bars.call_args_list] == ["1m", "1h", "1d"]
+
     def test_preferred_source_fallback(self):
         feed = DataFeed(preferred_source="polygon")
         chain = feed._get_source_chain()
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import fnmatch
+import time
+
 import pytest
 from datetime import datetime, timezone
 
@@ -27,6 +31,7 @@ from src.event_bus import (
     ConsumerCheckpoint,
     ConsumerGroup,
     AsyncConsumer,
+    TopicIndex,
 )
 
 
@@ -325,6 +330,326 @@ class TestEventBus:
         assert records[0].status == DeliveryStatus.DELIVERED
 
 
+class TestTopicIndex:
+    """Tests for indexed topic routing."""
+
+    PATTERNS = [
+        "*", "orders", "orders.*", "orders.executed", "*.executed",
+        "orders.?xecuted", "alerts.[ab]*", "alerts*", "o*", "*s", "*ed", "**",
+    ]
+    TOPICS = [
+        "orders", "orders.executed", "orders.cancelled", "alerts.a1",
+        "alerts.c", "alerts", "ordersX", "o", "", "trades.executed",
+    ]
+
+    def setup_method(self):
+        self.bus = EventBus()
+
+    def test_matches_fnmatch(self):
+        subs = [self.bus.subscribe(f"s{i}", p) for i, p in enumerate(self.PATTERNS)]
+        for topic in self.TOPICS:
+            expected = [s for s in subs if fnmatch.fnmatchcase(topic, s.topic_pattern)]
+            assert list(self.bus._get_matching_subscribers(topic)) == expected, topic
+
+    def test_subscription_order_across_buckets(self):
+        a = self.bus.subscribe("a", "*.executed")
+        b = self.bus.subscribe("b", "orders.executed")
+        c = self.bus.subscribe("c", "orders.*")
+        d = self.bus.subscribe("d", "orders.executed")
+        assert self.bus._get_matching_subscribers("orders.executed") == (a, b, c, d)
+
+    def test_prefixes_of_equal_length(self):
+        a = self.bus.subscribe("a", "orders.*")
+        b = self.bus.subscribe("b", "trades.*")
+        self.bus.subscribe("c", "alerts.*")
+        assert self.bus._get_matching_subscribers("orders.x") == (a,)
+        assert self.bus._index._prefix.lengths == [7]
+        self.bus.unsubscribe(a.subscriber_id)
+        assert self.bus._get_matching_subscribers("trades.x") == (b,)
+        assert self.bus._index._prefix.lengths == [7]
+
+    def test_cache_invalidated_on_subscribe_and_unsubscribe(self):
+        received: list[str] = []
+        first = self.bus.subscribe("first", "orders.*", lambda e: received.append("first"))
+        event = order_executed_event("o1", "AAPL", "buy", 100.0, 150.0)
+        self.bus.publish("orders.executed", event)
+        assert self.bus.get_statistics()["cached_topics"] == 1
+
+        self.bus.subscribe("second", "orders.executed", lambda e: received.append("second"))
+        self.bus.publish("orders.executed", event)
+        assert received == ["first", "first", "second"]
+
+        self.bus.unsubscribe(first.subscriber_id)
+        self.bus.publish("orders.executed", event)
+        assert received[-1:] == ["second"] and len(received) == 4
+
+    def test_empty_buckets_dropped(self):
+        index = TopicIndex()
+        subs = [Subscriber(topic_pattern=p) for p in ("orders.*", "*.x", "orders")]
+        for sub in subs:
+            index.add(sub)
+        for sub in subs:
+            index.remove(sub)
+        index.remove(subs[0])  # already gone
+        assert len(index) == 0
+        assert index.match("orders.x") == ()
+        assert index._prefix.lengths == [] and index._suffix.lengths == []
+
+    def test_cache_bounded(self):
+        index = TopicIndex(cache_size=2)
+        index.add(Subscriber(topic_pattern="*"))
+        for topic in ("a", "b", "c"):
+            assert len(index.match(topic)) == 1
+        assert index.cached_topics == 2
+
+    def test_max_subscribers_per_topic(self):
+        bus = EventBus(EventBusConfig(max_subscribers_per_topic=2))
+        bus.subscribe("a", "orders.*")
+        bus.subscribe("b", "orders.*")
+        with pytest.raises(ValueError):
+            bus.subscribe("c", "orders.*")
+        bus.subscribe("d", "orders")  # separate pattern, separate limit
+
+
+class TestEventBusAsyncDelivery:
+    """Tests for queued async delivery, backoff and bounded logs."""
+
+    def _run(self, coro):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coro)
+        finally:
+            loop.close()
+
+    def _event(self, n: int = 0) -> EventEnvelope:
+        return order_executed_event(f"o{n}", "AAPL", "buy", 100.0, 150.0)
+
+    def test_bounded_log_and_dead_letters(self):
+        bus = EventBus(EventBusConfig(delivery_log_size=5, dead_letter_max_size=3, max_retry_attempts=2))
+
+        def bad_handler(e: EventEnvelope) -> None:
+            raise ValueError("fail")
+
+        bus.subscribe("ok", "*")
+        bus.subscribe("bad", "*", bad_handler)
+        for n in range(10):
+            bus.publish("orders", self._event(n))
+        stats = bus.get_statistics()
+        assert stats["delivery_log_size"] == 5
+        assert stats["dead_letters"] == 3
+        assert stats["total_delivered"] == 10
+        assert stats["total_dead_lettered"] == 10
+        assert stats["total_retries"] == 10
+        assert len(bus.get_delivery_log(limit=100)) == 5
+
+    def test_batch_handler_receives_micro_batches(self):
+        batches: list[list[EventEnvelope]] = []
+
+        async def scenario():
+            bus = EventBus(EventBusConfig(max_batch_size=4))
+            bus.subscribe("batcher", "orders.*", batches.append, batch=True)
+            await bus.start()
+            records = [bus.publish("orders.executed", self._event(n))[0] for n in range(10)]
+            assert all(r.status == DeliveryStatus.PENDING for r in records)
+            await bus.stop()
+            return records
+
+        records = self._run(scenario())
+        assert [len(b) for b in batches] == [4, 4, 2]
+        assert [e.data["order_id"] for b in batches for e in b] == [f"o{n}" for n in range(10)]
+        assert all(r.status == DeliveryStatus.DELIVERED for r in records)
+
+    def test_slow_subscriber_does_not_block_others(self):
+        fast: list[EventEnvelope] = []
+        release = None
+
+        async def scenario():
+            nonlocal release
+            release = asyncio.Event()
+
+            async def slow(e: EventEnvelope) -> None:
+                await release.wait()
+
+            bus = EventBus()
+            bus.subscribe("slow", "*", slow)
+            bus.subscribe("fast", "*", fast.append)
+            await bus.start()
+            for n in range(3):
+                bus.publish("orders", self._event(n))
+            await asyncio.sleep(0.01)
+            assert len(fast) == 3
+            assert bus.get_statistics()["queued"] == 2  # slow worker holds one, two waiting
+            release.set()
+            await bus.stop()
+            return bus.get_statistics()
+
+        stats = self._run(scenario())
+        assert stats["total_delivered"] == 6
+        assert stats["async_running"] is False
+
+    def test_retry_uses_backoff(self):
+        attempts: list[float] = []
+
+        def flaky(e: EventEnvelope) -> None:
+            attempts.append(time.monotonic())
+            if len(attempts) < 3:
+                raise RuntimeError("try again")
+
+        async def scenario():
+            bus = EventBus(EventBusConfig(retry_backoff_base_seconds=0.02, max_retry_attempts=3))
+            bus.subscribe("flaky", "*", flaky)
+            await bus.start()
+            record = bus.publish("orders", self._event())[0]
+            await bus.stop()
+            return bus, record
+
+        bus, record = self._run(scenario())
+        assert record.status == DeliveryStatus.DELIVERED
+        assert record.attempts == 3
+        assert attempts[1] - attempts[0] >= 0.015
+        assert attempts[2] - attempts[1] >= 0.035
+        assert bus.get_statistics()["total_retries"] == 2
+
+    def test_async_dead_letter_after_retries(self):
+        def bad_handler(events: list[EventEnvelope]) -> None:
+            raise ValueError("boom")
+
+        async def scenario():
+            bus = EventBus(EventBusConfig(retry_backoff_base_seconds=0.001, max_retry_attempts=2))
+            bus.subscribe("bad", "*", bad_handler, batch=True)
+            await bus.start()
+            records = [bus.publish("orders", self._event(n))[0] for n in range(3)]
+            await bus.stop()
+            return bus, records
+
+        bus, records = self._run(scenario())
+        assert all(r.status == DeliveryStatus.DEAD_LETTER and r.attempts == 2 for r in records)
+        assert [d["error"] for d in bus.get_dead_letters()] == ["boom"] * 3
+
+    def test_full_queue_drops_without_blocking(self):
+        async def scenario():
+            bus = EventBus(EventBusConfig(subscriber_queue_size=2))
+            bus.subscribe("sub", "*")
+            await bus.start()
+            records = [bus.publish("orders", self._event(n))[0] for n in range(3)]
+            await bus.stop()
+            return bus, records
+
+        bus, records = self._run(scenario())
+        assert [r.status for r in records] == [
+            DeliveryStatus.DELIVERED, DeliveryStatus.DELIVERED, DeliveryStatus.DEAD_LETTER,
+        ]
+        assert bus.get_statistics()["total_dropped"] == 1
+
+    def test_publish_async_waits_for_space(self):
+        received: list[EventEnvelope] = []
+
+        async def scenario():
+            bus = EventBus(EventBusConfig(subscriber_queue_size=1))
+            bus.subscribe("sub", "*", received.append)
+            await bus.start()
+            for n in range(5):
+                await bus.publish_async("orders", self._event(n))
+            await bus.stop()
+            return bus
+
+        bus = self._run(scenario())
+        assert len(received) == 5
+        assert bus.get_statistics()["total_dropped"] == 0
+
+    def test_subscribe_and_unsubscribe_while_running(self):
+        received: list[EventEnvelope] = []
+
+        async def scenario():
+            bus = EventBus()
+            await bus.start()
+            sub = bus.subscribe("late", "*", received.append)
+            bus.publish("orders", self._event())
+            await bus.drain()
+            assert bus.unsubscribe(sub.subscriber_id) is True
+            assert bus.publish("orders", self._event(1)) == []
+            await bus.stop()
+
+        self._run(scenario())
+        assert len(received) == 1
+
+    def test_unsubscribe_wakes_blocked_publish_async(self):
+        async def scenario():
+            release = asyncio.Event()
+
+            async def slow(e: EventEnvelope) -> None:
+                await release.wait()
+
+            bus = EventBus(EventBusConfig(subscriber_queue_size=1))
+            sub = bus.subscribe("slow", "*", slow)
+            await bus.start()
+            await bus.publish_async("orders", self._event(0))  # in flight
+            await bus.publish_async("orders", self._event(1))  # queued
+            blocked = asyncio.ensure_future(bus.publish_async("orders", self._event(2)))
+            await asyncio.sleep(0.01)
+            assert not blocked.done()
+
+            bus.unsubscribe(sub.subscriber_id)
+            records = await asyncio.wait_for(blocked, timeout=1.0)
+            await asyncio.sleep(0)
+            await bus.stop()
+            return bus, records
+
+        bus, records = self._run(scenario())
+        assert records[0].status == DeliveryStatus.DEAD_LETTER
+        stats = bus.get_statistics()
+        assert stats["total_dead_lettered"] == 3  # in flight, queued and blocked
+        assert stats["total_delivered"] == 0
+
+    def test_unsubscribe_later_target_during_publish_async(self):
+        received: list[EventEnvelope] = []
+
+        async def scenario():
+            release = asyncio.Event()
+
+            async def slow(e: EventEnvelope) -> None:
+                await release.wait()
+
+            bus = EventBus(EventBusConfig(subscriber_queue_size=1))
+            bus.subscribe("slow", "*", slow)
+            other = bus.subscribe("other", "*", received.append)
+            await bus.start()
+            await bus.publish_async("orders", self._event(0))
+            await bus.publish_async("orders", self._event(1))
+            blocked = asyncio.ensure_future(bus.publish_async("orders", self._event(2)))
+            await asyncio.sleep(0.01)
+
+            bus.unsubscribe(other.subscriber_id)
+            release.set()
+            records = await asyncio.wait_for(blocked, timeout=1.0)
+            await bus.stop()
+            return records
+
+        records = self._run(scenario())
+        assert len(records) == 1
+        assert records[0].status == DeliveryStatus.DELIVERED
+        assert len(received) == 2
+
+    def test_stop_without_drain_settles_queued(self):
+        async def scenario():
+            bus = EventBus()
+            bus.subscribe("sub", "*")
+            await bus.start()
+            records = [bus.publish("orders", self._event(n))[0] for n in range(3)]
+            await bus.stop(drain=False)
+            return records
+
+        records = self._run(scenario())
+        assert all(r.status == DeliveryStatus.DEAD_LETTER for r in records)
+
+    def test_sync_batch_handler_gets_list(self):
+        batches: list[list[EventEnvelope]] = []
+        bus = EventBus()
+        bus.subscribe("batcher", "*", batches.append, batch=True)
+        bus.publish("orders", self._event())
+        assert len(batches) == 1 and len(batches[0]) == 1
+
+
 class TestEventStore:
     """Tests for the event store."""
 
@@ -524,6 +524,19 @@ class TestSystemMetrics:
         sm = SystemMetrics()
         assert sm.cache_hit_rate() == 0.0
 
+    def test_l1_cache_operations(self):
+        sm = SystemMetrics()
+        sm.record_l1_hit("prices")
+        sm.record_l1_miss("prices")
+        sm.record_l1_eviction("prices", "size", 3)
+        sm.record_l1_coalesced("prices")
+        sm.update_l1_usage("prices", entries=2, nbytes=4096)
+        assert sm.l1_cache_hits_total.get({"cache": "prices"}) == 1.0
+        assert sm.l1_cache_misses_total.get({"cache": "prices"}) == 1.0
+        assert sm.l1_cache_evictions_total.get({"cache": "prices", "reason": "size"}) == 3.0
+        assert sm.l1_cache_coalesced_total.get({"cache": "prices"}) == 1.0
+        assert sm.l1_cache_bytes.get({"cache": "prices"}) == 4096
+
     def test_websocket_connections(self):
         sm = SystemMetrics()
         sm.update_websocket_connections(25)
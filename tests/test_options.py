@@ -16,14 +16,17 @@ from src.options.config import (
 from src.options.pricing import (
     OptionsPricingEngine,
     OptionPrice,
+    OptionPriceArray,
     OptionLeg,
     OptionType,
 )
+from src.options.simulation import PathSimulator, MCResult
 from src.options.volatility import (
     VolatilitySurfaceBuilder,
     VolSurface,
     VolAnalytics,
     VolPoint,
+    SVISurfaceEngine,
 )
 from src.options.strategies import (
     StrategyBuilder,
@@ -214,6 +217,114 @@ class TestOptionsPricingEngine:
         intrinsic = 100 - 95
         assert abs(result.price - intrinsic) < 0.5
 
+    def test_black_scholes_array_matches_scalar(self, pricing_engine):
+        """Test array pricing agrees with the scalar model contract by contract."""
+        strikes = np.array([80.0, 95.0, 100.0, 105.0, 120.0, 100.0, 90.0])
+        T = np.array([0.1, 0.25, 0.5, 1.0, 0.75, 0.0, 0.3])
+        sigma = np.array([0.2, 0.35, 0.25, 0.15, 0.6, 0.2, 0.0])
+        types = np.array(["call", "put", "call", "put", "call", "put", "call"])
+
+        result = pricing_engine.black_scholes_array(100, strikes, T, 0.05, sigma, types, q=0.01)
+
+        assert isinstance(result, OptionPriceArray)
+        assert len(result) == len(strikes)
+        for i in range(len(strikes)):
+            scalar = pricing_engine.black_scholes(100, strikes[i], T[i], 0.05, sigma[i], types[i], 0.01)
+            for greek in ("price", "delta", "gamma", "theta", "vega", "rho"):
+                assert getattr(result, greek)[i] == pytest.approx(getattr(scalar, greek), abs=1e-10)
+
+    def test_implied_volatility_array(self, pricing_engine):
+        """Test chain-wide IV recovers the volatilities used to price it."""
+        rng = np.random.default_rng(7)
+        strikes = 100 * rng.uniform(0.6, 1.4, 500)
+        T = rng.uniform(0.02, 1.5, 500)
+        true_vol = rng.uniform(0.08, 1.2, 500)
+        is_call = rng.random(500) < 0.5
+        prices = pricing_engine.black_scholes_array(100, strikes, T, 0.05, true_vol, is_call).price
+
+        iv = pricing_engine.implied_volatility_array(prices, 100, strikes, T, 0.05, is_call)
+
+        repriced = pricing_engine.black_scholes_array(100, strikes, T, 0.05, iv, is_call).price
+        assert np.abs(repriced - prices).max() < 1e-6
+        has_vega = pricing_engine.black_scholes_array(100, strikes, T, 0.05, true_vol, is_call).vega > 1e-3
+        assert np.abs(iv - true_vol)[has_vega].max() < 1e-4
+
+    def test_implied_volatility_array_edge_cases(self, pricing_engine):
+        """Test expired/unpriced contracts and prices outside no-arbitrage bounds."""
+        iv = pricing_engine.implied_volatility_array(
+            [5.0, 0.0, 250.0, 1e-9], 100, [100, 100, 100, 200], [0.0, 0.25, 0.25, 0.25], 0.05, "call",
+        )
+        assert iv[0] == 0.0
+        assert iv[1] == 0.0
+        # Above the underlying price: pinned to the upper bracket
+        assert iv[2] == pytest.approx(pricing_engine.config.iv_max)
+        assert pricing_engine.config.iv_min <= iv[3] < 0.5
+
+
+# =============================================================================
+# Test Path Simulator
+# =============================================================================
+
+class TestPathSimulator:
+    """Tests for the variance-reduced Monte Carlo path simulator."""
+
+    @pytest.mark.parametrize("option_type", ["call", "put"])
+    def test_european_matches_black_scholes(self, pricing_engine, option_type):
+        """Test European price and pathwise Greeks against Black-Scholes."""
+        result = PathSimulator().price(100, 105, 0.5, 0.05, 0.25, option_type, n_paths=10_000)
+        bs = pricing_engine.black_scholes(100, 105, 0.5, 0.05, 0.25, option_type)
+
+        assert isinstance(result, MCResult)
+        assert abs(result.price - bs.price) < 4 * result.std_error + 1e-3
+        assert result.delta == pytest.approx(bs.delta, abs=2e-3)
+        assert result.vega == pytest.approx(bs.vega, abs=2e-3)
+        assert result.rho == pytest.approx(bs.rho, abs=2e-3)
+
+    def test_variance_reduction_shrinks_error(self):
+        """Test Sobol + antithetic + control variate beats plain draws by >10x."""
+        sim = PathSimulator()
+        plain = sim.price(
+            100, 100, 1.0, 0.05, 0.2, payoff="asian", n_paths=8_192, n_steps=16,
+            sequence="pseudo", antithetic=False, control_variate=False,
+        )
+        reduced = sim.price(100, 100, 1.0, 0.05, 0.2, payoff="asian", n_paths=8_192, n_steps=16)
+
+        assert reduced.std_error * 10 < plain.std_error
+        assert abs(reduced.price - plain.price) < 4 * plain.std_error
+
+    def test_path_dependent_payoffs(self, pricing_engine):
+        """Test Asian below vanilla and knock-in + knock-out = vanilla."""
+        sim = PathSimulator()
+        vanilla = pricing_engine.black_scholes(100, 100, 1.0, 0.05, 0.2, "call").price
+        asian = sim.price(100, 100, 1.0, 0.05, 0.2, payoff="asian", n_paths=4_096, n_steps=16)
+        out = sim.price(
+            100, 100, 1.0, 0.05, 0.2, payoff="barrier", barrier=90,
+            barrier_type="down-and-out", n_paths=4_096, n_steps=16,
+        )
+        knock_in = sim.price(
+            100, 100, 1.0, 0.05, 0.2, payoff="barrier", barrier=90,
+            barrier_type="down-and-in", n_paths=4_096, n_steps=16,
+        )
+
+        assert asian.price < vanilla
+        assert 0 < out.price < vanilla
+        assert out.price + knock_in.price == pytest.approx(vanilla, abs=0.05)
+        assert 0 < out.delta < 1.5
+
+        with pytest.raises(ValueError):
+            sim.price(100, 100, 1.0, 0.05, 0.2, payoff="barrier")
+
+    def test_engine_monte_carlo_uses_simulator(self, pricing_engine):
+        """Test monte_carlo returns simulator Greeks, legacy path behind the flag."""
+        result = pricing_engine.monte_carlo(100, 100, 0.25, 0.05, 0.2, n_simulations=4_096)
+        legacy = OptionsPricingEngine(PricingConfig(mc_variance_reduction=False)).monte_carlo(
+            100, 100, 0.25, 0.05, 0.2, n_simulations=4_096,
+        )
+
+        assert result.model == legacy.model == "monte_carlo"
+        assert result.vega > 0
+        assert legacy.vega == 0.0
+
 
 # =============================================================================
 # Test Volatility Surface Builder
@@ -238,6 +349,24 @@ class TestVolatilitySurfaceBuilder:
         assert isinstance(surface, VolSurface)
         assert len(surface.raw_points) == 6
 
+    def test_build_from_chain(self, vol_builder, pricing_engine):
+        """Test building surface from quoted chain prices."""
+        strikes = np.tile(np.arange(65.0, 140.0, 5.0), 3)
+        dtes = np.repeat([5, 30, 90], len(strikes) // 3)
+        types = np.where(strikes < 100, "put", "call")
+        true_iv = 0.25 + 0.4 * (strikes / 100 - 1) ** 2
+        mid = pricing_engine.black_scholes_array(100, strikes, dtes / 365.0, 0.05, true_iv, types).price
+        chain = pd.DataFrame({"strike": strikes, "dte": dtes, "mid_price": mid, "option_type": types})
+
+        surface = vol_builder.build_from_chain(chain, spot_price=100)
+
+        # 5 DTE is below min_dte; 65 and 135 strikes are outside the moneyness band
+        assert len(surface.raw_points) == 2 * 13
+        for point in surface.raw_points:
+            assert point.dte in (30, 90)
+            assert point.iv == pytest.approx(0.25 + 0.4 * (point.moneyness - 1) ** 2, abs=1e-4)
+            assert point.option_type == ("put" if point.strike < 100 else "call")
+
     def test_get_iv_interpolation(self, vol_builder):
         """Test IV interpolation from surface."""
         iv_data = [
@@ -280,6 +409,97 @@ class TestVolatilitySurfaceBuilder:
         assert len(cone) > 0
 
 
+# =============================================================================
+# Test SVI Surface Engine
+# =============================================================================
+
+SVI_SLICES = {
+    14: {"a": 0.0012, "b": 0.035, "rho": -0.55, "m": 0.01, "sigma": 0.10},
+    45: {"a": 0.0040, "b": 0.050, "rho": -0.50, "m": 0.01, "sigma": 0.11},
+    120: {"a": 0.0110, "b": 0.080, "rho": -0.45, "m": 0.01, "sigma": 0.12},
+}
+
+
+def _svi_iv(params, moneyness, dte):
+    k = np.log(moneyness)
+    w = params["a"] + params["b"] * (
+        params["rho"] * (k - params["m"]) + np.sqrt((k - params["m"]) ** 2 + params["sigma"] ** 2)
+    )
+    return np.sqrt(w / (dte / 365.0))
+
+
+def _svi_chain(engine, spot=100.0, bump=None):
+    """OTM chain priced off SVI_SLICES; bump maps dte -> price multiplier."""
+    frames = []
+    strikes = np.linspace(75.0, 125.0, 41)
+    types = np.where(strikes < spot, "put", "call")
+    for dte, params in SVI_SLICES.items():
+        iv = _svi_iv(params, strikes / spot, dte)
+        mid = engine.black_scholes_array(spot, strikes, dte / 365.0, 0.05, iv, types).price
+        mid = mid * (bump or {}).get(dte, 1.0)
+        frames.append(pd.DataFrame({"strike": strikes, "dte": dte, "mid_price": mid, "option_type": types}))
+    return pd.concat(frames, ignore_index=True)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestSVISurfaceEngine:
+    """Tests for the incremental per-expiry SVI surface engine."""
+
+    def test_fits_each_expiry(self, pricing_engine):
+        """Test each expiry gets its own slice reproducing the quoted smile."""
+        engine = SVISurfaceEngine(pricing_engine=pricing_engine)
+        surface = engine.update("XYZ", _svi_chain(pricing_engine), 100.0)
+
+        assert sorted(surface.slices) == [14, 45, 120]
+        assert surface.iv_grid.shape == (3, len(engine.moneyness_grid))
+        for dte, params in SVI_SLICES.items():
+            for m in (0.85, 1.0, 1.15):
+                assert surface.get_iv(m, dte) == pytest.approx(_svi_iv(params, m, dte), abs=2e-3)
+        # Between expiries: interpolated in total variance
+        near, mid, far = (surface.get_iv(1.0, d) for d in (14, 30, 45))
+        assert min(near, far) < mid < max(near, far)
+
+    def test_refits_only_changed_slices(self, pricing_engine):
+        """Test unchanged slices are reused and changed ones warm-started."""
+        clock = FakeClock()
+        engine = SVISurfaceEngine(pricing_engine=pricing_engine, clock=clock)
+        first = engine.update("XYZ", _svi_chain(pricing_engine), 100.0)
+        assert engine.stats == {"fitted": 3, "warm_started": 0, "reused": 0}
+
+        clock.now = 10.0
+        second = engine.update("XYZ", _svi_chain(pricing_engine, bump={45: 1.02}), 100.0)
+        assert engine.stats == {"fitted": 4, "warm_started": 1, "reused": 2}
+        assert second.slices[14] == first.slices[14]
+        assert second.slices[45] != first.slices[45]
+        assert engine.get_surface("XYZ") is second
+
+        # Past the cache TTL every slice is refit, even if unchanged
+        clock.now = 10.0 + engine.config.surface_cache_ttl
+        engine.update("XYZ", _svi_chain(pricing_engine, bump={45: 1.02}), 100.0)
+        assert engine.stats == {"fitted": 7, "warm_started": 4, "reused": 2}
+
+    def test_parallel_matches_serial(self, pricing_engine):
+        """Test pooled slice fits agree with serial fits."""
+        chains = {
+            "AAA": (_svi_chain(pricing_engine), 100.0),
+            "BBB": (_svi_chain(pricing_engine, bump={14: 0.98, 120: 1.03}), 100.0),
+        }
+        serial = SVISurfaceEngine(pricing_engine=pricing_engine).update_many(chains)
+        with SVISurfaceEngine(VolatilityConfig(svi_workers=2), pricing_engine) as engine:
+            pooled = engine.update_many(chains)
+
+        for symbol in chains:
+            assert pooled[symbol].slices == serial[symbol].slices
+            np.testing.assert_allclose(pooled[symbol].iv_grid, serial[symbol].iv_grid)
+
+
 # =============================================================================
 # Test Strategy Builder
 # =============================================================================
@@ -567,6 +787,47 @@ class TestOptionsBacktester:
         # Should have fewer trades with strict rules
         assert result.total_trades >= 0
 
+    @pytest.mark.parametrize("method,kwargs", [
+        ("backtest_short_put", {"delta_target": 0.30}),
+        ("backtest_short_put", {"delta_target": 0.16, "exit_rules": ExitRules(profit_target_pct=0.25, stop_loss_pct=1.0)}),
+        ("backtest_iron_condor", {"wing_delta": 0.15, "wing_width": 5.0}),
+    ])
+    def test_vectorized_matches_scalar(self, sample_price_history, sample_iv_history, method, kwargs):
+        """Test batched repricing reproduces the day-by-day simulation."""
+        fast = getattr(OptionsBacktester(), method)(
+            sample_price_history, sample_iv_history, entry_rules=EntryRules(min_dte=20, max_dte=30), **kwargs,
+        )
+        slow = getattr(OptionsBacktester(BacktestConfig(vectorized=False)), method)(
+            sample_price_history, sample_iv_history, entry_rules=EntryRules(min_dte=20, max_dte=30), **kwargs,
+        )
+
+        assert fast.total_trades == slow.total_trades > 0
+        for a, b in zip(fast.trades, slow.trades):
+            assert a.to_dict() == b.to_dict()
+            assert a.underlying_exit == b.underlying_exit
+        assert fast.summary() == slow.summary()
+
+    def test_sweep(self, sample_price_history, sample_iv_history):
+        """Test parameter sweep rows match individual backtests."""
+        bt = OptionsBacktester()
+        grid = bt.sweep(
+            sample_price_history, sample_iv_history,
+            delta_targets=[0.16, 0.30], dtes=[30, 45], profit_targets=[0.25, 0.50],
+        )
+
+        assert len(grid) == 8
+        assert {"delta_target", "dte", "profit_target_pct", "total_pnl", "win_rate"} <= set(grid.columns)
+        row = grid[(grid.delta_target == 0.30) & (grid.dte == 30) & (grid.profit_target_pct == 0.25)].iloc[0]
+        single = bt.backtest_short_put(
+            sample_price_history, sample_iv_history, delta_target=0.30,
+            entry_rules=EntryRules(max_dte=30), exit_rules=ExitRules(profit_target_pct=0.25),
+        )
+        assert row.total_trades == single.total_trades
+        assert row.total_pnl == pytest.approx(single.total_pnl)
+
+        with pytest.raises(ValueError):
+            bt.sweep(sample_price_history, sample_iv_history, strategy="butterfly")
+
 
 # =============================================================================
 # Test Configuration
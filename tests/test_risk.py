@@ -204,6 +204,45 @@ class TestVaRCalculator:
         assert result.cvar_95 >= result.var_95  # CVaR (expected shortfall) >= VaR
         assert result.returns_distribution is not None
 
+    @pytest.mark.parametrize("mc_method", ["cholesky", "factor"])
+    def test_monte_carlo_var_full(self, mc_method):
+        """Test one simulation gives VaR, CVaR and components at every level."""
+        rng = np.random.default_rng(0)
+        loadings = rng.normal(0, 0.15, (40, 3))
+        cov = loadings @ loadings.T + np.diag(rng.uniform(0.02, 0.06, 40))
+        weights = np.full(40, 1 / 40)
+        symbols = [f"S{i}" for i in range(40)]
+        calc = VaRCalculator(confidence_levels=(0.90, 0.95, 0.99), mc_method=mc_method, factor_rank=3, seed=7)
+
+        result = calc.monte_carlo_var_full(weights, cov, 100_000, n_simulations=50_000, symbols=symbols)
+        parametric = 1.6449 * np.sqrt(weights @ cov @ weights / 252) * 100_000
+
+        assert sorted(result.var_by_confidence) == [0.90, 0.95, 0.99]
+        assert result.var_95 == pytest.approx(parametric, rel=0.05)
+        assert result.var_by_confidence[0.90] < result.var_95 < result.var_99
+        assert result.cvar_95 > result.var_95
+        for level, components in result.component_var.items():
+            assert list(components) == symbols
+            assert sum(components.values()) == pytest.approx(result.var_by_confidence[level])
+
+    def test_monte_carlo_factor_cached(self):
+        """Test the covariance factor is reused until the matrix changes."""
+        cov = np.array([[0.04, 0.01], [0.01, 0.09]])
+        weights = np.array([0.6, 0.4])
+        calc = VaRCalculator(seed=3)
+
+        first = calc.monte_carlo_var_portfolio(weights, cov, 100_000, n_simulations=5_000)
+        calc.monte_carlo_var_portfolio(weights, cov, 100_000, n_simulations=5_000)
+        assert calc.factor_stats == {"factorized": 1, "reused": 1}
+
+        calc.monte_carlo_var_portfolio(weights, cov * 1.1, 100_000, n_simulations=5_000)
+        assert calc.factor_stats == {"factorized": 2, "reused": 1}
+
+        # Seeded draws are reproducible
+        assert VaRCalculator(seed=3).monte_carlo_var_portfolio(
+            weights, cov, 100_000, n_simulations=5_000,
+        ) == first
+
 
 # =============================================================================
 # Test StressTestEngine
@@ -254,6 +293,53 @@ class TestStressTestEngine:
             if result.worst_position_symbol:
                 assert result.worst_position_impact_pct <= 0
 
+    def _engine(self):
+        rng = np.random.default_rng(0)
+        dates = pd.bdate_range("2007-01-02", "2021-12-31")
+        prices = pd.DataFrame(
+            100 * np.cumprod(1 + rng.normal(0, 0.015, (len(dates), 4)), axis=0),
+            index=dates, columns=["AAPL", "MSFT", "JPM", "XOM"],
+        )
+        benchmark = pd.Series(100 * np.cumprod(1 + rng.normal(0, 0.01, len(dates))), index=dates)
+        return StressTestEngine(historical_data=prices, benchmark_data=benchmark)
+
+    def test_batched_historical_matches_scalar(self, sample_positions):
+        """Test batched historical tests reproduce per-scenario results."""
+        engine = self._engine()
+        positions = [dict(p, weight=p["market_value"] / 50_000) for p in sample_positions]
+        positions.append({"symbol": "NOPE", "weight": 0.05})
+
+        batched = engine.run_historical_tests(positions, 100_000)
+        scalar = [engine.run_historical_test(s, positions, 100_000) for s in HISTORICAL_SCENARIOS]
+
+        assert [r.scenario_name for r in batched] == [r.scenario_name for r in scalar]
+        for b, s in zip(batched, scalar):
+            assert b.portfolio_impact_pct == pytest.approx(s.portfolio_impact_pct, abs=1e-12)
+            assert b.position_impacts == pytest.approx(s.position_impacts)
+            assert b.worst_position_symbol == s.worst_position_symbol
+        assert any(r.portfolio_impact_pct != 0 for r in batched)
+
+    def test_historical_batch_many_portfolios(self, sample_positions):
+        """Test one matrix multiply prices every portfolio, cached per library."""
+        engine = self._engine()
+        portfolios = {
+            "current": [dict(p, weight=p["market_value"] / 50_000) for p in sample_positions],
+            "rebalanced": [{"symbol": "XOM", "weight": 0.5}, {"symbol": "JPM", "weight": 0.5}],
+        }
+        weights = engine.positions_to_weights(portfolios)
+        impacts = engine.run_historical_batch(weights)
+
+        assert impacts.shape == (2, len(HISTORICAL_SCENARIOS))
+        for name, positions in portfolios.items():
+            expected = [r.portfolio_impact_pct for r in engine.run_historical_tests(positions, 100_000)]
+            np.testing.assert_allclose(impacts.loc[name].to_numpy(), expected, atol=1e-12)
+
+        matrix = engine.build_shock_matrix()
+        assert engine.build_shock_matrix() is matrix
+        assert engine.build_shock_matrix(HISTORICAL_SCENARIOS[:2]) is not matrix
+        engine.update_data(engine.historical_data, engine.benchmark_data)
+        assert engine.build_shock_matrix().version != matrix.version
+
 
 # =============================================================================
 # Test DrawdownProtection
@@ -1,23 +1,26 @@
 """Tests for Advanced Stock Screener."""
 
+import numpy as np
+import pandas as pd
 import pytest
 from datetime import date
 
 from src.screener import (
     # Config
-    FilterCategory, DataType, Operator, Universe, AlertType,
+    FilterCategory, DataType, Operator, Universe, AlertType, SortOrder,
     # Models
     FilterCondition, CustomFormula, Screen, ScreenMatch,
     # Core
-    FilterRegistry, FILTER_REGISTRY, ExpressionParser,
+    FilterRegistry, FILTER_REGISTRY, ExpressionParser, ExpressionError,
     ScreenerEngine, ScreenManager,
     # Presets
     get_preset_screens, PRESET_SCREENS,
     # Alerts
     ScreenAlertManager,
     # Backtest
-    ScreenBacktester, ScreenBacktestConfig,
+    ScreenBacktester, ScreenBacktestConfig, MetricsPanel,
 )
+from src.screener.config import RebalanceFrequency
 
 
 # =============================================================================
@@ -234,6 +237,75 @@ class TestExpressionParser:
         
         is_valid, error = parser.validate("pe_ratio <")
         assert is_valid is False
+    
+    def test_compile_matches_evaluate(self):
+        """Compiled formulas agree with scalar evaluation element-wise."""
+        parser = ExpressionParser()
+        pe = np.array([5.0, 15.0, 25.0, 40.0])
+        roe = np.array([30.0, 10.0, 20.0, -5.0])
+        
+        for expr in [
+            "pe_ratio < 20 and roe > 15",
+            "not (pe_ratio > 20) or roe < 0",
+            "if(roe > 15, pe_ratio, roe) * 2",
+            "max(pe_ratio, roe) - min(pe_ratio, roe) ^ 2",
+            "abs(roe) % 7 + sqrt(pe_ratio) + log(pe_ratio, 10)",
+        ]:
+            result = parser.compile(expr)({"pe_ratio": pe, "roe": roe})
+            expected = [parser.evaluate(expr, {"pe_ratio": p, "roe": r}) for p, r in zip(pe, roe)]
+            np.testing.assert_allclose(np.asarray(result, dtype=float), np.asarray(expected, dtype=float))
+    
+    def test_compile_division_by_zero_is_nan(self):
+        """Division by zero yields NaN rather than raising."""
+        parser = ExpressionParser()
+        result = parser.compile("a / b")({"a": np.array([1.0, 2.0]), "b": np.array([0.0, 4.0])})
+        assert np.isnan(result[0])
+        assert result[1] == 0.5
+    
+    def test_compile_unknown_function(self):
+        """Unknown functions fail at compile time."""
+        parser = ExpressionParser()
+        with pytest.raises(ExpressionError):
+            parser.compile("median(pe_ratio) > 1")
+    
+    def test_parse_cache(self):
+        """Repeated expressions reuse the cached AST."""
+        parser = ExpressionParser()
+        
+        assert parser.parse("pe_ratio < 20") is parser.parse("pe_ratio < 20")
+        parser.evaluate("pe_ratio < 20", {"pe_ratio": 15})
+        info = parser.cache_info()
+        assert info["ast_misses"] == 1
+        assert info["ast_hits"] == 2
+        
+        assert parser.compile("roe > 1") is parser.compile("roe > 1")
+        assert parser.cache_info()["compiled_size"] == 1
+    
+    def test_parse_cache_is_bounded(self):
+        """Least recently used expressions are evicted; errors are not cached."""
+        parser = ExpressionParser(cache_size=2)
+        first = parser.parse("a > 1")
+        parser.parse("b > 1")
+        parser.parse("a > 1")
+        parser.parse("c > 1")  # evicts "b > 1"
+        
+        assert parser.cache_info()["ast_size"] == 2
+        assert parser.parse("a > 1") is first
+        assert parser.validate("a >")[0] is False
+        assert parser.cache_info()["ast_size"] == 2
+    
+    def test_evaluate_array_panel(self):
+        """Formulas evaluate over date x symbol panels and keep the labels."""
+        parser = ExpressionParser()
+        index = pd.date_range("2024-01-31", periods=3, freq="ME")
+        pe = pd.DataFrame([[10.0, 30.0], [25.0, 12.0], [np.nan, 8.0]], index=index, columns=["A", "B"])
+        roe = pd.DataFrame(20.0, index=index, columns=["A", "B"])
+        
+        result = parser.evaluate_array("pe_ratio < 20 and roe > 15", {"pe_ratio": pe, "roe": roe})
+        
+        assert isinstance(result, pd.DataFrame)
+        assert result.index.equals(index)
+        assert result.to_numpy().tolist() == [[True, False], [False, True], [False, True]]
 
 
 # =============================================================================
@@ -264,6 +336,23 @@ class TestFilterCondition:
         cond = FilterCondition(filter_id="sector", operator=Operator.IN, value=["Technology", "Healthcare"])
         assert cond.evaluate("Technology") is True
         assert cond.evaluate("Energy") is False
+    
+    def test_evaluate_array_matches_evaluate(self):
+        """Column evaluation agrees with per-value evaluation, None never matches."""
+        values = pd.Series([5.0, 10.0, None, 25.0, 15.0], dtype=object)
+        for operator, value, value2 in [
+            (Operator.GT, 10, None), (Operator.LTE, 10, None), (Operator.NE, 5.0, None),
+            (Operator.BETWEEN, 10, 20), (Operator.NOT_IN, [5.0, 25.0], None),
+        ]:
+            cond = FilterCondition(filter_id="pe_ratio", operator=operator, value=value, value2=value2)
+            expected = [cond.evaluate(v) for v in values]
+            assert cond.evaluate_array(values).tolist() == expected
+    
+    def test_evaluate_array_mixed_types(self):
+        """Mixed-type columns fall back to per-value evaluation."""
+        cond = FilterCondition(filter_id="pe_ratio", operator=Operator.GT, value=10)
+        values = pd.Series([15, "n/a", 5], dtype=object)
+        assert cond.evaluate_array(values).tolist() == [True, False, False]
 
 
 # =============================================================================
@@ -359,6 +448,69 @@ class TestScreenerEngine:
         assert is_valid is False
 
 
+class TestColumnarScreening:
+    """Tests for the columnar ScreenerEngine path."""
+    
+    @pytest.fixture
+    def screens(self):
+        return [
+            Screen(
+                filters=[
+                    FilterCondition(filter_id="pe_ratio", operator=Operator.LT, value=30),
+                    FilterCondition(filter_id="roe", operator=Operator.BETWEEN, value=15, value2=100),
+                ],
+                sort_by="pe_ratio",
+                sort_order=SortOrder.ASC,
+            ),
+            Screen(
+                sectors=["Technology", "Energy"],
+                custom_formulas=[CustomFormula(expression="operating_margin / gross_margin > 0.4")],
+                sort_by="name",
+            ),
+            Screen(market_cap_min=4e11, exclude_symbols=["MSFT"], max_results=1),
+            Screen(custom_formulas=[CustomFormula(expression="missing_metric > 1")]),
+        ]
+    
+    def test_frame_matches_row_path(self, sample_stock_data, screens):
+        """DataFrame input returns the same matches, in the same order."""
+        engine = ScreenerEngine()
+        frame = engine.build_metrics_frame(sample_stock_data)
+        
+        for screen in screens:
+            expected = engine.run_screen(screen, sample_stock_data)
+            result = engine.run_screen(screen, frame)
+            assert [m.symbol for m in result.stocks] == [m.symbol for m in expected.stocks]
+            assert result.total_universe == expected.total_universe
+    
+    def test_build_metrics_frame_columns(self, sample_stock_data, screens):
+        """A frame of only the columns a screen reads gives the same matches."""
+        engine = ScreenerEngine()
+        for screen in screens:
+            columns = engine.screen_columns(screen)
+            frame = engine.build_metrics_frame(sample_stock_data, columns)
+            assert list(frame.columns) == columns
+            result = engine.run_screen(screen, frame)
+            expected = engine.run_screen(screen, sample_stock_data)
+            assert [m.symbol for m in result.stocks] == [m.symbol for m in expected.stocks]
+        
+        frame = engine.build_metrics_frame(sample_stock_data)
+        assert engine.screen_mask(screens[0], frame).tolist() == [False, False, True, True]
+    
+    def test_formula_missing_value_never_matches(self):
+        """A stock missing a formula variable is excluded, as in the row path."""
+        stock_data = {
+            "A": {"beta": None, "market_cap": 1.0},
+            "B": {"market_cap": 2.0},
+            "C": {"beta": 1.0, "market_cap": 3.0},
+        }
+        screen = Screen(custom_formulas=[CustomFormula(expression="not (beta > 2)")])
+        engine = ScreenerEngine()
+        
+        result = engine.run_screen(screen, engine.build_metrics_frame(stock_data))
+        assert [m.symbol for m in result.stocks] == ["C"]
+        assert result.stocks[0].metrics == {"beta": 1.0, "market_cap": 3.0}
+
+
 # =============================================================================
 # Test Preset Screens
 # =============================================================================
@@ -457,6 +609,19 @@ class TestScreenAlertManager:
         # Second run with same data - no new entries
         notifications = manager.check_alerts(sample_stock_data)
         assert len(notifications) == 0
+    
+    def test_check_alerts_multiple_screens(self, value_screen, sample_stock_data):
+        """Several screens over the same data are screened column-wise."""
+        tech_screen = Screen(name="Tech", sectors=["Technology"])
+        manager = ScreenAlertManager()
+        manager.add_alert(value_screen, AlertType.ENTRY)
+        manager.add_alert(tech_screen, AlertType.ENTRY)
+        
+        notifications = manager.check_alerts(sample_stock_data)
+        
+        entered = {n.screen_id: set(n.entered_stocks) for n in notifications}
+        assert entered[value_screen.screen_id] == {"JNJ", "XOM"}
+        assert entered[tech_screen.screen_id] == {"AAPL", "MSFT"}
 
 
 # =============================================================================
@@ -483,3 +648,87 @@ class TestScreenBacktester:
         assert result is not None
         assert result.screen_id == value_screen.screen_id
         assert len(result.equity_curve) > 0
+    
+    @pytest.fixture
+    def price_history(self):
+        """Random-walk history: 40 symbols + SPY over ~6 months, some gaps."""
+        rng = np.random.default_rng(5)
+        symbols = [f"S{i:02d}" for i in range(40)] + ["SPY"]
+        dates = pd.bdate_range("2024-01-01", periods=120).date
+        prices = 50 * np.exp(np.cumsum(rng.normal(0, 0.02, (len(dates), len(symbols))), axis=0))
+        history = {}
+        for t, d in enumerate(dates):
+            history[d] = {
+                s: {
+                    "price": float(prices[t, j]),
+                    "market_cap": float(rng.uniform(1e9, 1e12)),
+                    "sector": "Energy" if j % 3 else "Technology",
+                    "pe_ratio": float(rng.uniform(5, 40)),
+                    "roe": float(rng.uniform(-5, 30)),
+                }
+                for j, s in enumerate(symbols)
+                if s == "SPY" or rng.random() > 0.05
+            }
+        return history
+    
+    @pytest.mark.parametrize("frequency", [RebalanceFrequency.WEEKLY, RebalanceFrequency.MONTHLY])
+    @pytest.mark.parametrize("equal_weight", [True, False])
+    def test_run_panel_matches_run(self, price_history, frequency, equal_weight):
+        """Panel mode reproduces run() on the same data."""
+        screen = Screen(
+            filters=[FilterCondition(filter_id="pe_ratio", operator=Operator.LT, value=25)],
+            custom_formulas=[CustomFormula(expression="roe / pe_ratio > 0.2")],
+            sectors=["Energy"],
+            sort_by="roe",
+        )
+        config = ScreenBacktestConfig(
+            rebalance_frequency=frequency, max_positions=5, equal_weight=equal_weight,
+            start_date=date(2024, 1, 15),
+        )
+        backtester = ScreenBacktester()
+        
+        expected = backtester.run(screen, price_history, config)
+        result = backtester.run_panel(screen, MetricsPanel.from_historical(price_history), config)
+        
+        assert result.dates == expected.dates
+        assert result.holdings_history == expected.holdings_history
+        np.testing.assert_allclose(result.equity_curve, expected.equity_curve, rtol=1e-12)
+        np.testing.assert_allclose(result.benchmark_curve, expected.benchmark_curve, rtol=1e-12)
+        assert result.sharpe_ratio == pytest.approx(expected.sharpe_ratio)
+        assert result.max_drawdown == pytest.approx(expected.max_drawdown)
+    
+    def test_run_panel_batch(self, price_history):
+        """A batch returns one result per screen, equal to single runs."""
+        panel = MetricsPanel.from_historical(price_history)
+        screens = [
+            Screen(name=f"pe<{v}", filters=[FilterCondition(filter_id="pe_ratio", operator=Operator.LT, value=v)])
+            for v in (10, 20, 30)
+        ]
+        backtester = ScreenBacktester()
+        
+        results = backtester.run_panel_batch(screens, panel)
+        
+        assert [r.screen_name for r in results] == ["pe<10", "pe<20", "pe<30"]
+        for screen, result in zip(screens, results):
+            single = backtester.run_panel(screen, panel)
+            assert result.config.screen_id == screen.screen_id
+            assert result.equity_curve == single.equity_curve
+    
+    def test_metrics_panel_constructors(self):
+        """Long frames and 3-D arrays build aligned panels with presence."""
+        long = pd.DataFrame(
+            {"price": [10.0, 20.0, 11.0], "roe": [5.0, None, 6.0]},
+            index=pd.MultiIndex.from_tuples([
+                (date(2024, 1, 1), "A"), (date(2024, 1, 1), "B"), (date(2024, 1, 2), "A"),
+            ]),
+        )
+        panel = MetricsPanel.from_frame(long)
+        assert panel.metrics == ["price", "roe"]
+        assert list(panel.symbols) == ["A", "B"]
+        assert panel.present.to_numpy().tolist() == [[True, True], [True, False]]
+        
+        values = np.arange(12, dtype=float).reshape(2, 3, 2)
+        panel = MetricsPanel.from_array(values, ["d1", "d2"], ["A", "B", "C"], ["price", "roe"])
+        assert panel.get("roe").loc["d2", "B"] == 9.0
+        with pytest.raises(ValueError):
+            MetricsPanel.from_array(values, ["d1"], ["A", "B", "C"], ["price", "roe"])
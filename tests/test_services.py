@@ -13,7 +13,7 @@ import json
 import os
 import sys
 import unittest
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import numpy as np
@@ -157,6 +157,153 @@ class TestServicesDataServiceGetPrices(unittest.TestCase):
         result = self._run(ds.get_prices(["AAPL"]))
         self.assertTrue(result.empty)
 
+    @patch("src.services.data_service.cache")
+    @patch("src.services.data_service.get_settings")
+    def test_repeat_request_served_from_local_cache(self, mock_settings, mock_cache):
+        mock_settings.return_value = MagicMock(use_database=False, fallback_to_yfinance=False)
+        df = pd.DataFrame({"AAPL": [150.0, 151.0]}, index=pd.date_range("2024-01-01", periods=2))
+        mock_cache.get_dataframe = AsyncMock(return_value=df)
+        from src.services.data_service import DataService
+        ds = DataService()
+        self._run(ds.get_prices(["AAPL"]))
+        result = self._run(ds.get_prices(["AAPL"]))
+        self.assertEqual(mock_cache.get_dataframe.await_count, 1)
+        self.assertEqual(list(result.columns), ["AAPL"])
+
+    @patch("src.services.data_service.cache")
+    @patch("src.services.data_service.get_settings")
+    def test_concurrent_requests_coalesce(self, mock_settings, mock_cache):
+        mock_settings.return_value = MagicMock(use_database=False, fallback_to_yfinance=False)
+        df = pd.DataFrame({"AAPL": [150.0, 151.0]}, index=pd.date_range("2024-01-01", periods=2))
+
+        async def slow_get(key):
+            await asyncio.sleep(0.01)
+            return df
+
+        mock_cache.get_dataframe = AsyncMock(side_effect=slow_get)
+        from src.services.data_service import DataService
+        ds = DataService()
+
+        async def fan_out():
+            return await asyncio.gather(*[ds.get_prices(["AAPL"]) for _ in range(25)])
+
+        results = self._run(fan_out())
+        self.assertEqual(len(results), 25)
+        self.assertEqual(mock_cache.get_dataframe.await_count, 1)
+        self.assertEqual(len({id(r) for r in results}), 25)
+
+    @patch("src.services.data_service.cache")
+    @patch("src.services.data_service.get_settings")
+    def test_local_cache_returns_copy(self, mock_settings, mock_cache):
+        mock_settings.return_value = MagicMock(use_database=False, fallback_to_yfinance=False)
+        df = pd.DataFrame({"AAPL": [150.0, 151.0]}, index=pd.date_range("2024-01-01", periods=2))
+        mock_cache.get_dataframe = AsyncMock(return_value=df)
+        from src.services.data_service import DataService
+        ds = DataService()
+        first = self._run(ds.get_prices(["AAPL"]))
+        first.iloc[0, 0] = 0.0
+        second = self._run(ds.get_prices(["AAPL"]))  # whole-panel L1 hit
+        second["AAPL"] = -1.0
+        third = self._run(ds.get_prices(["AAPL"]))
+        self.assertEqual(third["AAPL"].tolist(), [150.0, 151.0])
+        self.assertEqual(mock_cache.get_dataframe.await_count, 1)
+
+
+class TestServicesDataServicePriceTimeframe(unittest.TestCase):
+    """Tests for the timeframe argument of DataService.get_prices."""
+
+    def _run(self, coro):
+        return asyncio.get_event_loop().run_until_complete(coro)
+
+    @patch("src.services.data_service.cache")
+    @patch("src.services.data_service.get_settings")
+    def test_timeframe_passed_to_db_and_keyed_separately(self, mock_settings, mock_cache):
+        mock_settings.return_value = MagicMock(use_database=True, fallback_to_yfinance=False)
+        mock_cache.get_dataframe = AsyncMock(return_value=None)
+        mock_cache.set_dataframe = AsyncMock()
+        mock_cache.publish_invalidation = AsyncMock()
+        daily = pd.DataFrame({"AAPL": [1.0, 2.0]}, index=pd.date_range("2024-01-01", periods=2))
+        weekly = pd.DataFrame({"AAPL": [2.0]}, index=pd.DatetimeIndex(["2024-01-01"]))
+        from src.services.data_service import DataService
+        ds = DataService()
+
+        async def from_db(tickers, period, timeframe="1d"):
+            return weekly if timeframe == "1w" else daily
+
+        with patch.object(ds, "_get_prices_from_db", side_effect=from_db) as db:
+            self.assertEqual(len(self._run(ds.get_prices(["AAPL"], timeframe="1w"))), 1)
+            self.assertEqual(len(self._run(ds.get_prices(["AAPL"]))), 2)
+            self.assertEqual(len(self._run(ds.get_prices(["AAPL"], timeframe="1w"))), 1)  # L1
+        self.assertEqual([c.args[2] for c in db.call_args_list], ["1w", "1d"])
+        stored = [c.args[0] for c in mock_cache.set_dataframe.await_args_list]
+        self.assertEqual(stored, ["axion:prices:bulk:all:1w", "axion:prices:bulk:all:1d"])
+
+    @patch("src.services.data_service.cache")
+    @patch("src.services.data_service.get_settings")
+    def test_provider_fallback_downsampled(self, mock_settings, mock_cache):
+        mock_settings.return_value = MagicMock(use_database=False, fallback_to_yfinance=True)
+        mock_cache.get_dataframe = AsyncMock(return_value=None)
+        mock_cache.set_dataframe = AsyncMock()
+        mock_cache.publish_invalidation = AsyncMock()
+        daily = pd.DataFrame(
+            {"AAPL": np.arange(10, dtype=float)}, index=pd.bdate_range("2024-01-03", periods=10),
+        )
+        from src.services.data_service import DataService
+        ds = DataService()
+        with patch("src.services.providers.yfinance_provider.YFinanceProvider") as provider:
+            provider.return_value.fetch_prices = AsyncMock(return_value=daily)
+            result = self._run(ds.get_prices(["AAPL"], timeframe="1w"))
+        self.assertEqual(list(result.index), list(pd.to_datetime(["2024-01-01", "2024-01-08", "2024-01-15"])))
+        self.assertEqual(result["AAPL"].tolist(), [2.0, 7.0, 9.0])
+
+    @patch("src.services.data_service.get_settings")
+    def test_unknown_timeframe_rejected(self, mock_settings):
+        mock_settings.return_value = MagicMock()
+        from src.services.data_service import DataService
+        with self.assertRaises(ValueError):
+            self._run(DataService().get_prices(["AAPL"], timeframe="5m"))
+
+
+class TestServicesDataServiceStart(unittest.TestCase):
+    """Tests for DataService.start (L1 invalidation listener)."""
+
+    def _run(self, coro):
+        return asyncio.get_event_loop().run_until_complete(coro)
+
+    @patch("src.services.data_service.get_settings")
+    def test_start_subscribes_once(self, mock_settings):
+        mock_settings.return_value = MagicMock()
+        from src.services.data_service import DataService
+        ds = DataService()
+        with patch.object(ds.local_cache, "start_invalidation_listener", return_value=True) as listen:
+            self.assertTrue(self._run(ds.start()))
+            self.assertTrue(self._run(ds.start()))
+        listen.assert_called_once()
+
+    @patch("src.services.data_service.get_settings")
+    def test_failed_start_is_retried_after_backoff(self, mock_settings):
+        mock_settings.return_value = MagicMock()
+        from src.services import data_service
+        ds = data_service.DataService()
+        with patch.object(ds.local_cache, "start_invalidation_listener", side_effect=[False, True]) as listen:
+            self.assertFalse(self._run(ds.start()))
+            self.assertFalse(self._run(ds.start()))  # still backing off
+            self.assertEqual(listen.call_count, 1)
+            ds._listener_retry_at = 0.0
+            self.assertTrue(self._run(ds.start()))
+        self.assertEqual(listen.call_count, 2)
+
+    @patch("src.services.data_service.cache")
+    @patch("src.services.data_service.get_settings")
+    def test_requests_do_not_start_listener(self, mock_settings, mock_cache):
+        mock_settings.return_value = MagicMock(polygon_api_key="", fallback_to_yfinance=False)
+        mock_cache.get_quote = AsyncMock(return_value={"ticker": "AAPL", "price": 185.0})
+        from src.services.data_service import DataService
+        ds = DataService()
+        with patch.object(ds.local_cache, "start_invalidation_listener") as listen:
+            self._run(ds.get_quote("AAPL"))
+        listen.assert_not_called()
+
 
 # =============================================================================
 # DataService — get_fundamentals
@@ -231,6 +378,19 @@ class TestServicesDataServiceGetQuote(unittest.TestCase):
         self.assertIsNone(result["price"])
         self.assertEqual(result["source"], "unavailable")
 
+    @patch("src.services.data_service.cache")
+    @patch("src.services.data_service.get_settings")
+    def test_local_cache_returns_copy(self, mock_settings, mock_cache):
+        mock_settings.return_value = MagicMock(polygon_api_key="", fallback_to_yfinance=False)
+        mock_cache.get_quote = AsyncMock(return_value={"ticker": "AAPL", "price": 185.0})
+        from src.services.data_service import DataService
+        ds = DataService()
+        first = self._run(ds.get_quote("AAPL"))
+        first["price"] = 0.0
+        second = self._run(ds.get_quote("AAPL"))
+        self.assertEqual(second["price"], 185.0)
+        self.assertEqual(mock_cache.get_quote.await_count, 1)
+
 
 # =============================================================================
 # DataService — get_economic_indicator
@@ -365,6 +525,229 @@ class TestServicesDataServiceCacheSeries(unittest.TestCase):
         self.assertIsNone(stored["values"][1])
 
 
+# =============================================================================
+# DataService — bulk persistence
+# =============================================================================
+
+
+class _FakeCopyConnection:
+    """Records statements and COPY batches like an asyncpg connection."""
+
+    def __init__(self):
+        self.executed = []
+        self.copied = []
+
+    def transaction(self):
+        return _NullAsyncContext()
+
+    async def execute(self, sql, *args):
+        self.executed.append((sql, args))
+
+    async def copy_records_to_table(self, table, records, columns):
+        self.copied.append((table, list(records), columns))
+
+
+class _NullAsyncContext:
+    def __init__(self, value=None):
+        self.value = value
+
+    async def __aenter__(self):
+        return self.value
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def _fake_engine(driver):
+    conn = MagicMock()
+    conn.get_raw_connection = AsyncMock(return_value=MagicMock(driver_connection=driver))
+    engine = MagicMock()
+    engine.connect = MagicMock(return_value=_NullAsyncContext(conn))
+    return engine
+
+
+class TestServicesDataServiceBulkPersist(unittest.TestCase):
+    """Tests for COPY-based _persist_* methods."""
+
+    def _run(self, coro):
+        return asyncio.get_event_loop().run_until_complete(coro)
+
+    @patch("src.services.data_service.get_settings")
+    def test_persist_prices_copies_melted_frame(self, mock_settings):
+        mock_settings.return_value = MagicMock()
+        from src.services.data_service import DataService
+        ds = DataService()
+        ds._get_ticker_id_map = AsyncMock(return_value={"AAPL": 1, "MSFT": 2})
+        df = pd.DataFrame(
+            {"AAPL": [150.0, np.nan], "MSFT": [300.0, 301.0], "UNKNOWN": [1.0, 2.0]},
+            index=pd.date_range("2024-01-01", periods=2),
+        )
+        driver = _FakeCopyConnection()
+        with patch("src.db.engine.get_async_engine", return_value=_fake_engine(driver)):
+            n = self._run(ds._persist_prices(df))
+
+        self.assertEqual(n, 3)
+        table, records, columns = driver.copied[0]
+        self.assertEqual(table, "_stage_price_bars")
+        self.assertEqual(columns, ["time", "instrument_id", "close", "adj_close"])
+        self.assertEqual(
+            sorted((r[0].day, r[1], r[2]) for r in records),
+            [(1, 1, 150.0), (1, 2, 300.0), (2, 2, 301.0)],
+        )
+        statements = [sql for sql, _ in driver.executed]
+        self.assertEqual(len(statements), 2)
+        self.assertIn("CREATE TEMP TABLE _stage_price_bars", statements[0])
+        self.assertIn("ON CONFLICT (time, instrument_id)", statements[1])
+        self.assertEqual(driver.executed[1][1], ("yfinance",))
+
+    @patch("src.services.data_service.get_settings")
+    def test_persist_fundamentals_and_economic(self, mock_settings):
+        mock_settings.return_value = MagicMock()
+        from src.services.data_service import DataService
+        ds = DataService()
+        ds._get_ticker_id_map = AsyncMock(return_value={"AAPL": 7})
+        fundamentals = pd.DataFrame(
+            {"trailingPE": [25.0], "marketCap": [3e12], "currentPrice": [190.0]},
+            index=["AAPL"],
+        )
+        series = pd.Series([1.0, float("nan"), 3.0], index=pd.date_range("2024-01-01", periods=3))
+        driver = _FakeCopyConnection()
+        with patch("src.db.engine.get_async_engine", return_value=_fake_engine(driver)):
+            self.assertEqual(self._run(ds._persist_fundamentals(fundamentals)), 1)
+            self.assertEqual(self._run(ds._persist_economic("GDP", series)), 2)
+
+        (_, fin_records, fin_columns), (_, econ_records, _) = driver.copied
+        row = dict(zip(fin_columns, fin_records[0]))
+        self.assertEqual(row["instrument_id"], 7)
+        self.assertEqual(row["trailing_pe"], 25.0)
+        self.assertEqual(row["market_cap"], 3_000_000_000_000)
+        self.assertIsNone(row["price_to_book"])
+        self.assertEqual(econ_records, [("GDP", date(2024, 1, 1), 1.0), ("GDP", date(2024, 1, 3), 3.0)])
+
+    @patch("src.services.data_service.get_settings")
+    def test_bulk_upsert_rejects_unknown_identifiers(self, mock_settings):
+        mock_settings.return_value = MagicMock()
+        from src.services.data_service import DataService
+        ds = DataService()
+        driver = _FakeCopyConnection()
+        with patch("src.db.engine.get_async_engine", return_value=_fake_engine(driver)):
+            with self.assertRaises(ValueError):
+                self._run(ds.bulk_upsert("users", ["id"], [(1,)], conflict=["id"], update=[], source="test"))
+            with self.assertRaises(ValueError):
+                self._run(ds.bulk_upsert(
+                    "price_bars", ["time", "instrument_id", "close; DROP TABLE price_bars"], [],
+                    conflict=["time", "instrument_id"], update=[], source="test",
+                ))
+        self.assertEqual(driver.executed, [])
+
+
+def _copy_binary(rows):
+    """Encode (datetime, instrument_id, price) rows as a PostgreSQL binary COPY stream."""
+    import struct
+    epoch = datetime(2000, 1, 1, tzinfo=timezone.utc)
+    out = b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0)
+    for ts, iid, price in rows:
+        us = (ts - epoch) // timedelta(microseconds=1)
+        out += struct.pack(">hiqiiid", 3, 8, us, 4, iid, 8, price)
+    return out + struct.pack(">h", -1)
+
+
+class _FakeCopyOutConnection:
+    """Serves one binary COPY TO result in small, unaligned pieces."""
+
+    def __init__(self, rows, piece=23):
+        self.payload = _copy_binary(rows)
+        self.piece = piece
+        self.queries = []
+
+    async def copy_from_query(self, query, *args, output, format):
+        self.queries.append((query, args, format))
+        for start in range(0, len(self.payload), self.piece):
+            await output(self.payload[start:start + self.piece])
+
+
+class TestServicesDataServiceStreamPrices(unittest.TestCase):
+    """Tests for the streamed price read path."""
+
+    def setUp(self):
+        t0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        self.days = [t0 + timedelta(days=d) for d in range(5)]
+        # MSFT is missing on day 2; GOOG has no rows at all
+        self.rows = [
+            (day, iid, 100.0 * iid + d)
+            for d, day in enumerate(self.days)
+            for iid in (1, 2)
+            if not (d == 2 and iid == 2)
+        ]
+
+    def _run(self, coro):
+        return asyncio.get_event_loop().run_until_complete(coro)
+
+    def _service(self, mock_settings):
+        mock_settings.return_value = MagicMock()
+        from src.services.data_service import DataService
+        ds = DataService()
+        ds._get_ticker_id_map = AsyncMock(return_value={"MSFT": 2, "AAPL": 1, "GOOG": 3})
+        return ds
+
+    @patch("src.services.data_service.get_settings")
+    def test_get_prices_from_db_matches_pivot(self, mock_settings):
+        ds = self._service(mock_settings)
+        driver = _FakeCopyOutConnection(self.rows)
+        with patch("src.db.engine.get_async_engine", return_value=_fake_engine(driver)):
+            result = self._run(ds._get_prices_from_db(["AAPL", "MSFT", "GOOG"], "3mo"))
+
+        expected = pd.DataFrame(
+            [(t, {1: "AAPL", 2: "MSFT"}[i], p) for t, i, p in self.rows],
+            columns=["time", "ticker", "adj_close"],
+        ).pivot(index="time", columns="ticker", values="adj_close")
+        pd.testing.assert_frame_equal(result, expected, check_index_type=False, check_freq=False)
+        self.assertEqual(list(result.index), self.days)
+        query, args, fmt = driver.queries[0]
+        self.assertEqual(fmt, "binary")
+        self.assertNotIn("time_bucket", query)
+        self.assertEqual(sorted(args[0]), [1, 2, 3])
+
+    @patch("src.services.data_service.get_settings")
+    def test_iter_prices_yields_complete_timestamps(self, mock_settings):
+        ds = self._service(mock_settings)
+        driver = _FakeCopyOutConnection(self.rows, piece=7)
+
+        async def collect():
+            return [frame async for frame in ds.iter_prices(["AAPL", "MSFT"], "3mo", chunk_rows=3)]
+
+        with patch("src.db.engine.get_async_engine", return_value=_fake_engine(driver)):
+            frames = self._run(collect())
+
+        self.assertGreater(len(frames), 1)
+        combined = pd.concat(frames)
+        self.assertTrue(combined.index.is_unique)
+        self.assertEqual(list(combined.index), self.days)
+        self.assertEqual(list(combined.columns), ["AAPL", "GOOG", "MSFT"])
+        self.assertEqual(combined.loc[self.days[4], "MSFT"], 204.0)
+        self.assertTrue(np.isnan(combined.loc[self.days[2], "MSFT"]))
+
+    @patch("src.services.data_service.get_settings")
+    def test_coarse_timeframe_buckets_in_database(self, mock_settings):
+        ds = self._service(mock_settings)
+        driver = _FakeCopyOutConnection(self.rows[:2])
+        with patch("src.db.engine.get_async_engine", return_value=_fake_engine(driver)):
+            self._run(ds._get_prices_from_db(["AAPL", "MSFT"], "12mo", timeframe="1w"))
+        query = driver.queries[0][0]
+        self.assertIn("time_bucket(INTERVAL '1 week', time)", query)
+        self.assertIn("last(adj_close, time)", query)
+
+    def test_price_grid_grows_past_estimate(self):
+        from src.services.data_service import _PriceGrid
+        grid = _PriceGrid([5, 7], expected_rows=1)
+        for t in range(4):
+            grid.add(np.array([t, t]), np.array([7, 5]), np.array([t + 0.5, t + 0.25]))
+        frame = grid.frame(["A", "B"])
+        self.assertEqual(grid.n_rows, 4)
+        np.testing.assert_allclose(frame["A"], np.arange(4) + 0.25)
+        np.testing.assert_allclose(frame["B"], np.arange(4) + 0.5)
+
+
 # =============================================================================
 # SyncDataService — Init and _run
 # =============================================================================